@@ -14,7 +14,7 @@ Date: 2026-02-08
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Iterator, Tuple, Any
 from dataclasses import dataclass
 
 
@@ -61,6 +61,25 @@ class Column:
     foreign_key: Optional[str]  # Format: "ReferencedTable(ReferencedColumn)"
 
 
+@dataclass
+class TableStream:
+    """
+    Streaming table read (export path)
+    
+    Holds column names plus a lazy iterator of row batches (tuples in column
+    order), so callers can write rows out without materializing the table.
+    Exhausting or closing ``batches`` releases the underlying cursor.
+    """
+    columns: List[str]
+    batches: Iterator[List[Tuple[Any, ...]]]
+    
+    def close(self) -> None:
+        """Release the cursor early (e.g. client disconnected)"""
+        close = getattr(self.batches, 'close', None)
+        if close:
+            close()
+
+
 class IDataProductRepository(ABC):
     """
     Repository interface for data product operations
@@ -131,33 +150,69 @@ class IDataProductRepository(ABC):
         table_name: str,
         limit: int = 100,
         offset: int = 0,
-        filters: Optional[Dict] = None
+        filters: Optional[Dict] = None,
+        cursor: Optional[str] = None
     ) -> Dict:
         """
         Query data from a table with pagination
         
+        Pagination modes:
+        - Offset (cursor=None): classic LIMIT/OFFSET
+        - Keyset (cursor='' for the first page, then the previous page's
+          'nextCursor'): seeks by primary key, constant cost at any depth
+        
         Args:
             product_name: Name of the data product
             table_name: Name of the table
             limit: Maximum rows to return
-            offset: Number of rows to skip
+            offset: Number of rows to skip (offset mode only)
             filters: Optional filter conditions (future enhancement)
+            cursor: Opaque continuation token (enables keyset mode)
         
         Returns:
             Dictionary with structure:
             {
                 'rows': List[Dict],
                 'columns': List[Dict],
-                'totalCount': int,
-                'executionTime': float
+                'totalCount': Optional[int],  # None if the count failed
+                'executionTime': float,
+                'nextCursor': Optional[str],  # keyset mode only, None on last page
+                'hasMore': bool               # keyset mode only
             }
         
         Raises:
             ValueError: If table not found
+            InvalidCursorError: If cursor is malformed or for another table
             DataAccessError: If query fails
         """
         pass
     
+    @abstractmethod
+    def stream_table_data(
+        self,
+        product_name: str,
+        table_name: str,
+        batch_size: int = 1000
+    ) -> TableStream:
+        """
+        Stream all rows of a table in batches (uses cursor.fetchmany)
+        
+        Unlike query_table_data this has no row cap and keeps memory flat:
+        only one batch is held at a time.
+        
+        Args:
+            product_name: Name of the data product
+            table_name: Name of the table
+            batch_size: Rows per fetchmany() call
+        
+        Returns:
+            TableStream with column names and a lazy batch iterator
+        
+        Raises:
+            DataAccessError: If the query cannot be started
+        """
+        pass
+    
     @abstractmethod
     def get_source_type(self) -> str:
         """
@@ -214,3 +269,8 @@ class IDataProductRepository(ABC):
 class DataAccessError(Exception):
     """Raised when data access operation fails"""
     pass
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor is malformed or belongs to another table"""
+    pass
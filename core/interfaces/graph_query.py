@@ -333,6 +333,139 @@ class IGraphQueryEngine(ABC):
         Used to force reload from database after schema changes.
         """
         pass
+    
+    def find_paths(
+        self,
+        start_id: str,
+        end_id: str,
+        max_hops: int = 10,
+        edge_types: Optional[List[str]] = None,
+        k: int = 1
+    ) -> List[GraphPath]:
+        """
+        Find up to k shortest (simple, directed) paths between two nodes.
+        
+        The search is bounded: no path longer than max_hops is returned,
+        and engines stop searching once max_hops is exhausted. The default
+        supports the plain single shortest path only (via shortest_path());
+        engines override this for edge-type constraints and k > 1.
+        
+        Args:
+            start_id: Starting node ID
+            end_id: Target node ID
+            max_hops: Maximum path length (default 10)
+            edge_types: Only follow edges of these types
+            k: Number of paths to return
+            
+        Returns:
+            List of GraphPath objects ordered by length (empty if none)
+            
+        Raises:
+            NotImplementedError: If the engine cannot honour edge_types / k
+            
+        Examples:
+            # Three shortest FK routes from a supplier to an invoice
+            paths = engine.find_paths(
+                'Supplier:SUP001',
+                'SupplierInvoice:5100000001',
+                max_hops=6,
+                edge_types=['fk'],
+                k=3
+            )
+        """
+        if edge_types or k != 1:
+            raise NotImplementedError(
+                f"{type(self).__name__} does not support edge-type constrained or k-shortest path search"
+            )
+        path = self.shortest_path(start_id, end_id, max_hops)
+        return [path] if path else []
+    
+    def get_neighbors_batch(
+        self,
+        node_ids: List[str],
+        direction: TraversalDirection = TraversalDirection.OUTGOING,
+        edge_types: Optional[List[str]] = None,
+        limit: Optional[int] = None
+    ) -> Dict[str, List[GraphNode]]:
+        """
+        Get adjacent nodes of many nodes at once.
+
+        The default calls get_neighbors() per node; engines with a
+        per-query cost (HANA) override this to fetch all neighborhoods in
+        one round trip.
+
+        Args:
+            node_ids: IDs of the source nodes
+            direction: Direction to traverse (outgoing, incoming, both)
+            edge_types: Filter by edge types
+            limit: Maximum number of neighbors per node
+
+        Returns:
+            Dict mapping each requested node ID to its neighbors (unknown
+            nodes map to an empty list)
+
+        Examples:
+            # Expand several nodes of a visualization in one call
+            expanded = engine.get_neighbors_batch(
+                ['PurchaseOrder:PO000001', 'PurchaseOrder:PO000002'],
+                direction=TraversalDirection.BOTH
+            )
+        """
+        return {
+            node_id: self.get_neighbors(node_id, direction, edge_types, limit)
+            for node_id in dict.fromkeys(node_ids)
+        }
+
+    def traverse_batch(
+        self,
+        start_ids: List[str],
+        depth: int = 2,
+        direction: TraversalDirection = TraversalDirection.OUTGOING,
+        edge_types: Optional[List[str]] = None
+    ) -> List[GraphNode]:
+        """
+        Breadth-first traversal from a set of seed nodes (k-hop neighborhood).
+
+        Every reachable node is reported once. The default merges one
+        traverse() per seed; engines override this with a single
+        multi-source traversal (nodes in order of distance from the
+        nearest seed).
+
+        Args:
+            start_ids: Seed node IDs (depth 0)
+            depth: Maximum depth to traverse
+            direction: Direction to traverse
+            edge_types: Filter by edge types
+
+        Returns:
+            List of reachable GraphNode objects (seeds included)
+
+        Examples:
+            # Everything within 2 hops of three suppliers
+            related = engine.traverse_batch(
+                ['Supplier:SUP001', 'Supplier:SUP002', 'Supplier:SUP003'],
+                depth=2
+            )
+        """
+        seen = {}
+        for start_id in start_ids:
+            for node in self.traverse(start_id, depth, direction, edge_types):
+                seen.setdefault(node.id, node)
+        return list(seen.values())
+
+    def refresh(self) -> Dict[str, Any]:
+        """
+        Bring cached graph data up to date with the database.
+        
+        Called after the persisted graph was rebuilt. The default drops the
+        cache (lazy full reload on next query); engines that can apply
+        deltas override this to avoid a cold reload.
+        
+        Returns:
+            Dict describing the refresh (at least 'mode')
+        """
+        self.clear_cache()
+        return {'mode': 'clear'}
 
 
 # Type aliases for convenience
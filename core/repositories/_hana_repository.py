@@ -25,6 +25,14 @@ project_root = os.path.dirname(os.path.dirname(backend_dir))
 sys.path.insert(0, project_root)
 
 from core.repositories.base import AbstractRepository
+from core.interfaces.data_product_repository import TableStream
+from core.services.table_pagination import (
+    TableCountCache,
+    build_keyset_predicate,
+    decode_cursor,
+    encode_cursor,
+    quote_identifier
+)
 
 logger = logging.getLogger(__name__)
 
@@ -47,6 +55,9 @@ class _HanaRepository(AbstractRepository):
     Access ONLY via: create_repository('hana')
     """
     
+    # Cached COUNT(*) results are reused for this long
+    COUNT_CACHE_TTL_SECONDS = 60
+    
     def __init__(
         self, 
         host: str, 
@@ -74,6 +85,10 @@ class _HanaRepository(AbstractRepository):
         self.database = database
         self.schema = schema
         self._connection = None
+        
+        # HANA has no cheap change signal, so row counts expire by TTL
+        self._count_cache = TableCountCache(ttl_seconds=self.COUNT_CACHE_TTL_SECONDS)
+        self._pk_cache: Dict[str, List[str]] = {}
     
     def _connect(self) -> bool:
         """
@@ -464,18 +479,37 @@ class _HanaRepository(AbstractRepository):
         
         return columns
     
-    def query_table(self, schema: str, table: str, limit: int = 100, offset: int = 0) -> Dict:
+    def query_table(
+        self,
+        schema: str,
+        table: str,
+        limit: int = 100,
+        offset: int = 0,
+        cursor: Optional[str] = None
+    ) -> Dict:
         """
         Query data from a table.
         
+        Offset mode (cursor is None) uses LIMIT/OFFSET. Keyset mode (cursor
+        is '' for the first page, then the previous 'nextCursor') seeks past
+        the primary key, so deep pages cost the same as the first one.
+        Total counts are cached per table for COUNT_CACHE_TTL_SECONDS.
+        
         Args:
             schema: Schema name
             table: Table name
             limit: Maximum number of rows to return
-            offset: Number of rows to skip
+            offset: Number of rows to skip (offset mode)
+            cursor: Keyset continuation token
         
         Returns:
             Query results with rows, columns, and metadata
+            (keyset mode adds nextCursor and hasMore; totalCount is None
+            if the row count could not be determined)
+        
+        Raises:
+            InvalidCursorError: If the cursor is malformed or belongs to another table
+            ValueError: If keyset mode is requested for a table without primary key
         """
         # Get table structure to limit columns
         struct_sql = """
@@ -490,18 +524,50 @@ class _HanaRepository(AbstractRepository):
         if struct_result['success'] and struct_result['rows']:
             # Get first 10 columns for preview
             columns = [row['COLUMN_NAME'] for row in struct_result['rows'][:10]]
-            column_list = ', '.join([f'"{col}"' for col in columns])
         else:
-            column_list = '*'
+            columns = []
         
-        # Query data
-        sql = f"""
-        SELECT {column_list}
-        FROM "{schema}"."{table}"
-        LIMIT ? OFFSET ?
-        """
+        table_sql = f'{quote_identifier(schema)}.{quote_identifier(table)}'
+        key_columns = None
         
-        result = self.execute_query(sql, (limit, offset))
+        if cursor is None:
+            column_list = ', '.join(quote_identifier(col) for col in columns) or '*'
+            
+            # Query data
+            sql = f"""
+            SELECT {column_list}
+            FROM {table_sql}
+            LIMIT ? OFFSET ?
+            """
+            
+            result = self.execute_query(sql, (limit, offset))
+        else:
+            key_columns = self._get_primary_key_columns(schema, table)
+            if not key_columns:
+                raise ValueError(f'Cursor pagination requires a primary key on "{schema}"."{table}"')
+            
+            # Key columns must be selected to build the next cursor
+            columns = columns + [col for col in key_columns if col not in columns]
+            column_list = ', '.join(quote_identifier(col) for col in columns)
+            order_list = ', '.join(quote_identifier(col) for col in key_columns)
+            
+            where_sql = ''
+            params: List = []
+            if cursor:
+                key_values = decode_cursor(cursor, f'{schema}.{table}', key_columns)
+                predicate, params = build_keyset_predicate(key_columns, key_values, row_value_syntax=False)
+                where_sql = f'WHERE {predicate}'
+            
+            # Fetch one extra row to know whether another page exists
+            sql = f"""
+            SELECT {column_list}
+            FROM {table_sql}
+            {where_sql}
+            ORDER BY {order_list}
+            LIMIT ?
+            """
+            
+            result = self.execute_query(sql, tuple(params) + (limit + 1,))
         
         if not result['success']:
             return {
@@ -511,17 +577,111 @@ class _HanaRepository(AbstractRepository):
                 'executionTime': 0
             }
         
-        # Get total count for pagination
-        count_sql = f'SELECT COUNT(*) as TOTAL FROM "{schema}"."{table}"'
-        count_result = self.execute_query(count_sql)
-        total_count = count_result['rows'][0]['TOTAL'] if count_result['success'] and count_result['rows'] else result['rowCount']
+        # Get total count for pagination (cached - COUNT(*) scans the table;
+        # None when the count fails, which is not cached)
+        total_count = self._count_cache.get_or_compute(
+            f'{schema}.{table}',
+            lambda: self._count_rows(table_sql)
+        )
         
-        return {
+        response = {
             'rows': result['rows'],
             'columns': [{'name': col} for col in result['columns']],
             'totalCount': total_count,
             'executionTime': result['executionTime']
         }
+        
+        if key_columns is not None:
+            rows = result['rows']
+            has_more = len(rows) > limit
+            rows = rows[:limit]
+            response['rows'] = rows
+            response['hasMore'] = has_more
+            response['nextCursor'] = (
+                encode_cursor(f'{schema}.{table}', key_columns, [rows[-1][col] for col in key_columns])
+                if has_more and rows else None
+            )
+        
+        return response
+    
+    def _count_rows(self, table_sql: str) -> Optional[int]:
+        """Run COUNT(*) on a quoted table reference (None if the count fails)"""
+        count_sql = f'SELECT COUNT(*) as TOTAL FROM {table_sql}'
+        count_result = self.execute_query(count_sql)
+        if count_result['success'] and count_result['rows']:
+            return count_result['rows'][0]['TOTAL']
+        return None
+    
+    def _get_primary_key_columns(self, schema: str, table: str) -> List[str]:
+        """Get ordered primary key columns from SYS.INDEXES (cached per table)"""
+        cache_key = f'{schema}.{table}'
+        if cache_key in self._pk_cache:
+            return self._pk_cache[cache_key]
+        
+        pk_sql = """
+        SELECT ic.COLUMN_NAME
+        FROM SYS.INDEXES i
+        JOIN SYS.INDEX_COLUMNS ic
+            ON i.SCHEMA_NAME = ic.SCHEMA_NAME
+            AND i.TABLE_NAME = ic.TABLE_NAME
+            AND i.INDEX_NAME = ic.INDEX_NAME
+        WHERE i.SCHEMA_NAME = ? 
+            AND i.TABLE_NAME = ?
+            AND i.CONSTRAINT = 'PRIMARY KEY'
+        ORDER BY ic.POSITION
+        """
+        
+        pk_result = self.execute_query(pk_sql, (schema, table))
+        if not pk_result['success']:
+            return []
+        
+        key_columns = [row['COLUMN_NAME'] for row in pk_result['rows']]
+        self._pk_cache[cache_key] = key_columns
+        return key_columns
+    
+    def stream_table(self, schema: str, table: str, batch_size: int = 1000) -> TableStream:
+        """
+        Stream all rows of a table in fetchmany() batches.
+        
+        Rows are pulled from HANA one batch per round trip, so memory stays
+        bounded by batch_size regardless of table size.
+        
+        Args:
+            schema: Schema name
+            table: Table name
+            batch_size: Rows per fetchmany() call
+        
+        Returns:
+            TableStream with column names and lazy row batches
+        
+        Raises:
+            Exception: If connection or query start fails
+        """
+        if not self._connect():
+            logger.error("[HANA] Cannot stream table - connection failed")
+            raise Exception("Failed to connect to HANA")
+        
+        cursor = self._connection.cursor()
+        try:
+            cursor.execute(f'SELECT * FROM {quote_identifier(schema)}.{quote_identifier(table)}')
+            columns = [desc[0] for desc in cursor.description]
+        except Exception:
+            cursor.close()
+            raise
+        
+        logger.info(f"[HANA] Streaming \"{schema}\".\"{table}\" in batches of {batch_size}")
+        
+        def batches():
+            try:
+                while True:
+                    rows = cursor.fetchmany(batch_size)
+                    if not rows:
+                        break
+                    yield [tuple(row) for row in rows]
+            finally:
+                cursor.close()
+        
+        return TableStream(columns=columns, batches=batches())
     
     def get_csn_definition(self, schema: str) -> Optional[Dict]:
         """
@@ -23,9 +23,11 @@ project_root = os.path.dirname(os.path.dirname(backend_dir))
 sys.path.insert(0, project_root)
 
 from core.repositories.base import AbstractRepository
+from core.interfaces.data_product_repository import TableStream
 
 # Import the SQLiteDataProductsService from core/services (extracted from V1)
 from core.services.sqlite_data_products_service import SQLiteDataProductsService
+from core.services.database_connection_factory import get_connection_pool
 
 
 class _SqliteRepository(AbstractRepository):
@@ -55,6 +57,7 @@ class _SqliteRepository(AbstractRepository):
         """
         self.service = SQLiteDataProductsService(db_path)
         self._db_path = db_path or self._get_default_db_path()
+        self._pool = get_connection_pool(self._db_path)
     
     def _get_default_db_path(self) -> str:
         """Get default database path if none provided."""
@@ -101,7 +104,14 @@ class _SqliteRepository(AbstractRepository):
         """
         return self.service.get_table_structure(schema, table)
     
-    def query_table(self, schema: str, table: str, limit: int = 100, offset: int = 0) -> Dict:
+    def query_table(
+        self,
+        schema: str,
+        table: str,
+        limit: int = 100,
+        offset: int = 0,
+        cursor: Optional[str] = None
+    ) -> Dict:
         """
         Query data from a table.
         
@@ -109,12 +119,27 @@ class _SqliteRepository(AbstractRepository):
             schema: Schema name (ignored for SQLite)
             table: Table name
             limit: Maximum number of rows to return
-            offset: Number of rows to skip
+            offset: Number of rows to skip (offset mode)
+            cursor: Keyset continuation token ('' = first page, None = offset mode)
         
         Returns:
             Query results with rows, columns, and metadata
         """
-        return self.service.query_table(schema, table, limit, offset)
+        return self.service.query_table(schema, table, limit, offset, cursor=cursor)
+    
+    def stream_table(self, schema: str, table: str, batch_size: int = 1000) -> TableStream:
+        """
+        Stream all rows of a table in batches.
+        
+        Args:
+            schema: Schema name (ignored for SQLite)
+            table: Table name
+            batch_size: Rows per fetchmany() call
+        
+        Returns:
+            TableStream with column names and lazy row batches
+        """
+        return self.service.stream_table(schema, table, batch_size)
     
     def get_csn_definition(self, schema: str) -> Optional[Dict]:
         """
@@ -157,28 +182,27 @@ class _SqliteRepository(AbstractRepository):
         try:
             start_time = datetime.now()
             
-            # Create connection (managed internally)
-            conn = self._create_connection()
-            cursor = conn.cursor()
-            
-            # Execute query with or without parameters
-            if params:
-                cursor.execute(sql, params)
-            else:
-                cursor.execute(sql)
-            
             # Check if this is a SELECT query
             if sql.strip().upper().startswith('SELECT'):
-                rows = cursor.fetchall()
-                columns = [desc[0] for desc in cursor.description] if cursor.description else []
+                # Reads share pooled read-only connections
+                with self._pool.connection() as conn:
+                    cursor = conn.cursor()
+                    cursor.row_factory = sqlite3.Row
+                    
+                    # Execute query with or without parameters
+                    if params:
+                        cursor.execute(sql, params)
+                    else:
+                        cursor.execute(sql)
+                    
+                    rows = cursor.fetchall()
+                    columns = [desc[0] for desc in cursor.description] if cursor.description else []
                 
                 # Convert Row objects to dicts
                 result_rows = [dict(row) for row in rows]
                 
                 execution_time = (datetime.now() - start_time).total_seconds() * 1000
                 
-                conn.close()
-                
                 return {
                     'success': True,
                     'rows': result_rows,
@@ -187,14 +211,21 @@ class _SqliteRepository(AbstractRepository):
                     'executionTime': execution_time
                 }
             else:
-                # DML statement (INSERT, UPDATE, DELETE, etc.)
-                conn.commit()
-                row_count = cursor.rowcount
+                # DML statement (INSERT, UPDATE, DELETE, etc.) needs a writable connection
+                conn = self._create_connection()
+                try:
+                    cursor = conn.cursor()
+                    if params:
+                        cursor.execute(sql, params)
+                    else:
+                        cursor.execute(sql)
+                    conn.commit()
+                    row_count = cursor.rowcount
+                finally:
+                    conn.close()
                 
                 execution_time = (datetime.now() - start_time).total_seconds() * 1000
                 
-                conn.close()
-                
                 return {
                     'success': True,
                     'rows': [],
@@ -219,7 +250,9 @@ class _SqliteRepository(AbstractRepository):
     
     def _create_connection(self) -> sqlite3.Connection:
         """
-        Create a new SQLite database connection (private method).
+        Create a new writable SQLite database connection (private method).
+        
+        Read-only SELECTs go through the shared connection pool instead.
         
         Returns:
             sqlite3.Connection with Row factory configured
@@ -17,6 +17,8 @@ References:
 from abc import ABC, abstractmethod
 from typing import List, Dict, Optional
 
+from core.interfaces.data_product_repository import TableStream
+
 
 class AbstractRepository(ABC):
     """
@@ -92,7 +94,8 @@ class AbstractRepository(ABC):
         schema: str, 
         table: str, 
         limit: int = 100, 
-        offset: int = 0
+        offset: int = 0,
+        cursor: Optional[str] = None
     ) -> Dict:
         """
         Query data from a table.
@@ -101,7 +104,8 @@ class AbstractRepository(ABC):
             schema: Schema/data product name
             table: Table name
             limit: Maximum rows to return
-            offset: Number of rows to skip
+            offset: Number of rows to skip (ignored in keyset mode)
+            cursor: Keyset continuation token ('' = first page, None = offset mode)
             
         Returns:
             Dictionary with:
@@ -109,6 +113,22 @@ class AbstractRepository(ABC):
             - columns: List[Dict] - Column information
             - totalCount: int - Total rows in table
             - executionTime: float - Query execution time in ms
+            - nextCursor / hasMore - keyset mode only
+        """
+        pass
+    
+    @abstractmethod
+    def stream_table(self, schema: str, table: str, batch_size: int = 1000) -> TableStream:
+        """
+        Stream all rows of a table using cursor.fetchmany().
+        
+        Args:
+            schema: Schema/data product name
+            table: Table name
+            batch_size: Rows fetched per round trip
+            
+        Returns:
+            TableStream (column names + lazy iterator of row-tuple batches)
         """
         pass
     
@@ -10,6 +10,7 @@ Exports:
     - GraphQueryService: Unified graph query facade (HANA + NetworkX)
     - NetworkXGraphQueryEngine: SQLite-based graph engine
     - HANAGraphQueryEngine: HANA Property Graph engine
+    - CSRGraphQueryEngine: NumPy CSR engine for large SQLite graphs
 """
 
 from .module_registry import ModuleRegistry
@@ -18,6 +19,7 @@ from .path_resolver import PathResolver
 from .graph_query_service import GraphQueryService
 from .networkx_graph_query_engine import NetworkXGraphQueryEngine
 from .hana_graph_query_engine import HANAGraphQueryEngine
+from .csr_graph_query_engine import CSRGraphQueryEngine
 
 __all__ = [
     'ModuleRegistry',
@@ -26,4 +28,5 @@ __all__ = [
     'GraphQueryService',
     'NetworkXGraphQueryEngine',
     'HANAGraphQueryEngine',
+    'CSRGraphQueryEngine',
 ]
\ No newline at end of file
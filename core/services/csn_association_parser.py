@@ -144,20 +144,21 @@ class CSNAssociationParser:
         if self._cache is not None:
             return self._cache
         
-        associations = []
-        entities = self.csn_parser.list_entities()
+        # One streaming pass over the CSN files (one definition in memory at a time)
+        by_entity: Dict[str, List[CSNAssociation]] = {}
+        for entity_name, _, csn_def in self.csn_parser.iter_entity_definitions():
+            by_entity[entity_name] = self._parse_definition_associations(entity_name, csn_def)
         
-        logger.info(f"Parsing associations from {len(entities)} entities...")
+        logger.info(f"Parsed associations from {len(by_entity)} entities")
         
-        for entity_name in entities:
-            entity_assocs = self._parse_entity_associations(entity_name)
-            associations.extend(entity_assocs)
+        # Keep the entity order of list_entities()
+        associations = [assoc for name in sorted(by_entity) for assoc in by_entity[name]]
         
         logger.info(f"Parsed {len(associations)} associations")
         self._cache = associations
         return associations
     
-    def _parse_entity_associations(self, entity_name: str) -> List[CSNAssociation]:
+    def parse_entity_associations(self, entity_name: str) -> List[CSNAssociation]:
         """
         Parse associations for a specific entity
         
@@ -181,9 +182,27 @@ class CSNAssociationParser:
                 return associations
             
             csn_def, full_name = result
-            if 'elements' not in csn_def:
-                return associations
+            return self._parse_definition_associations(entity_name, csn_def)
+        
+        except Exception as e:
+            logger.warning(f"Error parsing associations for {entity_name}: {e}")
+        
+        return associations
+    
+    def _parse_definition_associations(self, entity_name: str, csn_def: Dict) -> List[CSNAssociation]:
+        """
+        Parse associations from a raw CSN entity definition
+        
+        Args:
+            entity_name: Entity name
+            csn_def: Entity definition from CSN
             
+        Returns:
+            List of associations for this entity
+        """
+        associations = []
+        
+        try:
             elements = csn_def.get('elements', {})
             
             # Scan elements for associations
@@ -0,0 +1,337 @@
+"""
+Compiled CSN Entity Index
+
+Persistent SQLite index over the CSN files of a directory:
+- entity name -> CSN file
+- byte span of the entity definition inside the file (read + parse only
+  that slice instead of the whole file)
+- pre-extracted EntityMetadata (as JSON)
+
+Without it every process json.loads every CSN file once to collect entity
+names and a second time to read definitions. With it, startup is one stat()
+per file; a file is re-parsed only when its mtime/size changed AND its
+content hash differs from the indexed one.
+
+The index is a cache: it can be deleted at any time and is rebuilt on the
+next sync(). If the index file cannot be written, an in-memory index is
+used for the process. Files are hashed and scanned in chunks (see
+csn_stream_reader), never loaded whole.
+
+@author P2P Development Team
+@version 1.0.0
+"""
+
+import hashlib
+import io
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, Optional
+
+from .csn_stream_reader import DEFAULT_CHUNK_SIZE, CSNDefinition, iter_csn_definitions
+
+logger = logging.getLogger(__name__)
+
+# Bump when the extracted metadata or the table layout changes
+INDEX_FORMAT_VERSION = '1'
+DEFAULT_INDEX_FILENAME = '.csn_index.db'
+
+
+@dataclass(frozen=True)
+class IndexedEntity:
+    """Location of one entity definition"""
+    simple_name: str
+    full_name: str
+    file_path: str
+    byte_offset: int
+    byte_length: int
+
+
+def scan_csn_definitions(raw: bytes) -> Iterator[CSNDefinition]:
+    """
+    Walk the definitions of an in-memory CSN document, tracking byte positions
+
+    Args:
+        raw: File content (UTF-8, optional BOM)
+
+    Yields:
+        (full_name, definition, byte_offset, byte_length) per definition
+
+    Raises:
+        ValueError: If the content is not a CSN JSON document
+    """
+    return iter_csn_definitions(io.BytesIO(raw))
+
+
+def _file_sha256(path: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> str:
+    """Content hash of a file, read in chunks"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class CSNIndexStore:
+    """
+    SQLite-backed compiled index of a CSN directory
+
+    Schema:
+    - csn_index_meta: format version and indexed directory
+    - csn_index_files: one row per CSN file (mtime, size, content hash)
+    - csn_index_entities: one row per entity (location + metadata JSON)
+
+    Usage:
+        store = CSNIndexStore('docs/csn/.csn_index.db')
+        stats = store.sync('docs/csn', extract_metadata)
+        entities = store.load_entities()
+        metadata = store.get_metadata(entities['PurchaseOrder'])
+    """
+
+    def __init__(self, index_path: str):
+        """
+        Open (or create) the index
+
+        Args:
+            index_path: SQLite file for the index (':memory:' for a
+                process-local index)
+        """
+        self.index_path = index_path
+        self._lock = threading.Lock()
+        try:
+            self._conn = self._open(index_path)
+        except sqlite3.Error as e:
+            logger.warning(f"CSN index {index_path} not writable ({e}) - using in-memory index")
+            self.index_path = ':memory:'
+            self._conn = self._open(':memory:')
+
+    @staticmethod
+    def _open(index_path: str) -> sqlite3.Connection:
+        """Open connection and create tables"""
+        conn = sqlite3.connect(index_path, timeout=30, isolation_level=None, check_same_thread=False)
+        conn.executescript("""
+            CREATE TABLE IF NOT EXISTS csn_index_meta (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS csn_index_files (
+                file_name TEXT PRIMARY KEY,
+                mtime_ns INTEGER NOT NULL,
+                size INTEGER NOT NULL,
+                sha256 TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS csn_index_entities (
+                file_name TEXT NOT NULL,
+                ordinal INTEGER NOT NULL,
+                simple_name TEXT NOT NULL,
+                full_name TEXT NOT NULL,
+                byte_offset INTEGER NOT NULL,
+                byte_length INTEGER NOT NULL,
+                metadata_json TEXT NOT NULL,
+                PRIMARY KEY (file_name, ordinal)
+            );
+        """)
+        return conn
+
+    def sync(
+        self,
+        csn_directory: str,
+        extract_metadata: Callable[[str, Dict[str, Any]], Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        Bring the index up to date with the CSN directory
+
+        Args:
+            csn_directory: Directory containing *.json CSN files
+            extract_metadata: (simple_name, entity_definition) -> JSON-serializable
+                metadata, called for entities of changed files only
+
+        Returns:
+            Dict with files_indexed, files_unchanged, files_removed, entities,
+            duration_ms
+        """
+        start = time.perf_counter()
+        stats = {'files_indexed': 0, 'files_unchanged': 0, 'files_removed': 0}
+        directory = os.path.abspath(csn_directory)
+        file_names = sorted(name for name in os.listdir(csn_directory) if name.endswith('.json'))
+
+        with self._lock:
+            conn = self._conn
+            # IMMEDIATE: processes sharing the index file sync one at a time
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._reset_if_incompatible(conn, directory)
+                known = {
+                    row[0]: row[1:]
+                    for row in conn.execute("SELECT file_name, mtime_ns, size, sha256 FROM csn_index_files")
+                }
+
+                for file_name in file_names:
+                    path = os.path.join(csn_directory, file_name)
+                    try:
+                        st = os.stat(path)
+                        previous = known.get(file_name)
+                        if previous is not None and previous[:2] == (st.st_mtime_ns, st.st_size):
+                            stats['files_unchanged'] += 1
+                            continue
+
+                        sha = _file_sha256(path)
+                        if previous is not None and previous[2] == sha:
+                            # Touched but identical content
+                            stats['files_unchanged'] += 1
+                        else:
+                            self._index_file(conn, file_name, path, extract_metadata)
+                            stats['files_indexed'] += 1
+                    except OSError:
+                        continue
+
+                    conn.execute(
+                        "INSERT OR REPLACE INTO csn_index_files (file_name, mtime_ns, size, sha256) "
+                        "VALUES (?, ?, ?, ?)",
+                        (file_name, st.st_mtime_ns, st.st_size, sha)
+                    )
+
+                for file_name in set(known) - set(file_names):
+                    conn.execute("DELETE FROM csn_index_entities WHERE file_name = ?", (file_name,))
+                    conn.execute("DELETE FROM csn_index_files WHERE file_name = ?", (file_name,))
+                    stats['files_removed'] += 1
+
+                stats['entities'] = conn.execute("SELECT COUNT(*) FROM csn_index_entities").fetchone()[0]
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+
+        stats['duration_ms'] = round((time.perf_counter() - start) * 1000, 2)
+        if stats['files_indexed'] or stats['files_removed']:
+            logger.info(f"CSN index {self.index_path} synced: {stats}")
+        return stats
+
+    def load_entities(self, csn_directory: str) -> Dict[str, IndexedEntity]:
+        """
+        Load entity locations keyed by simple name
+
+        Duplicate simple names resolve like the original directory scan:
+        the first definition within a file, the last file in name order.
+
+        Args:
+            csn_directory: Directory the file names are relative to
+
+        Returns:
+            Dict simple_name -> IndexedEntity
+        """
+        with self._lock:
+            rows = self._conn.execute("""
+                SELECT simple_name, full_name, file_name, byte_offset, byte_length
+                FROM csn_index_entities
+                ORDER BY file_name, ordinal
+            """).fetchall()
+
+        entities: Dict[str, IndexedEntity] = {}
+        seen_in_file = set()
+        for simple_name, full_name, file_name, byte_offset, byte_length in rows:
+            if (file_name, simple_name) in seen_in_file:
+                continue
+            seen_in_file.add((file_name, simple_name))
+            entities[simple_name] = IndexedEntity(
+                simple_name=simple_name,
+                full_name=full_name,
+                file_path=os.path.join(csn_directory, file_name),
+                byte_offset=byte_offset,
+                byte_length=byte_length
+            )
+        return entities
+
+    def get_metadata(self, entity: IndexedEntity) -> Optional[Dict[str, Any]]:
+        """
+        Get pre-extracted metadata for an entity
+
+        Args:
+            entity: Location from load_entities()
+
+        Returns:
+            Metadata dict (as produced by extract_metadata) or None
+        """
+        with self._lock:
+            row = self._conn.execute("""
+                SELECT metadata_json FROM csn_index_entities
+                WHERE file_name = ? AND full_name = ?
+                ORDER BY ordinal LIMIT 1
+            """, (os.path.basename(entity.file_path), entity.full_name)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    @staticmethod
+    def read_definition(entity: IndexedEntity) -> Dict[str, Any]:
+        """
+        Read and parse only the entity's definition from its CSN file
+
+        Args:
+            entity: Location from load_entities()
+
+        Returns:
+            Entity definition dict
+
+        Raises:
+            OSError, ValueError: If the file changed since the last sync
+        """
+        with open(entity.file_path, 'rb') as f:
+            f.seek(entity.byte_offset)
+            return json.loads(f.read(entity.byte_length))
+
+    def close(self) -> None:
+        """Close the index connection"""
+        with self._lock:
+            self._conn.close()
+
+    def _reset_if_incompatible(self, conn: sqlite3.Connection, directory: str) -> None:
+        """Drop index content built by another format version or for another directory"""
+        meta = dict(conn.execute("SELECT key, value FROM csn_index_meta"))
+        if meta.get('format_version') == INDEX_FORMAT_VERSION and meta.get('csn_directory') == directory:
+            return
+
+        conn.execute("DELETE FROM csn_index_entities")
+        conn.execute("DELETE FROM csn_index_files")
+        conn.executemany(
+            "INSERT OR REPLACE INTO csn_index_meta (key, value) VALUES (?, ?)",
+            [('format_version', INDEX_FORMAT_VERSION), ('csn_directory', directory)]
+        )
+
+    @staticmethod
+    def _index_file(
+        conn: sqlite3.Connection,
+        file_name: str,
+        path: str,
+        extract_metadata: Callable[[str, Dict[str, Any]], Dict[str, Any]]
+    ) -> None:
+        """Replace the entity rows of one file (streamed, one definition at a time)"""
+        conn.execute("DELETE FROM csn_index_entities WHERE file_name = ?", (file_name,))
+        rows = []
+        try:
+            for full_name, definition, offset, length in iter_csn_definitions(path):
+                if not isinstance(definition, dict) or definition.get('kind') != 'entity':
+                    continue
+                # Simple entity name (e.g., "PurchaseOrder" not "purchaseorder.PurchaseOrder")
+                simple_name = full_name.split('.')[-1]
+                rows.append((
+                    file_name,
+                    len(rows),
+                    simple_name,
+                    full_name,
+                    offset,
+                    length,
+                    json.dumps(extract_metadata(simple_name, definition), separators=(',', ':'))
+                ))
+        except ValueError as e:
+            # Unparseable file: indexed with no entities until its content changes
+            logger.warning(f"Skipping CSN file {file_name}: {e}")
+            rows = []
+
+        conn.executemany("""
+            INSERT INTO csn_index_entities (
+                file_name, ordinal, simple_name, full_name, byte_offset, byte_length, metadata_json
+            ) VALUES (?, ?, ?, ?, ?, ?, ?)
+        """, rows)
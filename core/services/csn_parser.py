@@ -11,16 +11,31 @@ Efficiently extracts metadata from SAP CSN JSON files:
 - Display Labels and Descriptions
 
 Performance optimized for large CSN files with lazy loading and caching.
+CSN files are never loaded whole: definitions are streamed one at a time
+(see csn_stream_reader).
+Entity locations and metadata come from a compiled index persisted next to
+the CSN files (see csn_index_store), so a new process does not re-parse
+unchanged CSN files.
 """
 
-import json
+import logging
 import os
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, field
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterator, List, Optional, Any, Tuple
+from dataclasses import asdict, dataclass, field
 from functools import lru_cache
 
+from core.services.csn_index_store import CSNIndexStore, IndexedEntity, DEFAULT_INDEX_FILENAME
+from core.services.csn_stream_reader import iter_csn_entities
 
-@dataclass
+logger = logging.getLogger(__name__)
+
+
+# Metadata objects are frozen and memoized per parser: they are shared by all
+# callers (and threads), so nested dicts must be treated as read-only.
+
+@dataclass(frozen=True)
 class ColumnMetadata:
     """Column metadata extracted from CSN with semantic annotations"""
     name: str
@@ -37,25 +52,25 @@ class ColumnMetadata:
     all_annotations: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(frozen=True)
 class AssociationMetadata:
     """Association/relationship metadata from CSN"""
     name: str
     target: str  # Target entity name
     cardinality: str  # "one", "many", etc.
-    keys: List[Dict[str, str]]  # Foreign key mappings
-    on_conditions: List[Dict[str, str]] = field(default_factory=list)  # JOIN ON conditions
+    keys: Tuple[Dict[str, str], ...]  # Foreign key mappings
+    on_conditions: Tuple[Dict[str, str], ...] = ()  # JOIN ON conditions
 
 
-@dataclass
+@dataclass(frozen=True)
 class EntityMetadata:
     """Complete entity metadata from CSN"""
     name: str
     original_name: str  # ABAP original name
     label: Optional[str]
-    columns: List[ColumnMetadata]
-    primary_keys: List[str]
-    associations: List[AssociationMetadata]
+    columns: Tuple[ColumnMetadata, ...]
+    primary_keys: Tuple[str, ...]
+    associations: Tuple[AssociationMetadata, ...]
     kind: str  # "entity", "context", etc.
 
 
@@ -70,84 +85,79 @@ class CSNParser:
         fks = parser.get_foreign_keys('PurchaseOrder')
     """
     
-    def __init__(self, csn_directory: str = 'docs/csn'):
+    METADATA_MEMO_SIZE = 1024
+    
+    def __init__(
+        self,
+        csn_directory: str = 'docs/csn',
+        index_path: Optional[str] = None,
+        persist_index: bool = True
+    ):
         """
         Initialize CSN parser
         
         Args:
             csn_directory: Path to directory containing CSN JSON files
+            index_path: Compiled index file (default: <csn_directory>/.csn_index.db)
+            persist_index: False keeps the compiled index in memory only
         """
         self.csn_directory = csn_directory
+        self.index_path = index_path
+        self.persist_index = persist_index
         self._file_cache: Dict[str, Any] = {}
         self._entity_index: Optional[Dict[str, str]] = None  # entity_name -> file_path
+        self._entity_locations: Dict[str, IndexedEntity] = {}
+        self._index_store: Optional[CSNIndexStore] = None
+        # entity_name -> EntityMetadata (bounded LRU, immutable values)
+        self._metadata_memo: "OrderedDict[str, EntityMetadata]" = OrderedDict()
+        self._memo_lock = threading.Lock()
     
     def _build_entity_index(self) -> Dict[str, str]:
         """
         Build index of entity names to CSN files (lazy)
         
+        Syncs the compiled index (re-parses only changed CSN files) and
+        loads entity locations from it.
+        
         Returns:
             Dictionary mapping entity names to file paths
         """
         if self._entity_index is not None:
             return self._entity_index
         
-        index = {}
-        
         if not os.path.exists(self.csn_directory):
-            return index
-        
-        # Scan all CSN files
-        for filename in os.listdir(self.csn_directory):
-            if not filename.endswith('.json'):
-                continue
-            
-            filepath = os.path.join(self.csn_directory, filename)
-            
-            # Quick scan for entity names (avoid full parse)
-            try:
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    
-                # CSN format: array with definitions
-                if isinstance(data, list) and len(data) > 0:
-                    definitions = data[0].get('definitions', {})
-                    
-                    for entity_name, entity_def in definitions.items():
-                        if entity_def.get('kind') == 'entity':
-                            # Store simple entity name (e.g., "PurchaseOrder" not "purchaseorder.PurchaseOrder")
-                            simple_name = entity_name.split('.')[-1]
-                            index[simple_name] = filepath
-                            
-            except (json.JSONDecodeError, IOError):
-                continue
-        
-        self._entity_index = index
-        return index
+            return {}
+        
+        store = self._get_index_store()
+        store.sync(self.csn_directory, self._extract_indexed_metadata)
+        self._entity_locations = store.load_entities(self.csn_directory)
+        self._entity_index = {
+            name: location.file_path
+            for name, location in self._entity_locations.items()
+        }
+        return self._entity_index
     
-    @lru_cache(maxsize=32)
-    def _load_csn_file(self, filepath: str) -> Optional[Dict]:
-        """
-        Load and cache CSN file (with LRU eviction)
-        
-        Args:
-            filepath: Path to CSN JSON file
-            
-        Returns:
-            Parsed CSN data or None if error
-        """
-        try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                # Return first element if array
-                return data[0] if isinstance(data, list) and len(data) > 0 else data
-        except (json.JSONDecodeError, IOError) as e:
-            print(f"Error loading CSN file {filepath}: {e}")
-            return None
+    def _get_index_store(self) -> CSNIndexStore:
+        """Open the compiled index (once per parser)"""
+        if self._index_store is None:
+            if not self.persist_index:
+                path = ':memory:'
+            else:
+                path = self.index_path or os.path.join(self.csn_directory, DEFAULT_INDEX_FILENAME)
+            self._index_store = CSNIndexStore(path)
+        return self._index_store
+    
+    def _extract_indexed_metadata(self, entity_name: str, entity_def: Dict) -> Dict[str, Any]:
+        """EntityMetadata for the compiled index (JSON-serializable)"""
+        return asdict(self._build_entity_metadata(entity_name, entity_def))
     
-    def _find_entity_definition(self, entity_name: str) -> Optional[tuple[Dict, str]]:
+    def _find_entity_definition(self, entity_name: str) -> Optional[Tuple[Dict, str]]:
         """
         Find entity definition in CSN files
         
+        Reads only the definition's byte span recorded in the compiled
+        index; falls back to streaming the file if it changed since.
+        
         Args:
             entity_name: Simple entity name (e.g., "PurchaseOrder")
             
@@ -160,19 +170,44 @@ class CSNParser:
         if not filepath:
             return None
         
-        csn_data = self._load_csn_file(filepath)
-        if not csn_data:
+        location = self._entity_locations[entity_name]
+        try:
+            entity_def = CSNIndexStore.read_definition(location)
+            if isinstance(entity_def, dict) and entity_def.get('kind') == 'entity':
+                return entity_def, location.full_name
+        except (OSError, ValueError):
+            pass
+        
+        full_name = self._entity_names_in_file(filepath).get(entity_name)
+        if full_name is None:
             return None
-        
-        definitions = csn_data.get('definitions', {})
-        
-        # Find entity (match on simple name)
-        for full_name, entity_def in definitions.items():
-            if entity_def.get('kind') == 'entity' and full_name.endswith(entity_name):
-                return entity_def, full_name
-        
+        try:
+            for name, entity_def in iter_csn_entities(filepath):
+                if name == full_name:
+                    return entity_def, full_name
+        except (OSError, ValueError) as e:
+            logger.warning(f"Error reading CSN file {filepath}: {e}")
         return None
     
+    @lru_cache(maxsize=32)
+    def _entity_names_in_file(self, filepath: str) -> Dict[str, str]:
+        """
+        Simple -> full entity name map for one CSN file (built once per file)
+        
+        Args:
+            filepath: Path to CSN JSON file
+            
+        Returns:
+            Dict mapping simple names to full names (first definition wins)
+        """
+        names: Dict[str, str] = {}
+        try:
+            for full_name, _ in iter_csn_entities(filepath):
+                names.setdefault(full_name.split('.')[-1], full_name)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Error reading CSN file {filepath}: {e}")
+        return names
+    
     def _extract_column_metadata(self, col_name: str, col_def: Dict) -> ColumnMetadata:
         """
         Extract column metadata with complete semantic annotations (HIGH-30)
@@ -325,26 +360,63 @@ class CSNParser:
             name=element_name,
             target=target,
             cardinality=cardinality,
-            keys=keys,
-            on_conditions=join_conditions
+            keys=tuple(keys),
+            on_conditions=tuple(join_conditions)
         )
     
     def get_entity_metadata(self, entity_name: str) -> Optional[EntityMetadata]:
         """
-        Get complete metadata for an entity
+        Get complete metadata for an entity (memoized)
         
         Args:
             entity_name: Simple entity name (e.g., "PurchaseOrder")
             
         Returns:
-            EntityMetadata object or None if not found
+            Immutable EntityMetadata (shared - do not modify nested dicts)
+            or None if not found
         """
+        with self._memo_lock:
+            metadata = self._metadata_memo.get(entity_name)
+            if metadata is not None:
+                self._metadata_memo.move_to_end(entity_name)
+                return metadata
+        
+        metadata = self._load_entity_metadata(entity_name)
+        if metadata is None:
+            return None
+        
+        with self._memo_lock:
+            self._metadata_memo[entity_name] = metadata
+            while len(self._metadata_memo) > self.METADATA_MEMO_SIZE:
+                self._metadata_memo.popitem(last=False)
+        return metadata
+    
+    def _load_entity_metadata(self, entity_name: str) -> Optional[EntityMetadata]:
+        """Metadata from the compiled index, else extracted from the definition"""
+        index = self._build_entity_index()
+        if entity_name in index:
+            metadata = self._index_store.get_metadata(self._entity_locations[entity_name])
+            if metadata is not None:
+                return self._entity_metadata_from_dict(metadata)
+        
         result = self._find_entity_definition(entity_name)
         if not result:
             return None
         
         entity_def, full_name = result
+        return self._build_entity_metadata(entity_name, entity_def)
+    
+    def _build_entity_metadata(self, entity_name: str, entity_def: Dict) -> EntityMetadata:
+        """
+        Extract EntityMetadata from an entity definition
         
+        Args:
+            entity_name: Simple entity name
+            entity_def: Entity definition from CSN
+            
+        Returns:
+            EntityMetadata object
+        """
         # Extract columns with semantic annotations
         columns = []
         primary_keys = []
@@ -377,12 +449,34 @@ class CSNParser:
             name=entity_name,
             original_name=entity_def.get('__abapOriginalName', entity_name),
             label=entity_def.get('@EndUserText.label'),
-            columns=columns,
-            primary_keys=primary_keys,
-            associations=associations,
+            columns=tuple(columns),
+            primary_keys=tuple(primary_keys),
+            associations=tuple(associations),
             kind=entity_def.get('kind', 'entity')
         )
     
+    @staticmethod
+    def _entity_metadata_from_dict(data: Dict[str, Any]) -> EntityMetadata:
+        """Rebuild EntityMetadata from its compiled-index form"""
+        return EntityMetadata(
+            name=data['name'],
+            original_name=data['original_name'],
+            label=data['label'],
+            columns=tuple(ColumnMetadata(**column) for column in data['columns']),
+            primary_keys=tuple(data['primary_keys']),
+            associations=tuple(
+                AssociationMetadata(
+                    name=assoc['name'],
+                    target=assoc['target'],
+                    cardinality=assoc['cardinality'],
+                    keys=tuple(assoc['keys']),
+                    on_conditions=tuple(assoc['on_conditions'])
+                )
+                for assoc in data['associations']
+            ),
+            kind=data['kind']
+        )
+    
     def get_primary_keys(self, entity_name: str) -> List[str]:
         """
         Get primary key column names for an entity
@@ -394,7 +488,7 @@ class CSNParser:
             List of primary key column names
         """
         metadata = self.get_entity_metadata(entity_name)
-        return metadata.primary_keys if metadata else []
+        return list(metadata.primary_keys) if metadata else []
     
     def get_foreign_keys(self, entity_name: str) -> List[Dict[str, Any]]:
         """
@@ -445,7 +539,7 @@ class CSNParser:
                 'target': assoc.target,
                 'cardinality': assoc.cardinality,
                 'type': 'foreign_key' if assoc.cardinality == 'one' else 'navigation',
-                'on_conditions': assoc.on_conditions
+                'on_conditions': [dict(condition) for condition in assoc.on_conditions]
             }
             for assoc in metadata.associations
         ]
@@ -481,11 +575,51 @@ class CSNParser:
         index = self._build_entity_index()
         return sorted(index.keys())
     
+    def list_entities_by_file(self) -> Dict[str, List[str]]:
+        """
+        Group entity names by the CSN file defining them
+        
+        Returns:
+            Dict mapping file path to sorted entity names (files sorted by path)
+        """
+        groups: Dict[str, List[str]] = {}
+        for entity_name, filepath in sorted(self._build_entity_index().items()):
+            groups.setdefault(filepath, []).append(entity_name)
+        return dict(sorted(groups.items()))
+    
+    def iter_entity_definitions(self) -> Iterator[Tuple[str, str, Dict[str, Any]]]:
+        """
+        Stream raw entity definitions, one CSN file and one entity at a time
+        
+        Sequential alternative to calling _find_entity_definition() per
+        entity: each file is read once, front to back, and only the current
+        definition is held in memory.
+        
+        Yields:
+            Tuple of (simple_name, full_name, entity_definition) for every
+            entity in list_entities(), grouped by file
+        """
+        index = self._build_entity_index()
+        for filepath in sorted(set(index.values())):
+            seen = set()
+            try:
+                for full_name, entity_def in iter_csn_entities(filepath):
+                    simple_name = full_name.split('.')[-1]
+                    if simple_name in seen or index.get(simple_name) != filepath:
+                        continue
+                    seen.add(simple_name)
+                    yield simple_name, full_name, entity_def
+            except (OSError, ValueError) as e:
+                logger.warning(f"Error reading CSN file {filepath}: {e}")
+    
     def clear_cache(self):
         """Clear all caches (useful for testing or reloading)"""
         self._file_cache.clear()
         self._entity_index = None
-        self._load_csn_file.cache_clear()
+        self._entity_locations = {}
+        with self._memo_lock:
+            self._metadata_memo.clear()
+        self._entity_names_in_file.cache_clear()
 
 
 # Singleton instance for convenience
@@ -0,0 +1,266 @@
+"""
+Streaming CSN Reader
+
+Reads the definitions of a CSN JSON document one at a time instead of
+json.load()-ing the whole file. S/4HANA CSN exports are tens of MB each;
+with this reader peak memory is one read chunk plus the definition being
+decoded, independent of the file size.
+
+Two entry points:
+- iter_csn_definitions(): (full_name, definition, byte_offset, byte_length)
+  per definition, pure Python. Byte spans feed the compiled CSN index.
+- iter_csn_entities(): (full_name, definition) per entity. Uses the
+  event-driven ijson parser when it is installed (optional, >= 3.1) and
+  falls back to the pure-Python scanner otherwise.
+
+Both handle the two CSN layouts used in docs/csn: a top-level object and a
+list whose first element is the document. Top-level sections other than
+'definitions' (meta, i18n, ...) are skipped without being materialized.
+
+@author P2P Development Team
+@version 1.0.0
+"""
+
+import codecs
+import json
+import os
+import re
+from typing import Any, BinaryIO, Dict, Iterator, NamedTuple, Tuple, Union
+
+try:
+    import ijson  # Optional accelerator (C backend when available)
+except ImportError:
+    ijson = None
+
+# Backend used by iter_csn_entities()
+STREAM_BACKEND = 'ijson' if ijson is not None else 'python'
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+_BOM = b'\xef\xbb\xbf'
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+_STRUCTURE = re.compile(r'["\[\]{}]')
+_STRING_BODY = re.compile(r'(?:[^"\\]+|\\.)*', re.DOTALL)
+
+CSNSource = Union[str, 'os.PathLike[str]', BinaryIO]
+
+
+class CSNDefinition(NamedTuple):
+    """One definition of a CSN document and its byte span in the source"""
+    full_name: str
+    definition: Dict[str, Any]
+    byte_offset: int
+    byte_length: int
+
+
+def iter_csn_definitions(source: CSNSource, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[CSNDefinition]:
+    """
+    Stream the definitions of a CSN document with their byte spans
+
+    Args:
+        source: Path to a CSN file or a binary file object (UTF-8,
+            optional BOM)
+        chunk_size: Bytes read per chunk
+
+    Yields:
+        CSNDefinition per entry of 'definitions', in document order
+
+    Raises:
+        ValueError: If the content is not a CSN JSON document
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, 'rb') as f:
+            yield from _CSNStreamScanner(f, chunk_size).definitions()
+    else:
+        yield from _CSNStreamScanner(source, chunk_size).definitions()
+
+
+def iter_csn_entities(source: CSNSource, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """
+    Stream the entity definitions (kind == 'entity') of a CSN document
+
+    Args:
+        source: Path to a CSN file or a binary file object
+        chunk_size: Bytes read per chunk (pure-Python backend)
+
+    Yields:
+        (full_name, entity_definition) in document order
+
+    Raises:
+        ValueError: If the content is not a CSN JSON document
+    """
+    if ijson is not None and isinstance(source, (str, os.PathLike)):
+        definitions = _iter_with_ijson(source)
+    else:
+        definitions = (
+            (item.full_name, item.definition)
+            for item in iter_csn_definitions(source, chunk_size)
+        )
+
+    for full_name, definition in definitions:
+        if isinstance(definition, dict) and definition.get('kind') == 'entity':
+            yield full_name, definition
+
+
+def _iter_with_ijson(path: CSNSource) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """Event-driven parse via ijson (only used when ijson is installed)"""
+    with open(path, 'rb') as f:
+        head = f.read(1024)
+        offset = len(_BOM) if head.startswith(_BOM) else 0
+        prefix = 'item.definitions' if head[offset:].lstrip().startswith(b'[') else 'definitions'
+        f.seek(offset)
+        try:
+            yield from ijson.kvitems(f, prefix, use_float=True)
+        except ijson.JSONError as e:
+            raise ValueError(f"Invalid CSN document {path}: {e}") from e
+
+
+class _CSNStreamScanner:
+    """
+    Incremental scanner over a CSN document
+
+    Keeps a text buffer of the not yet consumed input. Structural tokens
+    are walked by hand; each definition is decoded with json's raw_decode
+    once it is completely buffered. The read size doubles while a single
+    value does not fit, so large definitions are decoded in amortized
+    linear time.
+    """
+
+    def __init__(self, stream: BinaryIO, chunk_size: int):
+        self._stream = stream
+        self._chunk_size = max(int(chunk_size), 16)
+        self._utf8 = codecs.getincrementaldecoder('utf-8')()
+        self._json = json.JSONDecoder()
+        self._buf = ''
+        self._pos = 0
+        self._eof = False
+        self._started = False
+        # Byte offset of _buf[_cursor] (only moves forward)
+        self._cursor = 0
+        self._cursor_byte = 0
+
+    def definitions(self) -> Iterator[CSNDefinition]:
+        """Yield the definitions of the (first) CSN document"""
+        if self._peek() == '[':
+            self._pos += 1
+        self._expect('{')
+
+        while self._peek() != '}':
+            key = self._decode_value()
+            self._expect(':')
+
+            if key == 'definitions':
+                self._expect('{')
+                while self._peek() != '}':
+                    name = self._decode_value()
+                    self._expect(':')
+                    self._peek()
+                    start = self._byte_at(self._pos)
+                    definition = self._decode_value()
+                    yield CSNDefinition(name, definition, start, self._byte_at(self._pos) - start)
+                    self._skip_comma()
+                return
+
+            self._skip_value()
+            self._skip_comma()
+
+    def _fill(self, size: int = 0) -> bool:
+        """Drop consumed text and append the next chunk; False at end of input"""
+        if self._eof:
+            return False
+
+        self._cursor_byte = self._byte_at(self._pos)
+        self._buf = self._buf[self._pos:]
+        self._pos = self._cursor = 0
+
+        raw = self._stream.read(max(size, self._chunk_size))
+        if not self._started:
+            self._started = True
+            if raw.startswith(_BOM):
+                raw = raw[len(_BOM):]
+                self._cursor_byte += len(_BOM)
+        if not raw:
+            self._eof = True
+        try:
+            self._buf += self._utf8.decode(raw, final=self._eof)
+        except UnicodeDecodeError as e:
+            raise ValueError(f"CSN document is not valid UTF-8: {e}") from e
+        return bool(raw)
+
+    def _byte_at(self, index: int) -> int:
+        """Byte offset in the source of buffer position index"""
+        consumed = self._buf[self._cursor:index]
+        self._cursor_byte += len(consumed) if consumed.isascii() else len(consumed.encode('utf-8'))
+        self._cursor = index
+        return self._cursor_byte
+
+    def _peek(self) -> str:
+        """Skip whitespace and return the next character ('' at end of input)"""
+        while True:
+            self._pos = _WHITESPACE.match(self._buf, self._pos).end()
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                return ''
+
+    def _expect(self, char: str) -> None:
+        if self._peek() != char:
+            raise ValueError(f"Expected '{char}' at byte {self._byte_at(self._pos)}")
+        self._pos += 1
+
+    def _skip_comma(self) -> None:
+        if self._peek() == ',':
+            self._pos += 1
+
+    def _decode_value(self) -> Any:
+        """Decode the JSON value at the current position, reading more input as needed"""
+        self._peek()
+        while True:
+            try:
+                value, end = self._json.raw_decode(self._buf, self._pos)
+                # A number may continue in the next chunk
+                if end < len(self._buf) or self._eof:
+                    self._pos = end
+                    return value
+            except ValueError:
+                if self._eof:
+                    raise
+            # Incomplete value: grow the buffer geometrically
+            self._fill(len(self._buf) - self._pos)
+
+    def _skip_value(self) -> None:
+        """Skip the value at the current position without materializing it"""
+        if self._peek() not in ('{', '['):
+            self._decode_value()
+            return
+
+        depth = 0
+        while True:
+            match = _STRUCTURE.search(self._buf, self._pos)
+            if match is None:
+                self._pos = len(self._buf)
+                if not self._fill():
+                    raise ValueError('Unexpected end of CSN document')
+                continue
+
+            char = match.group()
+            self._pos = match.end()
+            if char == '"':
+                self._skip_string_body()
+            elif char in '{[':
+                depth += 1
+            else:
+                depth -= 1
+                if depth == 0:
+                    return
+
+    def _skip_string_body(self) -> None:
+        """Advance past the closing quote of the string being skipped"""
+        while True:
+            self._pos = _STRING_BODY.match(self._buf, self._pos).end()
+            if self._pos < len(self._buf) and self._buf[self._pos] == '"':
+                self._pos += 1
+                return
+            # End of buffer (possibly right after a backslash)
+            if not self._fill():
+                raise ValueError('Unterminated string in CSN document')
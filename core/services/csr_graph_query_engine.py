@@ -0,0 +1,619 @@
+"""
+CSR Graph Query Engine
+
+Compressed-sparse-row implementation of IGraphQueryEngine for large
+SQLite graphs. Where NetworkXGraphQueryEngine keeps a dict-of-dicts
+DiGraph (~1 KB per edge), this engine keeps:
+
+- node ids interned to positions (one str per node)
+- CSR (outgoing) and CSC (incoming) adjacency as NumPy int arrays
+- one small integer edge-type code per edge
+- edge labels / properties as interned strings, decoded on demand
+
+Traversals work level by level on whole frontiers (array gathers instead
+of per-node dict walks); path search runs graph_path_search's bounded
+bidirectional BFS over array slices; edge-type filters are bitmasks over
+the type codes; PageRank is a sparse power iteration (bincount over edges).
+
+Requires NumPy (optional dependency: GraphQueryService only selects this
+engine when NumPy is installed).
+
+@author P2P Development Team
+@version 1.2.0
+"""
+
+import json
+import threading
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np  # Optional dependency
+except ImportError:
+    np = None
+
+from core.interfaces.graph_query import (
+    IGraphQueryEngine,
+    GraphNode,
+    GraphEdge,
+    GraphPath,
+    Subgraph,
+    TraversalDirection
+)
+from core.services.database_connection_factory import get_connection_pool
+from core.services.graph_path_search import bidirectional_shortest_path, k_shortest_paths
+
+# Whether this engine can be used in this environment
+CSR_AVAILABLE = np is not None
+
+
+class CSRGraphQueryEngine(IGraphQueryEngine):
+    """
+    NumPy CSR/CSC graph query engine over graph_edges.
+
+    Semantics follow NetworkXGraphQueryEngine (same node ids, node
+    attributes derived from "Table:Id" keys, edge attributes = properties
+    + label/type/source_table/target_table). Parallel rows between the
+    same pair stay separate edges internally, so edge-type filters see
+    every type instead of the last row's; counts and PageRank use the
+    distinct pairs like the DiGraph.
+
+    Example:
+        engine = CSRGraphQueryEngine('database/p2p_graph.db')
+        engine.traverse('Supplier:SUP001', depth=3)
+        engine.get_pagerank(top_k=10)
+    """
+
+    LOAD_BATCH_SIZE = 50_000
+    _RESERVED_EDGE_ATTRS = ('source_table', 'target_table', 'label', 'type')
+
+    def __init__(self, db_path: str, auto_load: bool = True):
+        """
+        Initialize engine.
+
+        Args:
+            db_path: Path to SQLite database with graph_edges
+            auto_load: If True, load graph immediately
+
+        Raises:
+            ImportError: If NumPy is not installed
+        """
+        if np is None:
+            raise ImportError("CSRGraphQueryEngine requires numpy")
+
+        self.db_path = db_path
+        self._lock = threading.RLock()
+        self._loaded = False
+        self._load_time: Optional[float] = None
+
+        if auto_load:
+            self._ensure_graph_loaded()
+
+    # ========================================================================
+    # GRAPH LOADING (Internal)
+    # ========================================================================
+
+    def _ensure_graph_loaded(self) -> None:
+        """Load graph_edges into CSR/CSC arrays (once)"""
+        if self._loaded:
+            return
+        with self._lock:
+            if self._loaded:
+                return
+            start_time = datetime.now()
+
+            node_index: Dict[str, int] = {}
+            strings: Dict[Optional[str], int] = {None: -1}
+            sources: List[int] = []
+            targets: List[int] = []
+            types: List[int] = []
+            labels: List[int] = []
+            properties: List[int] = []
+            type_codes: Dict[str, int] = {}
+
+            with get_connection_pool(self.db_path).connection() as conn:
+                cursor = conn.execute("""
+                    SELECT from_node_key, to_node_key, edge_type, edge_label, properties_json
+                    FROM graph_edges
+                    ORDER BY edge_id
+                """)
+                while True:
+                    rows = cursor.fetchmany(self.LOAD_BATCH_SIZE)
+                    if not rows:
+                        break
+                    for from_key, to_key, edge_type, edge_label, props_json in rows:
+                        source = node_index.setdefault(from_key, len(node_index))
+                        target = node_index.setdefault(to_key, len(node_index))
+                        sources.append(source)
+                        targets.append(target)
+                        types.append(type_codes.setdefault(edge_type, len(type_codes)))
+                        labels.append(strings.setdefault(edge_label, len(strings) - 1))
+                        properties.append(strings.setdefault(props_json or None, len(strings) - 1))
+
+            self._node_index = node_index
+            self._node_ids: List[str] = list(node_index)
+            self._type_names: List[Optional[str]] = list(type_codes)
+            self._type_codes = type_codes
+            self._strings: List[str] = [s for s in strings if s is not None]
+
+            node_count = len(self._node_ids)
+            src = np.asarray(sources, dtype=np.int32)
+            dst = np.asarray(targets, dtype=np.int32)
+            self._edge_source = src
+            self._edge_target = dst
+            self._edge_type = np.asarray(types, dtype=np.uint16 if len(type_codes) > 255 else np.uint8)
+            self._edge_label = np.asarray(labels, dtype=np.int32)
+            self._edge_properties = np.asarray(properties, dtype=np.int32)
+
+            # CSR (outgoing) and CSC (incoming): edge positions grouped by node
+            self._out_ptr, self._out_edges = self._compress(src, node_count)
+            self._in_ptr, self._in_edges = self._compress(dst, node_count)
+            self._out_neighbors = dst[self._out_edges]
+            self._in_neighbors = src[self._in_edges]
+            self._pairs = None
+
+            self._loaded = True
+            self._load_time = (datetime.now() - start_time).total_seconds()
+            print(f"[CSR] Loaded {node_count} nodes, {len(src)} edges in {self._load_time*1000:.0f}ms")
+
+    @staticmethod
+    def _compress(keys: 'np.ndarray', node_count: int) -> Tuple['np.ndarray', 'np.ndarray']:
+        """
+        Group edge positions by key node
+
+        Returns:
+            (indptr int64[node_count + 1], edge positions int32 sorted by key, stable)
+        """
+        order = np.argsort(keys, kind='stable').astype(np.int32)
+        indptr = np.zeros(node_count + 1, dtype=np.int64)
+        np.cumsum(np.bincount(keys, minlength=node_count), out=indptr[1:])
+        return indptr, order
+
+    # ========================================================================
+    # VECTORIZED PRIMITIVES
+    # ========================================================================
+
+    def _type_mask(self, edge_types: Optional[Sequence[str]]) -> Optional['np.ndarray']:
+        """
+        Edge-type bitmask as a lookup table over type codes
+
+        Returns:
+            Boolean array indexed by type code (None = no filter)
+        """
+        if not edge_types:
+            return None
+        mask = 0
+        for edge_type in edge_types:
+            code = self._type_codes.get(edge_type)
+            if code is not None:
+                mask |= 1 << code
+        return np.array([(mask >> code) & 1 for code in range(len(self._type_names))], dtype=bool)
+
+    def _expand(
+        self,
+        frontier: 'np.ndarray',
+        direction: TraversalDirection,
+        type_mask: Optional['np.ndarray']
+    ) -> Tuple['np.ndarray', 'np.ndarray', 'np.ndarray']:
+        """
+        All edges leaving a frontier (one gather, no per-node loop)
+
+        Args:
+            frontier: Node positions
+            direction: Which adjacency to follow
+            type_mask: Edge-type filter (None = all)
+
+        Returns:
+            (from positions, neighbor positions, edge positions), one entry per edge
+        """
+        parts = []
+        if direction in (TraversalDirection.OUTGOING, TraversalDirection.BOTH):
+            parts.append(self._gather(frontier, self._out_ptr, self._out_edges, self._out_neighbors))
+        if direction in (TraversalDirection.INCOMING, TraversalDirection.BOTH):
+            parts.append(self._gather(frontier, self._in_ptr, self._in_edges, self._in_neighbors))
+
+        if len(parts) == 1:
+            origins, neighbors, edges = parts[0]
+        else:
+            origins, neighbors, edges = (np.concatenate(arrays) for arrays in zip(*parts))
+
+        if type_mask is not None and len(edges):
+            keep = type_mask[self._edge_type[edges]]
+            origins, neighbors, edges = origins[keep], neighbors[keep], edges[keep]
+        return origins, neighbors, edges
+
+    @staticmethod
+    def _gather(
+        frontier: 'np.ndarray',
+        indptr: 'np.ndarray',
+        edge_positions: 'np.ndarray',
+        neighbors: 'np.ndarray'
+    ) -> Tuple['np.ndarray', 'np.ndarray', 'np.ndarray']:
+        """Concatenate the adjacency slices of all frontier nodes"""
+        starts = indptr[frontier]
+        counts = indptr[frontier + 1] - starts
+        total = int(counts.sum())
+        if total == 0:
+            empty = np.empty(0, dtype=np.int32)
+            return empty, empty, empty
+        # Slot i of the result reads CSR position starts[k] + (i - first slot of k)
+        offsets = np.repeat(starts - (np.cumsum(counts) - counts), counts)
+        slots = offsets + np.arange(total, dtype=np.int64)
+        return np.repeat(frontier, counts), neighbors[slots], edge_positions[slots]
+
+    def _bfs_levels(
+        self,
+        seeds: 'np.ndarray',
+        depth: int,
+        direction: TraversalDirection,
+        type_mask: Optional['np.ndarray']
+    ) -> List['np.ndarray']:
+        """
+        Level-synchronous BFS
+
+        Args:
+            seeds: Start positions (level 0)
+            depth: Maximum number of hops
+            direction: Traversal direction
+            type_mask: Edge-type filter
+
+        Returns:
+            Node positions per level (each node in the first level reaching it)
+        """
+        visited = np.zeros(len(self._node_ids), dtype=bool)
+        visited[seeds] = True
+        levels = [seeds]
+        frontier = seeds
+        for _ in range(depth):
+            _, neighbors, _ = self._expand(frontier, direction, type_mask)
+            neighbors = neighbors[~visited[neighbors]]
+            if not len(neighbors):
+                break
+            frontier = np.unique(neighbors)
+            visited[frontier] = True
+            levels.append(frontier)
+        return levels
+
+    def _adjacency(
+        self,
+        type_mask: Optional['np.ndarray']
+    ) -> Tuple[Callable[[int], List[int]], Callable[[int], List[int]]]:
+        """Successor / predecessor callables over positions for graph_path_search"""
+        def neighbors_of(indptr, edge_positions, neighbors):
+            def lookup(position: int) -> List[int]:
+                start, end = indptr[position], indptr[position + 1]
+                adjacent = neighbors[start:end]
+                if type_mask is not None:
+                    adjacent = adjacent[type_mask[self._edge_type[edge_positions[start:end]]]]
+                return np.unique(adjacent).tolist()
+            return lookup
+
+        return (
+            neighbors_of(self._out_ptr, self._out_edges, self._out_neighbors),
+            neighbors_of(self._in_ptr, self._in_edges, self._in_neighbors)
+        )
+
+    def _pair_edge(self, source: int, target: int, type_mask: Optional['np.ndarray']) -> int:
+        """Newest edge row source -> target (allowed by the type mask), like the DiGraph's"""
+        start, end = self._out_ptr[source], self._out_ptr[source + 1]
+        edges = self._out_edges[start:end][self._out_neighbors[start:end] == target]
+        if type_mask is not None:
+            edges = edges[type_mask[self._edge_type[edges]]]
+        return int(edges.max())
+
+    def _unique_pairs(self) -> Tuple['np.ndarray', 'np.ndarray']:
+        """Distinct (source, target) position pairs (cached until reload)"""
+        if self._pairs is None:
+            n = max(len(self._node_ids), 1)
+            pairs = np.unique(self._edge_source.astype(np.int64) * n + self._edge_target)
+            self._pairs = ((pairs // n).astype(np.int32), (pairs % n).astype(np.int32))
+        return self._pairs
+
+    # ========================================================================
+    # RESULT CONVERSION
+    # ========================================================================
+
+    def _node(self, position: int) -> GraphNode:
+        """GraphNode for a node position (attributes derived from its key)"""
+        node_id = self._node_ids[position]
+        table, sep, record_id = node_id.partition(':')
+        return GraphNode(
+            id=node_id,
+            label=table,
+            properties={'label': table, 'table': table, 'record_id': record_id if sep else node_id}
+        )
+
+    def _edge_attrs(self, edge: int) -> Dict[str, Any]:
+        """Edge attributes like NetworkXGraphQueryEngine (decoded on demand)"""
+        attrs: Dict[str, Any] = {}
+        properties_index = int(self._edge_properties[edge])
+        if properties_index >= 0:
+            try:
+                decoded = json.loads(self._strings[properties_index])
+                attrs = {k: v for k, v in decoded.items() if k not in self._RESERVED_EDGE_ATTRS}
+            except (ValueError, AttributeError):
+                pass
+        label_index = int(self._edge_label[edge])
+        edge_type = self._type_names[int(self._edge_type[edge])]
+        attrs.update(
+            label=(self._strings[label_index] if label_index >= 0 else None) or edge_type,
+            type=edge_type,
+            source_table=self._node_ids[int(self._edge_source[edge])].partition(':')[0],
+            target_table=self._node_ids[int(self._edge_target[edge])].partition(':')[0]
+        )
+        return attrs
+
+    def _graph_edge(self, edge: int) -> GraphEdge:
+        """GraphEdge for an edge position"""
+        src = self._node_ids[int(self._edge_source[edge])]
+        tgt = self._node_ids[int(self._edge_target[edge])]
+        attrs = self._edge_attrs(edge)
+        return GraphEdge(
+            id=f"{src}->{tgt}",
+            source_id=src,
+            target_id=tgt,
+            label=attrs.get('label', 'related'),
+            properties=attrs
+        )
+
+    # ========================================================================
+    # IGraphQueryEngine Implementation
+    # ========================================================================
+
+    def get_neighbors(
+        self,
+        node_id: str,
+        direction: TraversalDirection = TraversalDirection.OUTGOING,
+        edge_types: Optional[List[str]] = None,
+        limit: Optional[int] = None
+    ) -> List[GraphNode]:
+        """Get adjacent nodes (one CSR/CSC slice, type bitmask filter)"""
+        self._ensure_graph_loaded()
+        position = self._node_index.get(node_id)
+        if position is None:
+            return []
+
+        _, neighbors, _ = self._expand(
+            np.array([position], dtype=np.int32), direction, self._type_mask(edge_types)
+        )
+        # Unique neighbors in adjacency order
+        _, first = np.unique(neighbors, return_index=True)
+        neighbors = neighbors[np.sort(first)]
+        if limit:
+            neighbors = neighbors[:limit]
+        return [self._node(int(n)) for n in neighbors]
+
+    def shortest_path(
+        self,
+        start_id: str,
+        end_id: str,
+        max_hops: int = 10
+    ) -> Optional[GraphPath]:
+        """Find shortest path (bounded bidirectional BFS, gives up after max_hops levels)"""
+        paths = self.find_paths(start_id, end_id, max_hops=max_hops)
+        return paths[0] if paths else None
+
+    def find_paths(
+        self,
+        start_id: str,
+        end_id: str,
+        max_hops: int = 10,
+        edge_types: Optional[List[str]] = None,
+        k: int = 1
+    ) -> List[GraphPath]:
+        """Find up to k shortest paths (bounded bidirectional BFS + Yen's algorithm)"""
+        self._ensure_graph_loaded()
+        start = self._node_index.get(start_id)
+        end = self._node_index.get(end_id)
+        if start is None or end is None:
+            return []
+
+        type_mask = self._type_mask(edge_types)
+        if edge_types and not type_mask.any():
+            return []
+        successors, predecessors = self._adjacency(type_mask)
+        if k == 1:
+            path = bidirectional_shortest_path(start, end, successors, predecessors, max_hops)
+            found = [path] if path else []
+        else:
+            found = k_shortest_paths(start, end, successors, predecessors, max_hops, k)
+
+        return [
+            GraphPath(
+                nodes=[self._node(p) for p in positions],
+                edges=[self._graph_edge(self._pair_edge(u, v, type_mask)) for u, v in zip(positions, positions[1:])],
+                length=len(positions) - 1
+            )
+            for positions in found
+        ]
+
+    def traverse(
+        self,
+        start_id: str,
+        depth: int = 2,
+        direction: TraversalDirection = TraversalDirection.OUTGOING,
+        edge_types: Optional[List[str]] = None
+    ) -> List[GraphNode]:
+        """Breadth-first k-hop traversal (whole frontier per level)"""
+        return self.traverse_batch([start_id], depth, direction, edge_types)
+
+    def get_neighbors_batch(
+        self,
+        node_ids: List[str],
+        direction: TraversalDirection = TraversalDirection.OUTGOING,
+        edge_types: Optional[List[str]] = None,
+        limit: Optional[int] = None
+    ) -> Dict[str, List[GraphNode]]:
+        """Get adjacent nodes of many nodes (one gather for all of them)"""
+        self._ensure_graph_loaded()
+        result: Dict[str, List[GraphNode]] = {node_id: [] for node_id in node_ids}
+        positions = [self._node_index[n] for n in result if n in self._node_index]
+        if not positions:
+            return result
+
+        origins, neighbors, _ = self._expand(
+            np.array(positions, dtype=np.int32), direction, self._type_mask(edge_types)
+        )
+        # Group by origin, unique neighbors in adjacency order
+        pairs = origins.astype(np.int64) * len(self._node_ids) + neighbors
+        _, first = np.unique(pairs, return_index=True)
+        first.sort()
+        for origin, neighbor in zip(origins[first].tolist(), neighbors[first].tolist()):
+            bucket = result[self._node_ids[origin]]
+            if not limit or len(bucket) < limit:
+                bucket.append(self._node(neighbor))
+        return result
+
+    def traverse_batch(
+        self,
+        start_ids: List[str],
+        depth: int = 2,
+        direction: TraversalDirection = TraversalDirection.OUTGOING,
+        edge_types: Optional[List[str]] = None
+    ) -> List[GraphNode]:
+        """Multi-source k-hop traversal (all seeds in the first frontier)"""
+        self._ensure_graph_loaded()
+        seeds = list(dict.fromkeys(self._node_index[n] for n in start_ids if n in self._node_index))
+        if not seeds:
+            return []
+
+        levels = self._bfs_levels(
+            np.array(seeds, dtype=np.int32), depth, direction, self._type_mask(edge_types)
+        )
+        return [self._node(int(n)) for level in levels for n in level]
+
+    def subgraph(
+        self,
+        node_ids: List[str],
+        include_edges: bool = True
+    ) -> Subgraph:
+        """Extract subgraph (edge selection is one vectorized mask)"""
+        self._ensure_graph_loaded()
+        positions = sorted({self._node_index[n] for n in node_ids if n in self._node_index})
+        if not positions:
+            return Subgraph()
+
+        selected = np.array(positions, dtype=np.int32)
+        nodes = {self._node(int(n)) for n in selected}
+        edges = set()
+        if include_edges:
+            in_selection = np.zeros(len(self._node_ids), dtype=bool)
+            in_selection[selected] = True
+            _, neighbors, edge_positions = self._expand(selected, TraversalDirection.OUTGOING, None)
+            # Newest row first: for parallel rows the last one wins, like the DiGraph
+            for edge in np.sort(edge_positions[in_selection[neighbors]])[::-1]:
+                edges.add(self._graph_edge(int(edge)))
+        return Subgraph(nodes=nodes, edges=edges)
+
+    def get_node(self, node_id: str) -> Optional[GraphNode]:
+        """Get single node"""
+        self._ensure_graph_loaded()
+        position = self._node_index.get(node_id)
+        return None if position is None else self._node(position)
+
+    def node_exists(self, node_id: str) -> bool:
+        """Check if node exists"""
+        self._ensure_graph_loaded()
+        return node_id in self._node_index
+
+    def get_node_count(self) -> int:
+        """Get total node count"""
+        self._ensure_graph_loaded()
+        return len(self._node_ids)
+
+    def get_edge_count(self) -> int:
+        """Get total edge count (distinct source/target pairs, like the NetworkX DiGraph)"""
+        self._ensure_graph_loaded()
+        return len(self._unique_pairs()[0])
+
+    def clear_cache(self) -> None:
+        """Drop the arrays (next query reloads)"""
+        with self._lock:
+            self._loaded = False
+            self._load_time = None
+
+    # ========================================================================
+    # ANALYTICS
+    # ========================================================================
+
+    def get_pagerank(self, top_k: Optional[int] = 10, damping_factor: float = 0.85,
+                     max_iter: int = 200, tol: float = 1e-06) -> List[Dict[str, Any]]:
+        """
+        PageRank by sparse power iteration.
+
+        Same model as networkx.pagerank on the engine's DiGraph: parallel
+        rows between a pair count once, dangling nodes spread their rank
+        uniformly, convergence when the L1 change < node_count * tol.
+
+        Args:
+            top_k: Number of top nodes to return (None = all)
+            damping_factor: Damping parameter
+            max_iter: Maximum iterations
+            tol: Convergence tolerance
+
+        Returns:
+            List of dicts with node_id and score, sorted by score (descending)
+        """
+        self._ensure_graph_loaded()
+        n = len(self._node_ids)
+        if n == 0:
+            return []
+
+        src, dst = self._unique_pairs()
+        out_degree = np.bincount(src, minlength=n).astype(np.float64)
+        dangling = out_degree == 0
+        inv_degree = np.divide(1.0, out_degree, out=np.zeros(n), where=~dangling)
+
+        rank = np.full(n, 1.0 / n)
+        for _ in range(max_iter):
+            previous = rank
+            spread = np.bincount(dst, weights=(previous * inv_degree)[src], minlength=n)
+            rank = damping_factor * (spread + previous[dangling].sum() / n) + (1.0 - damping_factor) / n
+            if np.abs(rank - previous).sum() < n * tol:
+                break
+        else:
+            print(f"[WARN] PageRank did not converge after {max_iter} iterations")
+
+        order = np.argsort(-rank, kind='stable')
+        if top_k is not None:
+            order = order[:top_k]
+        return [{'node_id': self._node_ids[int(i)], 'score': float(rank[i])} for i in order]
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        Graph size and memory footprint of the arrays.
+
+        Returns:
+            Dict with nodes, edges (distinct pairs), edge_rows, edge_types,
+            array_bytes, load_time_ms
+        """
+        self._ensure_graph_loaded()
+        arrays = (
+            self._edge_source, self._edge_target, self._edge_type, self._edge_label, self._edge_properties,
+            self._out_ptr, self._out_edges, self._out_neighbors, self._in_ptr, self._in_edges, self._in_neighbors
+        )
+        return {
+            'nodes': len(self._node_ids),
+            'edges': len(self._unique_pairs()[0]),
+            'edge_rows': len(self._edge_source),
+            'edge_types': len(self._type_names),
+            'array_bytes': int(sum(a.nbytes for a in arrays)),
+            'load_time_ms': self._load_time * 1000 if self._load_time else None
+        }
+
+
+def count_graph_edges(db_path: str) -> Optional[int]:
+    """
+    Number of graph_edges rows (cheap engine-selection probe)
+
+    Args:
+        db_path: SQLite database path
+
+    Returns:
+        Row count, or None if the table cannot be read
+    """
+    try:
+        with get_connection_pool(db_path).connection() as conn:
+            return conn.execute("SELECT COUNT(*) FROM graph_edges").fetchone()[0]
+    except Exception:
+        return None
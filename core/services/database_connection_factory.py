@@ -4,14 +4,22 @@ Database Connection Factory
 Factory pattern for creating database connections with proper resource management.
 Resolves DI violations by centralizing connection creation logic.
 
+Also provides SqliteConnectionPool: a thread-safe pool of read-only
+connections shared by the hot read paths (data products, SQL execution,
+graph property lookups) so they stop paying connect + PRAGMA cost per call.
+
 @author P2P Development Team
-@version 1.0.0 (DI Compliance)
+@version 1.1.0 (Read-only connection pool)
 @date 2026-02-23
 """
 
+import os
+import queue
 import sqlite3
 import logging
-from typing import Protocol, Optional
+import threading
+import time
+from typing import Protocol, Optional, Dict, Any
 from contextlib import contextmanager
 
 logger = logging.getLogger(__name__)
@@ -114,4 +122,354 @@ class SqliteConnectionFactory:
             yield conn
         finally:
             if conn:
-                conn.close()
\ No newline at end of file
+                conn.close()
+
+
+class SqliteConnectionPool:
+    """
+    Thread-safe pool of read-only SQLite connections
+    
+    Each connection is handed to exactly one thread at a time. Nested
+    acquisitions on the same thread reuse the connection the thread already
+    holds, so helpers calling helpers never deadlock on the pool.
+    
+    Connections are opened via a ``file:...?mode=ro`` URI and configured once
+    at creation time:
+    - mmap_size / cache_size (per connection)
+    - query_only=ON (defence in depth on top of mode=ro)
+    
+    The pool never writes, so it does not change the journal mode. Readers
+    only stop blocking on writers once the file is in WAL mode: switch it
+    with enable_wal() from the writer side (rebuild/migration scripts).
+    
+    Counters:
+    - hits: acquisitions served by an idle pooled connection
+    - misses: acquisitions that had to open a new connection
+    - wait time: time spent blocked because the pool was exhausted
+    
+    Example:
+        pool = get_connection_pool('database/p2p_data.db')
+        with pool.connection() as conn:
+            rows = conn.execute("SELECT * FROM Supplier LIMIT 10").fetchall()
+    """
+    
+    DEFAULT_MAX_CONNECTIONS = 8
+    DEFAULT_MMAP_SIZE = 256 * 1024 * 1024   # 256 MB
+    DEFAULT_CACHE_SIZE_KB = 16 * 1024       # 16 MB (negative PRAGMA value = KiB)
+    
+    def __init__(
+        self,
+        db_path: str,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        acquire_timeout: float = 30.0,
+        mmap_size: int = DEFAULT_MMAP_SIZE,
+        cache_size_kb: int = DEFAULT_CACHE_SIZE_KB
+    ):
+        """
+        Initialize pool (connections are opened lazily)
+        
+        Args:
+            db_path: Path to SQLite database file
+            max_connections: Upper bound on simultaneously open connections
+            acquire_timeout: Seconds to wait for a free connection before failing
+            mmap_size: PRAGMA mmap_size in bytes (0 disables memory mapping)
+            cache_size_kb: Page cache size per connection in KiB
+        """
+        if max_connections < 1:
+            raise ValueError("max_connections must be >= 1")
+        
+        self.db_path = db_path
+        self.max_connections = max_connections
+        self.acquire_timeout = acquire_timeout
+        self.mmap_size = mmap_size
+        self.cache_size_kb = cache_size_kb
+        
+        self._idle: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._open_count = 0
+        self._probe: Optional[sqlite3.Connection] = None
+        self._probe_lock = threading.Lock()
+        
+        self._hits = 0
+        self._misses = 0
+        self._waits = 0
+        self._wait_time_total = 0.0
+        self._wait_time_max = 0.0
+        
+        logger.debug(f"SqliteConnectionPool initialized: {db_path} (max={max_connections})")
+    
+    @contextmanager
+    def connection(self):
+        """
+        Borrow a read-only connection for the duration of the block
+        
+        Yields:
+            sqlite3.Connection: Read-only connection (default tuple rows;
+            set ``cursor.row_factory`` if dict-like rows are needed)
+        """
+        conn = self.acquire()
+        try:
+            yield conn
+        finally:
+            self.release(conn)
+    
+    def acquire(self) -> sqlite3.Connection:
+        """
+        Borrow a connection; must be paired with release()
+        
+        Returns:
+            sqlite3.Connection: Read-only connection owned by this thread
+            
+        Raises:
+            DatabaseConnectionError: If the pool stays exhausted past
+                acquire_timeout or the database cannot be opened
+        """
+        held = getattr(self._local, 'held', None)
+        if held is not None:
+            self._local.depth += 1
+            return held
+        
+        conn = self._take_connection()
+        self._local.held = conn
+        self._local.depth = 1
+        return conn
+    
+    def release(self, conn: sqlite3.Connection) -> None:
+        """
+        Return a connection obtained from acquire()
+        
+        Args:
+            conn: Connection previously returned by acquire() on this thread
+        """
+        if getattr(self._local, 'held', None) is not conn:
+            raise DatabaseConnectionError("Connection released by a thread that does not hold it")
+        
+        self._local.depth -= 1
+        if self._local.depth > 0:
+            return
+        
+        self._local.held = None
+        try:
+            # End any implicit read transaction so the next borrower
+            # sees the latest committed snapshot
+            if conn.in_transaction:
+                conn.rollback()
+        except sqlite3.Error:
+            self._discard(conn)
+            return
+        self._idle.put(conn)
+    
+    def create_unpooled_connection(self) -> sqlite3.Connection:
+        """
+        Open a read-only connection configured like pooled ones, but owned by the caller
+        
+        For long-running scans (e.g. table exports) that should not hold a
+        pool slot for minutes. The caller must close it.
+        
+        Returns:
+            sqlite3.Connection: Read-only connection (safe to hand to another thread)
+        """
+        return self._open_connection()
+    
+    def get_data_version(self) -> int:
+        """
+        Get PRAGMA data_version as seen by a dedicated probe connection
+        
+        data_version is only comparable on the same connection, and changes
+        whenever *another* connection commits. The probe never writes, so a
+        changed value means the database content changed (in this or any
+        other process). Used to invalidate read caches cheaply.
+        
+        Returns:
+            int: Current data version for this database file
+            
+        Raises:
+            DatabaseConnectionError: If the probe connection cannot be opened
+        """
+        with self._probe_lock:
+            if self._probe is None:
+                self._probe = self._open_connection()
+            try:
+                return self._probe.execute("PRAGMA data_version").fetchone()[0]
+            except sqlite3.Error as e:
+                self._probe.close()
+                self._probe = None
+                raise DatabaseConnectionError(f"data_version probe failed: {e}") from e
+    
+    def close_all(self) -> None:
+        """
+        Close the data_version probe and all idle connections
+        
+        Connections currently borrowed are not closed: they stay open and
+        return to the idle queue when released. Call again once they are
+        released (e.g. after the database file was replaced) to close them.
+        """
+        with self._probe_lock:
+            if self._probe is not None:
+                self._probe.close()
+                self._probe = None
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(conn)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get pool usage counters
+        
+        Returns:
+            Dict with hits, misses, hit_ratio, waits, wait_time_ms (total/max),
+            open and idle connection counts
+        """
+        with self._lock:
+            total = self._hits + self._misses
+            return {
+                'db_path': self.db_path,
+                'max_connections': self.max_connections,
+                'open_connections': self._open_count,
+                'idle_connections': self._idle.qsize(),
+                'hits': self._hits,
+                'misses': self._misses,
+                'hit_ratio': round(self._hits / total, 4) if total else 0.0,
+                'waits': self._waits,
+                'wait_time_total_ms': round(self._wait_time_total * 1000, 3),
+                'wait_time_max_ms': round(self._wait_time_max * 1000, 3)
+            }
+    
+    def _take_connection(self) -> sqlite3.Connection:
+        """Get an idle connection, open a new one, or wait for a release"""
+        try:
+            conn = self._idle.get_nowait()
+            with self._lock:
+                self._hits += 1
+            return conn
+        except queue.Empty:
+            pass
+        
+        with self._lock:
+            can_open = self._open_count < self.max_connections
+            if can_open:
+                self._open_count += 1
+                self._misses += 1
+        
+        if can_open:
+            try:
+                return self._open_connection()
+            except Exception:
+                with self._lock:
+                    self._open_count -= 1
+                raise
+        
+        # Pool exhausted - block until another thread releases a connection
+        started = time.perf_counter()
+        try:
+            conn = self._idle.get(timeout=self.acquire_timeout)
+        except queue.Empty:
+            raise DatabaseConnectionError(
+                f"Timed out after {self.acquire_timeout}s waiting for a connection to {self.db_path}"
+            )
+        waited = time.perf_counter() - started
+        with self._lock:
+            self._hits += 1
+            self._waits += 1
+            self._wait_time_total += waited
+            self._wait_time_max = max(self._wait_time_max, waited)
+        return conn
+    
+    def _open_connection(self) -> sqlite3.Connection:
+        """Open and configure a new read-only connection"""
+        try:
+            uri = f"file:{os.path.abspath(self.db_path)}?mode=ro"
+            # Connections migrate between threads via the pool, but are only
+            # ever used by one thread at a time
+            conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+            conn.execute(f"PRAGMA mmap_size = {int(self.mmap_size)}")
+            conn.execute(f"PRAGMA cache_size = -{int(self.cache_size_kb)}")
+            conn.execute("PRAGMA query_only = ON")
+            return conn
+            
+        except sqlite3.Error as e:
+            logger.error(f"Failed to open read-only connection to {self.db_path}: {e}")
+            raise DatabaseConnectionError(f"Connection failed: {e}") from e
+    
+    def _discard(self, conn: sqlite3.Connection) -> None:
+        """Close a connection and free its slot"""
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+        with self._lock:
+            self._open_count -= 1
+
+
+def enable_wal(db_path: str) -> bool:
+    """
+    Switch a database file to WAL journaling (setup step for writers)
+    
+    journal_mode=WAL is persistent, so this runs once per database file:
+    from the scripts that (re)build it, or manually for existing files.
+    In WAL mode pooled readers keep their snapshot while a writer commits.
+    
+    Args:
+        db_path: Path to SQLite database file
+        
+    Returns:
+        bool: True if the file is in WAL mode afterwards
+    """
+    try:
+        conn = sqlite3.connect(db_path, timeout=5.0)
+        try:
+            mode = conn.execute("PRAGMA journal_mode = WAL").fetchone()[0]
+        finally:
+            conn.close()
+    except sqlite3.Error as e:
+        logger.warning(f"Could not enable WAL for {db_path}: {e}")
+        return False
+    
+    if str(mode).lower() != 'wal':
+        logger.warning(f"Could not enable WAL for {db_path} (journal_mode={mode})")
+        return False
+    return True
+
+
+_pools: Dict[str, SqliteConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_connection_pool(db_path: str, **pool_options) -> SqliteConnectionPool:
+    """
+    Get the process-wide read-only pool for a database file
+    
+    Pools are keyed by absolute path so every component reading the same
+    file shares one set of connections. ``pool_options`` only apply when
+    the pool is first created.
+    
+    Args:
+        db_path: Path to SQLite database file
+        **pool_options: SqliteConnectionPool keyword arguments
+        
+    Returns:
+        SqliteConnectionPool: Shared pool for db_path
+    """
+    key = os.path.abspath(db_path)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = SqliteConnectionPool(db_path, **pool_options)
+            _pools[key] = pool
+        return pool
+
+
+def get_connection_pool_stats() -> Dict[str, Dict[str, Any]]:
+    """
+    Get counters for every pool created in this process
+    
+    Returns:
+        Dict mapping absolute db path to SqliteConnectionPool.get_stats()
+    """
+    with _pools_lock:
+        pools = dict(_pools)
+    return {path: pool.get_stats() for path, pool in pools.items()}
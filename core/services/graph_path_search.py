@@ -0,0 +1,159 @@
+"""
+Graph Path Search
+
+Backend-independent bounded path search used by the in-process graph
+query engines. Engines pass adjacency callables (successors and
+predecessors of a node, already filtered by edge type), so the same
+search runs over a NetworkX DiGraph or CSR arrays.
+
+- bidirectional_shortest_path: breadth-first from both ends, always
+  expanding the smaller frontier, and giving up as soon as the two
+  searches together have covered max_hops levels without meeting
+- k_shortest_paths: Yen's algorithm on top of the bounded search
+  (simple paths in order of length, none longer than max_hops)
+
+@author P2P Development Team
+@version 1.0.0
+"""
+
+import heapq
+from itertools import count
+from typing import Callable, Collection, Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+Neighbors = Callable[[Hashable], Iterable[Hashable]]
+
+
+def bidirectional_shortest_path(
+    source: Hashable,
+    target: Hashable,
+    successors: Neighbors,
+    predecessors: Neighbors,
+    max_hops: int,
+    blocked_nodes: Collection[Hashable] = (),
+    blocked_edges: Collection[Tuple[Hashable, Hashable]] = ()
+) -> Optional[List[Hashable]]:
+    """
+    Shortest directed path with at most max_hops edges
+
+    Args:
+        source: Start node
+        target: End node
+        successors: Outgoing neighbors of a node
+        predecessors: Incoming neighbors of a node
+        max_hops: Maximum path length in edges
+        blocked_nodes: Nodes the path must not visit
+        blocked_edges: (from, to) pairs the path must not use
+
+    Returns:
+        Node list from source to target, or None if no path within max_hops
+    """
+    if source in blocked_nodes or target in blocked_nodes:
+        return None
+    if source == target:
+        return [source]
+    if max_hops < 1:
+        return None
+
+    # Node -> previous node on the path from source / next node towards target
+    forward: Dict[Hashable, Optional[Hashable]] = {source: None}
+    backward: Dict[Hashable, Optional[Hashable]] = {target: None}
+    forward_frontier = [source]
+    backward_frontier = [target]
+    hops = 0
+
+    while forward_frontier and backward_frontier and hops < max_hops:
+        hops += 1
+        if len(forward_frontier) <= len(backward_frontier):
+            next_frontier = []
+            for node in forward_frontier:
+                for neighbor in successors(node):
+                    if neighbor in forward or neighbor in blocked_nodes or (node, neighbor) in blocked_edges:
+                        continue
+                    forward[neighbor] = node
+                    if neighbor in backward:
+                        return _join(neighbor, forward, backward)
+                    next_frontier.append(neighbor)
+            forward_frontier = next_frontier
+        else:
+            next_frontier = []
+            for node in backward_frontier:
+                for neighbor in predecessors(node):
+                    if neighbor in backward or neighbor in blocked_nodes or (neighbor, node) in blocked_edges:
+                        continue
+                    backward[neighbor] = node
+                    if neighbor in forward:
+                        return _join(neighbor, forward, backward)
+                    next_frontier.append(neighbor)
+            backward_frontier = next_frontier
+    return None
+
+
+def k_shortest_paths(
+    source: Hashable,
+    target: Hashable,
+    successors: Neighbors,
+    predecessors: Neighbors,
+    max_hops: int,
+    k: int
+) -> List[List[Hashable]]:
+    """
+    Up to k shortest simple paths (Yen's algorithm, bounded by max_hops)
+
+    Args:
+        source: Start node
+        target: End node
+        successors: Outgoing neighbors of a node
+        predecessors: Incoming neighbors of a node
+        max_hops: Maximum path length in edges
+        k: Number of paths
+
+    Returns:
+        Node lists ordered by length (fewer than k if no more paths exist)
+    """
+    first = bidirectional_shortest_path(source, target, successors, predecessors, max_hops)
+    if first is None or k < 1:
+        return []
+
+    paths = [first]
+    seen: Set[Tuple[Hashable, ...]] = {tuple(first)}
+    candidates: List[Tuple[int, int, List[Hashable]]] = []
+    tie_breaker = count()
+
+    while len(paths) < k:
+        previous = paths[-1]
+        for i in range(len(previous) - 1):
+            root = previous[:i + 1]
+            # Deviate from every accepted path sharing this root at its next edge
+            blocked_edges = {(path[i], path[i + 1]) for path in paths if len(path) > i + 1 and path[:i + 1] == root}
+            spur = bidirectional_shortest_path(
+                root[-1], target, successors, predecessors, max_hops - i,
+                blocked_nodes=set(root[:-1]), blocked_edges=blocked_edges
+            )
+            if spur is not None:
+                candidate = root[:-1] + spur
+                if tuple(candidate) not in seen:
+                    seen.add(tuple(candidate))
+                    heapq.heappush(candidates, (len(candidate), next(tie_breaker), candidate))
+        if not candidates:
+            break
+        paths.append(heapq.heappop(candidates)[2])
+    return paths
+
+
+def _join(
+    meeting: Hashable,
+    forward: Dict[Hashable, Optional[Hashable]],
+    backward: Dict[Hashable, Optional[Hashable]]
+) -> List[Hashable]:
+    """Path through the node where both searches met"""
+    path = []
+    node: Optional[Hashable] = meeting
+    while node is not None:
+        path.append(node)
+        node = forward[node]
+    path.reverse()
+    node = backward[meeting]
+    while node is not None:
+        path.append(node)
+        node = backward[node]
+    return path
@@ -2,14 +2,14 @@
 Graph Query Service - Unified Facade for Graph Operations
 
 Provides a single entry point for all graph query operations,
-automatically selecting the appropriate backend (HANA or NetworkX)
-based on the data source type.
+automatically selecting the appropriate backend (HANA, NetworkX or
+CSR) based on the data source type and graph size.
 
 This is the integration layer (Phase 4C) that completes the hybrid
 graph system architecture.
 
 @author P2P Development Team
-@version 1.0.0
+@version 1.1.0
 """
 
 import logging
@@ -24,6 +24,11 @@ from core.interfaces.graph_query import (
 )
 from core.services.networkx_graph_query_engine import NetworkXGraphQueryEngine
 from core.services.hana_graph_query_engine import HANAGraphQueryEngine
+from core.services.csr_graph_query_engine import (
+    CSRGraphQueryEngine,
+    CSR_AVAILABLE,
+    count_graph_edges
+)
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +44,7 @@ class GraphQueryService:
     Supported Backends:
     - HANAGraphQueryEngine: For HANA Cloud (10-100x faster)
     - NetworkXGraphQueryEngine: For SQLite (local development)
+    - CSRGraphQueryEngine: For large SQLite graphs (NumPy arrays, needs numpy)
     
     Example:
         # Service auto-detects backend
@@ -52,23 +58,41 @@ class GraphQueryService:
         print(service.get_backend_info())
     """
     
+    # Edge count from which 'auto' prefers the CSR engine for SQLite graphs
+    CSR_MIN_EDGES = 200_000
+    
+    ENGINES = ('auto', 'networkx', 'csr')
+    
     def __init__(
         self,
         data_source: Any,
         db_path: Optional[str] = None,
-        hana_workspace: str = 'P2P_GRAPH'
+        hana_workspace: str = 'P2P_GRAPH',
+        engine: str = 'auto',
+        csr_min_edges: Optional[int] = None
     ):
         """
         Initialize graph query service with automatic backend selection.
         
         Args:
             data_source: DataSource instance (HANADataSource or SQLiteDataSource)
-            db_path: Path to SQLite database (for NetworkX backend)
+            db_path: Path to SQLite database (for NetworkX/CSR backends)
             hana_workspace: HANA graph workspace name (default: P2P_GRAPH)
+            engine: Local engine: 'auto' (by graph size), 'networkx' or 'csr'
+            csr_min_edges: Edge count from which 'auto' selects CSR
+                (default: CSR_MIN_EDGES)
+        
+        Raises:
+            ValueError: If engine is not one of ENGINES
         """
+        if engine not in self.ENGINES:
+            raise ValueError(f"Unknown graph engine '{engine}' (expected one of {', '.join(self.ENGINES)})")
+        
         self.data_source = data_source
         self.db_path = db_path or 'app/database/p2p_data_products.db'
         self.hana_workspace = hana_workspace
+        self.engine_preference = engine
+        self.csr_min_edges = self.CSR_MIN_EDGES if csr_min_edges is None else csr_min_edges
         
         # Auto-select engine based on data source type
         self.engine = self._select_engine()
@@ -88,8 +112,10 @@ class GraphQueryService:
         
         Selection Logic:
         - HANADataSource → HANAGraphQueryEngine (native HANA Property Graph)
-        - SQLiteDataSource → NetworkXGraphQueryEngine (in-memory graph)
-        - Other → NetworkXGraphQueryEngine (safe fallback)
+        - SQLiteDataSource → NetworkXGraphQueryEngine (in-memory graph), or
+          CSRGraphQueryEngine for graphs with at least csr_min_edges edges
+          (or engine='csr') when NumPy is installed
+        - Other → same as SQLite (safe fallback)
         
         Returns:
             IGraphQueryEngine implementation
@@ -106,8 +132,29 @@ class GraphQueryService:
                 )
             except Exception as e:
                 logger.warning(f"Failed to create HANAGraphQueryEngine: {e}")
-                logger.info("Falling back to NetworkXGraphQueryEngine")
-                return NetworkXGraphQueryEngine(self.db_path)
+                logger.info("Falling back to local graph engine")
+                return self._select_local_engine()
+        
+        return self._select_local_engine()
+    
+    def _select_local_engine(self) -> IGraphQueryEngine:
+        """
+        Select the in-process engine for the SQLite graph.
+        
+        Returns:
+            CSRGraphQueryEngine if requested (or 'auto' and the graph is
+            large) and NumPy is available, else NetworkXGraphQueryEngine
+        """
+        use_csr = self.engine_preference == 'csr'
+        if self.engine_preference == 'auto' and CSR_AVAILABLE:
+            edge_count = count_graph_edges(self.db_path)
+            use_csr = edge_count is not None and edge_count >= self.csr_min_edges
+        
+        if use_csr:
+            if CSR_AVAILABLE:
+                logger.info("✓ Large SQLite graph → Using CSRGraphQueryEngine")
+                return CSRGraphQueryEngine(self.db_path)
+            logger.warning("CSRGraphQueryEngine requires numpy, falling back to NetworkXGraphQueryEngine")
         
         # Default: NetworkX (SQLite or unknown data source)
         logger.info("✓ Detected SQLite/local data source → Using NetworkXGraphQueryEngine")
@@ -131,6 +178,10 @@ class GraphQueryService:
             info['workspace'] = self.hana_workspace
             info['performance'] = '10-100x faster than NetworkX'
             info['platform'] = 'HANA Cloud Property Graph'
+        elif isinstance(self.engine, CSRGraphQueryEngine):
+            info['database'] = self.db_path
+            info['performance'] = 'Compact arrays for large graphs'
+            info['platform'] = 'NumPy CSR + SQLite'
         else:
             info['database'] = self.db_path
             info['performance'] = 'Optimized for local development'
@@ -161,6 +212,17 @@ class GraphQueryService:
         """Find shortest path (delegates to selected engine)"""
         return self.engine.shortest_path(start_id, end_id, max_hops)
     
+    def find_paths(
+        self,
+        start_id: str,
+        end_id: str,
+        max_hops: int = 10,
+        edge_types: Optional[List[str]] = None,
+        k: int = 1
+    ) -> List[GraphPath]:
+        """Find up to k shortest bounded paths (delegates to selected engine)"""
+        return self.engine.find_paths(start_id, end_id, max_hops, edge_types, k)
+    
     def traverse(
         self,
         start_id: str,
@@ -171,6 +233,26 @@ class GraphQueryService:
         """Breadth-first traversal (delegates to selected engine)"""
         return self.engine.traverse(start_id, depth, direction, edge_types)
     
+    def get_neighbors_batch(
+        self,
+        node_ids: List[str],
+        direction: TraversalDirection = TraversalDirection.OUTGOING,
+        edge_types: Optional[List[str]] = None,
+        limit: Optional[int] = None
+    ) -> Dict[str, List[GraphNode]]:
+        """Get adjacent nodes of many nodes (delegates to selected engine)"""
+        return self.engine.get_neighbors_batch(node_ids, direction, edge_types, limit)
+    
+    def traverse_batch(
+        self,
+        start_ids: List[str],
+        depth: int = 2,
+        direction: TraversalDirection = TraversalDirection.OUTGOING,
+        edge_types: Optional[List[str]] = None
+    ) -> List[GraphNode]:
+        """Multi-source k-hop traversal (delegates to selected engine)"""
+        return self.engine.traverse_batch(start_ids, depth, direction, edge_types)
+    
     def subgraph(
         self,
         node_ids: List[str],
@@ -199,6 +281,10 @@ class GraphQueryService:
         """Clear engine cache (delegates to selected engine)"""
         self.engine.clear_cache()
     
+    def refresh(self) -> Dict[str, Any]:
+        """Bring engine cache up to date with the database (delegates to selected engine)"""
+        return self.engine.refresh()
+    
     # ========================================================================
     # Advanced Methods (HANA-specific, graceful degradation for NetworkX)
     # ========================================================================
@@ -209,6 +295,7 @@ class GraphQueryService:
         
         HANA: Uses native GRAPH_PAGERANK()
         NetworkX: Uses networkx.pagerank()
+        CSR: Sparse power iteration over the adjacency arrays
         
         Args:
             top_k: Return top K nodes
@@ -225,23 +312,38 @@ class GraphQueryService:
     def get_betweenness_centrality(
         self,
         vertex_table: Optional[str] = None,
-        top_k: int = 10
+        top_k: int = 10,
+        sample_size: Optional[int] = None,
+        epsilon: Optional[float] = None,
+        seed: Optional[int] = None
     ) -> Dict[str, float]:
         """
         Calculate betweenness centrality.
         
         HANA: Uses native GRAPH_BETWEENNESS_CENTRALITY()
-        NetworkX: Uses networkx.betweenness_centrality()
+        NetworkX: Uses networkx.betweenness_centrality() (pivot sampling
+        when sample_size or epsilon is given)
         
         Args:
             vertex_table: Filter to specific table (HANA only)
             top_k: Return top K nodes
+            sample_size: Pivot count for approximate mode (NetworkX only)
+            epsilon: Target error for approximate mode (NetworkX only)
+            seed: Random seed for pivot selection (NetworkX only)
             
         Returns:
             Dict mapping node_id → centrality score
         """
         if hasattr(self.engine, 'get_betweenness_centrality'):
-            return self.engine.get_betweenness_centrality(vertex_table, top_k)
+            sampling = {
+                name: value
+                for name, value in (('sample_size', sample_size), ('epsilon', epsilon), ('seed', seed))
+                if value is not None
+            }
+            # Keywords: engines disagree on positional order (vertex_table/top_k)
+            return self.engine.get_betweenness_centrality(
+                vertex_table=vertex_table, top_k=top_k, **sampling
+            )
         
         logger.warning("Betweenness centrality not supported by current backend")
         return {}
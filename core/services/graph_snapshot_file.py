@@ -0,0 +1,341 @@
+"""
+Graph Snapshot File
+
+Columnar, memory-mappable on-disk format for cached graphs. A snapshot
+holds an interned string table (node keys, labels, types and property
+JSON blobs are stored once each) plus fixed-width integer columns that
+reference it, e.g. edge source/target as node positions. Loading maps
+the file and reads each column with a single memcpy instead of decoding
+one SQLite row (and one JSON blob) per node and edge.
+
+Layout (all integers in the byte order recorded in the header):
+
+    b'KGSNAP' | u16 format version | u32 header length | header JSON
+    sections, each 8-byte aligned (offsets/lengths listed in the header):
+      strings.offsets   int64[n + 1]  character offsets into strings.text
+      strings.text      UTF-8 text of all strings concatenated
+      <column>          int32[...]    one section per column
+
+The container is generic (string table + named int32 columns). The graph
+column layout below is shared by the writer (ColumnarGraphCacheRepository
+in knowledge_graph_v2) and the readers (that repository and
+NetworkXGraphQueryEngine). Files are written to a temporary name and renamed, so readers see either
+the previous or the new snapshot, never a partial one.
+
+@author P2P Development Team
+@version 1.0.0
+"""
+
+import json
+import mmap
+import os
+import struct
+import sys
+import threading
+from array import array
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+
+MAGIC = b'KGSNAP'
+FORMAT_VERSION = 1
+
+_PREAMBLE = struct.Struct('<6sHI')
+_ALIGNMENT = 8
+
+# Column typecode (int32 on all supported platforms)
+COLUMN_TYPECODE = 'i'
+
+if array(COLUMN_TYPECODE).itemsize != 4:  # pragma: no cover - exotic platforms
+    raise ImportError("graph snapshots require a 4-byte 'i' array typecode")
+
+# Graph column layout: one entry per node / edge, values are string table
+# indexes unless noted otherwise
+NODE_ID = 'node.id'
+NODE_LABEL = 'node.label'
+NODE_TYPE = 'node.type'
+NODE_PROPERTIES = 'node.properties'      # compact JSON object text
+NODE_ENTITY_TYPE = 'node.entity_type'    # properties['entity_type'] if a string
+NODE_PRODUCT = 'node.product'            # properties['product'] if a string
+EDGE_SOURCE = 'edge.source'              # node position
+EDGE_TARGET = 'edge.target'              # node position
+EDGE_TYPE = 'edge.type'
+EDGE_LABEL = 'edge.label'
+EDGE_PROPERTIES = 'edge.properties'      # compact JSON object text
+
+NO_VALUE = -1          # absent, None or empty
+NON_STRING_VALUE = -2  # present but not a string (NODE_ENTITY_TYPE / NODE_PRODUCT)
+
+SNAPSHOT_SUFFIX = '.kgsnap'
+
+
+class SnapshotFormatError(ValueError):
+    """Raised when a snapshot file is missing, truncated or of another format/version"""
+    pass
+
+
+class StringInterner:
+    """
+    Assigns one index per distinct string
+
+    Example:
+        strings = StringInterner()
+        strings.intern('PurchaseOrder')   # 0
+        strings.intern('Supplier')        # 1
+        strings.intern('PurchaseOrder')   # 0
+    """
+
+    def __init__(self):
+        self._index: Dict[str, int] = {}
+        self.strings: List[str] = []
+
+    def intern(self, value: str) -> int:
+        """Index of value in the string table (added on first use)"""
+        index = self._index.get(value)
+        if index is None:
+            index = self._index[value] = len(self.strings)
+            self.strings.append(value)
+        return index
+
+    def __len__(self) -> int:
+        return len(self.strings)
+
+
+def write_snapshot(
+    path: str,
+    metadata: Mapping[str, Any],
+    strings: Sequence[str],
+    columns: Mapping[str, array]
+) -> int:
+    """
+    Write a snapshot file atomically (temporary file + rename)
+
+    Args:
+        path: Target file path (parent directory is created if missing)
+        metadata: JSON-serializable metadata stored in the header
+        strings: String table
+        columns: Named int32 columns (array('i'))
+
+    Returns:
+        Size of the written file in bytes
+
+    Raises:
+        OSError: If the file cannot be written
+        ValueError: If a column is not an int32 array
+    """
+    text = ''.join(strings)
+    offsets = array('q', [0])
+    position = 0
+    for value in strings:
+        position += len(value)
+        offsets.append(position)
+
+    payloads = [('strings.offsets', 'q', offsets.tobytes()), ('strings.text', 'B', text.encode('utf-8'))]
+    for name, column in columns.items():
+        if not isinstance(column, array) or column.typecode != COLUMN_TYPECODE:
+            raise ValueError(f"Column '{name}' must be array('{COLUMN_TYPECODE}')")
+        payloads.append((name, COLUMN_TYPECODE, column.tobytes()))
+
+    # Section offsets are relative to the end of the header (header size is not known yet)
+    sections = {}
+    position = 0
+    for name, typecode, payload in payloads:
+        position = _align(position)
+        sections[name] = [position, len(payload), typecode]
+        position += len(payload)
+
+    header = json.dumps({
+        'byteorder': sys.byteorder,
+        'string_count': len(strings),
+        'sections': sections,
+        'metadata': dict(metadata)
+    }, separators=(',', ':')).encode('utf-8')
+    data_start = _align(_PREAMBLE.size + len(header))
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(_PREAMBLE.pack(MAGIC, FORMAT_VERSION, len(header)))
+            f.write(header)
+            for name, _, payload in payloads:
+                f.write(b'\0' * (data_start + sections[name][0] - f.tell()))
+                f.write(payload)
+            size = f.tell()
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return size
+
+
+def snapshot_path(directory: str, graph_type: str) -> str:
+    """
+    File path of the snapshot for a graph type
+
+    Args:
+        directory: Snapshot directory
+        graph_type: Graph type value (e.g. 'schema')
+
+    Returns:
+        Path '<directory>/<graph_type>.kgsnap'
+    """
+    return os.path.join(directory, graph_type + SNAPSHOT_SUFFIX)
+
+
+def read_snapshot_metadata(path: str) -> Optional[Dict[str, Any]]:
+    """
+    Read only the metadata of a snapshot (no mapping, no columns)
+
+    Args:
+        path: Snapshot file path
+
+    Returns:
+        Metadata dict, or None if the file is missing or not a valid snapshot
+    """
+    try:
+        with open(path, 'rb') as f:
+            return _parse_header(f.read(_PREAMBLE.size), f.read)['metadata']
+    except (OSError, SnapshotFormatError):
+        return None
+
+
+class SnapshotReader:
+    """
+    Memory-mapped snapshot reader
+
+    Columns are exposed as memoryviews over the mapping (no copy); call
+    tolist() or index them while the reader is open. Views handed out
+    are released on close().
+
+    Example:
+        with SnapshotReader(path) as snapshot:
+            strings = snapshot.strings()
+            sources = snapshot.column('edge.source').tolist()
+    """
+
+    def __init__(self, path: str):
+        """
+        Open and validate a snapshot file
+
+        Args:
+            path: Snapshot file path
+
+        Raises:
+            SnapshotFormatError: If the file is missing or invalid
+        """
+        try:
+            with open(path, 'rb') as f:
+                size = os.fstat(f.fileno()).st_size
+                if size < _PREAMBLE.size:
+                    raise SnapshotFormatError(f"Snapshot {path} is truncated")
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except OSError as e:
+            raise SnapshotFormatError(f"Cannot open snapshot {path}: {e}") from e
+
+        self._views: List[memoryview] = []
+        try:
+            position = [_PREAMBLE.size]
+
+            def read(length):
+                chunk = self._mmap[position[0]:position[0] + length]
+                position[0] += length
+                return chunk
+
+            header = _parse_header(self._mmap[:_PREAMBLE.size], read)
+            if header['byteorder'] != sys.byteorder:
+                raise SnapshotFormatError(f"Snapshot {path} was written on a {header['byteorder']}-endian machine")
+
+            data_start = _align(position[0])
+            self._sections = {}
+            for name, (offset, length, typecode) in header['sections'].items():
+                start = data_start + offset
+                if start + length > size:
+                    raise SnapshotFormatError(f"Snapshot {path} is truncated (section '{name}')")
+                self._sections[name] = (start, length, typecode)
+        except Exception:
+            self._mmap.close()
+            raise
+
+        self.path = path
+        self.metadata: Dict[str, Any] = header['metadata']
+        self.string_count: int = header['string_count']
+
+    def has_column(self, name: str) -> bool:
+        """Whether the snapshot contains a section"""
+        return name in self._sections
+
+    def column(self, name: str) -> memoryview:
+        """
+        Zero-copy view of a column
+
+        Args:
+            name: Column (section) name
+
+        Returns:
+            memoryview cast to the column's typecode
+
+        Raises:
+            SnapshotFormatError: If the column does not exist
+        """
+        try:
+            start, length, typecode = self._sections[name]
+        except KeyError:
+            raise SnapshotFormatError(f"Snapshot {self.path} has no column '{name}'") from None
+        view = memoryview(self._mmap)[start:start + length].cast(typecode)
+        self._views.append(view)
+        return view
+
+    def strings(self) -> List[str]:
+        """
+        Decode the string table
+
+        The text is decoded in one call and split by the offsets column.
+
+        Returns:
+            List of strings (index = interned id)
+        """
+        offsets = self.column('strings.offsets').tolist()
+        start, length, _ = self._sections['strings.text']
+        text = self._mmap[start:start + length].decode('utf-8')
+        if len(offsets) != self.string_count + 1 or offsets[-1] != len(text):
+            raise SnapshotFormatError(f"Snapshot {self.path} has a corrupt string table")
+        return [text[offsets[i]:offsets[i + 1]] for i in range(self.string_count)]
+
+    def close(self) -> None:
+        """Release column views and unmap the file"""
+        for view in self._views:
+            view.release()
+        self._views = []
+        self._mmap.close()
+
+    def __enter__(self) -> 'SnapshotReader':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
+def _align(position: int) -> int:
+    """Round position up to the section alignment"""
+    return (position + _ALIGNMENT - 1) // _ALIGNMENT * _ALIGNMENT
+
+
+def _parse_header(preamble: bytes, read) -> Dict[str, Any]:
+    """Validate the preamble and decode the header JSON"""
+    if len(preamble) < _PREAMBLE.size:
+        raise SnapshotFormatError("Snapshot is truncated")
+    magic, version, header_length = _PREAMBLE.unpack(preamble)
+    if magic != MAGIC:
+        raise SnapshotFormatError("Not a graph snapshot file")
+    if version != FORMAT_VERSION:
+        raise SnapshotFormatError(f"Unsupported snapshot format version {version}")
+    raw = read(header_length)
+    if len(raw) != header_length:
+        raise SnapshotFormatError("Snapshot header is truncated")
+    try:
+        header = json.loads(raw)
+    except ValueError as e:
+        raise SnapshotFormatError(f"Corrupt snapshot header: {e}") from e
+    if not isinstance(header, dict) or not {'byteorder', 'string_count', 'sections', 'metadata'} <= set(header):
+        raise SnapshotFormatError("Corrupt snapshot header: missing fields")
+    return header
@@ -9,12 +9,12 @@ Platform: HANA Cloud Q1 2025+
 Workspace: P2P_GRAPH (see sql/hana/create_p2p_graph_workspace.sql)
 
 @author P2P Development Team
-@version 1.0.0
+@version 1.1.0
 """
 
 import sys
 import os
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, NamedTuple, Optional, Any, Sequence
 import logging
 
 # Add project root to path
@@ -33,6 +33,22 @@ from core.repositories import AbstractRepository
 logger = logging.getLogger(__name__)
 
 
+class WorkspaceEdgeTable(NamedTuple):
+    """Edge table of a graph workspace (single-column source/target keys)"""
+    table: str
+    source_table: str
+    source_column: str
+    target_table: str
+    target_column: str
+
+
+# Edge tables of P2P_GRAPH (scripts/sql/hana/create_p2p_graph_workspace.sql)
+P2P_GRAPH_EDGE_TABLES = (
+    WorkspaceEdgeTable('PurchaseOrderItem', 'PurchaseOrder', 'PurchaseOrder', 'Product', 'Material'),
+    WorkspaceEdgeTable('SupplierInvoiceItem', 'SupplierInvoice', 'SupplierInvoice', 'PurchaseOrder', 'PurchaseOrder'),
+)
+
+
 class HANAGraphQueryEngine(IGraphQueryEngine):
     """
     HANA Property Graph implementation using native graph SQL functions.
@@ -43,6 +59,8 @@ class HANAGraphQueryEngine(IGraphQueryEngine):
     - Uses GRAPH_BFS_TRAVERSAL() for breadth-first search
     - 10-100x faster than NetworkX for production data
     
+    - Batch neighbor / k-hop queries: one statement per hop for a whole frontier
+    
     Example:
         engine = HANAGraphQueryEngine(hana_data_source, 'P2P_GRAPH')
         
@@ -53,10 +71,20 @@ class HANAGraphQueryEngine(IGraphQueryEngine):
         path = engine.shortest_path('Supplier:SUP001', 'Invoice:INV001')
     """
     
+    # Start vertices per batched neighbor statement (bounds bound-parameter count)
+    MAX_BATCH_VERTICES = 500
+    
+    _HANA_DIRECTIONS = {
+        TraversalDirection.OUTGOING: 'OUTGOING',
+        TraversalDirection.INCOMING: 'INCOMING',
+        TraversalDirection.BOTH: 'ANY'
+    }
+    
     def __init__(
         self,
         data_source: AbstractRepository,
-        workspace_name: str = 'P2P_GRAPH'
+        workspace_name: str = 'P2P_GRAPH',
+        edge_tables: Sequence[WorkspaceEdgeTable] = P2P_GRAPH_EDGE_TABLES
     ):
         """
         Initialize HANA graph query engine.
@@ -64,9 +92,11 @@ class HANAGraphQueryEngine(IGraphQueryEngine):
         Args:
             data_source: AbstractRepository instance (HANA repository)
             workspace_name: Graph workspace name (default: P2P_GRAPH)
+            edge_tables: Edge tables of the workspace (used by batch queries)
         """
         self.data_source = data_source
         self.workspace = workspace_name
+        self.edge_tables = tuple(edge_tables)
         self._cache = {}  # Simple cache for repeated queries
         
         logger.info(f"Initialized HANAGraphQueryEngine for workspace '{workspace_name}'")
@@ -329,6 +359,161 @@ class HANAGraphQueryEngine(IGraphQueryEngine):
             logger.error(f"Error in traverse: {e}")
             return []
     
+    def get_neighbors_batch(
+        self,
+        node_ids: List[str],
+        direction: TraversalDirection = TraversalDirection.OUTGOING,
+        edge_types: Optional[List[str]] = None,
+        limit: Optional[int] = None
+    ) -> Dict[str, List[GraphNode]]:
+        """
+        Get adjacent nodes of many nodes with one statement.
+        
+        The workspace edge tables are joined directly, filtered by the
+        start keys, so a batch costs one round trip (one per
+        MAX_BATCH_VERTICES start vertices).
+        """
+        result: Dict[str, List[GraphNode]] = {node_id: [] for node_id in node_ids}
+        try:
+            rows = self._batch_neighbor_rows(list(result), self._HANA_DIRECTIONS[direction], edge_types)
+            if rows is None:
+                return result
+            
+            for row in rows:
+                bucket = result.get(self._format_node_id(row['START_TABLE'], row['START_KEY']))
+                if bucket is None or (limit and len(bucket) >= limit):
+                    continue
+                bucket.append(GraphNode(
+                    id=self._format_node_id(row['VERTEX_TABLE'], row['VERTEX_KEY']),
+                    label=row['VERTEX_TABLE'],
+                    properties={'edge_via': row.get('EDGE_TABLE')}
+                ))
+            
+            logger.debug(f"Found neighbors for {len(result)} nodes in one batch")
+            return result
+            
+        except Exception as e:
+            logger.error(f"Error in get_neighbors_batch: {e}")
+            return result
+    
+    def traverse_batch(
+        self,
+        start_ids: List[str],
+        depth: int = 2,
+        direction: TraversalDirection = TraversalDirection.OUTGOING,
+        edge_types: Optional[List[str]] = None
+    ) -> List[GraphNode]:
+        """
+        Multi-source breadth-first traversal, one set-based query per hop.
+        
+        Each hop expands the whole frontier with one batched edge-table
+        statement (instead of one call per node); nodes
+        are reported once, with the hop at which they were first reached.
+        """
+        try:
+            hana_direction = self._HANA_DIRECTIONS[direction]
+            visited = {}
+            for start_id in start_ids:
+                if start_id not in visited:
+                    visited[start_id] = GraphNode(
+                        id=start_id,
+                        label=self._parse_node_id(start_id)[0],
+                        properties={'depth': 0}
+                    )
+            frontier = list(visited)
+            
+            for hop in range(1, depth + 1):
+                if not frontier:
+                    break
+                rows = self._batch_neighbor_rows(frontier, hana_direction, edge_types)
+                if rows is None:
+                    break
+                
+                frontier = []
+                for row in rows:
+                    node_id = self._format_node_id(row['VERTEX_TABLE'], row['VERTEX_KEY'])
+                    if node_id not in visited:
+                        visited[node_id] = GraphNode(id=node_id, label=row['VERTEX_TABLE'], properties={'depth': hop})
+                        frontier.append(node_id)
+            
+            logger.debug(f"Traversal from {len(start_ids)} seeds found {len(visited)} nodes")
+            return list(visited.values())
+            
+        except Exception as e:
+            logger.error(f"Error in traverse_batch: {e}")
+            return []
+    
+    def _batch_neighbor_rows(
+        self,
+        node_ids: List[str],
+        hana_direction: str,
+        edge_types: Optional[List[str]] = None
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Direct neighbors of many start vertices (set-based edge table scan).
+        
+        One SELECT per edge table and direction, each filtered by a
+        bound-parameter IN list of the start keys of its vertex table, so
+        the statement size depends on the workspace, not on the frontier.
+        
+        Args:
+            node_ids: Start node IDs
+            hana_direction: 'OUTGOING', 'INCOMING' or 'ANY'
+            edge_types: Filter by edge tables
+            
+        Returns:
+            Rows with START_TABLE, START_KEY, VERTEX_TABLE, VERTEX_KEY,
+            EDGE_TABLE, or None if a query failed
+        """
+        edge_tables = [
+            edge for edge in self.edge_tables
+            if not edge_types or edge.table in edge_types
+        ]
+        # (edge table, start side, neighbor side) as (table, column) pairs
+        branches = []
+        for edge in edge_tables:
+            source = (edge.source_table, edge.source_column)
+            target = (edge.target_table, edge.target_column)
+            if hana_direction in ('OUTGOING', 'ANY'):
+                branches.append((edge.table, source, target))
+            if hana_direction in ('INCOMING', 'ANY'):
+                branches.append((edge.table, target, source))
+        
+        rows = []
+        for offset in range(0, len(node_ids), self.MAX_BATCH_VERTICES):
+            keys_by_table: Dict[str, List[str]] = {}
+            for node_id in node_ids[offset:offset + self.MAX_BATCH_VERTICES]:
+                table_name, key_value = self._parse_node_id(node_id)
+                keys_by_table.setdefault(table_name, []).append(key_value)
+            
+            selects, params = [], []
+            for edge_table, (start_table, start_column), (vertex_table, vertex_column) in branches:
+                keys = keys_by_table.get(start_table)
+                if not keys:
+                    continue
+                selects.append(f"""
+                SELECT DISTINCT '{self._quote(start_table)}' AS START_TABLE, e."{start_column}" AS START_KEY,
+                       '{self._quote(vertex_table)}' AS VERTEX_TABLE, e."{vertex_column}" AS VERTEX_KEY,
+                       '{self._quote(edge_table)}' AS EDGE_TABLE
+                FROM "{edge_table}" e
+                WHERE e."{start_column}" IN ({", ".join("?" * len(keys))})
+                  AND e."{vertex_column}" IS NOT NULL""")
+                params.extend(keys)
+            if not selects:
+                continue
+            
+            result = self.data_source.execute_query(" UNION ALL ".join(selects), tuple(params))
+            if not result['success']:
+                logger.error(f"Batched neighbor query failed: {result.get('error')}")
+                return None
+            rows.extend(result['rows'])
+        return rows
+    
+    @staticmethod
+    def _quote(value: str) -> str:
+        """Escape a value for use inside a SQL string literal"""
+        return str(value).replace("'", "''")
+    
     def subgraph(
         self,
         node_ids: List[str],
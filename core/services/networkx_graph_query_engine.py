@@ -8,18 +8,28 @@ Features:
 - Loads graph from SQLite + ontology cache
 - In-memory processing (fast for < 100K nodes)
 - Full NetworkX algorithm support
+- Incremental refresh (edge_id high-water mark) after cache rebuilds
+- Cold load from columnar graph snapshots when they match graph_edges
+- Sampled (approximate) betweenness and bounded cycle enumeration
 - Zero HANA dependency
 
 @author P2P Development Team
-@version 1.0.0
+@version 1.5.0
 """
 
 import sqlite3
 import json
-from typing import List, Dict, Optional, Set, Any
+import math
+import threading
+from collections import deque
+from itertools import islice
+from typing import List, Dict, Iterator, Optional, Set, Any
 import networkx as nx
 from datetime import datetime
 
+from core.services import graph_snapshot_file as snapshot_format
+from core.services.graph_path_search import bidirectional_shortest_path, k_shortest_paths
+
 from core.interfaces.graph_query import (
     IGraphQueryEngine,
     GraphNode,
@@ -28,6 +38,10 @@ from core.interfaces.graph_query import (
     Subgraph,
     TraversalDirection
 )
+from core.services.database_connection_factory import (
+    get_connection_pool,
+    DatabaseConnectionError
+)
 
 
 class NetworkXGraphQueryEngine(IGraphQueryEngine):
@@ -45,6 +59,19 @@ class NetworkXGraphQueryEngine(IGraphQueryEngine):
     - Query time: <1ms for most operations
     - Best for: < 100K nodes
     
+    Refresh:
+    - Cold load streams graph_edges in batches into add_edges_from
+    - refresh() applies only rows inserted/deleted since the last load
+      (high-water mark on edge_id), instead of discarding the graph
+    
+    Snapshots (optional snapshot_dir):
+    - Each graph type saved by the graph cache may have a columnar
+      snapshot (see graph_snapshot_file). A cold load takes an
+      ontology's edges from its snapshot instead of parsing its rows when
+      the snapshot was written from that ontology_id, has the same edge
+      count, the rows have contiguous edge_ids and the first/last rows
+      match. Anything else is streamed from graph_edges as before.
+    
     Example:
         engine = NetworkXGraphQueryEngine('app/database/p2p_data_products.db')
         
@@ -53,17 +80,31 @@ class NetworkXGraphQueryEngine(IGraphQueryEngine):
         print(f"Path length: {path.length}")
     """
     
-    def __init__(self, db_path: str, auto_load: bool = True):
+    LOAD_BATCH_SIZE = 10_000
+    _EDGE_COLUMNS = "edge_id, from_node_key, to_node_key, edge_type, edge_label, properties_json"
+    
+    _RESERVED_EDGE_ATTRS = ('source_table', 'target_table', 'label', 'type')
+    
+    def __init__(self, db_path: str, auto_load: bool = True, snapshot_dir: Optional[str] = None):
         """
         Initialize engine.
         
         Args:
             db_path: Path to SQLite database
             auto_load: If True, load graph immediately
+            snapshot_dir: Directory of columnar graph snapshots (optional)
         """
         self.db_path = db_path
+        self.snapshot_dir = snapshot_dir
         self._graph: Optional[nx.DiGraph] = None
         self._load_time: Optional[float] = None
+        self._snapshot_edges = 0
+        
+        # Incremental refresh bookkeeping
+        self._lock = threading.RLock()
+        self._high_water_mark = 0
+        self._edge_pairs: Dict[int, tuple] = {}        # edge_id -> (from, to)
+        self._pair_edge_ids: Dict[tuple, List[int]] = {}  # (from, to) -> edge_ids (ascending)
         
         if auto_load:
             self._load_graph()
@@ -74,12 +115,14 @@ class NetworkXGraphQueryEngine(IGraphQueryEngine):
     
     def _load_graph(self) -> nx.DiGraph:
         """
-        Load graph from SQLite into NetworkX.
+        Load graph from SQLite into NetworkX (cold bulk load).
         
         Process:
-        1. Load ontology (relationships) from graph_edges
-        2. For each relationship, query actual data
-        3. Build NetworkX graph with nodes & edges
+        1. Stream graph_edges in edge_id order (batched fetchmany), or per
+           ontology from its snapshot when one matches
+        2. Parse each batch into (from, to, attrs) tuples
+        3. add_nodes_from / add_edges_from per batch
+        4. Record edge_id bookkeeping for later incremental refresh()
         
         Returns:
             NetworkX DiGraph
@@ -87,86 +130,404 @@ class NetworkXGraphQueryEngine(IGraphQueryEngine):
         if self._graph is not None:
             return self._graph
         
-        start_time = datetime.now()
+        with self._lock:
+            if self._graph is not None:
+                return self._graph
+            
+            start_time = datetime.now()
+            
+            G = nx.DiGraph()
+            self._edge_pairs = {}
+            self._pair_edge_ids = {}
+            self._high_water_mark = 0
+            self._snapshot_edges = 0
+            
+            with get_connection_pool(self.db_path).connection() as conn:
+                plan = self._snapshot_plan(conn)
+                if plan is None:
+                    self._stream_rows(conn, G)
+                else:
+                    for ontology_id, graph_type, first_id, count in plan:
+                        parsed = self._snapshot_rows(conn, ontology_id, graph_type, first_id, count)
+                        if parsed is None:
+                            self._stream_rows(conn, G, first_id, first_id + count - 1)
+                        else:
+                            self._apply_rows(G, parsed)
+                            self._snapshot_edges += count
+            
+            # Cache the graph
+            self._graph = G
+            self._load_time = (datetime.now() - start_time).total_seconds()
+            
+            source = f" ({self._snapshot_edges} edges from snapshots)" if self._snapshot_edges else ""
+            print(f"[NetworkX] Loaded {G.number_of_nodes()} nodes, {G.number_of_edges()} edges "
+                  f"in {self._load_time*1000:.0f}ms{source}")
+            
+            return G
+    
+    def _stream_rows(
+        self,
+        conn: sqlite3.Connection,
+        G: nx.DiGraph,
+        first_id: Optional[int] = None,
+        last_id: Optional[int] = None
+    ) -> None:
+        """Stream graph_edges rows (optionally an edge_id range) in batches into G"""
+        if first_id is None:
+            cursor = conn.execute(f"""
+                SELECT {self._EDGE_COLUMNS}
+                FROM graph_edges
+                ORDER BY edge_id
+            """)
+        else:
+            cursor = conn.execute(f"""
+                SELECT {self._EDGE_COLUMNS}
+                FROM graph_edges
+                WHERE edge_id BETWEEN ? AND ?
+                ORDER BY edge_id
+            """, (first_id, last_id))
+        while True:
+            rows = cursor.fetchmany(self.LOAD_BATCH_SIZE)
+            if not rows:
+                break
+            self._apply_rows(G, self._parse_rows(rows))
+    
+    def _snapshot_plan(self, conn: sqlite3.Connection) -> Optional[List[tuple]]:
+        """
+        Ontologies of graph_edges in edge_id order, if snapshots can be used
+        
+        Returns:
+            [(ontology_id, graph_type, first_edge_id, edge_count)], or None
+            if no snapshot_dir is configured or the rows of an ontology are
+            not one contiguous edge_id range (then rows are streamed as usual)
+        """
+        if not self.snapshot_dir:
+            return None
+        try:
+            ontologies = conn.execute("""
+                SELECT o.ontology_id, o.graph_type, MIN(e.edge_id), MAX(e.edge_id), COUNT(e.edge_id)
+                FROM graph_ontology o
+                JOIN graph_edges e ON e.ontology_id = o.ontology_id
+                GROUP BY o.ontology_id
+                ORDER BY MIN(e.edge_id)
+            """).fetchall()
+            total = conn.execute("SELECT COUNT(*) FROM graph_edges").fetchone()[0]
+        except sqlite3.Error:
+            return None
+        
+        if sum(row[4] for row in ontologies) != total:
+            return None  # Rows without an ontology
+        if any(last_id - first_id + 1 != count for _, _, first_id, last_id, count in ontologies):
+            return None
+        return [
+            (ontology_id, graph_type, first_id, count)
+            for ontology_id, graph_type, first_id, _, count in ontologies
+        ]
+    
+    def _snapshot_rows(
+        self,
+        conn: sqlite3.Connection,
+        ontology_id: int,
+        graph_type: str,
+        first_id: int,
+        count: int
+    ) -> Optional[List[tuple]]:
+        """
+        Parsed rows (same shape as _parse_rows) of one ontology from its snapshot
+        
+        Node attributes are derived once per node and property blobs are
+        decoded once per distinct blob (edges get shallow copies), so the
+        per-edge work is one attrs dict and one tuple.
         
-        G = nx.DiGraph()
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        Returns:
+            Parsed rows, or None if the snapshot is missing, stale or does
+            not match the first/last graph_edges rows of the ontology
+        """
+        path = snapshot_format.snapshot_path(self.snapshot_dir, graph_type)
+        try:
+            with snapshot_format.SnapshotReader(path) as snapshot:
+                metadata = snapshot.metadata
+                if metadata.get('source_version') != str(ontology_id) or metadata.get('edge_count') != count:
+                    return None
+                strings = snapshot.strings()
+                node_keys = [strings[i] for i in snapshot.column(snapshot_format.NODE_ID).tolist()]
+                sources = snapshot.column(snapshot_format.EDGE_SOURCE).tolist()
+                targets = snapshot.column(snapshot_format.EDGE_TARGET).tolist()
+                types = snapshot.column(snapshot_format.EDGE_TYPE).tolist()
+                labels = snapshot.column(snapshot_format.EDGE_LABEL).tolist()
+                properties = snapshot.column(snapshot_format.EDGE_PROPERTIES).tolist()
+            
+            # Same rows as in graph_edges? (edge_ids follow snapshot order)
+            for edge_id, i in ((first_id, 0), (first_id + count - 1, count - 1)):
+                row = conn.execute(
+                    "SELECT from_node_key, to_node_key, edge_type FROM graph_edges WHERE edge_id = ?",
+                    (edge_id,)
+                ).fetchone()
+                if row != (node_keys[sources[i]], node_keys[targets[i]], strings[types[i]]):
+                    return None
+        except (snapshot_format.SnapshotFormatError, IndexError, sqlite3.Error) as e:
+            print(f"[NetworkX] Snapshot {path} not used: {e}")
+            return None
         
-        # Step 1: Load edges from graph (simplified - just load edges)
-        cursor.execute("""
-            SELECT from_node_key, to_node_key, edge_type, edge_label, properties_json
-            FROM graph_edges
-            ORDER BY edge_id
-        """)
+        # Per node: (key, table, node attrs)
+        nodes = []
+        for key in node_keys:
+            table, sep, record_id = key.partition(':')
+            nodes.append((key, table, {'label': table, 'table': table, 'record_id': record_id if sep else key}))
+        
+        # Per distinct property blob: attributes without the reserved keys
+        blob_attrs: Dict[int, Dict[str, Any]] = {snapshot_format.NO_VALUE: {}}
+        
+        parsed = []
+        edge_id = first_id
+        for source, target, type_index, label_index, properties_index in zip(
+            sources, targets, types, labels, properties
+        ):
+            base = blob_attrs.get(properties_index)
+            if base is None:
+                try:
+                    decoded = json.loads(strings[properties_index])
+                except ValueError:
+                    decoded = {}
+                base = blob_attrs[properties_index] = {
+                    k: v for k, v in decoded.items() if k not in self._RESERVED_EDGE_ATTRS
+                }
+            
+            from_key, from_table, from_attrs = nodes[source]
+            to_key, to_table, to_attrs = nodes[target]
+            edge_type = strings[type_index]
+            attrs = dict(base)
+            attrs.update(
+                label=(strings[label_index] if label_index != snapshot_format.NO_VALUE else None) or edge_type,
+                type=edge_type,
+                source_table=from_table,
+                target_table=to_table
+            )
+            parsed.append((edge_id, from_key, to_key, attrs, from_attrs, to_attrs))
+            edge_id += 1
+        return parsed
+    
+    def refresh(self) -> Dict[str, Any]:
+        """
+        Bring the in-memory graph up to date with graph_edges.
         
-        edges = cursor.fetchall()
-        nodes_added = set()
-        edges_added = 0
+        graph_edges rows are only ever inserted or deleted (a cache save
+        deletes the old ontology and inserts a new one; AUTOINCREMENT ids
+        are never reused), so an edge_id high-water mark identifies new rows
+        and a count/id check below it identifies deleted ones. Only those
+        deltas are applied; unchanged (from, to) pairs keep their entries,
+        so a schema rebuild touches almost nothing.
         
-        # Step 2: For each edge, add nodes and edges to NetworkX graph
-        for from_node, to_node, edge_type, edge_label, props_json in edges:
+        Readers do not take the lock: the deltas are applied to a copy of
+        the DiGraph, which replaces the live graph in one assignment once
+        complete. Queries keep using the graph they started with.
+        
+        If nothing is loaded yet, performs the cold bulk load so the first
+        analytics request after a rebuild is warm.
+        
+        Returns:
+            Dict with mode ('load' | 'incremental'), inserted, deleted,
+            high_water_mark and duration_ms
+        """
+        if self._graph is None:
+            start_time = datetime.now()
+            self._load_graph()
+            return self._refresh_result('load', 0, 0, start_time)
+        
+        with self._lock:
+            start_time = datetime.now()
+            hwm = self._high_water_mark
+            
+            with get_connection_pool(self.db_path).connection() as conn:
+                # Deleted rows: only scan ids when the count below the mark changed
+                remaining = conn.execute(
+                    "SELECT COUNT(*) FROM graph_edges WHERE edge_id <= ?", (hwm,)
+                ).fetchone()[0]
+                deleted_ids: Set[int] = set()
+                if remaining != len(self._edge_pairs):
+                    live_ids = {
+                        row[0] for row in conn.execute(
+                            "SELECT edge_id FROM graph_edges WHERE edge_id <= ?", (hwm,)
+                        )
+                    }
+                    deleted_ids = set(self._edge_pairs) - live_ids
+                
+                new_rows = self._parse_rows(conn.execute(f"""
+                    SELECT {self._EDGE_COLUMNS}
+                    FROM graph_edges
+                    WHERE edge_id > ?
+                    ORDER BY edge_id
+                """, (hwm,)).fetchall())
+            
+            if not deleted_ids and not new_rows:
+                return self._refresh_result('incremental', 0, 0, start_time)
+            
+            # Work on copies (attribute dicts included); bookkeeping is only
+            # read under the lock and is restored if applying fails
+            G = self._graph.copy()
+            saved = (self._edge_pairs, self._pair_edge_ids, self._high_water_mark)
+            self._edge_pairs = dict(self._edge_pairs)
+            self._pair_edge_ids = {pair: list(ids) for pair, ids in self._pair_edge_ids.items()}
+            try:
+                self._apply_delta(G, deleted_ids, new_rows)
+            except Exception:
+                self._edge_pairs, self._pair_edge_ids, self._high_water_mark = saved
+                raise
+            self._graph = G
+            
+            result = self._refresh_result('incremental', len(new_rows), len(deleted_ids), start_time)
+            print(f"[NetworkX] Refreshed graph: +{result['inserted']} / -{result['deleted']} edges "
+                  f"in {result['duration_ms']:.0f}ms")
+            return result
+    
+    def _apply_delta(self, G: nx.DiGraph, deleted_ids: Set[int], new_rows: List[tuple]) -> None:
+        """Apply deleted edge_ids and parsed new rows to G and the bookkeeping"""
+        # 1. Detach deleted rows; remember which pairs lost a row
+        touched: Set[tuple] = set()
+        for edge_id in deleted_ids:
+            pair = self._edge_pairs.pop(edge_id)
+            ids = self._pair_edge_ids[pair]
+            ids.remove(edge_id)
+            if not ids:
+                del self._pair_edge_ids[pair]
+            touched.add(pair)
+        
+        # 2. Bulk-add new rows (also re-attaches pairs deleted and re-inserted)
+        new_attrs = {edge_id: attrs for edge_id, _, _, attrs, _, _ in new_rows}
+        self._apply_rows(G, new_rows)
+        
+        # 3. Drop pairs without rows; rebuild attributes of pairs that lost a row
+        stale_ids = []
+        for pair in touched:
+            ids = self._pair_edge_ids.get(pair)
+            if not ids:
+                self._remove_pair(G, pair)
+            else:
+                stale_ids.extend(i for i in ids if i not in new_attrs)
+        if stale_ids:
+            new_attrs.update(self._fetch_edge_attrs(stale_ids))
+        for pair in touched:
+            ids = self._pair_edge_ids.get(pair)
+            if ids:
+                edge_data = G.edges[pair]
+                edge_data.clear()
+                for edge_id in sorted(ids):
+                    edge_data.update(new_attrs.get(edge_id, {}))
+    
+    def get_graph_version(self) -> str:
+        """
+        Version of the loaded graph (loads it if needed).
+        
+        Derived from the edge_id high-water mark and the number of loaded
+        rows. Cache saves re-insert rows with fresh AUTOINCREMENT ids, so
+        every rebuild applied via refresh() yields a new version, while a
+        cold load of unchanged data yields the same version again (stable
+        across restarts).
+        
+        Returns:
+            Version string "<high-water mark>-<edge rows>"
+        """
+        self._ensure_graph_loaded()
+        with self._lock:
+            return f"{self._high_water_mark}-{len(self._edge_pairs)}"
+    
+    def _parse_rows(self, rows) -> List[tuple]:
+        """
+        Parse graph_edges rows into (edge_id, from, to, edge_attrs, from_attrs, to_attrs)
+        
+        Node keys have the format "TableName:ID" (plain keys map to themselves).
+        Malformed rows are skipped with a warning.
+        """
+        parsed = []
+        for edge_id, from_node, to_node, edge_type, edge_label, props_json in rows:
             try:
                 # Parse properties if present
                 properties = {}
                 if props_json:
                     try:
                         properties = json.loads(props_json)
-                    except:
+                    except ValueError:
                         pass
                 
-                # Extract table and ID from node keys (format: "TableName:ID")
-                if ':' in from_node:
-                    from_table, from_id = from_node.split(':', 1)
-                else:
-                    from_table, from_id = from_node, from_node
-                
-                if ':' in to_node:
-                    to_table, to_id = to_node.split(':', 1)
-                else:
-                    to_table, to_id = to_node, to_node
-                
-                # Add nodes if not exists
-                if from_node not in nodes_added:
-                    G.add_node(from_node, label=from_table, table=from_table, record_id=from_id)
-                    nodes_added.add(from_node)
-                
-                if to_node not in nodes_added:
-                    G.add_node(to_node, label=to_table, table=to_table, record_id=to_id)
-                    nodes_added.add(to_node)
+                from_table, from_sep, from_id = from_node.partition(':')
+                to_table, to_sep, to_id = to_node.partition(':')
                 
                 # Remove conflicting properties that we're setting explicitly
                 # NetworkX warns if attributes are passed both as kwargs and in **kwargs dict
-                # Filter out: label, type, source_table, target_table (all set as explicit kwargs below)
-                safe_properties = {k: v for k, v in properties.items() 
-                                  if k not in ('source_table', 'target_table', 'label', 'type')}
-                
-                # Add edge with explicit properties and safe additional properties
-                G.add_edge(
-                    from_node,
-                    to_node,
+                attrs = {
+                    k: v for k, v in properties.items()
+                    if k not in self._RESERVED_EDGE_ATTRS
+                }
+                attrs.update(
                     label=edge_label or edge_type,
                     type=edge_type,
                     source_table=from_table,
-                    target_table=to_table,
-                    **safe_properties
+                    target_table=to_table
                 )
-                edges_added += 1
-            
+                parsed.append((
+                    edge_id,
+                    from_node,
+                    to_node,
+                    attrs,
+                    {'label': from_table, 'table': from_table, 'record_id': from_id if from_sep else from_node},
+                    {'label': to_table, 'table': to_table, 'record_id': to_id if to_sep else to_node}
+                ))
             except Exception as e:
                 # Skip edges that fail
                 print(f"[WARN] Skipped edge {from_node}->{to_node}: {e}")
-                continue
-        
-        conn.close()
-        
-        # Cache the graph
-        self._graph = G
-        self._load_time = (datetime.now() - start_time).total_seconds()
-        
-        print(f"[NetworkX] Loaded {len(nodes_added)} nodes, {edges_added} edges in {self._load_time*1000:.0f}ms")
-        
-        return G
+        return parsed
+    
+    def _apply_rows(self, G: nx.DiGraph, parsed: List[tuple]) -> None:
+        """Bulk-add parsed rows (in edge_id order) and record edge_id bookkeeping"""
+        new_nodes = {}
+        edges = []
+        for edge_id, from_node, to_node, attrs, from_attrs, to_attrs in parsed:
+            if from_node not in G and from_node not in new_nodes:
+                new_nodes[from_node] = from_attrs
+            if to_node not in G and to_node not in new_nodes:
+                new_nodes[to_node] = to_attrs
+            edges.append((from_node, to_node, attrs))
+            
+            pair = (from_node, to_node)
+            self._edge_pairs[edge_id] = pair
+            self._pair_edge_ids.setdefault(pair, []).append(edge_id)
+            if edge_id > self._high_water_mark:
+                self._high_water_mark = edge_id
+        
+        G.add_nodes_from(new_nodes.items())
+        G.add_edges_from(edges)
+    
+    def _remove_pair(self, G: nx.DiGraph, pair: tuple) -> None:
+        """Remove an edge and any endpoint left without edges (a cold load would not have it)"""
+        if G.has_edge(*pair):
+            G.remove_edge(*pair)
+        for node in pair:
+            if node in G and G.degree(node) == 0:
+                G.remove_node(node)
+    
+    def _fetch_edge_attrs(self, edge_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+        """Re-read edge attributes for specific rows (pairs that lost one of several rows)"""
+        attrs: Dict[int, Dict[str, Any]] = {}
+        with get_connection_pool(self.db_path).connection() as conn:
+            for i in range(0, len(edge_ids), 500):
+                chunk = edge_ids[i:i + 500]
+                placeholders = ','.join('?' for _ in chunk)
+                rows = conn.execute(
+                    f"SELECT {self._EDGE_COLUMNS} FROM graph_edges WHERE edge_id IN ({placeholders})",
+                    chunk
+                ).fetchall()
+                attrs.update((row[0], row[3]) for row in self._parse_rows(rows))
+        return attrs
+    
+    def _refresh_result(self, mode: str, inserted: int, deleted: int, start_time: datetime) -> Dict[str, Any]:
+        """Build refresh() result dict"""
+        return {
+            'mode': mode,
+            'inserted': inserted,
+            'deleted': deleted,
+            'high_water_mark': self._high_water_mark,
+            'duration_ms': (datetime.now() - start_time).total_seconds() * 1000
+        }
     
     def _ensure_graph_loaded(self) -> nx.DiGraph:
         """Ensure graph is loaded, load if needed"""
@@ -186,21 +547,18 @@ class NetworkXGraphQueryEngine(IGraphQueryEngine):
         """
         table, record_id = node_id.split(':', 1)
         
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-        
         try:
-            cursor.execute(f"SELECT * FROM {table} WHERE {table} = ? LIMIT 1", (record_id,))
-            row = cursor.fetchone()
+            with get_connection_pool(self.db_path).connection() as conn:
+                cursor = conn.cursor()
+                cursor.row_factory = sqlite3.Row
+                cursor.execute(f"SELECT * FROM {table} WHERE {table} = ? LIMIT 1", (record_id,))
+                row = cursor.fetchone()
             
             if row:
                 return dict(row)
             return {}
-        except sqlite3.Error:
+        except (sqlite3.Error, DatabaseConnectionError):
             return {}
-        finally:
-            conn.close()
     
     # ========================================================================
     # IGraphQueryEngine Implementation
@@ -260,56 +618,74 @@ class NetworkXGraphQueryEngine(IGraphQueryEngine):
         end_id: str,
         max_hops: int = 10
     ) -> Optional[GraphPath]:
-        """Find shortest path using NetworkX"""
+        """Find shortest path (bounded bidirectional BFS, gives up after max_hops levels)"""
+        paths = self.find_paths(start_id, end_id, max_hops=max_hops)
+        return paths[0] if paths else None
+    
+    def find_paths(
+        self,
+        start_id: str,
+        end_id: str,
+        max_hops: int = 10,
+        edge_types: Optional[List[str]] = None,
+        k: int = 1
+    ) -> List[GraphPath]:
+        """Find up to k shortest paths (bounded bidirectional BFS + Yen's algorithm)"""
         G = self._ensure_graph_loaded()
         
         if not G.has_node(start_id) or not G.has_node(end_id):
-            return None
+            return []
         
-        try:
-            # Use NetworkX shortest_path algorithm
-            path_nodes = nx.shortest_path(G, start_id, end_id)
-            
-            # Check max hops
-            if len(path_nodes) - 1 > max_hops:
-                return None
-            
-            # Build GraphNode objects
-            nodes = [
-                GraphNode(
-                    id=n,
-                    label=G.nodes[n].get('label', ''),
-                    properties=G.nodes[n]
-                )
-                for n in path_nodes
-            ]
-            
-            # Build GraphEdge objects
-            edges = []
-            for i in range(len(path_nodes) - 1):
-                src = path_nodes[i]
-                tgt = path_nodes[i + 1]
-                edge_data = G.get_edge_data(src, tgt)
-                
-                edges.append(GraphEdge(
-                    id=f"{src}->{tgt}",
-                    source_id=src,
-                    target_id=tgt,
-                    label=edge_data.get('label', 'related') if edge_data else 'related',
-                    properties=edge_data or {}
-                ))
+        if edge_types:
+            allowed = set(edge_types)
             
-            return GraphPath(
-                nodes=nodes,
-                edges=edges,
-                length=len(edges)
-            )
+            def successors(n):
+                return [m for m, data in G.succ[n].items() if data.get('type') in allowed]
+            
+            def predecessors(n):
+                return [m for m, data in G.pred[n].items() if data.get('type') in allowed]
+        else:
+            successors, predecessors = G.successors, G.predecessors
         
-        except nx.NetworkXNoPath:
-            return None
+        try:
+            if k == 1:
+                path = bidirectional_shortest_path(start_id, end_id, successors, predecessors, max_hops)
+                found = [path] if path else []
+            else:
+                found = k_shortest_paths(start_id, end_id, successors, predecessors, max_hops, k)
         except Exception as e:
-            print(f"[ERROR] shortest_path failed: {e}")
-            return None
+            print(f"[ERROR] find_paths failed: {e}")
+            return []
+        
+        return [self._build_path(G, path_nodes) for path_nodes in found]
+    
+    def _build_path(self, G: nx.DiGraph, path_nodes: List[str]) -> GraphPath:
+        """GraphPath for a node sequence (edge attributes shared with the graph)"""
+        nodes = [
+            GraphNode(
+                id=n,
+                label=G.nodes[n].get('label', ''),
+                properties=G.nodes[n]
+            )
+            for n in path_nodes
+        ]
+        
+        edges = []
+        for src, tgt in zip(path_nodes, path_nodes[1:]):
+            edge_data = G.get_edge_data(src, tgt)
+            edges.append(GraphEdge(
+                id=f"{src}->{tgt}",
+                source_id=src,
+                target_id=tgt,
+                label=edge_data.get('label', 'related') if edge_data else 'related',
+                properties=edge_data or {}
+            ))
+        
+        return GraphPath(
+            nodes=nodes,
+            edges=edges,
+            length=len(edges)
+        )
     
     def traverse(
         self,
@@ -319,17 +695,38 @@ class NetworkXGraphQueryEngine(IGraphQueryEngine):
         edge_types: Optional[List[str]] = None
     ) -> List[GraphNode]:
         """Breadth-first traversal using NetworkX"""
+        return self.traverse_batch([start_id], depth, direction, edge_types)
+    
+    def get_neighbors_batch(
+        self,
+        node_ids: List[str],
+        direction: TraversalDirection = TraversalDirection.OUTGOING,
+        edge_types: Optional[List[str]] = None,
+        limit: Optional[int] = None
+    ) -> Dict[str, List[GraphNode]]:
+        """Get adjacent nodes of many nodes (one graph load, in-memory lookups)"""
+        self._ensure_graph_loaded()
+        return {
+            node_id: self.get_neighbors(node_id, direction, edge_types, limit)
+            for node_id in dict.fromkeys(node_ids)
+        }
+    
+    def traverse_batch(
+        self,
+        start_ids: List[str],
+        depth: int = 2,
+        direction: TraversalDirection = TraversalDirection.OUTGOING,
+        edge_types: Optional[List[str]] = None
+    ) -> List[GraphNode]:
+        """Multi-source breadth-first traversal (all seeds at depth 0, one pass)"""
         G = self._ensure_graph_loaded()
         
-        if not G.has_node(start_id):
-            return []
-        
         visited = set()
-        queue = [(start_id, 0)]
+        queue = deque((start_id, 0) for start_id in start_ids if G.has_node(start_id))
         result_nodes = []
         
         while queue:
-            node, current_depth = queue.pop(0)
+            node, current_depth = queue.popleft()
             
             if node in visited or current_depth > depth:
                 continue
@@ -444,9 +841,13 @@ class NetworkXGraphQueryEngine(IGraphQueryEngine):
         return G.number_of_edges()
     
     def clear_cache(self) -> None:
-        """Clear cached graph"""
-        self._graph = None
-        self._load_time = None
+        """Clear cached graph (next query performs a cold load; prefer refresh())"""
+        with self._lock:
+            self._graph = None
+            self._load_time = None
+            self._high_water_mark = 0
+            self._edge_pairs = {}
+            self._pair_edge_ids = {}
     
     # ========================================================================
     # ADVANCED QUERIES (NetworkX-Specific)
@@ -465,13 +866,13 @@ class NetworkXGraphQueryEngine(IGraphQueryEngine):
         G_undirected = G.to_undirected()
         return list(nx.connected_components(G_undirected))
     
-    def get_pagerank(self, top_k: int = 10, damping_factor: float = 0.85, 
+    def get_pagerank(self, top_k: Optional[int] = 10, damping_factor: float = 0.85, 
                      max_iter: int = 200, tol: float = 1e-06) -> List[Dict[str, Any]]:
         """
         Calculate PageRank for all nodes, return top_k.
         
         Args:
-            top_k: Number of top nodes to return
+            top_k: Number of top nodes to return (None = all)
             damping_factor: Damping parameter (0.85 is Google's original value)
             max_iter: Maximum iterations (increased from NetworkX default of 100)
             tol: Convergence tolerance
@@ -504,13 +905,28 @@ class NetworkXGraphQueryEngine(IGraphQueryEngine):
             for node_id, score in sorted_scores[:top_k]
         ]
     
-    def get_betweenness_centrality(self, top_k: int = 10, vertex_table: Optional[str] = None) -> List[Dict[str, Any]]:
+    def get_betweenness_centrality(
+        self,
+        top_k: Optional[int] = 10,
+        vertex_table: Optional[str] = None,
+        sample_size: Optional[int] = None,
+        epsilon: Optional[float] = None,
+        seed: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
         """
         Calculate betweenness centrality (how often node is on shortest paths).
         
+        Exact Brandes is O(V*E). With sample_size or epsilon, only k pivot
+        nodes are used as path sources (Brandes-Pich sampling), which is
+        O(k*E) and scales to data graphs.
+        
         Args:
-            top_k: Number of top nodes to return
+            top_k: Number of top nodes to return (None = all)
             vertex_table: Optional filter by table name (e.g., 'Supplier')
+            sample_size: Number of pivot nodes k (None = exact unless epsilon)
+            epsilon: Target additive error; derives k = ln(V) / epsilon^2
+                (ignored if sample_size is given)
+            seed: Random seed for reproducible pivot selection
             
         Returns:
             List of dicts with node_id and score, sorted by score (descending)
@@ -520,7 +936,8 @@ class NetworkXGraphQueryEngine(IGraphQueryEngine):
         if G.number_of_nodes() == 0:
             return []
         
-        scores = nx.betweenness_centrality(G)
+        k = self.resolve_sample_size(G.number_of_nodes(), sample_size, epsilon)
+        scores = nx.betweenness_centrality(G, k=k, seed=seed if k else None)
         
         # Filter by vertex_table if specified
         if vertex_table:
@@ -537,12 +954,45 @@ class NetworkXGraphQueryEngine(IGraphQueryEngine):
             for node_id, score in sorted_scores[:top_k]
         ]
     
-    def get_degree_centrality(self, top_k: int = 10, vertex_table: Optional[str] = None) -> List[Dict[str, Any]]:
+    @staticmethod
+    def resolve_sample_size(
+        node_count: int,
+        sample_size: Optional[int] = None,
+        epsilon: Optional[float] = None
+    ) -> Optional[int]:
+        """
+        Number of betweenness pivots for the requested accuracy.
+        
+        Args:
+            node_count: Nodes in the graph
+            sample_size: Explicit pivot count
+            epsilon: Target additive error (k = ceil(ln(V) / epsilon^2))
+            
+        Returns:
+            Pivot count, or None for exact computation (no sampling requested,
+            or the sample would cover the whole graph anyway)
+        """
+        if sample_size is not None:
+            k = sample_size
+        elif epsilon is not None:
+            k = math.ceil(math.log(max(node_count, 2)) / (epsilon ** 2))
+        else:
+            return None
+        
+        if k < 1:
+            raise ValueError("sample_size must be >= 1 and epsilon > 0")
+        return k if k < node_count else None
+    
+    def get_degree_centrality(
+        self,
+        top_k: Optional[int] = 10,
+        vertex_table: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
         """
         Calculate degree centrality (number of connections).
         
         Args:
-            top_k: Number of top nodes to return
+            top_k: Number of top nodes to return (None = all)
             vertex_table: Optional filter by table name (e.g., 'Supplier')
             
         Returns:
@@ -570,16 +1020,49 @@ class NetworkXGraphQueryEngine(IGraphQueryEngine):
             for node_id, score in sorted_scores[:top_k]
         ]
     
-    def find_cycles(self) -> List[List[str]]:
+    def iter_cycles(self, max_length: Optional[int] = None) -> Iterator[List[str]]:
         """
-        Find all cycles in graph.
+        Stream simple cycles (lazily - stop consuming to stop the search).
+        
+        The number of simple cycles can be exponential in graph size, so
+        callers should bound consumption (see find_cycles max_cycles).
         
+        Args:
+            max_length: Only cycles with at most this many nodes (None = any);
+                also prunes the search itself
+            
+        Yields:
+            Cycles as lists of node IDs
+        """
+        G = self._ensure_graph_loaded()
+        if max_length is None:
+            yield from nx.simple_cycles(G)
+            return
+        
+        try:
+            cycles = nx.simple_cycles(G, length_bound=max_length)
+        except TypeError:
+            # networkx < 3.1 has no length_bound - filter instead of pruning
+            cycles = (cycle for cycle in nx.simple_cycles(G) if len(cycle) <= max_length)
+        yield from cycles
+    
+    def find_cycles(
+        self,
+        max_length: Optional[int] = None,
+        max_cycles: Optional[int] = None
+    ) -> List[List[str]]:
+        """
+        Find cycles in graph.
+        
+        Args:
+            max_length: Only cycles with at most this many nodes (None = any)
+            max_cycles: Stop after this many cycles (None = all)
+            
         Returns:
             List of cycles, each cycle is a list of node IDs
         """
-        G = self._ensure_graph_loaded()
         try:
-            return list(nx.simple_cycles(G))
+            return list(islice(self.iter_cycles(max_length), max_cycles))
         except:
             return []
     
@@ -13,7 +13,7 @@ Integration with CSNAssociationParser enables semantic enhancement:
 - Many-to-many relationship tracking
 """
 
-from typing import List, Dict, Set, Optional
+from typing import Iterable, List, Dict, Set, Optional
 from dataclasses import dataclass
 from functools import lru_cache
 import logging
@@ -123,7 +123,11 @@ class CSNRelationshipMapper:
         """Get set of all entity names (cached)"""
         return set(self.csn_parser.list_entities())
     
-    def discover_relationships(self, confidence_threshold: float = 0.5) -> List[Relationship]:
+    def discover_relationships(
+        self,
+        confidence_threshold: float = 0.5,
+        source_entities: Optional[Iterable[str]] = None
+    ) -> List[Relationship]:
         """
         Discover all relationships between entities
         
@@ -133,22 +137,63 @@ class CSNRelationshipMapper:
         
         Args:
             confidence_threshold: Minimum confidence score (0.0 to 1.0)
+            source_entities: Only relationships originating from these
+                entities (targets may be any entity); used by parallel
+                schema builds. None = all entities (cached).
         
         Returns:
-            List of discovered relationships (explicit + inferred)
+            List of discovered relationships (explicit + inferred), sorted
+            by confidence (highest first), then by entity/column names
         """
+        if source_entities is not None:
+            return self._discover(confidence_threshold, list(source_entities))
+        
         if self._cache is not None:
             return self._cache
         
+        result = self._discover(confidence_threshold, None)
+        
+        # Cache result
+        self._cache = result
+        logger.info(f"Total relationships discovered: {len(result)} (threshold: {confidence_threshold})")
+        return result
+    
+    def merge_relationships(
+        self,
+        groups: Iterable[Iterable[Relationship]],
+        confidence_threshold: float = 0.5
+    ) -> List[Relationship]:
+        """
+        Merge relationships discovered per source-entity partition
+        
+        Partitions never overlap (every relationship belongs to the
+        partition of its from_entity), so the merge equals a single
+        discover_relationships() run.
+        
+        Args:
+            groups: Results of discover_relationships(source_entities=...)
+            confidence_threshold: Minimum confidence for manual relationships
+        
+        Returns:
+            Merged relationships (plus manual ones), deterministically sorted
+        """
+        relationships = set()
+        for group in groups:
+            relationships.update(group)
+        relationships.update(r for r in self._manual_relationships if r.confidence >= confidence_threshold)
+        return self._sorted(relationships)
+    
+    def _discover(self, confidence_threshold: float, source_entities: Optional[List[str]]) -> List[Relationship]:
+        """Explicit + inferred relationships for source_entities (None = all)"""
         relationships = set()
         
         # TIER 1: Discover explicit CSN associations (HIGH-29 Phase 2)
-        explicit_rels = self._discover_explicit_associations()
+        explicit_rels = self._discover_explicit_associations(source_entities)
         relationships.update(explicit_rels)
         logger.info(f"Discovered {len(explicit_rels)} explicit relationships from CSN associations")
         
         # TIER 2: Discover inferred relationships (legacy fallback)
-        inferred_rels = self._discover_inferred_relationships()
+        inferred_rels = self._discover_inferred_relationships(source_entities)
         
         # Remove inferred relationships that conflict with explicit ones
         explicit_keys = {(r.from_entity, r.from_column, r.to_entity) for r in explicit_rels}
@@ -159,19 +204,21 @@ class CSNRelationshipMapper:
         
         logger.info(f"Discovered {len(inferred_rels)} inferred relationships (after deduplication)")
         
-        # Add manual relationships
-        relationships.update(self._manual_relationships)
+        # Add manual relationships (full discovery only - merge_relationships adds them once)
+        if source_entities is None:
+            relationships.update(self._manual_relationships)
         
         # Filter by confidence threshold
         filtered = [r for r in relationships if r.confidence >= confidence_threshold]
-        
-        # Sort by confidence (highest first)
-        result = sorted(filtered, key=lambda r: r.confidence, reverse=True)
-        
-        # Cache result
-        self._cache = result
-        logger.info(f"Total relationships discovered: {len(result)} (threshold: {confidence_threshold})")
-        return result
+        return self._sorted(filtered)
+    
+    @staticmethod
+    def _sorted(relationships: Iterable[Relationship]) -> List[Relationship]:
+        """Sort by confidence (highest first); names break ties so the order never depends on set iteration"""
+        return sorted(
+            relationships,
+            key=lambda r: (-r.confidence, r.from_entity, r.from_column, r.to_entity, r.to_column)
+        )
     
     def _get_association_parser(self):
         """Lazy-load CSNAssociationParser"""
@@ -180,10 +227,13 @@ class CSNRelationshipMapper:
             self._association_parser = CSNAssociationParser(self.csn_parser)
         return self._association_parser
     
-    def _discover_explicit_associations(self) -> Set[Relationship]:
+    def _discover_explicit_associations(self, source_entities: Optional[List[str]] = None) -> Set[Relationship]:
         """
         Discover explicit relationships from CSN associations (HIGH-29 Phase 2)
         
+        Args:
+            source_entities: Only associations of these entities (None = all)
+        
         Returns:
             Set of relationships from CSN associations (with ON conditions)
         """
@@ -191,7 +241,14 @@ class CSNRelationshipMapper:
         
         try:
             parser = self._get_association_parser()
-            associations = parser.parse_all_associations()
+            if source_entities is None:
+                associations = parser.parse_all_associations()
+            else:
+                associations = [
+                    assoc
+                    for entity_name in source_entities
+                    for assoc in parser.parse_entity_associations(entity_name)
+                ]
             
             for assoc in associations:
                 # Strip namespace prefix from target entity (HIGH-29 fix)
@@ -244,18 +301,21 @@ class CSNRelationshipMapper:
             return entity_name.split('.')[-1]
         return entity_name
     
-    def _discover_inferred_relationships(self) -> Set[Relationship]:
+    def _discover_inferred_relationships(self, source_entities: Optional[List[str]] = None) -> Set[Relationship]:
         """
         Discover inferred relationships from column naming conventions (legacy)
         
+        Args:
+            source_entities: Only scan columns of these entities (None = all)
+        
         Returns:
             Set of inferred relationships
         """
         relationships = set()
         entities = self._get_entity_set()
         
-        # Scan all entities for potential relationships
-        for entity_name in entities:
+        # Scan entities for potential relationships (targets: any entity)
+        for entity_name in (entities if source_entities is None else source_entities):
             entity = self.csn_parser.get_entity_metadata(entity_name)
             if not entity:
                 continue
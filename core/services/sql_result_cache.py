@@ -0,0 +1,251 @@
+"""
+SQL Result Cache
+
+Byte-bounded LRU cache for the results of read-only (AI-generated) SQL.
+
+Users often re-ask the same question and the agent repeats identical
+queries within a conversation; each repetition used to run against the
+database again.
+
+Keys: (datasource, normalized SQL). Normalization collapses whitespace,
+lowercases everything outside string literals / quoted identifiers and
+drops a trailing semicolon, so formatting differences still hit.
+
+Freshness:
+- Callers pass a data version (SQLite: file identity + PRAGMA
+  data_version). An entry is only served for the version it was stored
+  with
+- Without a version (HANA: no cheap change signal) entries expire after
+  ttl_seconds
+
+Only successful results are cached. Entries larger than max_entry_bytes
+are not stored (a single huge result must not flush the whole cache).
+
+@author P2P Development Team
+@version 1.0.0
+@date 2026-02-25
+"""
+
+import json
+import logging
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# String literals and quoted identifiers are kept verbatim
+_QUOTED = re.compile(r"('(?:[^']|'')*'|\"(?:[^\"]|\"\")*\")")
+_WHITESPACE = re.compile(r'\s+')
+
+
+def normalize_sql(sql: str) -> str:
+    """
+    Normalize SQL text for use as a cache key
+
+    Args:
+        sql: SQL statement
+
+    Returns:
+        SQL with collapsed whitespace, lowercase outside quotes and
+        without trailing semicolon
+    """
+    parts = _QUOTED.split(sql.strip().rstrip(';').strip())
+    return ''.join(
+        part if i % 2 else _WHITESPACE.sub(' ', part).lower()
+        for i, part in enumerate(parts)
+    )
+
+
+def estimate_size(value: Any) -> int:
+    """
+    Approximate memory footprint of a cached result
+
+    Args:
+        value: JSON-like result (dicts, lists, scalars)
+
+    Returns:
+        Length of its JSON serialization
+    """
+    return len(json.dumps(value, default=str))
+
+
+class SQLResultCache:
+    """
+    Thread-safe, byte-bounded LRU of SQL results
+
+    Usage:
+        cache = SQLResultCache(max_bytes=64 * 1024 * 1024, ttl_seconds=300)
+
+        version = repo.get_data_version()
+        result = cache.get('sqlite', sql, version)
+        if result is None:
+            result = run(sql)
+            cache.put('sqlite', sql, result, version, size=estimate_size(result['rows']))
+    """
+
+    DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+    def __init__(
+        self,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        ttl_seconds: Optional[float] = 300.0,
+        max_entry_bytes: Optional[int] = None,
+        enabled: bool = True
+    ):
+        """
+        Initialize cache
+
+        Args:
+            max_bytes: Total size budget (least recently used entries are evicted)
+            ttl_seconds: Lifetime of entries stored without a data version
+                (None = no expiry)
+            max_entry_bytes: Largest single entry (default: max_bytes / 4)
+            enabled: False turns every get into a bypass and put into a no-op
+        """
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be >= 1")
+
+        self._max_bytes = max_bytes
+        self._max_entry_bytes = max_entry_bytes if max_entry_bytes is not None else max_bytes // 4
+        self._ttl_seconds = ttl_seconds
+        self.enabled = enabled
+
+        # key -> (value, version, expires_at, size)
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[Any, Any, Optional[float], int]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._stats = {
+            'hits': 0,
+            'misses': 0,
+            'bypasses': 0,
+            'stores': 0,
+            'evictions': 0,
+            'expirations': 0,
+            'version_invalidations': 0,
+            'oversized': 0
+        }
+
+    def get(self, datasource: str, sql: str, version: Any = None) -> Optional[Any]:
+        """
+        Look up a cached result
+
+        Args:
+            datasource: Datasource the query runs against
+            sql: SQL statement (normalized internally)
+            version: Current data version (None = TTL-based entry)
+
+        Returns:
+            Cached result, or None on a miss
+        """
+        if not self.enabled:
+            self.record_bypass()
+            return None
+
+        key = (datasource, normalize_sql(sql))
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, entry_version, expires_at, _ = entry
+                if entry_version != version:
+                    self._stats['version_invalidations'] += 1
+                    self._remove(key)
+                elif expires_at is not None and now >= expires_at:
+                    self._stats['expirations'] += 1
+                    self._remove(key)
+                else:
+                    self._entries.move_to_end(key)
+                    self._stats['hits'] += 1
+                    return value
+            self._stats['misses'] += 1
+            return None
+
+    def put(self, datasource: str, sql: str, value: Any, version: Any = None, size: Optional[int] = None) -> bool:
+        """
+        Store a result
+
+        Args:
+            datasource: Datasource the query ran against
+            sql: SQL statement (normalized internally)
+            value: Result to cache (treated as immutable by callers)
+            version: Data version the result belongs to (None = expire after TTL)
+            size: Size in bytes (default: estimate_size(value))
+
+        Returns:
+            True if stored, False if disabled or too large
+        """
+        if not self.enabled:
+            return False
+
+        size = estimate_size(value) if size is None else size
+        key = (datasource, normalize_sql(sql))
+        expires_at = None
+        if version is None and self._ttl_seconds is not None:
+            expires_at = time.monotonic() + self._ttl_seconds
+
+        with self._lock:
+            if size > self._max_entry_bytes:
+                self._stats['oversized'] += 1
+                return False
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (value, version, expires_at, size)
+            self._bytes += size
+            self._stats['stores'] += 1
+            while self._bytes > self._max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self._stats['evictions'] += 1
+        return True
+
+    def record_bypass(self) -> None:
+        """Count a lookup skipped on the caller's request (or while disabled)"""
+        with self._lock:
+            self._stats['bypasses'] += 1
+
+    def invalidate(self, datasource: Optional[str] = None) -> int:
+        """
+        Drop cached results
+
+        Args:
+            datasource: Only drop this datasource's entries (None = all)
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            keys = [key for key in self._entries if datasource is None or key[0] == datasource]
+            for key in keys:
+                self._remove(key)
+
+        logger.info(f"SQL result cache invalidated: {len(keys)} entries ({datasource or 'all datasources'})")
+        return len(keys)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics
+
+        Returns:
+            Dict with size in entries and bytes, limits, hit ratio and counters
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            lookups = stats['hits'] + stats['misses']
+            return {
+                'enabled': self.enabled,
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'max_bytes': self._max_bytes,
+                'max_entry_bytes': self._max_entry_bytes,
+                'ttl_seconds': self._ttl_seconds,
+                'hit_ratio': round(stats['hits'] / lookups, 4) if lookups else 0.0,
+                **stats
+            }
+
+    def _remove(self, key: Tuple[str, str]) -> None:
+        """Delete an entry and release its bytes (lock held by caller)"""
+        _, _, _, size = self._entries.pop(key)
+        self._bytes -= size
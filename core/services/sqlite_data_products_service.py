@@ -12,7 +12,18 @@ Columns: 321 total across all tables
 
 import sqlite3
 import os
-from typing import List, Dict, Optional
+from typing import List, Dict, Iterator, Optional, Tuple
+
+from core.interfaces.data_product_repository import TableStream
+
+from core.services.database_connection_factory import get_connection_pool
+from core.services.table_pagination import (
+    TableCountCache,
+    build_keyset_predicate,
+    decode_cursor,
+    encode_cursor,
+    quote_identifier
+)
 
 
 class SQLiteDataProductsService:
@@ -42,6 +53,12 @@ class SQLiteDataProductsService:
         
         self.db_path = db_path
         self._ensure_database()
+        
+        # Shared read-only connections (process-wide per database file)
+        self._pool = get_connection_pool(self.db_path)
+        
+        # Row counts per table, dropped whenever PRAGMA data_version moves
+        self._count_cache = TableCountCache(version_provider=self._pool.get_data_version)
     
     def _ensure_database(self):
         """
@@ -83,7 +100,7 @@ class SQLiteDataProductsService:
         Returns:
             List of data product metadata dictionaries
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._pool.acquire()
         cursor = conn.cursor()
         
         try:
@@ -229,7 +246,7 @@ class SQLiteDataProductsService:
             return products
         
         finally:
-            conn.close()
+            self._pool.release(conn)
     
     def get_tables(self, schema: str, entity_name: str = None) -> List[Dict]:
         """
@@ -243,7 +260,7 @@ class SQLiteDataProductsService:
         Returns:
             List of table metadata dictionaries
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._pool.acquire()
         cursor = conn.cursor()
         
         try:
@@ -395,7 +412,7 @@ class SQLiteDataProductsService:
             return tables
         
         finally:
-            conn.close()
+            self._pool.release(conn)
     
     def get_table_structure(self, schema: str, table: str) -> List[Dict]:
         """
@@ -408,7 +425,7 @@ class SQLiteDataProductsService:
         Returns:
             List of column metadata dictionaries with FK information
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._pool.acquire()
         cursor = conn.cursor()
         
         try:
@@ -454,49 +471,71 @@ class SQLiteDataProductsService:
             return columns
         
         finally:
-            conn.close()
+            self._pool.release(conn)
     
     def query_table(
         self, 
         schema: str, 
         table: str, 
         limit: int = 100, 
-        offset: int = 0
+        offset: int = 0,
+        cursor: Optional[str] = None
     ) -> Dict:
         """
         Query data from a table.
         
+        Two pagination modes:
+        - Offset (cursor is None): LIMIT/OFFSET, cost grows with offset
+        - Keyset (cursor is a string, '' for the first page): seeks past the
+          primary key in the continuation token, constant cost per page
+        
+        The total row count is cached per table and invalidated via
+        PRAGMA data_version, so scrolling does not re-count the table.
+        
         Args:
             schema: Schema name
             table: Table name
             limit: Maximum rows to return
-            offset: Number of rows to skip
+            offset: Number of rows to skip (offset mode only)
+            cursor: Continuation token from a previous page's 'nextCursor'
         
         Returns:
             Dictionary with rows, columns, totalCount, executionTime
+            (keyset mode adds nextCursor and hasMore)
+        
+        Raises:
+            InvalidCursorError: If the cursor is malformed or belongs to another table
         """
         import time
         start_time = time.time()
         
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row  # Enable column access by name
-        cursor = conn.cursor()
+        conn = self._pool.acquire()
+        cursor_obj = conn.cursor()
+        cursor_obj.row_factory = sqlite3.Row  # Enable column access by name
         
         try:
-            # Get total count
-            cursor.execute(f"SELECT COUNT(*) FROM {table}")
-            total_count = cursor.fetchone()[0]
-            
-            # Get data with limit/offset
-            cursor.execute(
-                f"SELECT * FROM {table} LIMIT ? OFFSET ?",
-                (limit, offset)
+            table_sql = quote_identifier(table)
+            total_count = self._count_cache.get_or_compute(
+                table,
+                lambda: cursor_obj.execute(f"SELECT COUNT(*) FROM {table_sql}").fetchone()[0]
             )
             
+            key_columns = None
+            if cursor is None:
+                # Get data with limit/offset
+                cursor_obj.execute(
+                    f"SELECT * FROM {table_sql} LIMIT ? OFFSET ?",
+                    (limit, offset)
+                )
+                fetched = cursor_obj.fetchall()
+            else:
+                key_columns = self._get_key_columns(cursor_obj, table)
+                fetched = self._fetch_keyset_page(cursor_obj, table, key_columns, limit, cursor)
+            
             rows = []
             columns_info = []
             
-            for row in cursor.fetchall():
+            for row in fetched:
                 # Convert Row to dict
                 row_dict = dict(row)
                 rows.append(row_dict)
@@ -506,19 +545,119 @@ class SQLiteDataProductsService:
                     columns_info = [
                         {'name': col, 'type': type(row_dict[col]).__name__}
                         for col in row.keys()
+                        if col != self._ROWID_ALIAS
                     ]
             
-            execution_time = (time.time() - start_time) * 1000  # Convert to ms
-            
-            return {
+            result = {
                 'rows': rows,
                 'columns': columns_info,
                 'totalCount': total_count,
-                'executionTime': round(execution_time, 2)
             }
+            
+            if key_columns is not None:
+                has_more = len(rows) > limit
+                rows = rows[:limit]
+                next_cursor = None
+                if has_more and rows:
+                    last = rows[-1]
+                    next_cursor = encode_cursor(table, key_columns, [last[col] for col in key_columns])
+                if key_columns == [self._ROWID_ALIAS]:
+                    for row_dict in rows:
+                        row_dict.pop(self._ROWID_ALIAS, None)
+                result['rows'] = rows
+                result['nextCursor'] = next_cursor
+                result['hasMore'] = has_more
+            
+            execution_time = (time.time() - start_time) * 1000  # Convert to ms
+            result['executionTime'] = round(execution_time, 2)
+            return result
         
         finally:
+            self._pool.release(conn)
+    
+    # Alias used when a table has no declared primary key (keyset on rowid)
+    _ROWID_ALIAS = '__rowid__'
+    
+    def _get_key_columns(self, cursor, table: str) -> List[str]:
+        """
+        Get the ordered primary-key columns used for keyset pagination.
+        
+        Falls back to SQLite's implicit rowid for tables without a declared key.
+        """
+        cursor.execute(f"PRAGMA table_info({quote_identifier(table)})")
+        table_info = cursor.fetchall()
+        if not table_info:
+            raise ValueError(f"Table not found: {table}")
+        
+        # PRAGMA table_info: (cid, name, type, notnull, dflt_value, pk) - pk is 1-based key position
+        pk_columns = sorted((row[5], row[1]) for row in table_info if row[5] > 0)
+        if pk_columns:
+            return [name for _, name in pk_columns]
+        return [self._ROWID_ALIAS]
+    
+    def _fetch_keyset_page(
+        self,
+        cursor,
+        table: str,
+        key_columns: List[str],
+        limit: int,
+        token: str
+    ) -> List[sqlite3.Row]:
+        """Fetch limit + 1 rows after the token's key (the extra row signals hasMore)"""
+        table_sql = quote_identifier(table)
+        if key_columns == [self._ROWID_ALIAS]:
+            select_sql = f"SELECT rowid AS {self._ROWID_ALIAS}, * FROM {table_sql}"
+            order_sql = "rowid"
+            seek_columns = ['rowid']
+        else:
+            select_sql = f"SELECT * FROM {table_sql}"
+            order_sql = ', '.join(quote_identifier(col) for col in key_columns)
+            seek_columns = key_columns
+        
+        params: List = []
+        if token:
+            key_values = decode_cursor(token, table, key_columns)
+            predicate, params = build_keyset_predicate(seek_columns, key_values)
+            select_sql += f" WHERE {predicate}"
+        
+        cursor.execute(f"{select_sql} ORDER BY {order_sql} LIMIT ?", (*params, limit + 1))
+        return cursor.fetchall()
+    
+    def stream_table(self, schema: str, table: str, batch_size: int = 1000) -> TableStream:
+        """
+        Stream all rows of a table in fetchmany() batches.
+        
+        Uses a dedicated read-only connection (exports can run for minutes
+        and should not hold a pool slot). The connection is closed when the
+        batch iterator is exhausted or closed.
+        
+        Args:
+            schema: Schema name (ignored for SQLite)
+            table: Table name
+            batch_size: Rows per fetchmany() call
+        
+        Returns:
+            TableStream with column names and lazy row batches
+        """
+        conn = self._pool.create_unpooled_connection()
+        try:
+            cursor = conn.execute(f"SELECT * FROM {quote_identifier(table)}")
+            columns = [desc[0] for desc in cursor.description]
+        except Exception:
             conn.close()
+            raise
+        
+        def batches() -> Iterator[List[Tuple]]:
+            try:
+                while True:
+                    rows = cursor.fetchmany(batch_size)
+                    if not rows:
+                        break
+                    yield rows
+            finally:
+                conn.close()
+        
+        return TableStream(columns=columns, batches=batches())
     
     def get_csn_definition(self, schema: str) -> Optional[Dict]:
         """
@@ -0,0 +1,211 @@
+"""
+Table Pagination Helpers
+
+Keyset (seek) pagination and row-count caching shared by the SQLite and
+HANA data product repositories.
+
+Keyset pagination replaces ``LIMIT ? OFFSET ?`` with
+``WHERE (pk) > (last seen pk) ORDER BY pk LIMIT ?`` so every page costs the
+same as the first one, regardless of depth. Clients receive an opaque
+continuation token (base64url JSON of the last row's primary-key values)
+and send it back to fetch the next page.
+
+@author P2P Development Team
+@version 1.0.0
+@date 2026-02-24
+"""
+
+import base64
+import json
+import threading
+import time
+import logging
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from core.interfaces.data_product_repository import InvalidCursorError
+
+logger = logging.getLogger(__name__)
+
+
+def quote_identifier(name: str) -> str:
+    """
+    Quote a SQL identifier (works for both SQLite and HANA)
+
+    Args:
+        name: Table or column name
+
+    Returns:
+        Double-quoted identifier with embedded quotes escaped
+    """
+    return '"' + name.replace('"', '""') + '"'
+
+
+def encode_cursor(table: str, key_columns: Sequence[str], key_values: Sequence[Any]) -> str:
+    """
+    Build an opaque continuation token from the last row's key values
+
+    Args:
+        table: Table the token belongs to
+        key_columns: Ordered key column names
+        key_values: Key values of the last row on the current page
+
+    Returns:
+        URL-safe token string
+    """
+    payload = {'t': table, 'c': list(key_columns), 'v': list(key_values)}
+    raw = json.dumps(payload, separators=(',', ':'), default=str).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def decode_cursor(token: str, table: str, key_columns: Sequence[str]) -> List[Any]:
+    """
+    Decode a continuation token produced by encode_cursor()
+
+    Args:
+        token: Token received from the client
+        table: Table being queried
+        key_columns: Ordered key column names of that table
+
+    Returns:
+        Key values to seek past
+
+    Raises:
+        InvalidCursorError: If the token is malformed or does not match the table/key
+    """
+    try:
+        padded = token + '=' * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+    except (ValueError, TypeError, UnicodeError) as e:
+        raise InvalidCursorError(f"Malformed cursor: {e}") from e
+
+    if not isinstance(payload, dict) or payload.get('t') != table or payload.get('c') != list(key_columns):
+        raise InvalidCursorError(f"Cursor does not belong to table '{table}'")
+
+    values = payload.get('v')
+    if not isinstance(values, list) or len(values) != len(key_columns):
+        raise InvalidCursorError("Cursor key values do not match table key")
+    return values
+
+
+def build_keyset_predicate(
+    key_columns: Sequence[str],
+    key_values: Sequence[Any],
+    row_value_syntax: bool = True
+) -> Tuple[str, List[Any]]:
+    """
+    Build the ``rows after key_values`` predicate for keyset pagination
+
+    Args:
+        key_columns: Ordered key column names (unquoted)
+        key_values: Key values of the last row already returned
+        row_value_syntax: Use ``(a, b) > (?, ?)`` (SQLite >= 3.15). When False,
+            expand into the equivalent OR chain (HANA has no row-value comparison).
+
+    Returns:
+        Tuple of (SQL predicate, parameters)
+    """
+    quoted = [quote_identifier(col) for col in key_columns]
+
+    if row_value_syntax or len(quoted) == 1:
+        placeholders = ', '.join('?' for _ in quoted)
+        return f"({', '.join(quoted)}) > ({placeholders})", list(key_values)
+
+    # (a > ?) OR (a = ? AND b > ?) OR (a = ? AND b = ? AND c > ?) ...
+    clauses = []
+    params: List[Any] = []
+    for i, col in enumerate(quoted):
+        parts = [f"{prev} = ?" for prev in quoted[:i]] + [f"{col} > ?"]
+        clauses.append('(' + ' AND '.join(parts) + ')')
+        params.extend(key_values[:i + 1])
+    return '(' + ' OR '.join(clauses) + ')', params
+
+
+class TableCountCache:
+    """
+    Per-table row-count cache
+
+    Entries are invalidated either by a version provider (e.g. SQLite
+    ``PRAGMA data_version``: any change means some table changed, so every
+    entry is stale) or by a TTL (HANA, where no cheap change signal exists).
+
+    Example:
+        cache = TableCountCache(version_provider=pool.get_data_version)
+        total = cache.get_or_compute('PurchaseOrder', lambda: count_rows())
+    """
+
+    def __init__(
+        self,
+        version_provider: Optional[Callable[[], Any]] = None,
+        ttl_seconds: Optional[float] = None
+    ):
+        """
+        Initialize cache
+
+        Args:
+            version_provider: Returns a value that changes whenever data changes
+            ttl_seconds: Maximum entry age in seconds (None = no expiry)
+        """
+        self._version_provider = version_provider
+        self._ttl_seconds = ttl_seconds
+        self._entries: Dict[str, Tuple[int, Any, float]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_compute(self, key: str, compute: Callable[[], Optional[int]]) -> Optional[int]:
+        """
+        Get cached count or compute and store it
+
+        Args:
+            key: Cache key (typically "schema.table")
+            compute: Function returning the exact row count, or None if
+                it is unknown (e.g. the COUNT query failed)
+
+        Returns:
+            Row count (None if unknown; unknown counts are not cached)
+        """
+        version = self._current_version()
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                count, entry_version, stored_at = entry
+                fresh = entry_version == version
+                if fresh and self._ttl_seconds is not None:
+                    fresh = (now - stored_at) < self._ttl_seconds
+                if fresh:
+                    self.hits += 1
+                    return count
+            self.misses += 1
+
+        count = compute()
+        if count is None:
+            return None
+        with self._lock:
+            self._entries[key] = (count, version, now)
+        return count
+
+    def invalidate(self, key: Optional[str] = None) -> None:
+        """
+        Drop one entry or the whole cache
+
+        Args:
+            key: Entry to drop (None = everything)
+        """
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def _current_version(self) -> Any:
+        """Read the current data version (None when no provider / probe fails)"""
+        if self._version_provider is None:
+            return None
+        try:
+            return self._version_provider()
+        except Exception as e:
+            # Unknown version - use a unique sentinel so nothing is served stale
+            logger.warning(f"Count cache version probe failed: {e}")
+            return object()
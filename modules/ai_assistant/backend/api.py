@@ -19,8 +19,8 @@ from .models import (
     ConversationContext,
     AssistantResponse
 )
-from .services import get_conversation_service, get_joule_agent
-import asyncio
+from .services import get_conversation_service, get_joule_agent, get_async_runtime
+from .services.stream_bridge import AsyncStreamBridge, HEARTBEAT
 
 # Create blueprint
 blueprint = Blueprint('ai_assistant', __name__, url_prefix='/api/ai-assistant')
@@ -53,6 +53,16 @@ def _map_datasource_to_facade_key(datasource: str) -> str:
     return mapping.get(datasource, 'sqlite')  # Default to sqlite
 
 
+def _get_async_runtime():
+    """
+    Get the shared event loop runtime for agent calls
+    
+    Injected by configure_ai_assistant; falls back to the module singleton
+    (e.g. blueprint registered without DI in tests).
+    """
+    return current_app.config.get('AI_ASSISTANT_ASYNC_RUNTIME') or get_async_runtime()
+
+
 @blueprint.route('/conversations', methods=['GET'])
 def list_conversations():
     """
@@ -256,8 +266,8 @@ def send_message(conversation_id):
                         "content": msg.content
                     })
             
-            # Process message with agent (async)
-            ai_response = asyncio.run(agent.process_message(
+            # Process message with agent (async, on the shared event loop)
+            ai_response = _get_async_runtime().run(agent.process_message(
                 user_message=user_message,
                 conversation_history=history,
                 context=session.context.dict(),
@@ -461,8 +471,22 @@ def chat_stream():
                     "content": msg.content
                 })
         
+        # Read stream settings while the request context is active
+        heartbeat_seconds = current_app.config.get('AI_ASSISTANT_STREAM_HEARTBEAT_SECONDS', 15)
+        queue_size = current_app.config.get('AI_ASSISTANT_STREAM_QUEUE_SIZE', 64)
+        runtime = _get_async_runtime()
+        
         def generate():
-            """Generator function for SSE streaming"""
+            """
+            Generator function for SSE streaming
+            
+            The agent stream runs on the shared event loop and each chunk is
+            forwarded as soon as it arrives (no buffering of the full answer).
+            Idle periods produce SSE comment heartbeats; when the client
+            disconnects, Flask closes this generator and the bridge cancels
+            the agent stream.
+            """
+            bridge = None
             try:
                 # Get injected services from DI container
                 sql_service = current_app.config['AI_ASSISTANT_SQL_SERVICE']
@@ -477,69 +501,44 @@ def chat_stream():
                 # Get Joule agent
                 agent = get_joule_agent()
                 
-                # Stream response
-                async def stream_response():
-                    """Async generator for streaming"""
-                    nonlocal conversation_id
-                    
-                    full_message = ""
-                    final_response = None
-                    
-                    async for event in agent.process_message_stream(
+                bridge = AsyncStreamBridge(
+                    lambda: agent.process_message_stream(
                         user_message=user_message,
                         conversation_history=history,
                         context=session.context.dict(),
                         sql_execution_service=sql_service,
                         repository=repository
-                    ):
-                        
-                        if event['type'] == 'delta':
-                            # Accumulate message content
-                            full_message += event['content']
-                            # Send delta to client
-                            yield f"data: {json.dumps(event)}\n\n"
-                        
-                        elif event['type'] == 'tool_call':
-                            # Send tool call notification
-                            yield f"data: {json.dumps(event)}\n\n"
-                        
-                        elif event['type'] == 'done':
-                            # Final result
-                            final_response = event['response']
-                            # Add conversation_id to response
-                            event['conversation_id'] = conversation_id
-                            yield f"data: {json.dumps(event)}\n\n"
+                    ),
+                    max_queue_size=queue_size,
+                    heartbeat_interval=heartbeat_seconds,
+                    loop=runtime.loop
+                )
+                
+                final_response = None
+                for event in bridge:
+                    if event is HEARTBEAT:
+                        # SSE comment: keeps proxies from closing an idle stream
+                        yield ": heartbeat\n\n"
+                        continue
                     
-                    # Save assistant response to conversation
-                    if final_response:
-                        from .models import AssistantResponse
-                        assistant_resp = AssistantResponse(**final_response)
-                        conversation_service.add_assistant_message(conversation_id, assistant_resp)
+                    if event['type'] == 'done':
+                        # Final result
+                        final_response = event['response']
+                        # Add conversation_id to response
+                        event['conversation_id'] = conversation_id
+                    elif event['type'] not in ('delta', 'tool_call'):
+                        continue
                     
-                    # Send completion signal
-                    yield "data: [DONE]\n\n"
-                
-                # Use asyncio.run() with proper event loop management
-                # This avoids the "cancel scope" error by using a single event loop
-                import asyncio
-                import sys
-                
-                # Collect all chunks from async generator
-                async def collect_chunks():
-                    chunks = []
-                    async for chunk in stream_response():
-                        chunks.append(chunk)
-                    return chunks
+                    # Forward immediately
+                    yield f"data: {json.dumps(event)}\n\n"
                 
-                # Run in new event loop (Windows-safe)
-                if sys.platform == 'win32':
-                    asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+                # Save assistant response to conversation
+                if final_response:
+                    assistant_resp = AssistantResponse(**final_response)
+                    conversation_service.add_assistant_message(conversation_id, assistant_resp)
                 
-                chunks = asyncio.run(collect_chunks())
-                
-                # Yield all chunks
-                for chunk in chunks:
-                    yield chunk
+                # Send completion signal
+                yield "data: [DONE]\n\n"
                 
             except Exception as e:
                 # Check if it's a Groq rate limit error
@@ -569,6 +568,10 @@ def chat_stream():
                     }
                 
                 yield f"data: {json.dumps(error_event)}\n\n"
+            
+            finally:
+                if bridge is not None:
+                    bridge.close()
         
         return Response(
             stream_with_context(generate()),
@@ -666,8 +669,8 @@ def chat():
                         "content": msg.content
                     })
             
-            # Process message with agent (async)
-            ai_response = asyncio.run(agent.process_message(
+            # Process message with agent (async, on the shared event loop)
+            ai_response = _get_async_runtime().run(agent.process_message(
                 user_message=req.message,
                 conversation_history=history,
                 context=session.context.dict(),
@@ -751,7 +754,9 @@ def execute_sql():
     Request:
         {
             "sql": "SELECT * FROM suppliers WHERE rating > 4.5",
-            "datasource": "p2p_data"  (optional, default: p2p_data)
+            "datasource": "p2p_data",  (optional, default: p2p_data)
+            "use_cache": true  (optional; false or header "Cache-Control: no-cache"
+                                bypasses the SQL result cache)
         }
     
     Response:
@@ -761,7 +766,8 @@ def execute_sql():
             "columns": ["id", "name", "rating"],
             "row_count": 10,
             "execution_time_ms": 15.5,
-            "warnings": ["Query modified to enforce LIMIT 1000"]
+            "warnings": ["Query modified to enforce LIMIT 1000"],
+            "cached": false
         }
     """
     try:
@@ -775,12 +781,13 @@ def execute_sql():
         
         sql = data['sql']
         datasource = data.get('datasource', 'p2p_data')
+        use_cache = bool(data.get('use_cache', True)) and 'no-cache' not in request.headers.get('Cache-Control', '')
         
         # Get SQL execution service from DI container (injected in server.py)
         sql_service = current_app.config['AI_ASSISTANT_SQL_SERVICE']
         
         # Execute query with datasource parameter
-        result = sql_service.execute_query(sql, datasource=datasource)
+        result = sql_service.execute_query(sql, datasource=datasource, use_cache=use_cache)
         
         # Return result
         return jsonify({
@@ -790,7 +797,8 @@ def execute_sql():
             "row_count": result.row_count,
             "execution_time_ms": result.execution_time_ms,
             "error": result.error,
-            "warnings": result.warnings
+            "warnings": result.warnings,
+            "cached": result.cached
         }), 200 if result.success else 400
         
     except Exception as e:
@@ -813,6 +821,20 @@ def health():
     except Exception as e:
         agent_status = f"error: {str(e)}"
     
+    # SQL result cache (shared by /sql/execute and the agent's execute_sql tool)
+    result_cache = getattr(current_app.config.get('AI_ASSISTANT_SQL_SERVICE'), 'result_cache', None)
+    sql_cache_stats = result_cache.get_stats() if result_cache else None
+    
+    # Pre-rendered schema fragments for the agent prompt
+    schema_context = current_app.config.get('AI_ASSISTANT_SCHEMA_CONTEXT')
+    schema_context_stats = schema_context.get_stats() if schema_context else None
+    
+    # Shared event loop: lag and in-flight agent tasks
+    try:
+        runtime_stats = _get_async_runtime().stats()
+    except Exception as e:
+        runtime_stats = {"error": str(e)}
+    
     return jsonify({
         "status": "healthy",
         "version": "2.1.0",
@@ -824,5 +846,8 @@ def health():
             "features": ["Type-safe responses", "P2P data access", "Conversation context", "Error fallback", "SQL execution"]
         },
         "agent_status": agent_status,
+        "async_runtime": runtime_stats,
+        "sql_result_cache": sql_cache_stats,
+        "schema_context": schema_context_stats,
         "statistics": stats
     })
\ No newline at end of file
@@ -9,9 +9,18 @@ from .conversation_service import (
     get_conversation_service
 )
 from .agent_service import get_joule_agent
+from .async_runtime import AsyncRuntime, get_async_runtime
+from .tool_executor import ToolExecutor, get_tool_executor
+from .schema_context_provider import SchemaContextProvider, get_schema_context_provider
 
 __all__ = [
     'ConversationService',
     'get_conversation_service',
-    'get_joule_agent'
+    'get_joule_agent',
+    'AsyncRuntime',
+    'get_async_runtime',
+    'ToolExecutor',
+    'get_tool_executor',
+    'SchemaContextProvider',
+    'get_schema_context_provider'
 ]
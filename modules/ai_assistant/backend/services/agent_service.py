@@ -17,6 +17,8 @@ from ..models import AssistantResponse, SuggestedAction
 from core.interfaces.data_product_repository import IDataProductRepository
 from core.services.ontology_service import get_ontology_service
 from .ai_core_auth import get_ai_core_auth
+from .tool_executor import ToolExecutor, get_tool_executor
+from .schema_context_provider import SchemaContextProvider, get_schema_context_provider
 
 
 class SAPAICoreOpenAI(OpenAIModel):
@@ -121,7 +123,9 @@ class JouleAgent:
         model_name: Optional[str] = None,
         temperature: float = 0.7,
         max_retries: int = 2,
-        provider: Optional[str] = None  # Auto-detect from env if None
+        provider: Optional[str] = None,  # Auto-detect from env if None
+        tool_executor: Optional[ToolExecutor] = None,
+        schema_context: Optional[SchemaContextProvider] = None
     ):
         """
         Initialize Joule agent with auto-provider detection
@@ -132,6 +136,10 @@ class JouleAgent:
             max_retries: Validation retry attempts
             provider: Force specific provider ("groq" | "github" | "ai_core")
                      If None, reads from AI_PROVIDER env var (default: "groq")
+            tool_executor: Runs blocking repository/SQL calls of tools off the
+                     event loop (default: shared singleton)
+            schema_context: Pre-rendered datasource schema fragments for the
+                     prompt (default: shared singleton)
         
         Environment Variables:
             AI_PROVIDER: Default provider ("groq" | "github" | "ai_core" | "litellm")
@@ -261,9 +269,13 @@ class JouleAgent:
             system_prompt=self._get_streaming_prompt()
         )
         
-        # Register tools
+        # Register tools (blocking calls go through the tool executor)
+        self.tool_executor = tool_executor or get_tool_executor()
         self._register_tools()
         
+        # Cached schema preamble (no catalog round-trip per message)
+        self.schema_context = schema_context or get_schema_context_provider()
+        
         # Configuration
         self.temperature = temperature
     
@@ -419,7 +431,14 @@ You can automatically answer questions like:
 **Security:** Only SELECT queries allowed. All SQL is validated and sanitized."""
     
     def _register_tools(self):
-        """Register tools for both agents"""
+        """
+        Register tools for both agents
+        
+        Repository calls block (sqlite3/hdbcli), so they run in the tool
+        executor: the event loop stays free and multiple tool calls of one
+        model turn run concurrently.
+        """
+        executor = self.tool_executor
         
         # Tool 1: List available data products
         async def list_data_products_impl(
@@ -429,7 +448,7 @@ You can automatically answer questions like:
             repository = ctx.deps.data_product_repository
             
             try:
-                products = repository.get_data_products()
+                products = await executor.run(ctx.deps.datasource, repository.get_data_products)
                 return [
                     {
                         "product_name": p.product_name,
@@ -465,7 +484,9 @@ You can automatically answer questions like:
                     return [{"error": f"Unknown entity type: {entity_type}"}]
                 
                 # Use repository.query_table_data() method
-                result = repository.query_table_data(
+                result = await executor.run(
+                    ctx.deps.datasource,
+                    repository.query_table_data,
                     product_name=table_name,  # For now, product_name = table_name
                     table_name=table_name,
                     limit=limit,
@@ -511,7 +532,7 @@ You can automatically answer questions like:
                 # Repository already knows the correct table names for its datasource
                 # The AI should use the table names from the enhanced context
                 repository = ctx.deps.data_product_repository
-                result = repository.execute_sql(sql_query)
+                result = await executor.run(ctx.deps.datasource, repository.execute_sql, sql_query)
                 return result
             except Exception as e:
                 return {
@@ -555,8 +576,11 @@ You can automatically answer questions like:
         )
         
         # Use enhanced context that includes HANA table names when needed
-        message_context = self._build_enhanced_message_context(
-            user_message, 
+        # (may query the repository, so it runs in the tool executor)
+        message_context = await self.tool_executor.run(
+            datasource,
+            self._build_enhanced_message_context,
+            user_message,
             conversation_history,
             datasource,
             repository
@@ -604,7 +628,10 @@ You can automatically answer questions like:
         )
         
         # Use enhanced context that includes HANA table names when needed
-        message_context = self._build_enhanced_message_context(
+        # (may query the repository, so it runs in the tool executor)
+        message_context = await self.tool_executor.run(
+            datasource,
+            self._build_enhanced_message_context,
             user_message,
             conversation_history,
             datasource,
@@ -670,14 +697,16 @@ You can automatically answer questions like:
         """
         Build enhanced message context with dynamic HANA table names
         
-        When datasource is 'hana', fetches actual data products and injects
-        HANA-specific table names (P2P_DATAPRODUCT_sap_bdc_*_V1) into prompt.
+        When datasource is 'hana', prepends the schema fragment of the schema
+        context provider: HANA table names (P2P_DATAPRODUCT_sap_bdc_*_V1) plus
+        column summaries and semantic hints. The fragment is pre-rendered and
+        cached per datasource version, so no catalog query runs per message.
         
         Args:
             user_message: User's question
             conversation_history: Previous messages
             datasource: Current data source ('hana', 'sqlite', 'p2p_data', etc.)
-            repository: Repository for querying available data products
+            repository: Repository for building the fragment on a cache miss
             
         Returns:
             Enhanced message context with data source specific information
@@ -688,26 +717,14 @@ You can automatically answer questions like:
         # Add HANA-specific context if needed
         if datasource == 'hana':
             try:
-                # Fetch actual data products from HANA
-                products = repository.get_data_products()
+                hana_context = self.schema_context.get_context(datasource, repository)
                 
-                if products:
-                    hana_context = "\n\n**IMPORTANT: HANA Cloud Data Source Active**\n"
-                    hana_context += "Table names follow SAP naming convention: P2P_DATAPRODUCT_sap_bdc_[ProductName]_V1\n\n"
-                    hana_context += "Available HANA tables:\n"
-                    
-                    # List first 10 products with actual table names from metadata
-                    for product in products[:10]:
-                        # product_name already contains the full HANA table name from repository
-                        hana_context += f"- {product.display_name}: {product.product_name}\n"
-                    
-                    hana_context += "\nWhen generating SQL, ALWAYS use the full table names shown above.\n"
-                    
+                if hana_context:
                     # Prepend HANA context before user message
-                    return hana_context + "\n" + base_context
+                    return "\n\n" + hana_context + "\n" + base_context
                     
             except Exception as e:
-                print(f"[JouleAgent] Warning: Could not fetch HANA data products: {e}")
+                print(f"[JouleAgent] Warning: Could not build HANA schema context: {e}")
         
         return base_context
 
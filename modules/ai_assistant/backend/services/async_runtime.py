@@ -0,0 +1,217 @@
+"""
+Async Runtime
+
+One long-lived asyncio event loop (in a dedicated daemon thread) that runs
+all AI assistant coroutines submitted from Flask request threads.
+
+Why not asyncio.run() per request:
+- asyncio.run() creates and closes an event loop every time
+- The LLM clients (pydantic-ai / OpenAI-compatible httpx.AsyncClient) bind
+  their connection pool to the loop that uses them, so keep-alive
+  connections and TLS sessions were discarded after every request
+- With a single loop, JouleAgent and its HTTP clients always run on the
+  same loop and their connections are reused across requests
+
+Monitoring:
+- A probe task sleeps for probe_interval and measures how late it wakes up
+  (loop lag = time the loop was blocked by other work)
+- stats() reports current/max loop lag and in-flight task counts
+"""
+
+import asyncio
+import concurrent.futures
+import sys
+import threading
+import time
+from typing import Any, Awaitable, Dict, Optional
+
+
+def new_event_loop() -> asyncio.AbstractEventLoop:
+    """
+    Create an event loop for a dedicated loop thread
+
+    On Windows this is a SelectorEventLoop: the default ProactorEventLoop
+    breaks some HTTP client libraries used by the LLM clients.
+
+    Returns:
+        New (not yet running) event loop
+    """
+    if sys.platform == 'win32':
+        return asyncio.SelectorEventLoop()
+    return asyncio.new_event_loop()
+
+
+class AsyncRuntime:
+    """
+    Dedicated event loop thread accepting coroutines from other threads
+
+    Example:
+        runtime = AsyncRuntime()
+        runtime.start()
+        response = runtime.run(agent.process_message(...), timeout=60)
+        runtime.stop()
+    """
+
+    def __init__(self, probe_interval: float = 0.5, name: str = 'ai-assistant-loop'):
+        """
+        Create runtime (not started)
+
+        Args:
+            probe_interval: Seconds between loop lag measurements
+            name: Name of the loop thread
+        """
+        self._probe_interval = probe_interval
+        self._name = name
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+        self._in_flight = 0
+        self._submitted = 0
+        self._failed = 0
+        self._loop_lag = 0.0
+        self._max_loop_lag = 0.0
+        self._loop_tasks = 0
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """The running event loop (starts the runtime if needed)"""
+        self.start()
+        return self._loop
+
+    @property
+    def is_running(self) -> bool:
+        """True while the loop thread is alive"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start the loop thread (no-op if already running)"""
+        with self._lock:
+            if self.is_running:
+                return
+            loop = new_event_loop()
+            ready = threading.Event()
+            self._thread = threading.Thread(
+                target=self._run_loop, args=(loop, ready), name=self._name, daemon=True
+            )
+            self._thread.start()
+            ready.wait()
+            self._loop = loop
+
+    def _run_loop(self, loop: asyncio.AbstractEventLoop, ready: threading.Event) -> None:
+        """Loop thread: run forever, clean up pending tasks on stop"""
+        asyncio.set_event_loop(loop)
+        probe = loop.create_task(self._probe_lag())
+        loop.call_soon(ready.set)
+        try:
+            loop.run_forever()
+        finally:
+            probe.cancel()
+            pending = asyncio.all_tasks(loop)
+            for task in pending:
+                task.cancel()
+            loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.close()
+
+    async def _probe_lag(self) -> None:
+        """Measure how late the loop wakes up a sleeping task"""
+        while True:
+            expected = time.perf_counter() + self._probe_interval
+            await asyncio.sleep(self._probe_interval)
+            lag = max(0.0, time.perf_counter() - expected)
+            self._loop_lag = lag
+            self._max_loop_lag = max(self._max_loop_lag, lag)
+            # Every task on the loop except this probe (includes stream producers)
+            self._loop_tasks = len(asyncio.all_tasks()) - 1
+
+    def submit(self, coro: Awaitable[Any]) -> concurrent.futures.Future:
+        """
+        Schedule a coroutine on the loop (thread-safe)
+
+        Args:
+            coro: Coroutine to run
+
+        Returns:
+            concurrent.futures.Future with the coroutine's result
+        """
+        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+        with self._lock:
+            self._in_flight += 1
+            self._submitted += 1
+        future.add_done_callback(self._on_done)
+        return future
+
+    def _on_done(self, future: concurrent.futures.Future) -> None:
+        with self._lock:
+            self._in_flight -= 1
+            if not future.cancelled() and future.exception() is not None:
+                self._failed += 1
+
+    def run(self, coro: Awaitable[Any], timeout: Optional[float] = None) -> Any:
+        """
+        Run a coroutine on the loop and wait for its result
+
+        Drop-in replacement for asyncio.run() in request threads.
+
+        Args:
+            coro: Coroutine to run
+            timeout: Seconds to wait (None = no limit); on timeout the
+                coroutine is cancelled and TimeoutError is raised
+
+        Returns:
+            The coroutine's result (its exception is re-raised)
+        """
+        future = self.submit(coro)
+        try:
+            return future.result(timeout=timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise TimeoutError(f"AI assistant task did not finish within {timeout}s")
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """
+        Stop the loop thread (cancels tasks still running)
+
+        Args:
+            timeout: Seconds to wait for the thread to exit
+        """
+        with self._lock:
+            if not self.is_running:
+                return
+            loop, thread = self._loop, self._thread
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Runtime statistics
+
+        Returns:
+            Dict with running state, loop lag (ms) and task counts
+        """
+        with self._lock:
+            return {
+                "running": self.is_running,
+                "loop_lag_ms": round(self._loop_lag * 1000, 2),
+                "max_loop_lag_ms": round(self._max_loop_lag * 1000, 2),
+                "in_flight_submissions": self._in_flight,
+                "loop_tasks": self._loop_tasks,
+                "submitted_total": self._submitted,
+                "failed_total": self._failed
+            }
+
+
+# Singleton instance
+_runtime = None
+_runtime_lock = threading.Lock()
+
+
+def get_async_runtime() -> AsyncRuntime:
+    """Get singleton async runtime (started on first use)"""
+    global _runtime
+    with _runtime_lock:
+        if _runtime is None:
+            _runtime = AsyncRuntime()
+        _runtime.start()
+        return _runtime
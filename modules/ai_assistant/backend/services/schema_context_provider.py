@@ -0,0 +1,426 @@
+"""
+Schema Context Provider
+
+Pre-renders the datasource schema preamble that JouleAgent prepends to the
+user message, so answering a message no longer waits on catalog queries.
+
+Before: every HANA message called repository.get_data_products() (a live
+round-trip to SYS.SCHEMAS plus a COUNT per schema) just to list table names.
+
+Now the fragment is built once per datasource version and served from
+memory:
+- Tables: data products and their tables from the repository
+- Column summaries: keys, leading columns, labels from CSN metadata
+- Semantic hints: amount/currency/quantity semantics and associations
+  from CSN, entity -> physical table mappings from the knowledge graph
+  (ontology in p2p_graph.db)
+- The text is cut to a token budget (approx. 4 characters per token)
+
+Freshness:
+- A version provider (e.g. SQLite data version) rebuilds on change
+- Otherwise (HANA) the fragment is refreshed after ttl_seconds; the stale
+  fragment keeps being served while a background thread rebuilds it
+- warm() builds ahead of the first message (called at startup)
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from core.services.csn_parser import CSNParser, ColumnMetadata, EntityMetadata
+from core.services.ontology_service import OntologyService
+
+logger = logging.getLogger(__name__)
+
+# Semantic types worth telling the model about (SQL aggregation/formatting)
+_SEMANTIC_HINT_TYPES = ('amount', 'currencyCode', 'quantity', 'unitOfMeasure', 'date', 'calendar')
+
+# built_at of a fragment kept after a failed rebuild (always expired)
+_FAILED_BUILD = float('-inf')
+
+
+class SchemaContextProvider:
+    """
+    Cached, token-budgeted schema fragments per datasource
+
+    Usage:
+        provider = SchemaContextProvider(csn_parser=get_parser(), ttl_seconds=600)
+        provider.warm('hana', hana_facade)
+
+        fragment = provider.get_context('hana', repository)  # '' if unavailable
+    """
+
+    CHARS_PER_TOKEN = 4
+
+    def __init__(
+        self,
+        csn_parser: Optional[CSNParser] = None,
+        ontology_db_path: Optional[str] = None,
+        token_budget: int = 1200,
+        ttl_seconds: Optional[float] = 600.0,
+        version_providers: Optional[Dict[str, Callable[[], Any]]] = None,
+        max_columns_per_table: int = 8
+    ):
+        """
+        Initialize provider (nothing is built until first use or warm())
+
+        Args:
+            csn_parser: CSN metadata for column summaries (None = tables only)
+            ontology_db_path: Knowledge graph database with entity -> table mappings
+                (None = match tables to CSN entities by name only)
+            token_budget: Max approximate tokens of one fragment
+            ttl_seconds: Refresh interval for datasources without version provider
+            version_providers: datasource -> callable returning its data version
+            max_columns_per_table: Columns listed per table summary
+        """
+        self._csn_parser = csn_parser
+        self._ontology_db_path = ontology_db_path
+        self._token_budget = token_budget
+        self._ttl_seconds = ttl_seconds
+        self._version_providers = dict(version_providers or {})
+        self._max_columns = max_columns_per_table
+
+        # datasource -> (fragment, version, built_at)
+        self._fragments: Dict[str, Tuple[str, Any, float]] = {}
+        self._refreshing: set = set()
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'builds': 0, 'background_refreshes': 0, 'build_errors': 0}
+
+    # ========================================================================
+    # Public API
+    # ========================================================================
+
+    def get_context(self, datasource: str, repository: Any) -> str:
+        """
+        Get the schema fragment for a datasource
+
+        Args:
+            datasource: Datasource key ('hana', 'p2p_data', ...)
+            repository: Repository/facade used when the fragment must be (re)built
+
+        Returns:
+            Pre-rendered prompt fragment ('' if it cannot be built)
+        """
+        version = self._current_version(datasource)
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._fragments.get(datasource)
+            if entry is not None and entry[1] == version:
+                fragment, _, built_at = entry
+                self._stats['hits'] += 1
+                if self._is_expired(datasource, built_at, now) and datasource not in self._refreshing:
+                    # Serve stale, rebuild off the message path
+                    self._refreshing.add(datasource)
+                    threading.Thread(
+                        target=self._refresh, args=(datasource, repository),
+                        name=f"schema-context-{datasource}", daemon=True
+                    ).start()
+                return fragment
+
+        return self._build_and_store(datasource, repository, version)
+
+    def warm(self, datasource: str, repository: Any, background: bool = True) -> None:
+        """
+        Build the fragment ahead of the first message
+
+        Args:
+            datasource: Datasource key
+            repository: Repository/facade to read the catalog from
+            background: True builds in a daemon thread
+        """
+        if not background:
+            self._build_and_store(datasource, repository, self._current_version(datasource))
+            return
+        threading.Thread(
+            target=self._build_and_store,
+            args=(datasource, repository, self._current_version(datasource)),
+            name=f"schema-context-{datasource}", daemon=True
+        ).start()
+
+    def invalidate(self, datasource: Optional[str] = None) -> None:
+        """
+        Drop cached fragments (next message rebuilds)
+
+        Args:
+            datasource: Only this datasource (None = all)
+        """
+        with self._lock:
+            if datasource is None:
+                self._fragments.clear()
+            else:
+                self._fragments.pop(datasource, None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get provider statistics
+
+        Returns:
+            Dict with cached datasources, fragment sizes (approx. tokens) and counters
+        """
+        now = time.monotonic()
+        with self._lock:
+            return {
+                'token_budget': self._token_budget,
+                'ttl_seconds': self._ttl_seconds,
+                'fragments': {
+                    name: {
+                        'approx_tokens': len(fragment) // self.CHARS_PER_TOKEN,
+                        'age_seconds': round(now - built_at, 1)
+                    }
+                    for name, (fragment, _, built_at) in self._fragments.items()
+                },
+                **self._stats
+            }
+
+    # ========================================================================
+    # Building
+    # ========================================================================
+
+    def _refresh(self, datasource: str, repository: Any) -> None:
+        """Background rebuild of an expired fragment"""
+        try:
+            with self._lock:
+                self._stats['background_refreshes'] += 1
+            self._build_and_store(datasource, repository, self._current_version(datasource))
+        finally:
+            with self._lock:
+                self._refreshing.discard(datasource)
+
+    def _build_and_store(self, datasource: str, repository: Any, version: Any) -> str:
+        """
+        Render the fragment and cache it
+
+        Failures are not cached: without a previous fragment nothing is
+        stored (the next message builds again); otherwise the last good
+        fragment is kept but marked expired, so it is served while the
+        next message retries in the background.
+        """
+        try:
+            fragment = self.render(datasource, repository)
+            built_at = time.monotonic()
+        except Exception as e:
+            logger.warning(f"[SchemaContext] Could not build schema context for {datasource}: {e}")
+            with self._lock:
+                self._stats['build_errors'] += 1
+                previous = self._fragments.get(datasource)
+                if previous is None:
+                    return ''
+            fragment, built_at = previous[0], _FAILED_BUILD
+
+        with self._lock:
+            self._fragments[datasource] = (fragment, version, built_at)
+            self._stats['builds'] += 1
+        return fragment
+
+    def render(self, datasource: str, repository: Any) -> str:
+        """
+        Render the schema fragment from the live catalog (no caching)
+
+        Args:
+            datasource: Datasource key
+            repository: Repository/facade to read the catalog from
+
+        Returns:
+            Prompt fragment within the token budget ('' if no data products)
+        """
+        products = repository.get_data_products()
+        if not products:
+            return ''
+
+        budget = _TextBudget(self._token_budget * self.CHARS_PER_TOKEN)
+        is_hana = datasource == 'hana'
+
+        if is_hana:
+            budget.add("**IMPORTANT: HANA Cloud Data Source Active**\n")
+            budget.add("Table names follow SAP naming convention: P2P_DATAPRODUCT_sap_bdc_[ProductName]_V1\n\n")
+            budget.add("Available HANA tables:\n")
+        else:
+            budget.add("Available tables:\n")
+        footer = "\nWhen generating SQL, ALWAYS use the full table names shown above.\n"
+        budget.reserve(len(footer))
+
+        # 1. Table list (always first: names matter more than details)
+        listed = 0
+        for product in products:
+            if not budget.add(f"- {product.display_name}: {product.product_name}\n"):
+                break
+            listed += 1
+        if listed < len(products):
+            budget.add(f"- ... {len(products) - listed} more data products\n", force=True)
+
+        # 2. Column summaries and semantic hints while budget remains
+        if self._csn_parser is not None and budget.remaining > 0:
+            entity_by_table = self._entity_by_table(datasource)
+            header_added = False
+            for product in products[:listed]:
+                for table_name in self._list_tables(repository, product.product_name):
+                    metadata = self._resolve_entity(table_name, entity_by_table)
+                    if metadata is None:
+                        continue
+                    if not header_added:
+                        if not budget.add("\nTable details (keys, columns, semantics):\n"):
+                            break
+                        header_added = True
+                    if not budget.add(self._summarize(table_name, metadata)):
+                        break
+                if budget.exhausted:
+                    break
+
+        budget.release(len(footer))
+        budget.add(footer, force=True)
+        return budget.text()
+
+    def _summarize(self, table_name: str, metadata: EntityMetadata) -> str:
+        """One-line summary of a table from its CSN metadata"""
+        label = f" ({metadata.label})" if metadata.label else ''
+        columns = [c.name for c in metadata.columns]
+        shown = columns[:self._max_columns]
+        more = f", ... +{len(columns) - len(shown)}" if len(columns) > len(shown) else ''
+
+        line = f"- {table_name}{label}: "
+        if metadata.primary_keys:
+            line += f"keys {', '.join(metadata.primary_keys)}; "
+        line += f"columns {', '.join(shown)}{more}"
+
+        semantics = [hint for hint in map(self._semantic_hint, metadata.columns) if hint]
+        if semantics:
+            line += f"; semantics {', '.join(semantics[:4])}"
+        if metadata.associations:
+            joins = [f"{a.name}->{a.target.split('.')[-1]}" for a in metadata.associations[:3]]
+            line += f"; joins {', '.join(joins)}"
+        return line + "\n"
+
+    @staticmethod
+    def _semantic_hint(column: ColumnMetadata) -> Optional[str]:
+        """Short semantic hint for a column (amount/quantity with their unit column)"""
+        props = column.semantic_properties
+        for prop, kind in (('currencyCode', 'amount'), ('unitOfMeasure', 'quantity')):
+            if prop in props:
+                ref = props[prop]
+                ref = ref.get('=', '') if isinstance(ref, dict) else ref
+                return f"{column.name}={kind} in {ref}" if isinstance(ref, str) and ref else f"{column.name}={kind}"
+        if column.semantic_type in _SEMANTIC_HINT_TYPES:
+            return f"{column.name}={column.semantic_type}"
+        return None
+
+    def _entity_by_table(self, datasource: str) -> Dict[str, str]:
+        """Physical table -> entity name from the knowledge graph (empty if unavailable)"""
+        if self._ontology_db_path is None:
+            return {}
+        try:
+            # Own connection per build: builds run on varying (background) threads
+            with OntologyService(self._ontology_db_path) as ontology:
+                mappings = ontology.get_all_table_mappings(datasource)
+        except Exception as e:
+            logger.debug(f"[SchemaContext] No ontology table mappings for {datasource}: {e}")
+            return {}
+        return {table: entity for entity, table in mappings.items()}
+
+    def _resolve_entity(self, table_name: str, entity_by_table: Dict[str, str]) -> Optional[EntityMetadata]:
+        """CSN metadata for a physical table (ontology mapping first, then name matching)"""
+        candidates = []
+        if table_name in entity_by_table:
+            candidates.append(entity_by_table[table_name])
+        simple = table_name.split('.')[-1].split(':')[-1]
+        candidates.extend([table_name, simple])
+        for suffix in ('_V1', '_v1'):
+            if simple.endswith(suffix):
+                candidates.append(simple[:-len(suffix)])
+
+        for name in candidates:
+            metadata = self._csn_parser.get_entity_metadata(name)
+            if metadata is not None:
+                return metadata
+        return None
+
+    @staticmethod
+    def _list_tables(repository: Any, product_name: str) -> List[str]:
+        """Table names of a product (works with repositories and facades)"""
+        get_tables = getattr(repository, 'get_tables_in_product', None) or getattr(repository, 'get_tables')
+        try:
+            return [t.table_name for t in get_tables(product_name)]
+        except Exception as e:
+            logger.debug(f"[SchemaContext] Could not list tables of {product_name}: {e}")
+            return []
+
+    # ========================================================================
+    # Freshness
+    # ========================================================================
+
+    def _current_version(self, datasource: str) -> Any:
+        """Data version of a datasource (None = TTL-based)"""
+        provider = self._version_providers.get(datasource)
+        if provider is None:
+            return None
+        try:
+            return provider()
+        except Exception as e:
+            logger.warning(f"[SchemaContext] Version check failed for {datasource}: {e}")
+            return object()
+
+    def _is_expired(self, datasource: str, built_at: float, now: float) -> bool:
+        """TTL check (datasources with a version provider only expire after a failed build)"""
+        if built_at == _FAILED_BUILD:
+            return True
+        if datasource in self._version_providers or self._ttl_seconds is None:
+            return False
+        return now - built_at >= self._ttl_seconds
+
+
+class _TextBudget:
+    """Appends text pieces until a character budget is used up"""
+
+    def __init__(self, max_chars: int):
+        self._max_chars = max_chars
+        self._used = 0
+        self._reserved = 0
+        self._parts: List[str] = []
+        self.exhausted = False
+
+    @property
+    def remaining(self) -> int:
+        return self._max_chars - self._reserved - self._used
+
+    def reserve(self, chars: int) -> None:
+        self._reserved += chars
+
+    def release(self, chars: int) -> None:
+        self._reserved -= chars
+
+    def add(self, piece: str, force: bool = False) -> bool:
+        """Append piece if it fits (force: always append); returns False when it did not fit"""
+        if not force and len(piece) > self.remaining:
+            self.exhausted = True
+            return False
+        self._parts.append(piece)
+        self._used += len(piece)
+        return True
+
+    def text(self) -> str:
+        return ''.join(self._parts)
+
+
+# Singleton instance
+_schema_context_provider = None
+
+
+def get_schema_context_provider() -> SchemaContextProvider:
+    """Get singleton schema context provider (CSN metadata from docs/csn)"""
+    global _schema_context_provider
+    if _schema_context_provider is None:
+        from core.services.csn_parser import get_parser
+        _schema_context_provider = SchemaContextProvider(csn_parser=get_parser())
+    return _schema_context_provider
+
+
+def set_schema_context_provider(provider: SchemaContextProvider) -> None:
+    """
+    Replace the singleton schema context provider (configured at startup)
+
+    Args:
+        provider: Provider used by agents created afterwards
+    """
+    global _schema_context_provider
+    _schema_context_provider = provider
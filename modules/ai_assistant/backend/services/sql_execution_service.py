@@ -10,12 +10,16 @@ SECURITY CRITICAL:
 - No DDL/DML operations
 """
 
+import os
 import re
 import sqlite3
 from typing import Dict, Any, List, Optional, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from pathlib import Path
 
+from core.services.database_connection_factory import get_connection_pool
+from core.services.sql_result_cache import SQLResultCache, estimate_size
+
 
 @dataclass
 class SQLExecutionResult:
@@ -27,6 +31,7 @@ class SQLExecutionResult:
     execution_time_ms: float
     error: Optional[str] = None
     warnings: List[str] = None
+    cached: bool = False
 
 
 class SQLValidator:
@@ -157,13 +162,20 @@ class SQLExecutionService:
     - Result limiting (prevent large result sets)
     - Error handling (user-friendly messages)
     - Performance tracking (execution time)
+    - Optional result cache (repeated questions skip the database)
     
     DI Pattern:
     - Constructor injection for database paths (from module.json)
     - No Service Locator pattern
     """
     
-    def __init__(self, p2p_data_db: str, p2p_graph_db: str, max_rows: int = 1000):
+    def __init__(
+        self,
+        p2p_data_db: str,
+        p2p_graph_db: str,
+        max_rows: int = 1000,
+        result_cache: Optional[SQLResultCache] = None
+    ):
         """
         Initialize SQL execution service
         
@@ -171,11 +183,14 @@ class SQLExecutionService:
             p2p_data_db: Path to P2P data database (from module.json)
             p2p_graph_db: Path to P2P graph database (from module.json)
             max_rows: Maximum rows to return (default 1000)
+            result_cache: Cache for successful results, keyed by datasource,
+                normalized SQL and database version (None = no caching)
         """
         self.p2p_data_db = Path(p2p_data_db)
         self.p2p_graph_db = Path(p2p_graph_db)
         self.max_rows = max_rows
         self.validator = SQLValidator()
+        self.result_cache = result_cache
         
         # Validate both databases exist
         if not self.p2p_data_db.exists():
@@ -183,13 +198,14 @@ class SQLExecutionService:
         if not self.p2p_graph_db.exists():
             raise FileNotFoundError(f"P2P graph database not found: {p2p_graph_db}")
     
-    def execute_query(self, sql: str, datasource: str = "p2p_data") -> SQLExecutionResult:
+    def execute_query(self, sql: str, datasource: str = "p2p_data", use_cache: bool = True) -> SQLExecutionResult:
         """
         Execute SQL query with validation
         
         Args:
             sql: SQL query to execute
             datasource: Database to query ("p2p_data" or "p2p_graph")
+            use_cache: False bypasses the result cache (always hits the database)
             
         Returns:
             SQLExecutionResult with rows, columns, metadata
@@ -230,6 +246,24 @@ class SQLExecutionService:
         if sanitized_sql != sql.strip().rstrip(';'):
             warnings.append(f"Query modified to enforce LIMIT {self.max_rows}")
         
+        # Serve repeated queries from the cache (only valid for the current database version)
+        cache = self.result_cache
+        version = None
+        if cache is not None:
+            if use_cache:
+                try:
+                    version = self._get_data_version(db_path)
+                except Exception:
+                    # Unknown database state - never serve or store a possibly stale result
+                    cache = None
+            else:
+                cache.record_bypass()
+                cache = None
+        if cache is not None:
+            cached_result = cache.get(datasource, sanitized_sql, version)
+            if cached_result is not None:
+                return replace(cached_result, cached=True, warnings=warnings if warnings else None)
+        
         # Execute query
         try:
             start_time = time.time()
@@ -250,7 +284,7 @@ class SQLExecutionService:
                 
                 execution_time_ms = (time.time() - start_time) * 1000
                 
-                return SQLExecutionResult(
+                result = SQLExecutionResult(
                     success=True,
                     rows=rows,
                     columns=columns,
@@ -258,7 +292,11 @@ class SQLExecutionService:
                     execution_time_ms=round(execution_time_ms, 2),
                     warnings=warnings if warnings else None
                 )
-                
+            
+            if cache is not None:
+                cache.put(datasource, sanitized_sql, result, version, size=estimate_size(rows))
+            return result
+            
         except sqlite3.Error as e:
             return SQLExecutionResult(
                 success=False,
@@ -277,5 +315,18 @@ class SQLExecutionService:
                 execution_time_ms=0,
                 error=f"Unexpected error: {str(e)}"
             )
+    
+    @staticmethod
+    def _get_data_version(db_path: Path) -> Tuple[int, int, int]:
+        """
+        Database version for cache validation
+        
+        File identity (inode + mtime) catches rebuilds; PRAGMA data_version
+        of the pooled connection catches commits (including WAL commits).
+        """
+        # Probe first: opening the pool's probe may switch the file to WAL (new mtime)
+        data_version = get_connection_pool(str(db_path)).get_data_version()
+        stat = os.stat(db_path)
+        return (stat.st_ino, stat.st_mtime_ns, data_version)
 
 
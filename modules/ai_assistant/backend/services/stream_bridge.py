@@ -0,0 +1,174 @@
+"""
+Async Stream Bridge
+
+Feeds an async generator (agent streaming) into a synchronous iterator, so
+a Flask streaming response can forward each chunk as soon as it arrives.
+
+- The async generator runs as a task on an event loop in another thread
+  (a dedicated loop per stream unless a running loop is passed in)
+- Chunks travel through a bounded asyncio.Queue: a slow client applies
+  back-pressure to the producer instead of buffering the whole answer
+- While no chunk arrives for heartbeat_interval seconds the iterator
+  yields HEARTBEAT, so the caller can keep the connection alive
+- close() (e.g. client disconnected) cancels the producer task, which
+  closes the async generator and the model stream behind it
+"""
+
+import asyncio
+import concurrent.futures
+import threading
+from typing import Any, AsyncIterator, Callable, Iterator, Optional
+
+from .async_runtime import new_event_loop
+
+# Yielded by AsyncStreamBridge when no chunk arrived within the heartbeat interval
+HEARTBEAT = object()
+
+_ITEM = 'item'
+_ERROR = 'error'
+_END = 'end'
+
+
+class AsyncStreamBridge:
+    """
+    Synchronous, incremental view of an async generator
+
+    Exceptions raised by the async generator are re-raised by the iterator.
+
+    Example:
+        bridge = AsyncStreamBridge(lambda: agent.process_message_stream(...))
+        try:
+            for event in bridge:
+                if event is HEARTBEAT:
+                    yield ": heartbeat\\n\\n"
+                else:
+                    yield f"data: {json.dumps(event)}\\n\\n"
+        finally:
+            bridge.close()
+    """
+
+    def __init__(
+        self,
+        stream_factory: Callable[[], AsyncIterator[Any]],
+        max_queue_size: int = 64,
+        heartbeat_interval: Optional[float] = 15.0,
+        loop: Optional[asyncio.AbstractEventLoop] = None
+    ):
+        """
+        Start streaming in the background
+
+        Args:
+            stream_factory: Creates the async generator (called on the loop thread)
+            max_queue_size: Chunks buffered before the producer waits
+            heartbeat_interval: Seconds without a chunk before HEARTBEAT is
+                yielded (None = never)
+            loop: Running event loop to use (None = dedicated loop thread)
+        """
+        self._heartbeat_interval = heartbeat_interval
+        self._closed = False
+        # (queue, producer task), set by the producer once it runs on the loop
+        self._started: concurrent.futures.Future = concurrent.futures.Future()
+        self._finished = threading.Event()
+
+        producer = self._produce(stream_factory, max_queue_size)
+        if loop is None:
+            loop = new_event_loop()
+            thread = threading.Thread(target=self._run_loop, args=(loop, producer), name='ai-stream', daemon=True)
+            thread.start()
+        else:
+            asyncio.run_coroutine_threadsafe(producer, loop)
+        self._loop = loop
+
+    @staticmethod
+    def _run_loop(loop: asyncio.AbstractEventLoop, producer) -> None:
+        """Dedicated loop thread: run until the producer finishes"""
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_until_complete(producer)
+        except asyncio.CancelledError:
+            pass
+        finally:
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.close()
+
+    async def _produce(self, stream_factory: Callable[[], AsyncIterator[Any]], max_queue_size: int) -> None:
+        """Copy chunks from the async generator into the bounded queue"""
+        # Created here: asyncio.Queue binds to the running loop
+        queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue_size)
+        self._started.set_result((queue, asyncio.current_task()))
+        try:
+            try:
+                stream = stream_factory()
+                try:
+                    async for item in stream:
+                        await queue.put((_ITEM, item))
+                finally:
+                    aclose = getattr(stream, 'aclose', None)
+                    if aclose is not None:
+                        await aclose()
+                await queue.put((_END, None))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                await queue.put((_ERROR, e))
+            # Keep the loop alive until the consumer has read the last message
+            await queue.join()
+        finally:
+            self._finished.set()
+
+    @staticmethod
+    async def _get(queue: asyncio.Queue):
+        """Take the next message and mark it consumed (releases queue.join())"""
+        message = await queue.get()
+        queue.task_done()
+        return message
+
+    def __iter__(self) -> Iterator[Any]:
+        queue, _ = self._started.result()
+        pending = None
+        try:
+            while not self._closed:
+                if pending is None:
+                    pending = asyncio.run_coroutine_threadsafe(self._get(queue), self._loop)
+                try:
+                    kind, value = pending.result(timeout=self._heartbeat_interval)
+                except concurrent.futures.TimeoutError:
+                    # Keep waiting on the same get(): no chunk is lost
+                    yield HEARTBEAT
+                    continue
+                pending = None
+                if kind == _ITEM:
+                    yield value
+                elif kind == _ERROR:
+                    raise value
+                else:
+                    return
+        finally:
+            if pending is not None:
+                pending.cancel()
+
+    def close(self) -> None:
+        """Stop streaming: cancel the producer (closes the async generator)"""
+        if self._closed:
+            return
+        self._closed = True
+        if self._finished.is_set():
+            return
+        _, task = self._started.result()
+        try:
+            self._loop.call_soon_threadsafe(task.cancel)
+        except RuntimeError:
+            # Loop already closed: the producer has finished
+            pass
+
+    def wait_finished(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until the producer task has finished (completed, failed or cancelled)
+
+        Args:
+            timeout: Seconds to wait (None = no limit)
+
+        Returns:
+            True if the producer has finished
+        """
+        return self._finished.wait(timeout)
@@ -0,0 +1,128 @@
+"""
+Tool Executor
+
+Runs the blocking repository / SQL calls of agent tools (sqlite3, hdbcli)
+off the event loop.
+
+- One bounded thread pool per datasource: its size is the datasource's
+  concurrency limit (e.g. HANA connections are more expensive than SQLite)
+- Each call has a timeout; on timeout the tool gets TimeoutError (the
+  worker thread finishes the call in the background, its result is dropped)
+- The event loop stays responsive, and when the model requests several
+  tool calls in one turn (pydantic-ai runs them as concurrent tasks) the
+  database work actually overlaps
+"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict, Optional
+
+
+class ToolExecutor:
+    """
+    Per-datasource bounded executors for blocking tool calls
+
+    Example:
+        executor = ToolExecutor(concurrency_limits={'hana': 2})
+        products = await executor.run('hana', repository.get_data_products)
+    """
+
+    def __init__(
+        self,
+        default_concurrency: int = 4,
+        concurrency_limits: Optional[Dict[str, int]] = None,
+        timeout: Optional[float] = 30.0
+    ):
+        """
+        Create executor (thread pools are created on first use)
+
+        Args:
+            default_concurrency: Max parallel calls for datasources without a limit
+            concurrency_limits: Max parallel calls per datasource (e.g. {'hana': 2})
+            timeout: Default seconds per call (None = no limit)
+        """
+        self._default_concurrency = default_concurrency
+        self._concurrency_limits = dict(concurrency_limits or {})
+        self._timeout = timeout
+        self._pools: Dict[str, ThreadPoolExecutor] = {}
+        self._lock = threading.Lock()
+
+    def _get_pool(self, datasource: str) -> ThreadPoolExecutor:
+        """Get (or create) the thread pool of a datasource"""
+        with self._lock:
+            pool = self._pools.get(datasource)
+            if pool is None:
+                pool = ThreadPoolExecutor(
+                    max_workers=self._concurrency_limits.get(datasource, self._default_concurrency),
+                    thread_name_prefix=f"ai-tool-{datasource}"
+                )
+                self._pools[datasource] = pool
+            return pool
+
+    async def run(
+        self,
+        datasource: str,
+        func: Callable[..., Any],
+        *args: Any,
+        timeout: Optional[float] = None,
+        **kwargs: Any
+    ) -> Any:
+        """
+        Run a blocking call in the datasource's pool
+
+        Args:
+            datasource: Datasource the call uses (selects pool and limit)
+            func: Blocking callable
+            *args, **kwargs: Passed to func
+            timeout: Seconds for this call (None = executor default);
+                time spent waiting for a free worker counts too
+
+        Returns:
+            func's result (its exception is re-raised)
+
+        Raises:
+            TimeoutError: Call did not finish in time
+        """
+        timeout = self._timeout if timeout is None else timeout
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self._get_pool(datasource), partial(func, *args, **kwargs))
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError(
+                f"{getattr(func, '__name__', 'Tool call')} on '{datasource}' did not finish within {timeout}s"
+            )
+
+    def shutdown(self, wait: bool = False) -> None:
+        """Shut down all thread pools"""
+        with self._lock:
+            pools, self._pools = list(self._pools.values()), {}
+        for pool in pools:
+            pool.shutdown(wait=wait, cancel_futures=True)
+
+
+# Singleton instance
+_tool_executor = None
+
+
+def get_tool_executor() -> ToolExecutor:
+    """Get singleton tool executor"""
+    global _tool_executor
+    if _tool_executor is None:
+        _tool_executor = ToolExecutor()
+    return _tool_executor
+
+
+def set_tool_executor(executor: ToolExecutor) -> None:
+    """
+    Replace the singleton tool executor (configured at startup)
+
+    Args:
+        executor: Executor used by agents created afterwards
+    """
+    global _tool_executor
+    if _tool_executor is not None and _tool_executor is not executor:
+        _tool_executor.shutdown()
+    _tool_executor = executor
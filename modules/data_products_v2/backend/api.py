@@ -9,15 +9,26 @@ Version: 3.0.0 (DI Refactoring)
 Date: 2026-02-15
 """
 
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, Response, request, jsonify, stream_with_context
+import csv
+import io
+import json
 import logging
-from typing import Dict, Optional
-from core.interfaces.data_product_repository import DataAccessError
+import time
+from typing import Dict, Iterator, Optional
+from core.interfaces.data_product_repository import DataAccessError, InvalidCursorError, TableStream
+from core.services.database_connection_factory import get_connection_pool_stats
 from modules.data_products_v2.facade.data_products_facade import DataProductsFacade
 
 
 logger = logging.getLogger(__name__)
 
+# Export format -> response mimetype
+EXPORT_FORMATS = {
+    'ndjson': 'application/x-ndjson',
+    'csv': 'text/csv'
+}
+
 
 class DataProductsV2API:
     """
@@ -223,23 +234,42 @@ class DataProductsV2API:
             return jsonify({'success': False, 'error': str(e)}), 500
     
     def query_table(self, product_name: str, table_name: str):
-        """Query table data"""
+        """
+        Query table data
+        
+        Body: {"limit": 100, "offset": 0} for offset pagination, or
+        {"limit": 100, "cursor": null} to start keyset pagination and
+        {"limit": 100, "cursor": "<nextCursor>"} for the following pages.
+        """
         try:
             source = request.args.get('source', 'sqlite').lower()
-            data = request.get_json() or {}
+            data = request.get_json(silent=True) or {}
+            
+            # Presence of the "cursor" key selects keyset mode (null = first page)
+            cursor = (data.get('cursor') or '') if 'cursor' in data else None
             
             facade = self.get_facade(source)
             result = facade.query_table(
                 product_name,
                 table_name,
-                limit=min(int(data.get('limit', 100)), 1000),
-                offset=max(int(data.get('offset', 0)), 0)
+                limit=min(max(int(data.get('limit', 100)), 1), 1000),
+                offset=max(int(data.get('offset', 0)), 0),
+                cursor=cursor
             )
             
             result['success'] = True
             result['source'] = source
             return jsonify(result)
             
+        except InvalidCursorError as e:
+            return jsonify({
+                'success': False,
+                'error': {
+                    'message': str(e),
+                    'code': 'INVALID_CURSOR',
+                    'userMessage': 'Pagination cursor is invalid. Restart from the first page.'
+                }
+            }), 400
         except (ValueError, DataAccessError) as e:
             logger.error(f"Data access error: {str(e)}")
             return jsonify({
@@ -253,6 +283,155 @@ class DataProductsV2API:
         except Exception as e:
             logger.error(f"Unexpected error querying table: {e}")
             return jsonify({'success': False, 'error': str(e)}), 500
+    
+    def get_cache_status(self):
+        """
+        Metadata cache and SQLite connection pool statistics
+        
+        Returns:
+            JSON with hit ratio, size and invalidation counters for each
+            source (null for sources without cache or not configured), and
+            connection pool counters per database file
+        """
+        try:
+            caches = {
+                source: facade.get_cache_stats() if facade else None
+                for source, facade in self._facades.items()
+            }
+            return jsonify({
+                'success': True,
+                'caches': caches,
+                'connectionPools': get_connection_pool_stats()
+            })
+        except Exception as e:
+            logger.error(f"Unexpected error reading cache status: {e}")
+            return jsonify({'success': False, 'error': str(e)}), 500
+    
+    def invalidate_cache(self):
+        """
+        Invalidate cached metadata
+        
+        Query Parameters:
+            source: 'hana' or 'sqlite' (default: all configured sources)
+            product: Only invalidate this data product (default: everything)
+        """
+        try:
+            source = request.args.get('source')
+            product_name = request.args.get('product')
+            sources = [source.lower()] if source else [s for s, f in self._facades.items() if f]
+            
+            removed = {
+                name: self.get_facade(name).invalidate_cache(product_name)
+                for name in sources
+            }
+            return jsonify({'success': True, 'invalidated': removed})
+            
+        except ValueError as e:
+            return jsonify({'success': False, 'error': str(e)}), 400
+        except Exception as e:
+            logger.error(f"Unexpected error invalidating cache: {e}")
+            return jsonify({'success': False, 'error': str(e)}), 500
+    
+    def export_table(self, product_name: str, table_name: str):
+        """
+        Stream a full table as NDJSON or CSV
+        
+        Query Parameters:
+            source: 'hana' or 'sqlite' (default: 'sqlite')
+            format: 'ndjson' (default) or 'csv'
+            batch_size: Rows per fetchmany() round trip (1-10000, default 1000)
+        
+        Rows are written batch by batch through a generator response, so
+        memory stays flat regardless of table size. WSGI offers no HTTP
+        trailers, so throughput (rows/sec) is reported in the server log
+        once the stream completes.
+        """
+        try:
+            source = request.args.get('source', 'sqlite').lower()
+            export_format = request.args.get('format', 'ndjson').lower()
+            if export_format not in EXPORT_FORMATS:
+                return jsonify({
+                    'success': False,
+                    'error': f'Invalid format. Use one of: {", ".join(EXPORT_FORMATS)}'
+                }), 400
+            batch_size = min(max(int(request.args.get('batch_size', 1000)), 1), 10000)
+            
+            facade = self.get_facade(source)
+            stream = facade.stream_table(product_name, table_name, batch_size=batch_size)
+            
+        except (ValueError, DataAccessError) as e:
+            logger.error(f"Data access error: {str(e)}")
+            return jsonify({
+                'success': False,
+                'error': {
+                    'message': str(e),
+                    'code': 'DATA_ACCESS_ERROR',
+                    'userMessage': 'Failed to access HANA Cloud. Please use SQLite as data source.'
+                }
+            }), 503
+        except Exception as e:
+            logger.error(f"Unexpected error exporting table: {e}")
+            return jsonify({'success': False, 'error': str(e)}), 500
+        
+        body = self._generate_export(stream, export_format, f'{source}:{product_name}.{table_name}')
+        return Response(
+            stream_with_context(body),
+            mimetype=EXPORT_FORMATS[export_format],
+            headers={
+                'Content-Disposition': f'attachment; filename="{table_name}.{export_format}"',
+                'X-Accel-Buffering': 'no'  # Don't let reverse proxies buffer the stream
+            }
+        )
+    
+    @staticmethod
+    def _generate_export(stream: TableStream, export_format: str, label: str) -> Iterator[str]:
+        """
+        Serialize TableStream batches to NDJSON lines or CSV rows
+        
+        Args:
+            stream: Column names + lazy row batches
+            export_format: 'ndjson' or 'csv'
+            label: Identifies the export in log lines
+        
+        Yields:
+            One text chunk per batch
+        """
+        columns = stream.columns
+        row_count = 0
+        started = time.perf_counter()
+        completed = False
+        
+        buffer = io.StringIO()
+        writer = csv.writer(buffer) if export_format == 'csv' else None
+        
+        try:
+            if writer:
+                writer.writerow(columns)
+                yield buffer.getvalue()
+            
+            for batch in stream.batches:
+                buffer.seek(0)
+                buffer.truncate()
+                if writer:
+                    writer.writerows(batch)
+                else:
+                    for row in batch:
+                        buffer.write(json.dumps(dict(zip(columns, row)), default=str))
+                        buffer.write('\n')
+                row_count += len(batch)
+                yield buffer.getvalue()
+            completed = True
+            
+        finally:
+            # Runs on completion, error, or client disconnect (generator closed)
+            stream.close()
+            elapsed = time.perf_counter() - started
+            rows_per_sec = row_count / elapsed if elapsed > 0 else 0.0
+            status = 'completed' if completed else 'aborted'
+            logger.info(
+                f"Export {status}: {label} as {export_format}, "
+                f"{row_count} rows in {elapsed:.2f}s ({rows_per_sec:,.0f} rows/sec)"
+            )
 
 
 def create_blueprint(api_instance: DataProductsV2API) -> Blueprint:
@@ -279,6 +458,14 @@ def create_blueprint(api_instance: DataProductsV2API) -> Blueprint:
     def list_data_products():
         return api_instance.list_data_products()
     
+    @bp.route('/cache/status', methods=['GET'])
+    def get_cache_status():
+        return api_instance.get_cache_status()
+    
+    @bp.route('/cache', methods=['DELETE'])
+    def invalidate_cache():
+        return api_instance.invalidate_cache()
+    
     @bp.route('/<product_name>/tables', methods=['GET'])
     def get_tables(product_name):
         return api_instance.get_tables(product_name)
@@ -291,6 +478,10 @@ def create_blueprint(api_instance: DataProductsV2API) -> Blueprint:
     def query_table(product_name, table_name):
         return api_instance.query_table(product_name, table_name)
     
+    @bp.route('/<product_name>/<table_name>/export', methods=['GET'])
+    def export_table(product_name, table_name):
+        return api_instance.export_table(product_name, table_name)
+    
     return bp
 
 
@@ -12,7 +12,7 @@ Date: 2026-02-15
 """
 
 from typing import List, Dict, Optional
-from core.interfaces.data_product_repository import IDataProductRepository, DataProduct, Table, Column
+from core.interfaces.data_product_repository import IDataProductRepository, DataProduct, Table, Column, TableStream
 
 
 class DataProductsFacade:
@@ -73,17 +73,47 @@ class DataProductsFacade:
         table_name: str,
         limit: int = 100,
         offset: int = 0,
-        filters: Optional[Dict] = None
+        filters: Optional[Dict] = None,
+        cursor: Optional[str] = None
     ) -> Dict:
-        """Query table data"""
+        """Query table data (cursor enables keyset pagination, '' = first page)"""
         return self._repository.query_table_data(
             product_name,
             table_name,
             limit,
             offset,
-            filters
+            filters,
+            cursor=cursor
         )
     
+    def stream_table(self, product_name: str, table_name: str, batch_size: int = 1000) -> TableStream:
+        """Stream all table rows in batches (export path, no row cap)"""
+        return self._repository.stream_table_data(product_name, table_name, batch_size)
+    
+    def get_cache_stats(self) -> Optional[Dict]:
+        """Get metadata cache statistics (None if the repository is not cached)"""
+        if hasattr(self._repository, 'get_cache_stats'):
+            return self._repository.get_cache_stats()
+        return None
+    
+    def invalidate_cache(self, product_name: Optional[str] = None) -> int:
+        """Drop cached metadata (all, or one product); returns entries removed"""
+        if hasattr(self._repository, 'invalidate'):
+            return self._repository.invalidate(product_name)
+        return 0
+    
+    def execute_sql(self, sql: str, use_cache: bool = True) -> Dict:
+        """Execute a read-only SQL query (served from the SQL result cache if configured)"""
+        if not use_cache and hasattr(self._repository, 'get_sql_cache_stats'):
+            return self._repository.execute_sql(sql, use_cache=False)
+        return self._repository.execute_sql(sql)
+    
+    def get_sql_cache_stats(self) -> Optional[Dict]:
+        """Get SQL result cache statistics (None if the repository has no SQL cache)"""
+        if hasattr(self._repository, 'get_sql_cache_stats'):
+            return self._repository.get_sql_cache_stats()
+        return None
+    
     def get_current_source(self) -> str:
         """Get current data source type"""
         return self._repository.get_source_type()
@@ -18,9 +18,13 @@ from modules.data_products_v2.repositories.hana_data_product_repository import (
 from modules.data_products_v2.repositories.repository_factory import (
     DataProductRepositoryFactory
 )
+from modules.data_products_v2.repositories.caching_data_product_repository import (
+    CachingDataProductRepository
+)
 
 __all__ = [
     'SQLiteDataProductRepository',
     'HANADataProductRepository',
-    'DataProductRepositoryFactory'
+    'DataProductRepositoryFactory',
+    'CachingDataProductRepository'
 ]
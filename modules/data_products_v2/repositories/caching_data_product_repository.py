@@ -0,0 +1,324 @@
+"""
+Caching Data Product Repository
+
+Decorator around any IDataProductRepository that caches catalog metadata
+(data products, tables, table structures) in a bounded LRU.
+
+Browsing the catalog is the most frequent UI action. Without the cache,
+SQLite runs COUNT(*) on every table of a product for each tables list and
+PRAGMA table_info on every table for each product list.
+
+Invalidation is source-aware:
+- SQLite: a version provider (file inode/mtime + PRAGMA data_version) drops
+  entries as soon as the database changes
+- HANA: no cheap change signal, so entries expire after a configurable TTL
+- Both: explicit invalidate() for callers that know data changed
+
+Row data (query_table_data, stream_table_data) is never cached. Results of
+execute_sql (AI-generated SELECTs) go to an optional SQLResultCache, using
+the same version provider / TTL for freshness.
+
+Author: P2P Development Team
+Version: 1.0.0
+Date: 2026-02-24
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from core.interfaces.data_product_repository import (
+    IDataProductRepository,
+    DataProduct,
+    Table,
+    Column,
+    TableStream
+)
+from core.services.sql_result_cache import SQLResultCache, estimate_size
+
+
+logger = logging.getLogger(__name__)
+
+
+class CachingDataProductRepository(IDataProductRepository):
+    """
+    LRU + TTL caching decorator for IDataProductRepository
+
+    Cached operations: get_data_products, get_tables_in_product,
+    get_table_structure, plus execute_sql when an SQL result cache is
+    given. Everything else delegates straight through.
+
+    Usage:
+        # SQLite: invalidate on any database change
+        repo = CachingDataProductRepository(
+            SQLiteDataProductRepository(db_path),
+            version_provider=sqlite_repo.get_data_version
+        )
+
+        # HANA: time-based expiry
+        repo = CachingDataProductRepository(hana_repo, ttl_seconds=300)
+
+        # Also cache execute_sql results
+        repo = CachingDataProductRepository(hana_repo, ttl_seconds=300, sql_cache=SQLResultCache())
+    """
+
+    DEFAULT_MAX_ENTRIES = 512
+
+    def __init__(
+        self,
+        repository: IDataProductRepository,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl_seconds: Optional[float] = None,
+        version_provider: Optional[Callable[[], Any]] = None,
+        sql_cache: Optional[SQLResultCache] = None
+    ):
+        """
+        Initialize caching decorator
+
+        Args:
+            repository: Repository to decorate
+            max_entries: LRU capacity (least recently used entries are evicted)
+            ttl_seconds: Per-entry lifetime in seconds (None = no expiry)
+            version_provider: Returns a value that changes whenever the
+                underlying data changes (None = rely on TTL only)
+            sql_cache: Result cache for execute_sql (None = not cached); entries
+                are keyed by source type and validated with version_provider,
+                or expire after the cache's TTL when there is no provider
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+
+        self._repository = repository
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._version_provider = version_provider
+        self._sql_cache = sql_cache
+
+        # key -> (value, version, expires_at)
+        self._entries: "OrderedDict[Tuple, Tuple[Any, Any, Optional[float]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {
+            'hits': 0,
+            'misses': 0,
+            'evictions': 0,
+            'expirations': 0,
+            'version_invalidations': 0,
+            'explicit_invalidations': 0
+        }
+        self._op_stats: Dict[str, Dict[str, int]] = {}
+
+    # ========================================================================
+    # Cached operations
+    # ========================================================================
+
+    def get_data_products(self) -> List[DataProduct]:
+        """Get all data products (cached)"""
+        return list(self._cached(('get_data_products',), self._repository.get_data_products))
+
+    def get_tables_in_product(self, product_name: str) -> List[Table]:
+        """Get tables within a data product (cached per product)"""
+        return list(self._cached(
+            ('get_tables_in_product', product_name),
+            lambda: self._repository.get_tables_in_product(product_name)
+        ))
+
+    def get_table_structure(self, product_name: str, table_name: str) -> List[Column]:
+        """Get column structure for a table (cached per table)"""
+        return list(self._cached(
+            ('get_table_structure', product_name, table_name),
+            lambda: self._repository.get_table_structure(product_name, table_name)
+        ))
+
+    # ========================================================================
+    # Pass-through operations (row data is never cached)
+    # ========================================================================
+
+    def query_table_data(
+        self,
+        product_name: str,
+        table_name: str,
+        limit: int = 100,
+        offset: int = 0,
+        filters: Optional[Dict] = None,
+        cursor: Optional[str] = None
+    ) -> Dict:
+        """Query table data (not cached)"""
+        return self._repository.query_table_data(
+            product_name, table_name, limit, offset, filters, cursor=cursor
+        )
+
+    def stream_table_data(
+        self,
+        product_name: str,
+        table_name: str,
+        batch_size: int = 1000
+    ) -> TableStream:
+        """Stream table rows (not cached)"""
+        return self._repository.stream_table_data(product_name, table_name, batch_size)
+
+    def get_source_type(self) -> str:
+        """Get source type of the decorated repository"""
+        return self._repository.get_source_type()
+
+    def test_connection(self) -> bool:
+        """Test connection (not cached - callers want the live answer)"""
+        return self._repository.test_connection()
+
+    def execute_sql(self, sql: str, use_cache: bool = True) -> Dict:
+        """
+        Execute raw SQL (successful results cached when an SQL cache is configured)
+
+        Args:
+            sql: SQL SELECT statement
+            use_cache: False bypasses the SQL result cache
+
+        Returns:
+            Repository result dict; 'cached' is True when served from the cache
+        """
+        cache = self._sql_cache
+        if cache is None:
+            return self._repository.execute_sql(sql)
+        if not use_cache:
+            cache.record_bypass()
+            return self._repository.execute_sql(sql)
+
+        source = self.get_source_type()
+        version = self._current_version()
+        cached = cache.get(source, sql, version)
+        if cached is not None:
+            return {**cached, 'cached': True}
+
+        result = self._repository.execute_sql(sql)
+        if result.get('success'):
+            cache.put(source, sql, result, version, size=estimate_size(result.get('rows', [])))
+        return result
+
+    def get_sql_cache_stats(self) -> Optional[Dict[str, Any]]:
+        """Get SQL result cache statistics (None if not configured)"""
+        return self._sql_cache.get_stats() if self._sql_cache else None
+
+    def __getattr__(self, name: str):
+        """Expose source-specific helpers of the decorated repository"""
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return getattr(self._repository, name)
+
+    # ========================================================================
+    # Cache management
+    # ========================================================================
+
+    def invalidate(self, product_name: Optional[str] = None) -> int:
+        """
+        Drop cached entries
+
+        Args:
+            product_name: Only drop entries for this product (plus the
+                product list, whose table counts may change). None drops all.
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            if product_name is None:
+                removed = len(self._entries)
+                self._entries.clear()
+            else:
+                keys = [
+                    key for key in self._entries
+                    if key[0] == 'get_data_products' or (len(key) > 1 and key[1] == product_name)
+                ]
+                for key in keys:
+                    del self._entries[key]
+                removed = len(keys)
+            self._stats['explicit_invalidations'] += removed
+
+        logger.info(f"[{self.get_source_type()}] Metadata cache invalidated: {removed} entries")
+        return removed
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics
+
+        Returns:
+            Dict with size, capacity, TTL, invalidation mode, hit ratio and
+            per-operation hits/misses
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            lookups = stats['hits'] + stats['misses']
+            operations = {
+                op: {
+                    **counts,
+                    'hit_ratio': self._ratio(counts['hits'], counts['hits'] + counts['misses'])
+                }
+                for op, counts in self._op_stats.items()
+            }
+            return {
+                'source': self.get_source_type(),
+                'size': len(self._entries),
+                'max_entries': self._max_entries,
+                'ttl_seconds': self._ttl_seconds,
+                'invalidation': 'version' if self._version_provider else 'ttl',
+                'hit_ratio': self._ratio(stats['hits'], lookups),
+                **stats,
+                'operations': operations
+            }
+
+    # ========================================================================
+    # Internals
+    # ========================================================================
+
+    def _cached(self, key: Tuple, load: Callable[[], Any]) -> Any:
+        """Return cached value for key, loading (and storing) it on a miss"""
+        version = self._current_version()
+        now = time.monotonic()
+        op = key[0]
+
+        with self._lock:
+            op_counts = self._op_stats.setdefault(op, {'hits': 0, 'misses': 0})
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, entry_version, expires_at = entry
+                if entry_version != version:
+                    self._stats['version_invalidations'] += 1
+                    del self._entries[key]
+                elif expires_at is not None and now >= expires_at:
+                    self._stats['expirations'] += 1
+                    del self._entries[key]
+                else:
+                    self._entries.move_to_end(key)
+                    self._stats['hits'] += 1
+                    op_counts['hits'] += 1
+                    return value
+            self._stats['misses'] += 1
+            op_counts['misses'] += 1
+
+        # Load outside the lock - a slow source must not block cache hits
+        value = load()
+        expires_at = now + self._ttl_seconds if self._ttl_seconds is not None else None
+
+        with self._lock:
+            self._entries[key] = (value, version, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self._stats['evictions'] += 1
+        return value
+
+    def _current_version(self) -> Any:
+        """Current data version (None without provider, unique sentinel on failure)"""
+        if self._version_provider is None:
+            return None
+        try:
+            return self._version_provider()
+        except Exception as e:
+            # Unknown state - never serve a possibly stale entry
+            logger.warning(f"Metadata cache version check failed: {e}")
+            return object()
+
+    @staticmethod
+    def _ratio(hits: int, total: int) -> float:
+        """Hit ratio rounded for display"""
+        return round(hits / total, 4) if total else 0.0
@@ -19,7 +19,9 @@ from core.interfaces.data_product_repository import (
     DataProduct,
     Table,
     Column,
-    DataAccessError
+    DataAccessError,
+    InvalidCursorError,
+    TableStream
 )
 from core.repositories import create_repository, AbstractRepository
 
@@ -184,7 +186,8 @@ class HANADataProductRepository(IDataProductRepository):
         table_name: str,
         limit: int = 100,
         offset: int = 0,
-        filters: Optional[Dict] = None
+        filters: Optional[Dict] = None,
+        cursor: Optional[str] = None
     ) -> Dict:
         """
         Query data from a table
@@ -195,12 +198,15 @@ class HANADataProductRepository(IDataProductRepository):
             limit: Max rows
             offset: Skip rows
             filters: Filter conditions (future)
+            cursor: Keyset continuation token ('' = first page, None = offset mode)
         
         Returns:
             Dict with rows, columns, totalCount, executionTime
+            (plus nextCursor/hasMore in keyset mode)
         
         Raises:
             ValueError: If table not found
+            InvalidCursorError: If cursor is malformed
             DataAccessError: If query fails
         """
         try:
@@ -212,16 +218,48 @@ class HANADataProductRepository(IDataProductRepository):
                 schema=schema_name,
                 table=table_name,
                 limit=limit,
-                offset=offset
+                offset=offset,
+                cursor=cursor
             )
             
             # V1 repository already returns correct format!
             # {rows, columns, totalCount, executionTime}
             return result
             
+        except InvalidCursorError:
+            raise
         except Exception as e:
             raise DataAccessError(f"Failed to query {table_name}: {e}")
     
+    def stream_table_data(
+        self,
+        product_name: str,
+        table_name: str,
+        batch_size: int = 1000
+    ) -> TableStream:
+        """
+        Stream all rows of a table in batches
+        
+        Args:
+            product_name: Product name
+            table_name: Table name
+            batch_size: Rows per fetchmany() call
+        
+        Returns:
+            TableStream with column names and lazy row batches
+        
+        Raises:
+            DataAccessError: If the query cannot be started
+        """
+        try:
+            return self._repository.stream_table(
+                schema=product_name,
+                table=table_name,
+                batch_size=batch_size
+            )
+        except Exception as e:
+            raise DataAccessError(f"Failed to stream {table_name}: {e}")
+    
     def get_source_type(self) -> str:
         """Get source type"""
         return 'hana'
@@ -12,15 +12,19 @@ Version: 2.0.0
 Date: 2026-02-08
 """
 
-from typing import List, Dict, Optional
+import os
+from typing import List, Dict, Optional, Tuple
 from core.interfaces.data_product_repository import (
     IDataProductRepository,
     DataProduct,
     Table,
     Column,
-    DataAccessError
+    DataAccessError,
+    InvalidCursorError,
+    TableStream
 )
 from core.repositories import create_repository, AbstractRepository
+from core.services.database_connection_factory import get_connection_pool
 
 
 class SQLiteDataProductRepository(IDataProductRepository):
@@ -170,7 +174,8 @@ class SQLiteDataProductRepository(IDataProductRepository):
         table_name: str,
         limit: int = 100,
         offset: int = 0,
-        filters: Optional[Dict] = None
+        filters: Optional[Dict] = None,
+        cursor: Optional[str] = None
     ) -> Dict:
         """
         Query data from a table
@@ -181,12 +186,15 @@ class SQLiteDataProductRepository(IDataProductRepository):
             limit: Max rows
             offset: Skip rows
             filters: Filter conditions (future)
+            cursor: Keyset continuation token ('' = first page, None = offset mode)
         
         Returns:
             Dict with rows, columns, totalCount, executionTime
+            (plus nextCursor/hasMore in keyset mode)
         
         Raises:
             ValueError: If table not found
+            InvalidCursorError: If cursor is malformed
             DataAccessError: If query fails
         """
         try:
@@ -198,16 +206,62 @@ class SQLiteDataProductRepository(IDataProductRepository):
                 schema=schema_name,
                 table=table_name,
                 limit=limit,
-                offset=offset
+                offset=offset,
+                cursor=cursor
             )
             
             # V1 service already returns the correct format!
             # {rows, columns, totalCount, executionTime}
             return result
             
+        except InvalidCursorError:
+            raise
         except Exception as e:
             raise DataAccessError(f"Failed to query {table_name}: {e}")
     
+    def stream_table_data(
+        self,
+        product_name: str,
+        table_name: str,
+        batch_size: int = 1000
+    ) -> TableStream:
+        """
+        Stream all rows of a table in batches
+        
+        Args:
+            product_name: Product name
+            table_name: Table name
+            batch_size: Rows per fetchmany() call
+        
+        Returns:
+            TableStream with column names and lazy row batches
+        
+        Raises:
+            DataAccessError: If the query cannot be started
+        """
+        try:
+            return self._repo.stream_table(
+                schema=f'SQLITE_{product_name.upper()}',
+                table=table_name,
+                batch_size=batch_size
+            )
+        except Exception as e:
+            raise DataAccessError(f"Failed to stream {table_name}: {e}")
+    
+    def get_data_version(self) -> Tuple[int, int, int]:
+        """
+        Get a value that changes whenever the database content changes
+        
+        Combines the file identity (inode + mtime, catches the file being
+        replaced by a rebuild) with PRAGMA data_version (catches commits,
+        including WAL commits that don't touch the main file's mtime).
+        
+        Returns:
+            Tuple of (inode, mtime_ns, data_version)
+        """
+        stat = os.stat(self._db_path)
+        return (stat.st_ino, stat.st_mtime_ns, get_connection_pool(self._db_path).get_data_version())
+    
     def get_source_type(self) -> str:
         """Get source type"""
         return 'sqlite'
@@ -259,19 +313,18 @@ class SQLiteDataProductRepository(IDataProductRepository):
         try:
             start_time = time.time()
             
-            # Connect to SQLite database
-            conn = sqlite3.connect(self._db_path)
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute(sql)
-            
-            # Fetch results
-            rows = [dict(row) for row in cursor.fetchall()]
-            columns = [desc[0] for desc in cursor.description] if cursor.description else []
+            # Borrow a pooled read-only connection (query_only also blocks writes)
+            with get_connection_pool(self._db_path).connection() as conn:
+                cursor = conn.cursor()
+                cursor.row_factory = sqlite3.Row
+                cursor.execute(sql)
+                
+                # Fetch results
+                rows = [dict(row) for row in cursor.fetchall()]
+                columns = [desc[0] for desc in cursor.description] if cursor.description else []
             
             execution_time_ms = (time.time() - start_time) * 1000
             
-            conn.close()
-            
             return {
                 'success': True,
                 'rows': rows,
@@ -4,8 +4,10 @@ Knowledge Graph v2 API Endpoints
 RESTful API for knowledge graph operations with dependency injection.
 Version 2.0.0 - Constructor Injection Pattern
 """
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, current_app, jsonify, request
 from functools import wraps
+import json
+from typing import Any, Dict
 
 from ..facade import KnowledgeGraphFacadeV2
 from .query_template_api import query_template_bp
@@ -46,15 +48,23 @@ class KnowledgeGraphV2API:
         - offset: int (default: 0) - Offset for pagination
         - include_edges: bool (default: true) - Include edges in response
         - summary: bool (default: false) - Return summary only (counts, no graph data)
+        - properties: str (default: all) - Node properties to return: "all", "none"
+          (ids, labels and types only) or comma-separated keys
         
         Examples:
         - Get summary: /api/knowledge-graph/schema?summary=true
         - Filter entities: /api/knowledge-graph/schema?entity_types=PurchaseOrder,Invoice
         - Paginate: /api/knowledge-graph/schema?limit=100&offset=0
         - Nodes only: /api/knowledge-graph/schema?include_edges=false
+        - Overview: /api/knowledge-graph/schema?properties=entity_label,semantic_summary
+        
+        Conditional requests:
+        - Responses carry an ETag for the current schema graph snapshot
+        - If-None-Match with that ETag returns 304 without a body
         
         Returns:
             200: Success with graph data (or summary) wrapped in 'data'
+            304: Not modified (If-None-Match matches current snapshot)
             400: Invalid parameters
             500: Error
         """
@@ -73,6 +83,15 @@ class KnowledgeGraphV2API:
             include_edges_param = request.args.get('include_edges', 'true').lower()
             include_edges = include_edges_param not in ('false', '0', 'no')
             
+            # None = all node properties
+            properties_param = request.args.get('properties', 'all').strip()
+            if properties_param.lower() == 'all':
+                property_keys = None
+            elif properties_param.lower() == 'none':
+                property_keys = ()
+            else:
+                property_keys = tuple(k.strip() for k in properties_param.split(',') if k.strip())
+            
             # Validate parameters
             if limit is not None and limit < 1:
                 return jsonify({
@@ -86,49 +105,100 @@ class KnowledgeGraphV2API:
                     'error': 'offset must be >= 0'
                 }), 400
             
-            # Get full graph from facade
-            result = self.facade.get_schema_graph(use_cache=use_cache)
+            # Projected overview: no full snapshot needed on a cold start
+            if property_keys is not None and use_cache and not summary_only and not entity_types and limit is None:
+                overview = self.facade.get_schema_overview(property_keys)
+                if not overview['success']:
+                    return jsonify(overview), 500
+                
+                nodes = overview['graph']['nodes']
+                response = jsonify({
+                    'success': True,
+                    'data': {
+                        'graph': {
+                            'nodes': nodes,
+                            'edges': overview['graph']['edges'] if include_edges else []
+                        },
+                        'metadata': overview['metadata'],
+                        'pagination': {
+                            'total_nodes': len(nodes),
+                            'returned_nodes': len(nodes),
+                            'offset': offset,
+                            'limit': limit
+                        }
+                    },
+                    'cache_used': overview['cache_used']
+                })
+                return response, 200
+            
+            # Get process-level snapshot (built once, shared by all requests)
+            try:
+                snapshot = self.facade.get_schema_snapshot(use_cache=use_cache)
+            except Exception as e:
+                return jsonify({
+                    'success': False,
+                    'error': str(e),
+                    'error_type': type(e).__name__
+                }), 500
             
-            if not result['success']:
-                return jsonify(result), 500
+            if request.if_none_match.contains(snapshot.etag):
+                return self._with_etag(current_app.response_class(status=304), snapshot.etag)
             
-            graph = result['graph']
-            metadata = result['metadata']
+            graph = snapshot.graph_dict
+            metadata = dict(snapshot.metadata)
             
-            # Handle summary request
+            # Handle summary request (precomputed in snapshot)
             if summary_only:
-                return jsonify({
+                return self._with_etag(jsonify({
                     'success': True,
                     'data': {
-                        'summary': {
-                            'total_nodes': len(graph.get('nodes', [])),
-                            'total_edges': len(graph.get('edges', [])),
-                            'entity_types': self._get_entity_type_counts(graph.get('nodes', [])),
-                            'relationship_types': self._get_relationship_type_counts(graph.get('edges', []))
-                        },
+                        'summary': dict(snapshot.summary),
                         'metadata': metadata
                     },
-                    'cache_used': result.get('cache_used', False)
-                }), 200
+                    'cache_used': snapshot.cache_used
+                }), snapshot.etag), 200
             
-            # Filter nodes by entity types
-            nodes = graph.get('nodes', [])
-            if entity_types:
-                nodes = [n for n in nodes if n.get('type') in entity_types or n.get('entity_type') in entity_types]
+            # Unfiltered request: splice the pre-serialized graph JSON
+            if not entity_types and limit is None and include_edges:
+                total_nodes = snapshot.summary['total_nodes']
+                body = (
+                    '{"success":true,"cache_used":' + json.dumps(snapshot.cache_used)
+                    + ',"data":{"graph":' + snapshot.graph_json
+                    + ',"metadata":' + json.dumps(metadata)
+                    + ',"pagination":' + json.dumps({
+                        'total_nodes': total_nodes,
+                        'returned_nodes': total_nodes,
+                        'offset': offset,
+                        'limit': limit
+                    })
+                    + '}}'
+                )
+                return self._with_etag(
+                    current_app.response_class(body, status=200, mimetype='application/json'),
+                    snapshot.etag
+                )
             
-            # Apply pagination to nodes
-            total_nodes = len(nodes)
-            if limit is not None:
-                nodes = nodes[offset:offset + limit]
+            # Filter + paginate via the Graph indexes (cost ~ page size, not graph size).
+            # Positions index straight into the snapshot's serialized node/edge lists.
+            indexed = snapshot.graph
+            all_nodes = graph.get('nodes', [])
+            all_edges = graph.get('edges', [])
             
-            # Filter edges if needed
-            edges = graph.get('edges', [])
+            total_nodes = indexed.count_nodes(entity_types)
+            page_offset = offset if limit is not None else 0
+            node_positions = indexed.page_node_positions(entity_types, page_offset, limit)
+            nodes = [all_nodes[i] for i in node_positions]
+            if property_keys is not None:
+                nodes = self.facade.project_node_dicts(nodes, property_keys)
+            
+            # Only include edges where both nodes are in the returned set
             if not include_edges:
                 edges = []
             elif entity_types or limit is not None:
-                # Only include edges where both nodes are in the filtered set
-                node_ids = {n.get('id') for n in nodes}
-                edges = [e for e in edges if e.get('from') in node_ids and e.get('to') in node_ids]
+                node_ids = indexed.node_ids_at(node_positions)
+                edges = [all_edges[i] for i in indexed.edge_positions_within(node_ids)]
+            else:
+                edges = all_edges
             
             # Build response
             filtered_graph = {
@@ -148,10 +218,10 @@ class KnowledgeGraphV2API:
                         'limit': limit
                     }
                 },
-                'cache_used': result.get('cache_used', False)
+                'cache_used': snapshot.cache_used
             }
             
-            return jsonify(response), 200
+            return self._with_etag(jsonify(response), snapshot.etag), 200
             
         except Exception as e:
             return jsonify({
@@ -160,21 +230,12 @@ class KnowledgeGraphV2API:
                 'error_type': type(e).__name__
             }), 500
     
-    def _get_entity_type_counts(self, nodes):
-        """Helper to count nodes by entity type"""
-        counts = {}
-        for node in nodes:
-            entity_type = node.get('type') or node.get('entity_type', 'Unknown')
-            counts[entity_type] = counts.get(entity_type, 0) + 1
-        return counts
-    
-    def _get_relationship_type_counts(self, edges):
-        """Helper to count edges by relationship type"""
-        counts = {}
-        for edge in edges:
-            rel_type = edge.get('label') or edge.get('type', 'Unknown')
-            counts[rel_type] = counts.get(rel_type, 0) + 1
-        return counts
+    @staticmethod
+    def _with_etag(response, etag: str):
+        """Attach snapshot ETag; clients must revalidate before reusing"""
+        response.set_etag(etag)
+        response.headers['Cache-Control'] = 'no-cache'
+        return response
     
     def rebuild_schema_graph(self):
         """
@@ -202,7 +263,9 @@ class KnowledgeGraphV2API:
             response = result
         
         status_code = 200 if result['success'] else 500
-        return jsonify(response), status_code
+        if not result['success']:
+            return jsonify(response), status_code
+        return self._with_etag(jsonify(response), result['etag']), status_code
     
     def get_status(self):
         """
@@ -308,6 +371,74 @@ class KnowledgeGraphV2API:
                 'error_type': type(e).__name__
             }), 500
     
+    MAX_PATH_HOPS = 20
+    MAX_PATHS = 20
+    
+    def find_paths(self):
+        """
+        GET /api/knowledge-graph/paths
+        
+        Find the k shortest paths between two nodes (bounded search)
+        
+        Query Parameters:
+        - source: str (required) - Start node ID
+        - target: str (required) - End node ID
+        - max_hops: int (default: 10, at most MAX_PATH_HOPS) - Maximum path length
+        - edge_types: str (optional) - Comma-separated edge types to follow
+        - k: int (default: 1, at most MAX_PATHS) - Number of paths
+        
+        Returns:
+            200: Success with paths (empty list if none within max_hops)
+            400: Invalid parameters
+            404: Source or target node not found
+            501: Edge-type / k-shortest search not supported by the backend
+            500: Error
+        """
+        try:
+            source = request.args.get('source', '').strip()
+            target = request.args.get('target', '').strip()
+            max_hops = int(request.args.get('max_hops', 10))
+            k = int(request.args.get('k', 1))
+            edge_types = [t.strip() for t in request.args.get('edge_types', '').split(',') if t.strip()]
+            
+            if not source or not target:
+                return jsonify({
+                    'success': False,
+                    'error': 'source and target are required'
+                }), 400
+            
+            if not (1 <= max_hops <= self.MAX_PATH_HOPS):
+                return jsonify({
+                    'success': False,
+                    'error': f'max_hops must be between 1 and {self.MAX_PATH_HOPS}'
+                }), 400
+            
+            if not (1 <= k <= self.MAX_PATHS):
+                return jsonify({
+                    'success': False,
+                    'error': f'k must be between 1 and {self.MAX_PATHS}'
+                }), 400
+            
+            result = self.facade.find_paths(source, target, max_hops, edge_types or None, k)
+            
+            if not result['success']:
+                if result.get('error_type') == 'NotImplementedError':
+                    status_code = 501
+                elif 'not found' in result.get('error', '').lower():
+                    status_code = 404
+                else:
+                    status_code = 500
+                return jsonify(result), status_code
+            
+            return jsonify(result), 200
+            
+        except ValueError as e:
+            return jsonify({
+                'success': False,
+                'error': str(e),
+                'error_type': 'ValueError'
+            }), 400
+    
     # ========================================================================
     # Advanced Query Endpoints (HIGH-31: Phase 3)
     # ========================================================================
@@ -324,6 +455,7 @@ class KnowledgeGraphV2API:
         
         Returns:
             200: Success with PageRank scores
+            202: Computation in progress (retry after Retry-After seconds)
             400: Invalid parameters
             500: Error
         """
@@ -344,8 +476,7 @@ class KnowledgeGraphV2API:
                 }), 400
             
             result = self.facade.get_pagerank(top_k, damping_factor)
-            status_code = 200 if result['success'] else 500
-            return jsonify(result), status_code
+            return self._analytics_response(result)
             
         except ValueError as e:
             return jsonify({
@@ -363,9 +494,14 @@ class KnowledgeGraphV2API:
         Query Parameters:
         - metric: str (default: betweenness) - Centrality type
         - top_k: int (default: 10) - Number of top nodes to return
+        - sample_size: int (optional) - Betweenness pivot count (approximate mode)
+        - epsilon: float (optional) - Betweenness target error, 0 < epsilon < 1
+          (approximate mode, derives sample_size)
+        - seed: int (optional) - Random seed for reproducible sampling
         
         Returns:
             200: Success with centrality scores
+            202: Computation in progress (retry after Retry-After seconds)
             400: Invalid parameters
             500: Error
         """
@@ -373,15 +509,30 @@ class KnowledgeGraphV2API:
             metric = request.args.get('metric', 'betweenness')
             top_k = int(request.args.get('top_k', 10))
             
+            sample_size = self._optional_arg('sample_size', int)
+            epsilon = self._optional_arg('epsilon', float)
+            seed = self._optional_arg('seed', int)
+            
             if top_k < 1:
                 return jsonify({
                     'success': False,
                     'error': 'top_k must be >= 1'
                 }), 400
             
-            result = self.facade.get_centrality(metric, top_k)
-            status_code = 200 if result['success'] else 500
-            return jsonify(result), status_code
+            if sample_size is not None and sample_size < 1:
+                return jsonify({
+                    'success': False,
+                    'error': 'sample_size must be >= 1'
+                }), 400
+            
+            if epsilon is not None and not (0.0 < epsilon < 1.0):
+                return jsonify({
+                    'success': False,
+                    'error': 'epsilon must be between 0 and 1'
+                }), 400
+            
+            result = self.facade.get_centrality(metric, top_k, sample_size, epsilon, seed)
+            return self._analytics_response(result)
             
         except ValueError as e:
             return jsonify({
@@ -414,15 +565,44 @@ class KnowledgeGraphV2API:
         """
         GET /api/knowledge-graph/analytics/cycles
         
-        Find all cycles in graph
+        Find cycles in graph (bounded enumeration)
+        
+        Query Parameters:
+        - max_length: int (optional) - Only cycles with at most this many nodes
+        - max_cycles: int (default: 1000) - Stop after this many cycles
+          (data.truncated tells whether more exist)
         
         Returns:
             200: Success with cycles
+            202: Computation in progress (retry after Retry-After seconds)
+            400: Invalid parameters
             500: Error (or not implemented)
         """
-        result = self.facade.find_cycles()
-        status_code = 200 if result['success'] else 500
-        return jsonify(result), status_code
+        try:
+            max_length = self._optional_arg('max_length', int)
+            max_cycles = self._optional_arg('max_cycles', int)
+            
+            if max_length is not None and max_length < 1:
+                return jsonify({
+                    'success': False,
+                    'error': 'max_length must be >= 1'
+                }), 400
+            
+            if max_cycles is not None and max_cycles < 1:
+                return jsonify({
+                    'success': False,
+                    'error': 'max_cycles must be >= 1'
+                }), 400
+            
+            result = self.facade.find_cycles(max_length, max_cycles)
+            return self._analytics_response(result)
+            
+        except ValueError as e:
+            return jsonify({
+                'success': False,
+                'error': str(e),
+                'error_type': 'ValueError'
+            }), 400
     
     def get_connected_components(self):
         """
@@ -432,11 +612,37 @@ class KnowledgeGraphV2API:
         
         Returns:
             200: Success with components
+            202: Computation in progress (retry after Retry-After seconds)
             500: Error (or not implemented)
         """
         result = self.facade.get_connected_components()
-        status_code = 200 if result['success'] else 500
-        return jsonify(result), status_code
+        return self._analytics_response(result)
+    
+    ANALYTICS_RETRY_AFTER_SECONDS = 5
+    
+    @staticmethod
+    def _optional_arg(name: str, convert):
+        """Optional query parameter converted with convert (None if absent; ValueError if invalid)"""
+        value = request.args.get(name)
+        if value is None or value == '':
+            return None
+        return convert(value)
+    
+    def _analytics_response(self, result: Dict[str, Any]):
+        """
+        Build response for a cached analytics result
+        
+        Pending results (first computation for a graph version still
+        running in the background) return 202 + Retry-After instead of
+        holding the request thread.
+        """
+        if not result['success']:
+            return jsonify(result), 500
+        if result.get('status') == 'pending':
+            response = jsonify(result)
+            response.headers['Retry-After'] = str(self.ANALYTICS_RETRY_AFTER_SECONDS)
+            return response, 202
+        return jsonify(result), 200
     
     def get_graph_statistics(self):
         """
@@ -532,6 +738,11 @@ def create_blueprint(api_instance: KnowledgeGraphV2API) -> Blueprint:
         """KGV-001: Get detailed column metadata for table"""
         return api_instance.get_table_columns(table_name)
     
+    @blueprint.route('/paths', methods=['GET'])
+    @handle_errors
+    def find_paths():
+        return api_instance.find_paths()
+    
     @blueprint.route('/health', methods=['GET'])
     def health_check():
         """Health check endpoint (no authentication required)"""
@@ -7,6 +7,7 @@ from .enums import GraphType, NodeType, EdgeType
 from .graph_node import GraphNode
 from .graph_edge import GraphEdge
 from .graph import Graph
+from .lazy_properties import LazyProperties
 
 __all__ = [
     'GraphType',
@@ -14,5 +15,6 @@ __all__ = [
     'EdgeType',
     'GraphNode',
     'GraphEdge',
-    'Graph'
+    'Graph',
+    'LazyProperties'
 ]
\ No newline at end of file
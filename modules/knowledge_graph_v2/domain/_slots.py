@@ -0,0 +1,62 @@
+"""
+Slotted dataclass helper for Knowledge Graph v2 domain objects
+
+Backport of dataclass(slots=True) (Python 3.10+) for the supported >=3.8
+range. Graphs hold one GraphNode per entity and one GraphEdge per
+relationship, so dropping the per-instance __dict__ matters at data-graph
+scale (hundreds of thousands of objects).
+"""
+from dataclasses import fields
+from typing import Type, TypeVar
+
+T = TypeVar('T')
+
+
+def with_slots(cls: Type[T]) -> Type[T]:
+    """
+    Recreate a dataclass with __slots__ for its fields
+
+    Apply on top of @dataclass (decorators run bottom-up):
+
+        @with_slots
+        @dataclass(frozen=True)
+        class GraphEdge: ...
+
+    Frozen classes get __getstate__/__setstate__ so instances stay
+    picklable (default slot restoration would go through the frozen
+    __setattr__ and fail).
+
+    Args:
+        cls: Class already processed by @dataclass
+
+    Returns:
+        New class with identical behaviour and no per-instance __dict__
+    """
+    field_names = tuple(f.name for f in fields(cls))
+
+    cls_dict = dict(cls.__dict__)
+    cls_dict['__slots__'] = field_names
+    for name in field_names:
+        # Defaults live in the generated __init__; class attributes would clash with slots
+        cls_dict.pop(name, None)
+    cls_dict.pop('__dict__', None)
+    cls_dict.pop('__weakref__', None)
+
+    if cls.__dataclass_params__.frozen:
+        cls_dict['__getstate__'] = _frozen_getstate
+        cls_dict['__setstate__'] = _frozen_setstate
+
+    slotted = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    slotted.__qualname__ = cls.__qualname__
+    return slotted
+
+
+def _frozen_getstate(self):
+    """Pickle support: field values in declaration order"""
+    return [getattr(self, f.name) for f in fields(self)]
+
+
+def _frozen_setstate(self, state):
+    """Pickle support: bypass the frozen __setattr__"""
+    for f, value in zip(fields(self), state):
+        object.__setattr__(self, f.name, value)
@@ -3,10 +3,13 @@ Graph Aggregate Root for Knowledge Graph v2
 
 The Graph is the aggregate root that enforces invariants across nodes and edges.
 """
-from typing import Dict, List, Any, Optional
+import heapq
+from array import array
+from itertools import islice
+from typing import Dict, Iterable, List, Any, Optional, Set, Tuple
 from .graph_node import GraphNode
 from .graph_edge import GraphEdge
-from .enums import GraphType, EdgeType
+from .enums import GraphType, EdgeType, NodeType
 
 
 class Graph:
@@ -19,6 +22,17 @@ class Graph:
     - No duplicate edges (idempotent edge addition)
     
     This is the main domain object that ensures graph consistency.
+    
+    Indexes (maintained incrementally by add_node/add_edge):
+    - by type: type key -> node positions (insertion order)
+    - by product: product name -> node positions (product node + its tables)
+    - adjacency: node id -> outgoing / incoming edge positions
+    - edge keys: (source_id, target_id, type) set for O(1) duplicate detection
+    
+    Positions are stable (nodes and edges are never removed) and match the
+    order of nodes, edges and to_dict(), so callers holding a serialized
+    copy can slice it directly. Position lists are compact int64 arrays
+    (no per-entry int objects), which keeps million-edge data graphs small.
     """
     
     def __init__(self, graph_id: str, graph_type: GraphType):
@@ -38,6 +52,14 @@ class Graph:
         self.type = graph_type
         self._nodes: Dict[str, GraphNode] = {}
         self._edges: List[GraphEdge] = []
+        
+        # Secondary indexes (positions into _node_ids / _edges)
+        self._node_ids: List[str] = []
+        self._nodes_by_type: Dict[str, array] = {}
+        self._nodes_by_product: Dict[str, array] = {}
+        self._out_edges: Dict[str, array] = {}
+        self._in_edges: Dict[str, array] = {}
+        self._edge_keys: Set[Tuple[str, str, EdgeType]] = set()
     
     def add_node(self, node: GraphNode) -> None:
         """
@@ -55,6 +77,7 @@ class Graph:
             raise ValueError(f"Node with id '{node.id}' already exists")
         
         self._nodes[node.id] = node
+        self._index_node(node)
     
     def add_edge(self, edge: GraphEdge) -> None:
         """
@@ -75,11 +98,15 @@ class Graph:
         if edge.target_id not in self._nodes:
             raise ValueError(f"Target node '{edge.target_id}' not found in graph")
         
-        # Check for duplicate (idempotent addition)
+        # Check for duplicate (idempotent addition) - O(1) via key index
         if self._has_edge(edge.source_id, edge.target_id, edge.type):
             return  # Silently ignore duplicate
         
+        position = len(self._edges)
+        self._edge_keys.add(edge.key)
         self._edges.append(edge)
+        self._append_position(self._out_edges, edge.source_id, position)
+        self._append_position(self._in_edges, edge.target_id, position)
     
     def get_node(self, node_id: str) -> Optional[GraphNode]:
         """
@@ -125,6 +152,185 @@ class Graph:
         """
         return list(self._edges)
     
+    def get_nodes_by_type(self, node_type: NodeType) -> List[GraphNode]:
+        """
+        Get all nodes of a type (index lookup)
+        
+        Args:
+            node_type: Node type to select
+            
+        Returns:
+            Nodes of that type in insertion order
+        """
+        return self._nodes_at(self._nodes_by_type.get(node_type.value, ()))
+    
+    def get_nodes_by_product(self, product: str) -> List[GraphNode]:
+        """
+        Get the product node and all nodes belonging to it (index lookup)
+        
+        Args:
+            product: Data product name
+            
+        Returns:
+            Product node (if any) followed by its member nodes, in insertion order
+        """
+        return self._nodes_at(self._nodes_by_product.get(product, ()))
+    
+    def get_outgoing_edges(self, node_id: str) -> List[GraphEdge]:
+        """
+        Get edges leaving a node (adjacency lookup)
+        
+        Args:
+            node_id: Source node ID
+            
+        Returns:
+            Outgoing edges in insertion order
+        """
+        return [self._edges[i] for i in self._out_edges.get(node_id, ())]
+    
+    def get_incoming_edges(self, node_id: str) -> List[GraphEdge]:
+        """
+        Get edges entering a node (adjacency lookup)
+        
+        Args:
+            node_id: Target node ID
+            
+        Returns:
+            Incoming edges in insertion order
+        """
+        return [self._edges[i] for i in self._in_edges.get(node_id, ())]
+    
+    def count_nodes(self, type_keys: Optional[Iterable[str]] = None) -> int:
+        """
+        Count nodes, optionally restricted to type keys
+        
+        Args:
+            type_keys: Node type values (e.g. 'table') or 'entity_type'
+                property values; None counts all nodes
+            
+        Returns:
+            Number of matching nodes
+        """
+        if type_keys is None:
+            return len(self._node_ids)
+        lists = self._type_key_lists(type_keys)
+        if len(lists) == 1:
+            return len(lists[0])
+        return sum(1 for _ in self._merge_unique(lists))
+    
+    def page_node_positions(
+        self,
+        type_keys: Optional[Iterable[str]] = None,
+        offset: int = 0,
+        limit: Optional[int] = None
+    ) -> List[int]:
+        """
+        Get positions of one page of nodes, optionally filtered by type keys
+        
+        Cost is proportional to the page (offset + limit), not the graph:
+        a single type is sliced directly, several types are merged lazily.
+        
+        Args:
+            type_keys: Node type values or 'entity_type' property values
+                (None = all nodes)
+            offset: Number of matching nodes to skip
+            limit: Maximum number of positions (None = all remaining)
+            
+        Returns:
+            Node positions in insertion order (index into nodes / to_dict()['nodes'])
+        """
+        stop = None if limit is None else offset + limit
+        
+        if type_keys is None:
+            return list(range(len(self._node_ids))[offset:stop])
+        
+        lists = self._type_key_lists(type_keys)
+        if not lists:
+            return []
+        if len(lists) == 1:
+            return list(lists[0][offset:stop])
+        return list(islice(self._merge_unique(lists), offset, stop))
+    
+    def _type_key_lists(self, type_keys: Iterable[str]) -> List[List[int]]:
+        """Sorted position lists of the requested type keys (missing keys skipped)"""
+        return [self._nodes_by_type[key] for key in set(type_keys) if key in self._nodes_by_type]
+    
+    @staticmethod
+    def _merge_unique(lists: List[List[int]]) -> Iterable[int]:
+        """
+        Merge sorted position lists, yielding each position once
+        
+        A node is indexed under its type value and its 'entity_type'
+        property, so it can appear in several of the lists.
+        """
+        previous = None
+        for position in heapq.merge(*lists):
+            if position != previous:
+                yield position
+                previous = position
+    
+    def node_ids_at(self, positions: Iterable[int]) -> List[str]:
+        """
+        Map node positions to node IDs
+        
+        Args:
+            positions: Node positions from page_node_positions()
+            
+        Returns:
+            Node IDs in the same order
+        """
+        return [self._node_ids[i] for i in positions]
+    
+    def edge_positions_within(self, node_ids: Iterable[str]) -> List[int]:
+        """
+        Get positions of edges whose endpoints are both in node_ids
+        
+        Walks the adjacency of the given nodes only (cost proportional to
+        their degree, not to the total edge count).
+        
+        Args:
+            node_ids: IDs of the nodes to keep
+            
+        Returns:
+            Edge positions in insertion order (index into edges / to_dict()['edges'])
+        """
+        selected: Set[str] = set(node_ids)
+        positions = [
+            i
+            for node_id in selected
+            for i in self._out_edges.get(node_id, ())
+            if self._edges[i].target_id in selected
+        ]
+        positions.sort()
+        return positions
+    
+    def _index_node(self, node: GraphNode) -> None:
+        """Add a newly inserted node to the secondary indexes"""
+        position = len(self._node_ids)
+        self._node_ids.append(node.id)
+        
+        type_key = node.type.value
+        self._append_position(self._nodes_by_type, type_key, position)
+        entity_type = node.properties.get('entity_type')
+        if isinstance(entity_type, str) and entity_type != type_key:
+            self._append_position(self._nodes_by_type, entity_type, position)
+        
+        product = node.label if node.type == NodeType.PRODUCT else node.properties.get('product')
+        if isinstance(product, str) and product:
+            self._append_position(self._nodes_by_product, product, position)
+    
+    @staticmethod
+    def _append_position(index: Dict[str, array], key: str, position: int) -> None:
+        """Append position to index[key], creating the array on first use"""
+        positions = index.get(key)
+        if positions is None:
+            positions = index[key] = array('q')
+        positions.append(position)
+    
+    def _nodes_at(self, positions: Iterable[int]) -> List[GraphNode]:
+        """Resolve node positions to nodes"""
+        return [self._nodes[self._node_ids[i]] for i in positions]
+    
     def _has_edge(self, source_id: str, target_id: str, edge_type: EdgeType) -> bool:
         """
         Check if edge already exists
@@ -137,12 +343,7 @@ class Graph:
         Returns:
             True if edge exists, False otherwise
         """
-        return any(
-            e.source_id == source_id 
-            and e.target_id == target_id 
-            and e.type == edge_type
-            for e in self._edges
-        )
+        return (source_id, target_id, edge_type) in self._edge_keys
     
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -179,12 +380,12 @@ class Graph:
         }
     
     def _count_nodes_by_type(self) -> Dict[str, int]:
-        """Count nodes by type"""
-        counts = {}
-        for node in self._nodes.values():
-            type_name = node.type.value
-            counts[type_name] = counts.get(type_name, 0) + 1
-        return counts
+        """Count nodes by type (from the type index)"""
+        return {
+            node_type.value: len(self._nodes_by_type[node_type.value])
+            for node_type in NodeType
+            if self._nodes_by_type.get(node_type.value)
+        }
     
     def _count_edges_by_type(self) -> Dict[str, int]:
         """Count edges by type"""
@@ -4,10 +4,12 @@ GraphEdge Value Object for Knowledge Graph v2
 Represents an immutable edge/relationship in the knowledge graph.
 """
 from dataclasses import dataclass, field
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from .enums import EdgeType
+from ._slots import with_slots
 
 
+@with_slots
 @dataclass(frozen=True)
 class GraphEdge:
     """
@@ -15,6 +17,7 @@ class GraphEdge:
     
     Represents a directed edge between two nodes.
     Immutable (frozen=True) - value objects cannot change after creation.
+    Slotted (no per-instance __dict__) to keep large data graphs compact.
     """
     source_id: str
     target_id: str
@@ -56,3 +59,8 @@ class GraphEdge:
             result.update(self.properties)
         
         return result
+    
+    @property
+    def key(self) -> Tuple[str, str, EdgeType]:
+        """Identity used for duplicate detection: (source_id, target_id, type)"""
+        return (self.source_id, self.target_id, self.type)
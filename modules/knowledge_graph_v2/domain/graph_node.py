@@ -6,8 +6,10 @@ Represents a node in the knowledge graph with immutable properties.
 from dataclasses import dataclass, field
 from typing import Dict, Any
 from .enums import NodeType
+from ._slots import with_slots
 
 
+@with_slots
 @dataclass
 class GraphNode:
     """
@@ -15,6 +17,7 @@ class GraphNode:
     
     Represents a node in the knowledge graph (table, record, product, column).
     Immutable after creation (value object semantics for thread safety).
+    Slotted (no per-instance __dict__) to keep large data graphs compact.
     """
     id: str
     label: str
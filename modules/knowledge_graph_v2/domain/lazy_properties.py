@@ -0,0 +1,88 @@
+"""
+Lazily decoded node/edge properties for Knowledge Graph v2
+
+Schema graph nodes carry per-column semantic annotations in their
+properties. Callers that only need ids, labels and a few scalar fields
+should not pay for json.loads of every blob when a graph is loaded from
+the cache, so repositories can hand out LazyProperties instead of dicts:
+the JSON is decoded on first access.
+"""
+import json
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, Optional
+
+
+class LazyProperties(Mapping):
+    """
+    Read-only properties mapping decoded from JSON on first access
+
+    A few values can be preloaded (e.g. extracted by SQL): get() serves them
+    without decoding the blob. Preloaded values cannot distinguish a missing
+    key from null, so only get() uses them; every other access decodes.
+
+    Thread-safe: concurrent first accesses may both decode, the result is
+    the same.
+
+    Example:
+        props = LazyProperties('{"product": "P2P", "columns": {...}}', {'product': 'P2P'})
+        props.get('product')   # no decode
+        props['columns']       # decodes once
+    """
+    __slots__ = ('_raw', '_data', '_preloaded')
+
+    def __init__(self, raw_json: str, preloaded: Optional[Dict[str, Any]] = None):
+        """
+        Args:
+            raw_json: JSON object text
+            preloaded: Values already known for some keys (None = absent or null)
+        """
+        self._raw = raw_json
+        self._data: Optional[Dict[str, Any]] = None
+        self._preloaded = preloaded
+
+    @property
+    def materialized(self) -> bool:
+        """True once the JSON blob has been decoded"""
+        return self._data is not None
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if self._data is None and self._preloaded is not None and key in self._preloaded:
+            value = self._preloaded[key]
+            return default if value is None else value
+        return self._load().get(key, default)
+
+    def __getitem__(self, key: str) -> Any:
+        return self._load()[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._load())
+
+    def __len__(self) -> int:
+        return len(self._load())
+
+    def __bool__(self) -> bool:
+        raw = self._raw
+        data = self._data
+        if data is not None:
+            return bool(data)
+        return raw.strip() not in ('', '{}')
+
+    def __repr__(self) -> str:
+        if self._data is None:
+            return f"LazyProperties(<{len(self._raw)} bytes, not decoded>)"
+        return f"LazyProperties({self._data!r})"
+
+    def __reduce__(self):
+        # Pickle/copy as a plain dict
+        return dict, (dict(self._load()),)
+
+    def _load(self) -> Dict[str, Any]:
+        """Decode once, then drop the raw text"""
+        # Read _raw before _data: a concurrent _load() sets _data before clearing _raw
+        raw = self._raw
+        data = self._data
+        if data is None:
+            data = json.loads(raw)
+            self._data = data
+            self._raw = None
+        return data
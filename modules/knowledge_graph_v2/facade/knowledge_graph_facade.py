@@ -11,15 +11,20 @@ DI Pattern: All dependencies injected (no internal instantiation)
 - Graph query engine (for analytics)
 - CSN parser
 """
-from typing import Dict, Any, Optional
+import logging
+from typing import Dict, Any, Iterable, List, Mapping, Optional, Sequence
 from pathlib import Path
 
 from ..domain import Graph, GraphType
-from ..repositories import AbstractGraphCacheRepository
+from ..repositories import AbstractGraphCacheRepository, GraphProjection
 from ..services import GraphCacheService, SchemaGraphBuilderService
+from ..services import SchemaGraphSnapshot, SchemaGraphSnapshotStore
+from ..services import GraphAnalyticsCache, AnalyticsResult
 from core.services.csn_parser import CSNParser
 from core.interfaces.graph_query import IGraphQueryEngine
 
+logger = logging.getLogger(__name__)
+
 
 class KnowledgeGraphFacadeV2:
     """
@@ -53,7 +58,9 @@ class KnowledgeGraphFacadeV2:
         cache_service: GraphCacheService,
         schema_builder: SchemaGraphBuilderService,
         graph_query_engine: IGraphQueryEngine,
-        csn_parser: Optional[CSNParser] = None
+        csn_parser: Optional[CSNParser] = None,
+        snapshot_store: Optional[SchemaGraphSnapshotStore] = None,
+        analytics_cache: Optional[GraphAnalyticsCache] = None
     ):
         """
         Initialize facade with ALL dependencies injected (REQUIRED, no Nones)
@@ -64,6 +71,10 @@ class KnowledgeGraphFacadeV2:
             schema_builder: Schema builder (SchemaGraphBuilderService)
             graph_query_engine: Query engine for analytics (IGraphQueryEngine impl)
             csn_parser: CSN parser (optional, creates default if None)
+            snapshot_store: Process-level schema graph snapshot (optional,
+                creates a private store if None)
+            analytics_cache: Analytics result cache + background workers
+                (optional, creates an in-memory cache if None)
         
         Raises:
             TypeError: If any required dependency is None
@@ -78,6 +89,8 @@ class KnowledgeGraphFacadeV2:
         self.schema_builder = schema_builder
         self.graph_query_service = graph_query_engine  # Implements IGraphQueryEngine
         self.csn_parser = csn_parser or CSNParser('docs/csn')
+        self.snapshot_store = snapshot_store or SchemaGraphSnapshotStore()
+        self.analytics_cache = analytics_cache or GraphAnalyticsCache()
     
     def get_schema_graph(self, use_cache: bool = True) -> Dict[str, Any]:
         """
@@ -93,6 +106,8 @@ class KnowledgeGraphFacadeV2:
             - graph: Generic graph dict (nodes, edges)
             - cache_used: bool
             - metadata: Dict with stats
+            - etag: str (content hash of the snapshot, for conditional GETs)
+            - version: int (process-local snapshot version)
         
         Example:
             result = facade.get_schema_graph()
@@ -101,21 +116,68 @@ class KnowledgeGraphFacadeV2:
                 print(f"Nodes: {result['metadata']['node_count']}")
         """
         try:
-            # Get or rebuild graph
-            if use_cache:
-                graph = self.cache_service.get_or_rebuild_schema_graph()
-                cache_used = True
-            else:
-                graph = self.cache_service.force_rebuild_schema()
-                cache_used = False
+            snapshot = self.get_schema_snapshot(use_cache=use_cache)
             
-            # Convert to generic dict format
-            stats = graph.get_statistics()
+            return {
+                'success': True,
+                'graph': snapshot.graph_dict,  # Generic format (NOT vis.js!) - shared, read-only
+                'cache_used': snapshot.cache_used,
+                'metadata': dict(snapshot.metadata),
+                'etag': snapshot.etag,
+                'version': snapshot.version
+            }
+            
+        except Exception as e:
+            return {
+                'success': False,
+                'error': str(e),
+                'error_type': type(e).__name__
+            }
+    
+    def get_schema_overview(self, property_keys: Sequence[str] = ()) -> Dict[str, Any]:
+        """
+        Get the schema graph with only selected node properties
+        
+        For overviews (vis.js landing page) that show ids, labels and a few
+        fields. Served from the current snapshot when one exists; otherwise
+        loaded from the cache with a projection, so a cold start does not
+        decode column annotations the overview never shows. The projected
+        graph does not become the snapshot.
+        
+        Args:
+            property_keys: Node property keys to include (empty = ids,
+                           labels and types only). Edges keep their properties.
+        
+        Returns:
+            Dictionary with:
+            - success: bool
+            - graph: Generic graph dict (nodes, edges)
+            - metadata: Dict with stats
+            - cache_used: bool
+            - etag: str or None (snapshot ETag when served from the snapshot)
+        """
+        try:
+            snapshot = self.snapshot_store.current
+            if snapshot is not None:
+                return {
+                    'success': True,
+                    'graph': {
+                        'nodes': self.project_node_dicts(snapshot.graph_dict['nodes'], property_keys),
+                        'edges': snapshot.graph_dict['edges']
+                    },
+                    'metadata': dict(snapshot.metadata),
+                    'cache_used': snapshot.cache_used,
+                    'etag': snapshot.etag
+                }
             
+            cache_used = self.cache_service.exists_in_cache('schema', GraphType.SCHEMA)
+            graph = self.cache_service.get_or_rebuild_schema_graph(
+                projection=GraphProjection.subset(*property_keys)
+            )
+            stats = graph.get_statistics()
             return {
                 'success': True,
-                'graph': graph.to_dict(),  # Generic format (NOT vis.js!)
-                'cache_used': cache_used,
+                'graph': graph.to_dict(),
                 'metadata': {
                     'graph_id': graph.id,
                     'graph_type': graph.type.value,
@@ -123,7 +185,9 @@ class KnowledgeGraphFacadeV2:
                     'edge_count': stats['edge_count'],
                     'nodes_by_type': stats['nodes_by_type'],
                     'edges_by_type': stats['edges_by_type']
-                }
+                },
+                'cache_used': cache_used,
+                'etag': None
             }
             
         except Exception as e:
@@ -133,6 +197,63 @@ class KnowledgeGraphFacadeV2:
                 'error_type': type(e).__name__
             }
     
+    @staticmethod
+    def project_node_dicts(
+        nodes: Iterable[Mapping[str, Any]],
+        property_keys: Sequence[str]
+    ) -> List[Dict[str, Any]]:
+        """
+        Keep id/label/type plus the given properties of generic node dicts
+        
+        Args:
+            nodes: Node dicts from Graph.to_dict() (properties are flattened)
+            property_keys: Property keys to keep
+        
+        Returns:
+            New list of projected node dicts
+        """
+        keep = {'id', 'label', 'type', *property_keys}
+        return [{key: value for key, value in node.items() if key in keep} for node in nodes]
+    
+    def get_schema_snapshot(self, use_cache: bool = True) -> SchemaGraphSnapshot:
+        """
+        Get the process-level schema graph snapshot
+        
+        With use_cache=True the current snapshot is returned as-is; the
+        persistent cache is only read when no snapshot exists yet. With
+        use_cache=False the graph is rebuilt from CSN and a new snapshot is
+        published, and the analytics engine is refreshed incrementally so
+        the next analytics request does not pay for a cold reload.
+        
+        Args:
+            use_cache: If False, force rebuild and publish a new snapshot
+        
+        Returns:
+            SchemaGraphSnapshot (pre-serialized JSON, stats, ETag)
+        
+        Raises:
+            Exception: If loading or rebuilding the graph fails
+        """
+        if not use_cache:
+            graph = self.cache_service.force_rebuild_schema()
+            snapshot = self.snapshot_store.publish(graph, cache_used=False)
+            self._refresh_query_engine()
+            self.precompute_analytics()
+            return snapshot
+        
+        return self.snapshot_store.get_or_build(
+            lambda: (self.cache_service.get_or_rebuild_schema_graph(), True)
+        )
+    
+    def _refresh_query_engine(self) -> None:
+        """Apply persisted graph changes to the analytics engine (best effort)"""
+        try:
+            result = self.graph_query_service.refresh()
+            logger.info(f"Graph query engine refreshed after rebuild: {result}")
+        except Exception as e:
+            # Analytics stay on the previous graph; a failed refresh must not fail the rebuild
+            logger.warning(f"Graph query engine refresh failed: {e}")
+    
     def get_table_columns(self, table_name: str) -> Dict[str, Any]:
         """
         Get detailed column metadata for a specific table (KGV-001)
@@ -196,9 +317,73 @@ class KnowledgeGraphFacadeV2:
     # Advanced Query Methods (HIGH-31: Phase 3)
     # ========================================================================
     
+    def find_paths(
+        self,
+        source_id: str,
+        target_id: str,
+        max_hops: int = 10,
+        edge_types: Optional[Sequence[str]] = None,
+        k: int = 1
+    ) -> Dict[str, Any]:
+        """
+        Find up to k shortest paths between two nodes
+        
+        Bounded search: the engine gives up once max_hops is exhausted, so
+        a fruitless query between distant nodes stays cheap.
+        
+        Args:
+            source_id: Start node ID
+            target_id: End node ID
+            max_hops: Maximum path length in edges
+            edge_types: Only follow edges of these types (None = any)
+            k: Number of paths
+        
+        Returns:
+            Dictionary with:
+            - success: bool
+            - data: Dict with paths, path_count, source, target, max_hops, edge_types, k
+            - error: str (if failed; 'not found' for unknown nodes)
+            - error_type: 'NotImplementedError' if the engine cannot honour edge_types / k
+        """
+        if not self.graph_query_service:
+            return {
+                'success': False,
+                'error': 'GraphQueryService not initialized'
+            }
+        
+        try:
+            for node_id in (source_id, target_id):
+                if not self.graph_query_service.node_exists(node_id):
+                    return {
+                        'success': False,
+                        'error': f'Node "{node_id}" not found in graph'
+                    }
+            
+            paths = self.graph_query_service.find_paths(
+                source_id, target_id, max_hops=max_hops, edge_types=list(edge_types) if edge_types else None, k=k
+            )
+            return {
+                'success': True,
+                'data': {
+                    'paths': [path.to_dict() for path in paths],
+                    'path_count': len(paths),
+                    'source': source_id,
+                    'target': target_id,
+                    'max_hops': max_hops,
+                    'edge_types': list(edge_types) if edge_types else None,
+                    'k': k
+                }
+            }
+        except Exception as e:
+            return {
+                'success': False,
+                'error': str(e),
+                'error_type': type(e).__name__
+            }
+    
     def get_pagerank(self, top_k: int = 10, damping_factor: float = 0.85) -> Dict[str, Any]:
         """
-        Calculate PageRank centrality scores
+        Calculate PageRank centrality scores (cached per graph version)
         
         Args:
             top_k: Number of top nodes to return
@@ -208,6 +393,8 @@ class KnowledgeGraphFacadeV2:
             Dictionary with:
             - success: bool
             - data: Dict with scores, top_k, total_nodes
+            - cache: Dict with status, source, graph_version, computed_at
+            - status: 'pending' (only while the first computation runs)
             - error: str (if failed)
         
         Example:
@@ -222,17 +409,24 @@ class KnowledgeGraphFacadeV2:
             }
         
         try:
-            scores = self.graph_query_service.get_pagerank(top_k=top_k, damping_factor=damping_factor)
+            result = self.analytics_cache.get(
+                'pagerank',
+                {'damping_factor': damping_factor},
+                lambda: self._compute_pagerank(damping_factor)
+            )
+            if not result.available:
+                return self._analytics_pending(result)
             
             return {
                 'success': True,
                 'data': {
-                    'scores': scores,
+                    'scores': result.value['scores'][:top_k],
                     'top_k': top_k,
-                    'total_nodes': self.graph_query_service.get_node_count(),
+                    'total_nodes': result.value['total_nodes'],
                     'algorithm': 'PageRank',
                     'damping_factor': damping_factor
-                }
+                },
+                'cache': result.to_cache_info()
             }
         except Exception as e:
             return {
@@ -244,19 +438,27 @@ class KnowledgeGraphFacadeV2:
     def get_centrality(
         self,
         metric: str = 'betweenness',
-        top_k: int = 10
+        top_k: int = 10,
+        sample_size: Optional[int] = None,
+        epsilon: Optional[float] = None,
+        seed: Optional[int] = None
     ) -> Dict[str, Any]:
         """
-        Calculate centrality metrics
+        Calculate centrality metrics (cached per graph version)
         
         Args:
             metric: Centrality type ('betweenness', 'degree')
             top_k: Number of top nodes to return
+            sample_size: Betweenness pivot count (approximate mode)
+            epsilon: Betweenness target error (approximate mode)
+            seed: Random seed for reproducible pivot selection
         
         Returns:
             Dictionary with:
             - success: bool
-            - data: Dict with metric, scores, top_k
+            - data: Dict with metric, scores, top_k, sampling
+            - cache: Dict with status, source, graph_version, computed_at
+            - status: 'pending' (only while the first computation runs)
             - error: str (if failed)
         
         Example:
@@ -270,25 +472,35 @@ class KnowledgeGraphFacadeV2:
                 'error': 'GraphQueryService not initialized'
             }
         
+        if metric not in self.CENTRALITY_METRICS:
+            return {
+                'success': False,
+                'error': f'Centrality metric "{metric}" not supported. Supported: betweenness, degree'
+            }
+        
+        sampling = None
+        if metric == 'betweenness' and (sample_size is not None or epsilon is not None):
+            sampling = {'sample_size': sample_size, 'epsilon': epsilon, 'seed': seed}
+        
         try:
-            # Delegate to engine based on metric type
-            if metric == 'betweenness':
-                scores = self.graph_query_service.get_betweenness_centrality(top_k=top_k)
-            elif metric == 'degree':
-                scores = self.graph_query_service.get_degree_centrality(top_k=top_k)
-            else:
-                return {
-                    'success': False,
-                    'error': f'Centrality metric "{metric}" not supported. Supported: betweenness, degree'
-                }
+            result = self.analytics_cache.get(
+                f'{metric}_centrality',
+                sampling or {},
+                lambda: self._compute_centrality(metric, sampling)
+            )
+            if not result.available:
+                return self._analytics_pending(result)
             
             return {
                 'success': True,
                 'data': {
                     'metric': metric,
-                    'scores': scores,
-                    'top_k': top_k
-                }
+                    'scores': result.value[:top_k],
+                    'top_k': top_k,
+                    'approximate': sampling is not None,
+                    'sampling': sampling
+                },
+                'cache': result.to_cache_info()
             }
         except Exception as e:
             return {
@@ -312,14 +524,27 @@ class KnowledgeGraphFacadeV2:
             'error': 'Community detection not yet implemented'
         }
     
-    def find_cycles(self) -> Dict[str, Any]:
+    def find_cycles(
+        self,
+        max_length: Optional[int] = None,
+        max_cycles: Optional[int] = None
+    ) -> Dict[str, Any]:
         """
-        Find all cycles in graph
+        Find cycles in graph (cached per graph version)
+        
+        Simple cycles can be exponential in number, so enumeration is
+        bounded by cycle length and count.
+        
+        Args:
+            max_length: Only cycles with at most this many nodes (None = any)
+            max_cycles: Stop after this many cycles (default: DEFAULT_MAX_CYCLES)
         
         Returns:
             Dictionary with:
             - success: bool
-            - data: Dict with cycles, cycle_count
+            - data: Dict with cycles, cycle_count, truncated, max_length, max_cycles
+            - cache: Dict with status, source, graph_version, computed_at
+            - status: 'pending' (only while the first computation runs)
             - error: str (if failed)
         """
         if not self.graph_query_service:
@@ -328,15 +553,28 @@ class KnowledgeGraphFacadeV2:
                 'error': 'GraphQueryService not initialized'
             }
         
+        if max_cycles is None:
+            max_cycles = self.DEFAULT_MAX_CYCLES
+        bounds = {'max_length': max_length, 'max_cycles': max_cycles}
+        
         try:
-            cycles = self.graph_query_service.find_cycles()
+            result = self.analytics_cache.get(
+                'cycles',
+                bounds,
+                lambda: self._compute_cycles(max_length, max_cycles)
+            )
+            if not result.available:
+                return self._analytics_pending(result)
             
             return {
                 'success': True,
                 'data': {
-                    'cycles': cycles,
-                    'cycle_count': len(cycles)
-                }
+                    'cycles': result.value['cycles'],
+                    'cycle_count': len(result.value['cycles']),
+                    'truncated': result.value['truncated'],
+                    **bounds
+                },
+                'cache': result.to_cache_info()
             }
         except Exception as e:
             return {
@@ -347,12 +585,14 @@ class KnowledgeGraphFacadeV2:
     
     def get_connected_components(self) -> Dict[str, Any]:
         """
-        Find connected components in graph
+        Find connected components in graph (cached per graph version)
         
         Returns:
             Dictionary with:
             - success: bool
             - data: Dict with components, component_count
+            - cache: Dict with status, source, graph_version, computed_at
+            - status: 'pending' (only while the first computation runs)
             - error: str (if failed)
         """
         if not self.graph_query_service:
@@ -362,17 +602,17 @@ class KnowledgeGraphFacadeV2:
             }
         
         try:
-            components_sets = self.graph_query_service.get_connected_components()
-            
-            # Convert sets to lists for JSON serialization
-            components = [list(comp) for comp in components_sets]
+            result = self.analytics_cache.get('components', {}, self._compute_components)
+            if not result.available:
+                return self._analytics_pending(result)
             
             return {
                 'success': True,
                 'data': {
-                    'components': components,
-                    'component_count': len(components)
-                }
+                    'components': result.value,
+                    'component_count': len(result.value)
+                },
+                'cache': result.to_cache_info()
             }
         except Exception as e:
             return {
@@ -381,6 +621,75 @@ class KnowledgeGraphFacadeV2:
                 'error_type': type(e).__name__
             }
     
+    def precompute_analytics(self) -> int:
+        """
+        Schedule background computation of the default analytics
+        
+        Called after a schema rebuild so the first analytics requests hit
+        the cache. Never blocks.
+        
+        Returns:
+            Number of computations scheduled
+        """
+        try:
+            self.analytics_cache.invalidate()
+            return self.analytics_cache.precompute([
+                ('pagerank', {'damping_factor': 0.85}, lambda: self._compute_pagerank(0.85)),
+                ('betweenness_centrality', {}, lambda: self._compute_centrality('betweenness')),
+                ('degree_centrality', {}, lambda: self._compute_centrality('degree')),
+                ('components', {}, self._compute_components),
+                (
+                    'cycles',
+                    {'max_length': None, 'max_cycles': self.DEFAULT_MAX_CYCLES},
+                    lambda: self._compute_cycles(None, self.DEFAULT_MAX_CYCLES)
+                )
+            ])
+        except Exception as e:
+            logger.warning(f"Scheduling analytics precomputation failed: {e}")
+            return 0
+    
+    # Analytics computations (run on the analytics cache worker pool).
+    # Full rankings are cached; requests slice top_k from them.
+    
+    CENTRALITY_METRICS = ('betweenness', 'degree')
+    DEFAULT_MAX_CYCLES = 1000
+    
+    def _compute_pagerank(self, damping_factor: float) -> Dict[str, Any]:
+        """Full PageRank ranking plus node count"""
+        return {
+            'scores': self.graph_query_service.get_pagerank(top_k=None, damping_factor=damping_factor),
+            'total_nodes': self.graph_query_service.get_node_count()
+        }
+    
+    def _compute_centrality(self, metric: str, sampling: Optional[Dict[str, Any]] = None) -> list:
+        """Full centrality ranking (betweenness sampled if sampling is set)"""
+        if metric == 'betweenness':
+            return self.graph_query_service.get_betweenness_centrality(top_k=None, **(sampling or {}))
+        return self.graph_query_service.get_degree_centrality(top_k=None)
+    
+    def _compute_components(self) -> list:
+        """Connected components as lists (JSON-serializable)"""
+        return [list(comp) for comp in self.graph_query_service.get_connected_components()]
+    
+    def _compute_cycles(self, max_length: Optional[int], max_cycles: int) -> Dict[str, Any]:
+        """Bounded simple cycles (one extra cycle is read to detect truncation)"""
+        cycles = self.graph_query_service.find_cycles(max_length=max_length, max_cycles=max_cycles + 1)
+        return {
+            'cycles': cycles[:max_cycles],
+            'truncated': len(cycles) > max_cycles
+        }
+    
+    @staticmethod
+    def _analytics_pending(result: AnalyticsResult) -> Dict[str, Any]:
+        """Response while the first computation for a graph version is running"""
+        return {
+            'success': True,
+            'status': 'pending',
+            'data': None,
+            'cache': result.to_cache_info(),
+            'message': 'Computation in progress - retry shortly'
+        }
+    
     def get_graph_statistics(self) -> Dict[str, Any]:
         """
         Get comprehensive graph statistics
@@ -440,6 +749,7 @@ class KnowledgeGraphFacadeV2:
             - cached: bool (is schema cached?)
             - csn_files_count: int
             - csn_directory: str
+            - analytics_cache: Dict (analytics cache statistics)
         
         Example:
             status = facade.get_schema_status()
@@ -450,13 +760,14 @@ class KnowledgeGraphFacadeV2:
             cached = self.cache_service.exists_in_cache('schema', GraphType.SCHEMA)
             
             # Count CSN files
-            csn_files = list(self.csn_parser.csn_dir.glob("*_CSN.json"))
+            csn_files = list(Path(self.csn_parser.csn_directory).glob("*_CSN.json"))
             
             return {
                 'success': True,
                 'cached': cached,
                 'csn_files_count': len(csn_files),
-                'csn_directory': str(self.csn_parser.csn_dir)
+                'csn_directory': str(self.csn_parser.csn_directory),
+                'analytics_cache': self.analytics_cache.get_stats()
             }
             
         except Exception as e:
@@ -482,6 +793,7 @@ class KnowledgeGraphFacadeV2:
         """
         try:
             cleared = self.cache_service.clear_cache(GraphType.SCHEMA)
+            self.snapshot_store.invalidate()
             
             return {
                 'success': True,
@@ -5,14 +5,20 @@ Provides access to graph cache repository implementations.
 """
 from .graph_cache_repository import (
     AbstractGraphCacheRepository,
+    GraphProjection,
     RepositoryError
 )
 from .in_memory_graph_cache_repository import InMemoryGraphCacheRepository
+from .columnar_graph_cache_repository import ColumnarGraphCacheRepository
 from .sqlite_graph_cache_repository import SqliteGraphCacheRepository
+from .sqlite_graph_analytics_repository import SqliteGraphAnalyticsRepository
 
 __all__ = [
     'AbstractGraphCacheRepository',
+    'GraphProjection',
     'RepositoryError',
     'InMemoryGraphCacheRepository',
-    'SqliteGraphCacheRepository'
+    'ColumnarGraphCacheRepository',
+    'SqliteGraphCacheRepository',
+    'SqliteGraphAnalyticsRepository'
 ]
\ No newline at end of file
@@ -0,0 +1,366 @@
+"""
+Columnar Graph Cache Repository
+
+Graph cache stored as memory-mappable snapshot files (one per graph
+type) instead of one SQLite row per node and edge. Strings (node keys,
+labels, types, property JSON) are interned once; nodes and edges are
+int32 columns referencing them. A load maps the file, copies the
+columns and decodes each distinct property blob once - no per-row
+cursor work and no JSON parsing for labels-only/lazy loads.
+
+Used as a derived, read-optimized copy of SqliteGraphCacheRepository:
+GraphCacheService writes a snapshot after every SQLite save, tagged with
+the SQLite version of the graph, and only serves it while that version
+is current. SQLite stays the source of truth.
+
+@author P2P Development Team
+@version 1.0.0
+@pattern Repository
+"""
+import json
+import logging
+import os
+from array import array
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Mapping, Optional
+
+from core.services import graph_snapshot_file as snapshot_format
+from core.services.graph_snapshot_file import (
+    SnapshotFormatError,
+    SnapshotReader,
+    StringInterner,
+    read_snapshot_metadata,
+    snapshot_path,
+    write_snapshot
+)
+
+from .graph_cache_repository import AbstractGraphCacheRepository, GraphProjection, RepositoryError
+from ..domain import Graph, GraphNode, GraphEdge, GraphType, NodeType, EdgeType, LazyProperties
+
+logger = logging.getLogger(__name__)
+
+# Compact encoder (properties are plain, acyclic dicts)
+_encode_properties = json.JSONEncoder(separators=(',', ':'), check_circular=False).encode
+
+_NO_VALUE = snapshot_format.NO_VALUE
+_NON_STRING_VALUE = snapshot_format.NON_STRING_VALUE
+
+
+class ColumnarGraphCacheRepository(AbstractGraphCacheRepository):
+    """
+    Graph cache repository backed by columnar snapshot files
+
+    Files: <snapshot_dir>/<graph_type>.kgsnap (see core.services.graph_snapshot_file)
+
+    Projections:
+    - labels only: property columns are not read
+    - property subset: each node blob is decoded, then projected
+    - lazy: LazyProperties over the interned text; entity_type/product
+      come from their own columns, so Graph indexes need no decoding
+    - full: edge property blobs shared by several edges are decoded once
+
+    Example:
+        repo = ColumnarGraphCacheRepository('database/graph_snapshots')
+        repo.save(graph, source_version='42')
+        repo.get_source_version('schema', GraphType.SCHEMA)   # '42'
+        graph = repo.get('schema', GraphType.SCHEMA)
+    """
+
+    def __init__(self, snapshot_dir: str):
+        """
+        Initialize repository
+
+        Args:
+            snapshot_dir: Directory for snapshot files (created on first save)
+        """
+        self.snapshot_dir = str(snapshot_dir)
+        logger.info(f"ColumnarGraphCacheRepository initialized ({self.snapshot_dir})")
+
+    def save(self, graph: Graph, source_version: Optional[str] = None) -> None:
+        """
+        Write graph as snapshot file (replaces the snapshot of its type)
+
+        Args:
+            graph: Graph to save
+            source_version: Version of the graph in the primary cache
+                            (stored in the header, see get_source_version)
+
+        Raises:
+            RepositoryError: If the file cannot be written
+        """
+        strings = StringInterner()
+        intern = strings.intern
+        columns = {name: array(snapshot_format.COLUMN_TYPECODE) for name in (
+            snapshot_format.NODE_ID, snapshot_format.NODE_LABEL, snapshot_format.NODE_TYPE,
+            snapshot_format.NODE_PROPERTIES, snapshot_format.NODE_ENTITY_TYPE, snapshot_format.NODE_PRODUCT,
+            snapshot_format.EDGE_SOURCE, snapshot_format.EDGE_TARGET, snapshot_format.EDGE_TYPE,
+            snapshot_format.EDGE_LABEL, snapshot_format.EDGE_PROPERTIES
+        )}
+
+        try:
+            positions: Dict[str, int] = {}
+            for node in graph.nodes:
+                positions[node.id] = len(positions)
+                properties = node.properties
+                columns[snapshot_format.NODE_ID].append(intern(node.id))
+                columns[snapshot_format.NODE_LABEL].append(intern(node.label))
+                columns[snapshot_format.NODE_TYPE].append(intern(node.type.value))
+                columns[snapshot_format.NODE_PROPERTIES].append(
+                    intern(_encode_properties(dict(properties))) if properties else _NO_VALUE
+                )
+                columns[snapshot_format.NODE_ENTITY_TYPE].append(self._string_value(properties, 'entity_type', intern))
+                columns[snapshot_format.NODE_PRODUCT].append(self._string_value(properties, 'product', intern))
+
+            for edge in graph.edges:
+                columns[snapshot_format.EDGE_SOURCE].append(positions[edge.source_id])
+                columns[snapshot_format.EDGE_TARGET].append(positions[edge.target_id])
+                columns[snapshot_format.EDGE_TYPE].append(intern(edge.type.value))
+                columns[snapshot_format.EDGE_LABEL].append(_NO_VALUE if edge.label is None else intern(edge.label))
+                columns[snapshot_format.EDGE_PROPERTIES].append(
+                    intern(_encode_properties(dict(edge.properties))) if edge.properties else _NO_VALUE
+                )
+
+            size = write_snapshot(
+                self._path(graph.type),
+                {
+                    'graph_id': graph.id,
+                    'graph_type': graph.type.value,
+                    'node_count': len(positions),
+                    'edge_count': len(columns[snapshot_format.EDGE_SOURCE]),
+                    'source_version': source_version,
+                    'created_at': datetime.now().isoformat()
+                },
+                strings.strings,
+                columns
+            )
+            logger.info(
+                f"Saved graph snapshot '{graph.id}' ({graph.type.value}): {len(graph.nodes)} nodes, "
+                f"{len(graph.edges)} edges, {len(strings)} strings, {size / 1024:.0f} KB"
+            )
+        except Exception as e:
+            logger.error(f"Error saving graph snapshot: {e}")
+            raise RepositoryError(f"Failed to save graph snapshot: {e}")
+
+    def get(
+        self,
+        graph_id: str,
+        graph_type: GraphType,
+        projection: Optional[GraphProjection] = None
+    ) -> Optional[Graph]:
+        """
+        Load graph from its snapshot file
+
+        Args:
+            graph_id: Identifier of graph (used as id of the returned graph)
+            graph_type: Type of graph
+            projection: Properties to materialize (None = everything, eagerly)
+
+        Returns:
+            Graph if a valid snapshot exists, None otherwise
+        """
+        projection = projection or GraphProjection()
+        path = self._path(graph_type)
+        if not os.path.exists(path):
+            return None
+
+        try:
+            with SnapshotReader(path) as snapshot:
+                strings = snapshot.strings()
+                node_ids = snapshot.column(snapshot_format.NODE_ID).tolist()
+                node_labels = snapshot.column(snapshot_format.NODE_LABEL).tolist()
+                node_types = snapshot.column(snapshot_format.NODE_TYPE).tolist()
+                load_node_properties = projection.property_keys != ()
+                if load_node_properties:
+                    node_properties = snapshot.column(snapshot_format.NODE_PROPERTIES).tolist()
+                    entity_types = snapshot.column(snapshot_format.NODE_ENTITY_TYPE).tolist()
+                    products = snapshot.column(snapshot_format.NODE_PRODUCT).tolist()
+                sources = snapshot.column(snapshot_format.EDGE_SOURCE).tolist()
+                targets = snapshot.column(snapshot_format.EDGE_TARGET).tolist()
+                edge_types = snapshot.column(snapshot_format.EDGE_TYPE).tolist()
+                edge_labels = snapshot.column(snapshot_format.EDGE_LABEL).tolist()
+                if projection.edge_properties:
+                    edge_properties = snapshot.column(snapshot_format.EDGE_PROPERTIES).tolist()
+
+            node_type_map = {node_type.value: node_type for node_type in NodeType}
+            edge_type_map = {edge_type.value: edge_type for edge_type in EdgeType}
+            graph = Graph(graph_id, graph_type)
+
+            # Nodes
+            if not load_node_properties:
+                for id_index, label_index, type_index in zip(node_ids, node_labels, node_types):
+                    graph.add_node(GraphNode(
+                        strings[id_index], strings[label_index], node_type_map[strings[type_index]], {}
+                    ))
+            else:
+                read_properties = self._node_properties_reader(projection, strings)
+                for id_index, label_index, type_index, properties_index, entity_type_index, product_index in zip(
+                    node_ids, node_labels, node_types, node_properties, entity_types, products
+                ):
+                    graph.add_node(GraphNode(
+                        strings[id_index],
+                        strings[label_index],
+                        node_type_map[strings[type_index]],
+                        read_properties(properties_index, entity_type_index, product_index)
+                    ))
+
+            # Edges (endpoints are node positions)
+            keys = [strings[i] for i in node_ids]
+            read_edge_properties = (
+                self._properties_decoder(strings, projection.lazy)
+                if projection.edge_properties else (lambda index: {})
+            )
+            if not projection.edge_properties:
+                edge_properties = [_NO_VALUE] * len(sources)
+            for source, target, type_index, label_index, properties_index in zip(
+                sources, targets, edge_types, edge_labels, edge_properties
+            ):
+                graph.add_edge(GraphEdge(
+                    keys[source],
+                    keys[target],
+                    edge_type_map[strings[type_index]],
+                    None if label_index == _NO_VALUE else strings[label_index],
+                    read_edge_properties(properties_index)
+                ))
+
+            logger.info(
+                f"Loaded graph snapshot '{graph_type.value}': {len(graph.nodes)} nodes, {len(graph.edges)} edges"
+            )
+            return graph
+
+        except (SnapshotFormatError, KeyError, IndexError, ValueError) as e:
+            logger.error(f"Error loading graph snapshot {path}: {e}")
+            return None
+
+    def get_source_version(self, graph_id: str, graph_type: GraphType) -> Optional[str]:
+        """
+        Primary-cache version the snapshot was written from (header only)
+
+        Args:
+            graph_id: Identifier of graph (not used: one snapshot per type)
+            graph_type: Type of graph
+
+        Returns:
+            Version passed to save(), None if unknown or no snapshot exists
+        """
+        metadata = read_snapshot_metadata(self._path(graph_type))
+        return metadata.get('source_version') if metadata else None
+
+    def exists(self, graph_id: str, graph_type: GraphType) -> bool:
+        """
+        Check if a valid snapshot exists
+
+        Args:
+            graph_id: Identifier of graph (not used: one snapshot per type)
+            graph_type: Type of graph
+
+        Returns:
+            True if cached, False otherwise
+        """
+        return read_snapshot_metadata(self._path(graph_type)) is not None
+
+    def delete(self, graph_id: str, graph_type: GraphType) -> bool:
+        """
+        Delete snapshot file
+
+        Args:
+            graph_id: Identifier of graph (not used: one snapshot per type)
+            graph_type: Type of graph
+
+        Returns:
+            True if deleted, False if not found
+
+        Raises:
+            RepositoryError: If the file exists but cannot be removed
+        """
+        path = self._path(graph_type)
+        try:
+            os.remove(path)
+            logger.info(f"Deleted {graph_type.value} graph snapshot")
+            return True
+        except FileNotFoundError:
+            return False
+        except OSError as e:
+            logger.error(f"Error deleting graph snapshot: {e}")
+            raise RepositoryError(f"Failed to delete graph snapshot: {e}")
+
+    def clear_all(self) -> int:
+        """
+        Delete all snapshot files
+
+        Returns:
+            Number of snapshots deleted
+        """
+        return sum(1 for graph_type in GraphType if self.delete(graph_type.value, graph_type))
+
+    def _path(self, graph_type: GraphType) -> str:
+        """Snapshot file of a graph type"""
+        return snapshot_path(self.snapshot_dir, graph_type.value)
+
+    def _node_properties_reader(
+        self,
+        projection: GraphProjection,
+        strings: List[str]
+    ) -> Callable[[int, int, int], Mapping[str, Any]]:
+        """
+        Reader (properties, entity_type, product indexes) -> node properties
+
+        Args:
+            projection: Requested projection (property_keys is not ())
+            strings: Decoded string table
+
+        Returns:
+            Reader function
+        """
+        if projection.lazy and projection.property_keys is None:
+            def read_lazy(properties_index, entity_type_index, product_index):
+                if properties_index == _NO_VALUE:
+                    return {}
+                preloaded = {}
+                for key, index in (('entity_type', entity_type_index), ('product', product_index)):
+                    if index != _NON_STRING_VALUE:
+                        preloaded[key] = None if index == _NO_VALUE else strings[index]
+                return LazyProperties(strings[properties_index], preloaded)
+            return read_lazy
+
+        def read_decoded(properties_index, entity_type_index, product_index):
+            if properties_index == _NO_VALUE:
+                return {}
+            return projection.project_properties(json.loads(strings[properties_index]))
+        return read_decoded
+
+    @staticmethod
+    def _properties_decoder(strings: List[str], lazy: bool) -> Callable[[int], Mapping[str, Any]]:
+        """
+        Decoder for interned property blobs (edges)
+
+        Flat blobs (no nested containers) are decoded once and copied for
+        every further use; nested ones are decoded per use so no two
+        edges share mutable values.
+        """
+        if lazy:
+            return lambda index: {} if index == _NO_VALUE else LazyProperties(strings[index])
+
+        flat: Dict[int, Dict[str, Any]] = {}
+
+        def decode(index):
+            if index == _NO_VALUE:
+                return {}
+            properties = flat.get(index)
+            if properties is not None:
+                return dict(properties)
+            properties = json.loads(strings[index])
+            if not any(isinstance(value, (dict, list)) for value in properties.values()):
+                flat[index] = properties
+                return dict(properties)
+            return properties
+        return decode
+
+    @staticmethod
+    def _string_value(properties: Mapping[str, Any], key: str, intern: Callable[[str], int]) -> int:
+        """Column value for an indexed string property"""
+        value = properties.get(key) if properties else None
+        if value is None:
+            return _NO_VALUE
+        if isinstance(value, str):
+            return intern(value)
+        return _NON_STRING_VALUE
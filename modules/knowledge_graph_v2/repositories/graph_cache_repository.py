@@ -5,8 +5,82 @@ Abstract base class for graph caching implementations.
 Follows Repository Pattern (Cosmic Python Ch 2).
 """
 from abc import ABC, abstractmethod
-from typing import Optional
-from ..domain import Graph, GraphType
+from dataclasses import dataclass
+from typing import Any, Mapping, Optional, Tuple
+from ..domain import Graph, GraphEdge, GraphNode, GraphType
+
+
+@dataclass(frozen=True)
+class GraphProjection:
+    """
+    What get() materializes per node and edge
+    
+    Attributes:
+        property_keys: Node property keys to load (None = all, () = none)
+        edge_properties: Whether edge properties are loaded
+        lazy: With all properties: decode each properties blob on first
+              access instead of while loading
+    
+    Example:
+        repo.get('schema', GraphType.SCHEMA, GraphProjection.labels_only())
+        repo.get('schema', GraphType.SCHEMA, GraphProjection.subset('entity_label'))
+        repo.get('schema', GraphType.SCHEMA, GraphProjection.lazy_properties())
+    """
+    property_keys: Optional[Tuple[str, ...]] = None
+    edge_properties: bool = True
+    lazy: bool = False
+    
+    @classmethod
+    def labels_only(cls) -> 'GraphProjection':
+        """Ids, labels, types and edges - no properties"""
+        return cls(property_keys=(), edge_properties=False)
+    
+    @classmethod
+    def subset(cls, *keys: str, edge_properties: bool = True) -> 'GraphProjection':
+        """Only the given node property keys"""
+        return cls(property_keys=tuple(keys), edge_properties=edge_properties)
+    
+    @classmethod
+    def lazy_properties(cls) -> 'GraphProjection':
+        """All properties, decoded on first access"""
+        return cls(lazy=True)
+    
+    @property
+    def is_full(self) -> bool:
+        """True if nothing is left out"""
+        return self.property_keys is None and self.edge_properties
+    
+    def project_properties(self, properties: Mapping[str, Any]) -> Mapping[str, Any]:
+        """Apply property_keys to already loaded node properties"""
+        if self.property_keys is None:
+            return properties
+        return {key: properties[key] for key in self.property_keys if key in properties}
+    
+    def project(self, graph: Graph) -> Graph:
+        """
+        Apply the projection to an in-memory graph
+        
+        Args:
+            graph: Fully loaded graph (not modified)
+        
+        Returns:
+            graph itself for full projections, otherwise a projected copy
+        """
+        if self.is_full:
+            return graph
+        
+        projected = Graph(graph.id, graph.type)
+        for node in graph.nodes:
+            projected.add_node(GraphNode(node.id, node.label, node.type, self.project_properties(node.properties)))
+        for edge in graph.edges:
+            projected.add_edge(GraphEdge(
+                edge.source_id,
+                edge.target_id,
+                edge.type,
+                edge.label,
+                edge.properties if self.edge_properties else {}
+            ))
+        return projected
 
 
 class AbstractGraphCacheRepository(ABC):
@@ -18,26 +92,36 @@ class AbstractGraphCacheRepository(ABC):
     """
     
     @abstractmethod
-    def save(self, graph: Graph) -> None:
+    def save(self, graph: Graph) -> Optional[str]:
         """
         Save graph to cache
         
         Args:
             graph: Graph to save
             
+        Returns:
+            Version of the saved graph (as get_version reports it),
+            None if versions are not supported
+            
         Raises:
             RepositoryError: If save fails
         """
         pass
     
     @abstractmethod
-    def get(self, graph_id: str, graph_type: GraphType) -> Optional[Graph]:
+    def get(
+        self,
+        graph_id: str,
+        graph_type: GraphType,
+        projection: Optional[GraphProjection] = None
+    ) -> Optional[Graph]:
         """
         Retrieve graph from cache
         
         Args:
             graph_id: Identifier of graph (e.g., schema name, product name)
             graph_type: Type of graph (SCHEMA, DATA, CSN)
+            projection: Properties to materialize (None = everything)
             
         Returns:
             Graph if found, None otherwise
@@ -81,6 +165,22 @@ class AbstractGraphCacheRepository(ABC):
             Number of graphs deleted
         """
         pass
+    
+    def get_version(self, graph_id: str, graph_type: GraphType) -> Optional[str]:
+        """
+        Version of the cached graph (changes on every save)
+        
+        Lets derived caches (e.g. columnar snapshots) detect that they are
+        stale without loading the graph.
+        
+        Args:
+            graph_id: Identifier of graph
+            graph_type: Type of graph
+            
+        Returns:
+            Version string, None if not cached or not supported
+        """
+        return None
 
 
 class RepositoryError(Exception):
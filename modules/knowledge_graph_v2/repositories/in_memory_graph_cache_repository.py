@@ -5,7 +5,7 @@ Fake implementation for testing (no database required).
 Follows Repository Pattern - enables fast unit tests.
 """
 from typing import Dict, Tuple, Optional
-from .graph_cache_repository import AbstractGraphCacheRepository, RepositoryError
+from .graph_cache_repository import AbstractGraphCacheRepository, GraphProjection, RepositoryError
 from ..domain import Graph, GraphType
 
 
@@ -37,19 +37,28 @@ class InMemoryGraphCacheRepository(AbstractGraphCacheRepository):
         except Exception as e:
             raise RepositoryError(f"Failed to save graph: {e}")
     
-    def get(self, graph_id: str, graph_type: GraphType) -> Optional[Graph]:
+    def get(
+        self,
+        graph_id: str,
+        graph_type: GraphType,
+        projection: Optional[GraphProjection] = None
+    ) -> Optional[Graph]:
         """
         Retrieve graph from memory
         
         Args:
             graph_id: Identifier of graph
             graph_type: Type of graph
+            projection: Properties to keep (None = everything)
             
         Returns:
             Graph if found, None otherwise
         """
         key = self._make_key(graph_id, graph_type)
-        return self._storage.get(key)
+        graph = self._storage.get(key)
+        if graph is None or projection is None:
+            return graph
+        return projection.project(graph)
     
     def exists(self, graph_id: str, graph_type: GraphType) -> bool:
         """
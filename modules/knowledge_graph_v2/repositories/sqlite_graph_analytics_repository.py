@@ -0,0 +1,148 @@
+"""
+SQLite Graph Analytics Repository
+
+Persists computed graph analytics (PageRank, centrality, components,
+cycles) in the graph database, tagged with the graph version they were
+computed for. Lets a restarted server serve results without recomputing.
+
+@version 1.0.0 (Feb 2026)
+@pattern Repository + Unit of Work + Factory
+"""
+import json
+import logging
+from typing import Any, Dict, Optional
+
+from .graph_cache_repository import RepositoryError
+
+logger = logging.getLogger(__name__)
+
+
+class SqliteGraphAnalyticsRepository:
+    """
+    SQLite store for analytics results
+
+    Schema:
+    - graph_analytics_results: one row per (metric, params_key), replaced
+      whenever the metric is recomputed; graph_version records which graph
+      the result belongs to (callers compare it with the current version)
+    """
+
+    def __init__(self, connection_factory, unit_of_work):
+        """
+        Initialize with injected dependencies (DI compliant)
+
+        Args:
+            connection_factory: Factory for creating database connections
+                               (IDatabaseConnectionFactory compatible)
+            unit_of_work: Unit of work for transaction management
+                         (IUnitOfWork compatible)
+        """
+        self.connection_factory = connection_factory
+        self.unit_of_work = unit_of_work
+        self._ensure_schema()
+
+    def _ensure_schema(self) -> None:
+        """Create analytics table if it doesn't exist"""
+        try:
+            with self.unit_of_work.transaction() as conn:
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS graph_analytics_results (
+                        metric TEXT NOT NULL,
+                        params_key TEXT NOT NULL,
+                        graph_version TEXT NOT NULL,
+                        result_json TEXT NOT NULL,
+                        duration_ms REAL,
+                        computed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                        PRIMARY KEY (metric, params_key)
+                    )
+                """)
+        except Exception as e:
+            logger.error(f"Error initializing analytics schema: {e}")
+            raise RepositoryError(f"Failed to initialize analytics schema: {e}")
+
+    def get(self, metric: str, params_key: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the persisted result for a metric
+
+        Args:
+            metric: Metric name (e.g., 'pagerank')
+            params_key: Canonical JSON of the metric parameters
+
+        Returns:
+            Dict with graph_version, value, duration_ms, computed_at
+            (None if not persisted or unreadable)
+        """
+        try:
+            with self.unit_of_work.readonly_query() as conn:
+                row = conn.execute("""
+                    SELECT graph_version, result_json, duration_ms, computed_at
+                    FROM graph_analytics_results
+                    WHERE metric = ? AND params_key = ?
+                """, (metric, params_key)).fetchone()
+        except Exception as e:
+            logger.warning(f"Error reading analytics result {metric} {params_key}: {e}")
+            return None
+
+        if not row:
+            return None
+
+        graph_version, result_json, duration_ms, computed_at = row
+        try:
+            value = json.loads(result_json)
+        except ValueError:
+            logger.warning(f"Corrupt analytics result {metric} {params_key} ignored")
+            return None
+
+        return {
+            'graph_version': graph_version,
+            'value': value,
+            'duration_ms': duration_ms,
+            'computed_at': computed_at
+        }
+
+    def save(
+        self,
+        metric: str,
+        params_key: str,
+        graph_version: str,
+        value: Any,
+        duration_ms: float
+    ) -> None:
+        """
+        Persist (replace) the result for a metric
+
+        Args:
+            metric: Metric name
+            params_key: Canonical JSON of the metric parameters
+            graph_version: Graph version the result was computed for
+            value: JSON-serializable result
+            duration_ms: Computation time
+
+        Raises:
+            RepositoryError: If save fails
+        """
+        try:
+            with self.unit_of_work.transaction() as conn:
+                conn.execute("""
+                    INSERT OR REPLACE INTO graph_analytics_results (
+                        metric, params_key, graph_version, result_json, duration_ms, computed_at
+                    ) VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+                """, (
+                    metric,
+                    params_key,
+                    graph_version,
+                    json.dumps(value, separators=(',', ':'), default=str),
+                    duration_ms
+                ))
+        except Exception as e:
+            raise RepositoryError(f"Failed to save analytics result {metric}: {e}")
+
+    def clear(self) -> int:
+        """
+        Delete all persisted analytics results
+
+        Returns:
+            Number of rows deleted
+        """
+        with self.unit_of_work.transaction() as conn:
+            return conn.execute("DELETE FROM graph_analytics_results").rowcount
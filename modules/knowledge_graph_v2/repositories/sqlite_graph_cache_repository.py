@@ -4,20 +4,24 @@ SQLite Graph Cache Repository
 Production implementation using SQLite for persistence.
 Uses same schema as v1 for backward compatibility.
 
-@version 2.0.0 (DI Compliant - Feb 2026)
+@version 2.3.0 (get_version for derived snapshots)
 @pattern Repository + Unit of Work + Factory
 """
 import sqlite3
 import json
 import logging
-from typing import Optional
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, Mapping, Optional, Tuple
 from datetime import datetime
 
-from .graph_cache_repository import AbstractGraphCacheRepository, RepositoryError
-from ..domain import Graph, GraphNode, GraphEdge, GraphType, NodeType, EdgeType
+from .graph_cache_repository import AbstractGraphCacheRepository, GraphProjection, RepositoryError
+from ..domain import Graph, GraphNode, GraphEdge, GraphType, NodeType, EdgeType, LazyProperties
 
 logger = logging.getLogger(__name__)
 
+# Compact encoder shared by bulk saves (properties are plain, acyclic dicts)
+_encode_properties = json.JSONEncoder(separators=(',', ':'), check_circular=False).encode
+
 
 class SqliteGraphCacheRepository(AbstractGraphCacheRepository):
     """
@@ -35,9 +39,33 @@ class SqliteGraphCacheRepository(AbstractGraphCacheRepository):
     - Uses injected connection_factory for connections
     - Uses injected unit_of_work for transactions (8 violations fixed)
     - Total: 15 DI violations resolved
+    
+    Bulk Write (v2.1.0):
+    - WAL journal + synchronous=NORMAL on the saving connection
+    - Rows streamed from generators (no per-graph row lists)
+    - Secondary indexes dropped and rebuilt once for large loads
+    - New graph written under a staging ontology_id; the graph_ontology
+      row (graph_type -> ontology_id) is flipped last, in the same
+      transaction, so readers see either the old or the new graph
     """
     
-    def __init__(self, connection_factory, unit_of_work):
+    # Secondary indexes: (name, table, columns)
+    INDEXES: Tuple[Tuple[str, str, str], ...] = (
+        ('idx_nodes_ontology', 'graph_nodes', 'ontology_id'),
+        ('idx_nodes_key', 'graph_nodes', 'ontology_id, node_key'),
+        ('idx_edges_ontology', 'graph_edges', 'ontology_id'),
+        ('idx_edges_from', 'graph_edges', 'ontology_id, from_node_key'),
+        ('idx_edges_to', 'graph_edges', 'ontology_id, to_node_key'),
+    )
+    
+    # Node property keys the Graph aggregate reads on add_node (preloaded for lazy loads)
+    INDEXED_PROPERTY_KEYS: Tuple[str, ...] = ('entity_type', 'product')
+    
+    # Rebuilding indexes scans whole tables: only worth it when the new
+    # graph has at least this many rows AND outweighs the rows of other graphs
+    DEFER_INDEX_MIN_ROWS = 5000
+    
+    def __init__(self, connection_factory, unit_of_work, bulk_write: bool = True):
         """
         Initialize with injected dependencies (DI compliant)
         
@@ -46,9 +74,13 @@ class SqliteGraphCacheRepository(AbstractGraphCacheRepository):
                                (IDatabaseConnectionFactory compatible)
             unit_of_work: Unit of work for transaction management
                          (IUnitOfWork compatible)
+            bulk_write: Use the bulk-write save path (False = plain
+                        DELETE + executemany in the default journal mode)
         """
         self.connection_factory = connection_factory
         self.unit_of_work = unit_of_work
+        self.bulk_write = bulk_write
+        self._json1: Optional[bool] = None
         logger.info("SqliteGraphCacheRepository initialized (DI v2.0)")
         self._ensure_schema()
     
@@ -104,11 +136,7 @@ class SqliteGraphCacheRepository(AbstractGraphCacheRepository):
                 """)
                 
                 # Indexes for performance
-                cursor.execute("CREATE INDEX IF NOT EXISTS idx_nodes_ontology ON graph_nodes(ontology_id)")
-                cursor.execute("CREATE INDEX IF NOT EXISTS idx_nodes_key ON graph_nodes(ontology_id, node_key)")
-                cursor.execute("CREATE INDEX IF NOT EXISTS idx_edges_ontology ON graph_edges(ontology_id)")
-                cursor.execute("CREATE INDEX IF NOT EXISTS idx_edges_from ON graph_edges(ontology_id, from_node_key)")
-                cursor.execute("CREATE INDEX IF NOT EXISTS idx_edges_to ON graph_edges(ontology_id, to_node_key)")
+                self._create_indexes(cursor)
                 
                 # Transaction auto-commits on exit (Unit of Work pattern)
                 logger.info("Cache schema initialized successfully")
@@ -118,13 +146,117 @@ class SqliteGraphCacheRepository(AbstractGraphCacheRepository):
             logger.error(f"Error initializing cache schema: {e}")
             raise RepositoryError(f"Failed to initialize schema: {e}")
     
-    def save(self, graph: Graph) -> None:
+    def save(self, graph: Graph) -> str:
+        """
+        Save graph to SQLite cache (replaces the cached graph of its type)
+        
+        Args:
+            graph: Graph to save
+            
+        Returns:
+            ontology_id written, as string (see get_version)
+            
+        Raises:
+            RepositoryError: If save fails
+        """
+        if self.bulk_write:
+            ontology_id = self._save_bulk(graph)
+        else:
+            ontology_id = self._save_standard(graph)
+        return str(ontology_id)
+    
+    def _save_bulk(self, graph: Graph) -> int:
+        """
+        Bulk-write save: staging ontology_id + pointer flip in one transaction
+        
+        Args:
+            graph: Graph to save
+            
+        Returns:
+            ontology_id of the saved graph
+            
+        Raises:
+            RepositoryError: If save fails
+        """
+        try:
+            with self.unit_of_work.transaction() as conn:
+                # Connection settings must be applied outside a transaction
+                self._enable_wal(conn)
+                conn.execute("PRAGMA synchronous = NORMAL")
+                # Rows reference the staging ontology_id before its
+                # graph_ontology row exists (inserted by the flip below)
+                conn.execute("PRAGMA foreign_keys = OFF")
+                conn.execute("BEGIN IMMEDIATE")
+                cursor = conn.cursor()
+                
+                # 1. Allocate staging ontology_id (never reused: AUTOINCREMENT)
+                cursor.execute("SELECT seq FROM sqlite_sequence WHERE name = 'graph_ontology'")
+                row = cursor.fetchone()
+                cursor.execute("SELECT COALESCE(MAX(ontology_id), 0) FROM graph_ontology")
+                staging_id = max(row[0] if row else 0, cursor.fetchone()[0]) + 1
+                
+                cursor.execute("SELECT ontology_id FROM graph_ontology WHERE graph_type = ?", (graph.type.value,))
+                old_ids = [old_id for (old_id,) in cursor.fetchall()]
+                
+                # 2. Defer index maintenance for loads that dominate the tables
+                cursor.execute("SELECT COUNT(*) FROM graph_edges")
+                other_rows = cursor.fetchone()[0]
+                new_rows = len(graph.nodes) + len(graph.edges)
+                defer_indexes = new_rows >= max(self.DEFER_INDEX_MIN_ROWS, other_rows)
+                if defer_indexes:
+                    for name, _, _ in self.INDEXES:
+                        cursor.execute(f"DROP INDEX IF EXISTS {name}")
+                
+                # 3. Stream rows under the staging ontology_id
+                cursor.executemany("""
+                    INSERT INTO graph_nodes (
+                        ontology_id, node_key, node_label, node_type, properties_json
+                    ) VALUES (?, ?, ?, ?, ?)
+                """, self._node_rows(graph, staging_id))
+                
+                cursor.executemany("""
+                    INSERT INTO graph_edges (
+                        ontology_id, from_node_key, to_node_key,
+                        edge_type, edge_label, properties_json
+                    ) VALUES (?, ?, ?, ?, ?, ?)
+                """, self._edge_rows(graph, staging_id))
+                
+                # 4. Flip: drop the old graph, point graph_type at the staging id
+                for old_id in old_ids:
+                    cursor.execute("DELETE FROM graph_edges WHERE ontology_id = ?", (old_id,))
+                    cursor.execute("DELETE FROM graph_nodes WHERE ontology_id = ?", (old_id,))
+                    cursor.execute("DELETE FROM graph_ontology WHERE ontology_id = ?", (old_id,))
+                
+                cursor.execute("""
+                    INSERT INTO graph_ontology (ontology_id, graph_type, description, created_at, updated_at)
+                    VALUES (?, ?, ?, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
+                """, (staging_id, graph.type.value, f"{graph.type.value.capitalize()} graph"))
+                
+                if defer_indexes:
+                    self._create_indexes(cursor)
+                
+                logger.info(
+                    f"Saved graph '{graph.id}' ({graph.type.value}, bulk): "
+                    f"{len(graph.nodes)} nodes, {len(graph.edges)} edges"
+                    f"{' (indexes rebuilt)' if defer_indexes else ''}"
+                )
+                # Transaction auto-commits on exit
+            return staging_id
+                
+        except Exception as e:
+            logger.error(f"Error saving graph: {e}")
+            raise RepositoryError(f"Failed to save graph: {e}")
+    
+    def _save_standard(self, graph: Graph) -> int:
         """
-        Save graph to SQLite cache
+        Plain save: delete old ontology (CASCADE) and executemany the new rows
         
         Args:
             graph: Graph to save
             
+        Returns:
+            ontology_id of the saved graph
+            
         Raises:
             RepositoryError: If save fails
         """
@@ -187,24 +319,98 @@ class SqliteGraphCacheRepository(AbstractGraphCacheRepository):
                 
                 logger.info(f"Saved graph '{graph.id}' ({graph.type.value}): {len(graph.nodes)} nodes, {len(graph.edges)} edges")
                 # Transaction auto-commits on exit
+            return ontology_id
                 
         except Exception as e:
             logger.error(f"Error saving graph: {e}")
             raise RepositoryError(f"Failed to save graph: {e}")
     
-    def get(self, graph_id: str, graph_type: GraphType) -> Optional[Graph]:
+    @staticmethod
+    def _node_rows(graph: Graph, ontology_id: int) -> Iterator[tuple]:
+        """Node rows for executemany (generated lazily)"""
+        type_values = {node_type: node_type.value for node_type in NodeType}
+        for node in graph.nodes:
+            yield (
+                ontology_id,
+                node.id,
+                node.label,
+                type_values[node.type],
+                _encode_properties(dict(node.properties)) if node.properties else None
+            )
+    
+    @staticmethod
+    def _edge_rows(graph: Graph, ontology_id: int) -> Iterator[tuple]:
+        """Edge rows for executemany (generated lazily)"""
+        type_values = {edge_type: edge_type.value for edge_type in EdgeType}
+        for edge in graph.edges:
+            yield (
+                ontology_id,
+                edge.source_id,
+                edge.target_id,
+                type_values[edge.type],
+                edge.label,
+                _encode_properties(dict(edge.properties)) if edge.properties else None
+            )
+    
+    def _create_indexes(self, cursor: sqlite3.Cursor) -> None:
+        """Create secondary indexes (no-op for existing ones)"""
+        for name, table, columns in self.INDEXES:
+            cursor.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {table}({columns})")
+    
+    @staticmethod
+    def _enable_wal(conn: sqlite3.Connection) -> None:
+        """Switch the database file to WAL (persistent; readers keep their snapshot during saves)"""
+        try:
+            conn.execute("PRAGMA journal_mode = WAL")
+        except sqlite3.OperationalError as e:
+            # Another connection holds a lock: keep the current journal mode
+            logger.debug(f"Could not enable WAL: {e}")
+    
+    @staticmethod
+    @contextmanager
+    def _read_snapshot(conn: sqlite3.Connection) -> Iterator[None]:
+        """
+        Run several SELECTs in one read transaction
+        
+        Autocommit SELECTs each see the latest commit, so a save landing
+        between reading graph_ontology and the node/edge rows would return
+        a half-loaded graph. Inside BEGIN...COMMIT all statements read the
+        same snapshot (WAL: writers are not blocked).
+        """
+        conn.execute("BEGIN")
+        try:
+            yield
+        finally:
+            if conn.in_transaction:
+                conn.commit()
+    
+    def get(
+        self,
+        graph_id: str,
+        graph_type: GraphType,
+        projection: Optional[GraphProjection] = None
+    ) -> Optional[Graph]:
         """
         Retrieve graph from SQLite cache
         
+        Projections keep unneeded properties in the database:
+        - labels only: properties_json is not read at all
+        - property subset: values are extracted by SQLite (json_extract),
+          the rest of each blob is never decoded in Python
+        - lazy: blobs are decoded on first access (LazyProperties); the
+          keys the Graph indexes on add_node are extracted up front
+        
         Args:
             graph_id: Identifier of graph (not used in v1 schema, but kept for interface)
             graph_type: Type of graph
+            projection: Properties to materialize (None = everything, eagerly)
             
         Returns:
             Graph if found, None otherwise
         """
+        projection = projection or GraphProjection()
         try:
-            with self.unit_of_work.readonly_query() as conn:
+            with self.unit_of_work.readonly_query() as conn, self._read_snapshot(conn):
                 cursor = conn.cursor()
                 
                 # Get ontology
@@ -220,44 +426,54 @@ class SqliteGraphCacheRepository(AbstractGraphCacheRepository):
                     return None
                 
                 ontology_id = row[0]
+                use_json1 = self._supports_json1(conn)
                 
                 # Create graph (use graph_id from parameter, not graph_type)
                 graph = Graph(graph_id, graph_type)
                 
                 # Load nodes (optimized: list comprehension avoids N+1 pattern)
-                cursor.execute("""
-                    SELECT node_key, node_label, node_type, properties_json
+                columns, params, read_properties = self._node_properties_select(projection, use_json1)
+                cursor.execute(f"""
+                    SELECT node_key, node_label, node_type{columns}
                     FROM graph_nodes
                     WHERE ontology_id = ?
-                """, (ontology_id,))
+                """, params + (ontology_id,))
                 
                 nodes = [
                     GraphNode(
-                        node_key,
-                        node_label,
-                        self._parse_node_type(node_type),
-                        json.loads(properties_json) if properties_json else {}
+                        row[0],
+                        row[1],
+                        self._parse_node_type(row[2]),
+                        read_properties(row)
                     )
-                    for node_key, node_label, node_type, properties_json in cursor.fetchall()
+                    for row in cursor.fetchall()
                 ]
                 
                 for node in nodes:
                     graph.add_node(node)
                 
                 # Load edges (optimized: list comprehension avoids N+1 pattern)
-                cursor.execute("""
-                    SELECT from_node_key, to_node_key, edge_type, edge_label, properties_json
-                    FROM graph_edges
-                    WHERE ontology_id = ?
-                """, (ontology_id,))
-                
+                if projection.edge_properties:
+                    cursor.execute("""
+                        SELECT from_node_key, to_node_key, edge_type, edge_label, properties_json
+                        FROM graph_edges
+                        WHERE ontology_id = ?
+                    """, (ontology_id,))
+                else:
+                    cursor.execute("""
+                        SELECT from_node_key, to_node_key, edge_type, edge_label, NULL
+                        FROM graph_edges
+                        WHERE ontology_id = ?
+                    """, (ontology_id,))
+                
+                decode = LazyProperties if projection.lazy else json.loads
                 edges = [
                     GraphEdge(
                         from_key,
                         to_key,
                         self._parse_edge_type(edge_type),
                         edge_label,
-                        json.loads(properties_json) if properties_json else {}
+                        decode(properties_json) if properties_json else {}
                     )
                     for from_key, to_key, edge_type, edge_label, properties_json in cursor.fetchall()
                 ]
@@ -272,6 +488,89 @@ class SqliteGraphCacheRepository(AbstractGraphCacheRepository):
             logger.error(f"Error loading graph: {e}")
             return None
     
+    def _node_properties_select(
+        self,
+        projection: GraphProjection,
+        use_json1: bool
+    ) -> Tuple[str, tuple, Callable[[tuple], Mapping[str, Any]]]:
+        """
+        Extra SELECT columns for node properties and the row -> properties reader
+        
+        Args:
+            projection: Requested projection
+            use_json1: SQLite JSON functions are available
+        
+        Returns:
+            (columns SQL starting with ', ' or '', bound parameters, reader);
+            the reader gets the full row (properties columns start at index 3)
+        """
+        keys = projection.property_keys
+        
+        if keys == ():
+            return '', (), lambda row: {}
+        
+        if keys is None and not projection.lazy:
+            return ', properties_json', (), lambda row: json.loads(row[3]) if row[3] else {}
+        
+        if not use_json1 or any('"' in key for key in keys or ()):
+            # Decode in Python, then project (JSON paths cannot quote '"')
+            def read_decoded(row):
+                return projection.project_properties(json.loads(row[3])) if row[3] else {}
+            return ', properties_json', (), read_decoded
+        
+        if keys is None:
+            # Lazy: keys used by Graph.add_node are extracted by SQLite
+            paths = tuple(self._json_path(key) for key in self.INDEXED_PROPERTY_KEYS)
+            columns = ', properties_json' + ', json_extract(properties_json, ?)' * len(paths)
+            
+            def read_lazy(row):
+                if not row[3]:
+                    return {}
+                return LazyProperties(row[3], dict(zip(self.INDEXED_PROPERTY_KEYS, row[4:])))
+            return columns, paths, read_lazy
+        
+        # Subset: (json_type, json_extract) per key
+        params = tuple(
+            param for key in keys for param in (self._json_path(key), self._json_path(key))
+        )
+        columns = ', json_type(properties_json, ?), json_extract(properties_json, ?)' * len(keys)
+        
+        def read_subset(row):
+            properties = {}
+            for i, key in enumerate(keys):
+                json_type, value = row[3 + 2 * i], row[4 + 2 * i]
+                if json_type is not None:
+                    properties[key] = self._from_json_extract(json_type, value)
+            return properties
+        return columns, params, read_subset
+    
+    @staticmethod
+    def _json_path(key: str) -> str:
+        """JSON path for a top-level key (quoted: keys may contain dots)"""
+        return '$."' + key + '"'
+    
+    @staticmethod
+    def _from_json_extract(json_type: str, value: Any) -> Any:
+        """Python value from json_type()/json_extract() results"""
+        if json_type in ('object', 'array'):
+            return json.loads(value)
+        if json_type == 'true':
+            return True
+        if json_type == 'false':
+            return False
+        return value  # integer/real/text, None for 'null'
+    
+    def _supports_json1(self, conn: sqlite3.Connection) -> bool:
+        """Whether this SQLite build has the JSON functions (probed once)"""
+        if self._json1 is None:
+            try:
+                conn.execute("SELECT json_extract('{}', '$.a')")
+                self._json1 = True
+            except sqlite3.OperationalError:
+                logger.info("SQLite JSON functions unavailable - projections decode in Python")
+                self._json1 = False
+        return self._json1
+    
     def exists(self, graph_id: str, graph_type: GraphType) -> bool:
         """
         Check if graph exists in cache
@@ -292,6 +591,28 @@ class SqliteGraphCacheRepository(AbstractGraphCacheRepository):
             count = cursor.fetchone()[0]
             return count > 0
     
+    def get_version(self, graph_id: str, graph_type: GraphType) -> Optional[str]:
+        """
+        Version of the cached graph: its ontology_id
+        
+        Every save inserts a new graph_ontology row and AUTOINCREMENT ids
+        are never reused, so the id identifies one saved graph.
+        
+        Args:
+            graph_id: Identifier of graph (not used in v1 schema)
+            graph_type: Type of graph
+            
+        Returns:
+            ontology_id as string, None if not cached
+        """
+        with self.unit_of_work.readonly_query() as conn:
+            row = conn.execute("""
+                SELECT ontology_id FROM graph_ontology
+                WHERE graph_type = ?
+                ORDER BY created_at DESC LIMIT 1
+            """, (graph_type.value,)).fetchone()
+            return str(row[0]) if row else None
+    
     def delete(self, graph_id: str, graph_type: GraphType) -> bool:
         """
         Delete graph from cache
@@ -3,10 +3,17 @@ Knowledge Graph v2 Services
 
 Business logic layer with cache rebuild capability.
 """
-from .schema_graph_builder_service import SchemaGraphBuilderService
+from .schema_graph_builder_service import SchemaGraphBuilderService, SchemaGraphPartial
 from .graph_cache_service import GraphCacheService
+from .schema_graph_snapshot import SchemaGraphSnapshot, SchemaGraphSnapshotStore
+from .graph_analytics_cache import GraphAnalyticsCache, AnalyticsResult
 
 __all__ = [
     'SchemaGraphBuilderService',
+    'SchemaGraphPartial',
     'GraphCacheService',
+    'SchemaGraphSnapshot',
+    'SchemaGraphSnapshotStore',
+    'GraphAnalyticsCache',
+    'AnalyticsResult',
 ]
\ No newline at end of file
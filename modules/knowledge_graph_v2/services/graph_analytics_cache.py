@@ -0,0 +1,387 @@
+"""
+Graph Analytics Cache
+
+Caches graph analytics results (PageRank, centrality, components, cycles)
+per graph version and computes them on a background worker pool.
+
+Without it every analytics request recomputes the metric inline on the
+HTTP thread - betweenness alone is O(V*E) and takes seconds to minutes on
+data graphs.
+
+Behaviour:
+- Results are keyed by (metric, params) and tagged with the graph version
+- Lookup order: memory -> persisted (graph DB) -> background computation
+- Concurrent requests for the same metric/version share one computation
+- Requests wait a bounded time; if the result is not ready they get the
+  previous version's result (stale) or a pending status
+- precompute() schedules metrics after a rebuild so users never wait
+"""
+import json
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class AnalyticsResult:
+    """
+    Outcome of an analytics lookup
+
+    Attributes:
+        status: 'ready' (current version), 'stale' (previous version while
+            recomputing) or 'pending' (no result available yet)
+        value: Cached metric value (None when pending)
+        graph_version: Graph version the value was computed for
+        source: 'memory', 'persisted' or 'computed'
+        computed_at: ISO timestamp of the computation
+        duration_ms: Computation time
+    """
+    status: str
+    value: Any = None
+    graph_version: Any = None
+    source: Optional[str] = None
+    computed_at: Optional[str] = None
+    duration_ms: Optional[float] = None
+
+    @property
+    def available(self) -> bool:
+        """True if a value can be served (ready or stale)"""
+        return self.status != 'pending'
+
+    def to_cache_info(self) -> Dict[str, Any]:
+        """Cache metadata for API responses"""
+        return {
+            'status': self.status,
+            'source': self.source,
+            'graph_version': self.graph_version,
+            'computed_at': self.computed_at,
+            'duration_ms': self.duration_ms
+        }
+
+
+@dataclass
+class _Entry:
+    """In-memory cache entry"""
+    value: Any
+    version: Any
+    computed_at: str
+    duration_ms: Optional[float]
+
+
+class GraphAnalyticsCache:
+    """
+    Version-keyed analytics result cache with background computation
+
+    Usage:
+        cache = GraphAnalyticsCache(
+            repository=SqliteGraphAnalyticsRepository(factory, uow),
+            version_provider=networkx_engine.get_graph_version
+        )
+        result = cache.get('pagerank', {'damping_factor': 0.85}, compute_pagerank)
+        if result.available:
+            scores = result.value[:top_k]
+
+        # After a rebuild
+        cache.precompute([('pagerank', {'damping_factor': 0.85}, compute_pagerank)])
+    """
+
+    DEFAULT_WAIT_SECONDS = 10.0
+    DEFAULT_WORKERS = 1
+
+    def __init__(
+        self,
+        repository=None,
+        version_provider: Optional[Callable[[], Any]] = None,
+        max_workers: int = DEFAULT_WORKERS,
+        wait_seconds: float = DEFAULT_WAIT_SECONDS
+    ):
+        """
+        Initialize cache
+
+        Args:
+            repository: Optional persistent store (SqliteGraphAnalyticsRepository
+                compatible: get/save)
+            version_provider: Returns the current graph version (a string, so it
+                can be compared with persisted rows). Without it, results stay
+                valid until invalidate() is called and nothing is persisted.
+            max_workers: Background computation threads
+            wait_seconds: How long a request waits for a running computation
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be >= 1")
+
+        self._repository = repository
+        self._version_provider = version_provider
+        self._wait_seconds = wait_seconds
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix='kg-analytics'
+        )
+        self._max_workers = max_workers
+
+        self._entries: Dict[Tuple[str, str], _Entry] = {}
+        self._inflight: Dict[Tuple[str, str, Any], Future] = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+        self._stats = {
+            'memory_hits': 0,
+            'persisted_hits': 0,
+            'computations': 0,
+            'coalesced': 0,
+            'stale_served': 0,
+            'pending_served': 0,
+            'discarded_stale': 0,
+            'failures': 0
+        }
+
+    # ========================================================================
+    # Public API
+    # ========================================================================
+
+    def get(
+        self,
+        metric: str,
+        params: Dict[str, Any],
+        compute: Callable[[], Any],
+        wait_seconds: Optional[float] = None
+    ) -> AnalyticsResult:
+        """
+        Get a metric for the current graph version
+
+        Args:
+            metric: Metric name (e.g., 'pagerank')
+            params: Parameters that change the result (part of the key)
+            compute: Computes the full (JSON-serializable) result; runs on
+                the background pool, never on the calling thread
+            wait_seconds: Override for the bounded wait (0 = don't wait)
+
+        Returns:
+            AnalyticsResult (ready, stale or pending)
+
+        Raises:
+            Exception: If the computation failed (re-raised from the worker)
+        """
+        key = (metric, self._params_key(params))
+        version = self._current_version()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.version == version:
+                self._stats['memory_hits'] += 1
+                return self._result('ready', entry, 'memory')
+
+        persisted = self._load_persisted(key)
+        if persisted is not None:
+            if persisted.version == str(version):
+                persisted.version = version
+                with self._lock:
+                    self._entries[key] = persisted
+                    self._stats['persisted_hits'] += 1
+                return self._result('ready', persisted, 'persisted')
+            if entry is None:
+                # Older persisted result (e.g. after restart + rebuild) - serve as stale if needed
+                entry = persisted
+                with self._lock:
+                    self._entries.setdefault(key, persisted)
+
+        future = self._submit(key, version, compute)
+        wait = self._wait_seconds if wait_seconds is None else wait_seconds
+        try:
+            computed = future.result(timeout=wait)
+            return self._result('ready', computed, 'computed')
+        except FutureTimeoutError:
+            pass
+
+        with self._lock:
+            if entry is not None:
+                self._stats['stale_served'] += 1
+                return self._result('stale', entry, 'memory')
+            self._stats['pending_served'] += 1
+        return AnalyticsResult(status='pending', graph_version=version)
+
+    def precompute(self, jobs: Iterable[Tuple[str, Dict[str, Any], Callable[[], Any]]]) -> int:
+        """
+        Schedule computations for the current graph version (non-blocking)
+
+        Metrics already cached for this version are skipped; metrics
+        already being computed are coalesced.
+
+        Args:
+            jobs: (metric, params, compute) tuples
+
+        Returns:
+            Number of computations scheduled or joined
+        """
+        version = self._current_version()
+        scheduled = 0
+        for metric, params, compute in jobs:
+            key = (metric, self._params_key(params))
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None and entry.version == version:
+                    continue
+            self._submit(key, version, compute)
+            scheduled += 1
+
+        logger.info(f"Scheduled {scheduled} analytics computations for graph version {version}")
+        return scheduled
+
+    def invalidate(self) -> None:
+        """
+        Mark all results outdated
+
+        Only needed without a version provider (a provider already reports
+        a new version after rebuilds). Outdated entries are kept so they
+        can be served as stale while recomputing.
+        """
+        with self._lock:
+            self._generation += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics
+
+        Returns:
+            Dict with entry count, in-flight computations, counters and
+            per-metric versions/durations
+        """
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'inflight': len(self._inflight),
+                'workers': self._max_workers,
+                'wait_seconds': self._wait_seconds,
+                'persistent': self._repository is not None,
+                **self._stats,
+                'metrics': {
+                    f"{metric} {params_key}": {
+                        'graph_version': entry.version,
+                        'computed_at': entry.computed_at,
+                        'duration_ms': entry.duration_ms
+                    }
+                    for (metric, params_key), entry in self._entries.items()
+                }
+            }
+
+    def shutdown(self, wait: bool = False) -> None:
+        """Stop the worker pool"""
+        self._executor.shutdown(wait=wait)
+
+    # ========================================================================
+    # Internals
+    # ========================================================================
+
+    def _submit(self, key: Tuple[str, str], version: Any, compute: Callable[[], Any]) -> Future:
+        """Start (or join) the computation of key for version"""
+        inflight_key = (key[0], key[1], version)
+        with self._lock:
+            future = self._inflight.get(inflight_key)
+            if future is not None:
+                self._stats['coalesced'] += 1
+                return future
+            future = self._executor.submit(self._run, key, version, compute)
+            self._inflight[inflight_key] = future
+
+        future.add_done_callback(lambda _: self._forget(inflight_key))
+        return future
+
+    def _forget(self, inflight_key: Tuple[str, str, Any]) -> None:
+        """Drop a finished computation from the in-flight table"""
+        with self._lock:
+            self._inflight.pop(inflight_key, None)
+
+    def _run(self, key: Tuple[str, str], version: Any, compute: Callable[[], Any]) -> _Entry:
+        """
+        Worker: compute, store in memory, persist
+
+        compute() reads whatever graph is live when it runs, so if the
+        graph changed since the request the value may belong to a newer
+        graph than version. Such results are returned to the waiting
+        caller but neither cached nor persisted under the old version.
+        """
+        metric, params_key = key
+        start = time.perf_counter()
+        try:
+            value = compute()
+        except Exception as e:
+            with self._lock:
+                self._stats['failures'] += 1
+            logger.error(f"Analytics computation {metric} {params_key} failed: {e}")
+            raise
+
+        entry = _Entry(
+            value=value,
+            version=version,
+            computed_at=datetime.now().isoformat(),
+            duration_ms=(time.perf_counter() - start) * 1000
+        )
+        if self._current_version() != version:
+            with self._lock:
+                self._stats['computations'] += 1
+                self._stats['discarded_stale'] += 1
+            logger.info(f"Discarded analytics {metric} {params_key}: graph changed from version {version} "
+                        f"during computation")
+            return entry
+
+        with self._lock:
+            self._entries[key] = entry
+            self._stats['computations'] += 1
+
+        logger.info(f"Computed analytics {metric} {params_key} for graph version {version} "
+                    f"in {entry.duration_ms:.0f}ms")
+
+        if self._repository is not None and self._version_provider is not None:
+            try:
+                self._repository.save(metric, params_key, str(version), value, entry.duration_ms)
+            except Exception as e:
+                # Memory result is still valid; persistence is an optimization
+                logger.warning(f"Could not persist analytics {metric}: {e}")
+        return entry
+
+    def _load_persisted(self, key: Tuple[str, str]) -> Optional[_Entry]:
+        """Load the persisted result for key (any version; version kept as stored string)"""
+        if self._repository is None or self._version_provider is None:
+            return None
+        row = self._repository.get(*key)
+        if row is None:
+            return None
+        return _Entry(
+            value=row['value'],
+            version=row['graph_version'],
+            computed_at=str(row['computed_at']),
+            duration_ms=row['duration_ms']
+        )
+
+    def _current_version(self) -> Any:
+        """Current graph version (generation counter without provider)"""
+        if self._version_provider is None:
+            return self._generation
+        try:
+            return self._version_provider()
+        except Exception as e:
+            # Unknown state - unique version, so nothing is served as current
+            logger.warning(f"Analytics cache version check failed: {e}")
+            return f"unknown-{time.monotonic_ns()}"
+
+    @staticmethod
+    def _params_key(params: Dict[str, Any]) -> str:
+        """Canonical JSON for the parameter part of the key"""
+        return json.dumps(params or {}, sort_keys=True, separators=(',', ':'))
+
+    @staticmethod
+    def _result(status: str, entry: _Entry, source: str) -> AnalyticsResult:
+        """Build AnalyticsResult from an entry"""
+        return AnalyticsResult(
+            status=status,
+            value=entry.value,
+            graph_version=entry.version,
+            source=source,
+            computed_at=entry.computed_at,
+            duration_ms=entry.duration_ms
+        )
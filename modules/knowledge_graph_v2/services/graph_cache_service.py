@@ -8,13 +8,14 @@ Key Features:
 - Automatic rebuild if cache missing/corrupted
 - Force rebuild capability (manual refresh)
 - Orchestrates builders + repository
+- Optional columnar snapshot (read-optimized copy of the cache)
 - Returns generic Graph domain objects
 """
 import logging
 from typing import Optional
 
 from ..domain import Graph, GraphType
-from ..repositories import AbstractGraphCacheRepository
+from ..repositories import AbstractGraphCacheRepository, GraphProjection
 from .schema_graph_builder_service import SchemaGraphBuilderService
 
 logger = logging.getLogger(__name__)
@@ -33,6 +34,12 @@ class GraphCacheService:
     - Force rebuild on demand
     - Orchestrate builder + repository
     
+    Snapshots (optional):
+    - If a snapshot repository is injected, loads prefer its snapshot
+      while it was written from the current cache version
+    - Otherwise the cache is read and the snapshot (re)written from it
+    - Snapshot failures are logged and never fail a request
+    
     Does NOT:
     - Build graphs directly (delegates to builders)
     - Format for vis.js (returns generic domain objects)
@@ -42,32 +49,42 @@ class GraphCacheService:
         self,
         cache_repository: AbstractGraphCacheRepository,
         schema_builder: SchemaGraphBuilderService,
-        data_builder=None  # Optional: DataGraphBuilderService (Phase 2B)
+        data_builder=None,  # Optional: DataGraphBuilderService (Phase 2B)
+        snapshot_repository=None  # Optional: ColumnarGraphCacheRepository
     ):
         """
         Initialize with injected dependencies
         
         Args:
-            cache_repository: Repository for graph persistence
+            cache_repository: Repository for graph persistence (source of truth)
             schema_builder: Builder for schema graphs
             data_builder: Builder for data graphs (optional, future)
+            snapshot_repository: Columnar snapshot repository preferred for
+                                 loads (optional; needs get_source_version and
+                                 save(graph, source_version))
         """
         self.cache_repo = cache_repository
         self.schema_builder = schema_builder
         self.data_builder = data_builder
+        self.snapshot_repo = snapshot_repository
         logger.info("GraphCacheService initialized")
     
-    def get_or_rebuild_schema_graph(self) -> Graph:
+    def get_or_rebuild_schema_graph(self, projection: Optional[GraphProjection] = None) -> Graph:
         """
         Get schema graph from cache, rebuild if missing/corrupted
         
         This is the PRIMARY method for your use case!
         
         Flow:
-        1. Try to load from cache (fast: ~60ms)
-        2. If found → return cached graph
-        3. If not found → rebuild from CSN → save to cache → return
-        4. If corrupted → rebuild from CSN → save to cache → return
+        1. Try the columnar snapshot (if configured and current)
+        2. Try to load from cache (fast: ~60ms)
+        3. If found → write snapshot (full loads only) → return cached graph
+        4. If not found → rebuild from CSN → save to cache → return
+        5. If corrupted → rebuild from CSN → save to cache → return
+        
+        Args:
+            projection: Properties to load from the cache (None = all).
+                        A rebuilt graph is projected the same way.
         
         Returns:
             Graph: Schema graph (either cached or freshly built)
@@ -78,24 +95,39 @@ class GraphCacheService:
         graph_id = 'schema'
         graph_type = GraphType.SCHEMA
         
+        snapshot_graph = self._get_from_snapshot(graph_id, graph_type, projection)
+        if snapshot_graph:
+            logger.info(f"✓ Snapshot HIT: Loaded schema graph from snapshot ({len(snapshot_graph.nodes)} nodes)")
+            return snapshot_graph
+        
         try:
             logger.info("Attempting to load schema graph from cache...")
             
+            # Read before loading: a save in between leaves the snapshot stale, never wrong
+            version = self._get_cache_version(graph_id, graph_type)
+            
             # Try cache first (fast path)
-            cached_graph = self.cache_repo.get(graph_id, graph_type)
+            if projection is None:
+                cached_graph = self.cache_repo.get(graph_id, graph_type)
+            else:
+                cached_graph = self.cache_repo.get(graph_id, graph_type, projection=projection)
             
             if cached_graph:
                 logger.info(f"✓ Cache HIT: Loaded schema graph from cache ({len(cached_graph.nodes)} nodes)")
+                if projection is None or projection.is_full:
+                    self._save_snapshot(cached_graph, version)
                 return cached_graph
             
             # Cache miss - rebuild (slow path)
             logger.info("Cache MISS: Schema graph not in cache, rebuilding from CSN...")
-            return self._rebuild_and_cache_schema()
+            fresh_graph = self._rebuild_and_cache_schema()
             
         except Exception as e:
             # Cache corrupted - rebuild (recovery path)
             logger.warning(f"Cache READ failed ({e}), rebuilding from CSN...")
-            return self._rebuild_and_cache_schema()
+            fresh_graph = self._rebuild_and_cache_schema()
+        
+        return projection.project(fresh_graph) if projection else fresh_graph
     
     def force_rebuild_schema(self) -> Graph:
         """
@@ -128,6 +160,7 @@ class GraphCacheService:
             deleted = self.cache_repo.delete(graph_id, graph_type)
             if deleted:
                 logger.info("✓ Deleted old schema cache")
+        self._delete_snapshot(graph_id, graph_type)
         
         # Rebuild and cache
         return self._rebuild_and_cache_schema()
@@ -155,8 +188,9 @@ class GraphCacheService:
             
             # Save to cache for next time
             logger.info("Saving schema graph to cache...")
-            self.cache_repo.save(fresh_graph)
+            version = self.cache_repo.save(fresh_graph)
             logger.info("✓ Saved to cache")
+            self._save_snapshot(fresh_graph, version)
             
             return fresh_graph
             
@@ -194,13 +228,74 @@ class GraphCacheService:
         logger.warning(f"Clearing cache for graph type: {graph_type}")
         
         if graph_type == GraphType.SCHEMA:
+            self._delete_snapshot('schema', graph_type)
             return self.cache_repo.delete('schema', graph_type)
         elif graph_type == GraphType.DATA:
+            self._delete_snapshot('data', graph_type)
             return self.cache_repo.delete('data', graph_type)
         else:
             logger.error(f"Unknown graph type: {graph_type}")
             return False
     
+    def _get_from_snapshot(
+        self,
+        graph_id: str,
+        graph_type: GraphType,
+        projection: Optional[GraphProjection]
+    ) -> Optional[Graph]:
+        """
+        Internal: Load graph from the snapshot if it matches the cache version
+        
+        Returns:
+            Graph, or None if no snapshot repository, no current snapshot or
+            the snapshot cannot be read
+        """
+        if self.snapshot_repo is None:
+            return None
+        try:
+            version = self.cache_repo.get_version(graph_id, graph_type)
+            if version is None or self.snapshot_repo.get_source_version(graph_id, graph_type) != version:
+                return None
+            return self.snapshot_repo.get(graph_id, graph_type, projection=projection)
+        except Exception as e:
+            logger.warning(f"Snapshot READ failed ({e}), using cache")
+            return None
+    
+    def _get_cache_version(self, graph_id: str, graph_type: GraphType) -> Optional[str]:
+        """Internal: Cache version to stamp a snapshot with (None without snapshot repository)"""
+        if self.snapshot_repo is None:
+            return None
+        try:
+            return self.cache_repo.get_version(graph_id, graph_type)
+        except Exception as e:
+            logger.warning(f"Cache version lookup failed ({e}), skipping snapshot")
+            return None
+    
+    def _save_snapshot(self, graph: Graph, version: Optional[str]) -> None:
+        """
+        Internal: Write the snapshot for a graph just saved to / loaded from the cache
+        
+        Args:
+            graph: Graph as saved / loaded
+            version: Cache version of exactly that graph (returned by save(),
+                or read before loading); None skips the snapshot
+        """
+        if self.snapshot_repo is None or version is None:
+            return  # Without a version a snapshot could never be validated
+        try:
+            self.snapshot_repo.save(graph, source_version=version)
+        except Exception as e:
+            logger.warning(f"Snapshot WRITE failed ({e}), continuing with cache only")
+    
+    def _delete_snapshot(self, graph_id: str, graph_type: GraphType) -> None:
+        """Internal: Drop the snapshot of a graph type"""
+        if self.snapshot_repo is None:
+            return
+        try:
+            self.snapshot_repo.delete(graph_id, graph_type)
+        except Exception as e:
+            logger.warning(f"Snapshot DELETE failed ({e})")
+    
     # Future methods (Phase 2B - Data graphs)
     # def get_or_rebuild_data_graph(self) -> Graph:
     #     """Get data graph from cache, rebuild if missing"""
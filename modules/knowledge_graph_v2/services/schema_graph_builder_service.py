@@ -9,17 +9,55 @@ Key Differences from v1:
 - No vis.js formatting (that's frontend's job)
 - Clean separation: business logic only
 - Dependency injection (CSNParser injected)
+- Optional parallel mode: CSN files fan out to a process pool, each
+  worker returns a picklable SchemaGraphPartial, partials are merged
+  deterministically (same graph as the sequential build)
 """
 import logging
-from typing import Dict, List
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
 
 from core.services.csn_parser import CSNParser
-from core.services.relationship_mapper import CSNRelationshipMapper
+from core.services.relationship_mapper import CSNRelationshipMapper, Relationship
 from ..domain import Graph, GraphNode, GraphEdge, GraphType, NodeType, EdgeType
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class SchemaGraphPartial:
+    """
+    Compact, picklable result of processing one CSN file
+    
+    Attributes:
+        file_path: CSN file the partial was built from
+        tables: (table_name, table node properties without 'product') per entity
+        relationships: Relationships originating from the file's entities
+    """
+    file_path: str
+    tables: Tuple[Tuple[str, Dict[str, Any]], ...]
+    relationships: Tuple[Relationship, ...]
+
+
+# Per-process builder of pool workers (created by _init_worker)
+_worker_builder: Optional['SchemaGraphBuilderService'] = None
+
+
+def _init_worker(csn_directory: str, index_path: Optional[str], persist_index: bool) -> None:
+    """Process pool initializer: one parser/builder per worker process"""
+    global _worker_builder
+    parser = CSNParser(csn_directory, index_path=index_path, persist_index=persist_index)
+    _worker_builder = SchemaGraphBuilderService(parser)
+
+
+def _build_partial(file_path: str, entity_names: Tuple[str, ...]) -> SchemaGraphPartial:
+    """Process pool task: build the partial graph of one CSN file"""
+    return _worker_builder.build_partial(file_path, entity_names)
+
+
 class SchemaGraphBuilderService:
     """
     Service for building schema graphs from CSN metadata
@@ -64,16 +102,19 @@ class SchemaGraphBuilderService:
         'PaymentTerms': 'Payment_Terms'
     }
     
-    def __init__(self, csn_parser: CSNParser):
+    def __init__(self, csn_parser: CSNParser, workers: int = 1):
         """
         Initialize with CSN parser (injected via DI)
         
         Args:
             csn_parser: Parser for CSN files
+            workers: Worker processes for parallel builds (1 = sequential,
+                0 = one per CPU core)
         """
         self.csn_parser = csn_parser
         self.relationship_mapper = CSNRelationshipMapper(csn_parser)
-        logger.info("SchemaGraphBuilderService initialized")
+        self.workers = workers if workers > 0 else (os.cpu_count() or 1)
+        logger.info(f"SchemaGraphBuilderService initialized (workers={self.workers})")
     
     def build_from_csn(self) -> Graph:
         """
@@ -111,6 +152,18 @@ class SchemaGraphBuilderService:
             products_map = self._infer_products_from_entities(entity_names)
             table_to_product = {}  # Track for FK edges
             
+            # Per-entity work (metadata, column semantics, relationships):
+            # in worker processes if configured, else inline
+            partials = self._build_partials_parallel() if self.workers > 1 else None
+            if partials is not None:
+                table_properties = {name: props for partial in partials for name, props in partial.tables}
+                relationships = self.relationship_mapper.merge_relationships(
+                    partial.relationships for partial in partials
+                )
+            else:
+                table_properties = {name: self._table_properties(name) for name in entity_names}
+                relationships = None
+            
             # Phase 2: Create product and table nodes
             for product_name, table_names in products_map.items():
                 # Create product node (generic format)
@@ -124,9 +177,7 @@ class SchemaGraphBuilderService:
                 
                 # Create table nodes for this product
                 for table_name in table_names:
-                    metadata = self.csn_parser.get_entity_metadata(table_name)
-                    
-                # Create table node (generic format)
+                    # Create table node (generic format)
                     table_node_id = f"table-{product_name}-{table_name}"
                     table_node = GraphNode(
                         id=table_node_id,
@@ -134,14 +185,9 @@ class SchemaGraphBuilderService:
                         type=NodeType.TABLE,
                         properties={
                             'product': product_name,
-                            'entity_label': metadata.label if metadata else None
+                            **table_properties.get(table_name, {'entity_label': None})
                         }
                     )
-                    
-                    # Phase 1 (HIGH-30): Enrich table node with column semantics
-                    if metadata:
-                        self._enrich_table_node_with_column_semantics(table_node, metadata)
-                    
                     graph.add_node(table_node)
                     
                     # Add containment edge: product contains table (generic format)
@@ -162,7 +208,7 @@ class SchemaGraphBuilderService:
             
             # Phase 3: Discover FK relationships from CSN
             logger.info("Analyzing foreign key relationships from CSN...")
-            self._add_fk_edges(graph, table_to_product)
+            self._add_fk_edges(graph, table_to_product, relationships)
             
             stats = graph.get_statistics()
             logger.info(
@@ -178,6 +224,87 @@ class SchemaGraphBuilderService:
             logger.error(f"Error building schema graph from CSN: {e}", exc_info=True)
             raise
     
+    def build_partial(self, file_path: str, entity_names: Tuple[str, ...]) -> SchemaGraphPartial:
+        """
+        Build the partial graph for the entities of one CSN file
+        
+        Runs in pool workers; also usable inline.
+        
+        Args:
+            file_path: CSN file the entities belong to
+            entity_names: Entities defined in that file
+        
+        Returns:
+            SchemaGraphPartial with table properties and outgoing relationships
+        """
+        return SchemaGraphPartial(
+            file_path=file_path,
+            tables=tuple((name, self._table_properties(name)) for name in entity_names),
+            relationships=tuple(self.relationship_mapper.discover_relationships(source_entities=entity_names))
+        )
+    
+    def _build_partials_parallel(self) -> Optional[List[SchemaGraphPartial]]:
+        """
+        Fan CSN files out to a process pool
+        
+        Largest files are submitted first (load balancing); results are
+        returned in file path order so the merge is deterministic.
+        
+        Returns:
+            Partials in file order, or None to build sequentially (fewer
+            than two files, or the pool failed)
+        """
+        files = self.csn_parser.list_entities_by_file()
+        if len(files) < 2:
+            return None
+        
+        workers = min(self.workers, len(files))
+        by_size = sorted(files, key=lambda path: -os.path.getsize(path) if os.path.exists(path) else 0)
+        # Never fork: the caller is a multi-threaded server, and a forked child
+        # inherits any lock another thread held at fork time. forkserver forks
+        # workers from a clean single-threaded server process (POSIX only).
+        start_method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+        
+        try:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context(start_method),
+                initializer=_init_worker,
+                initargs=(self.csn_parser.csn_directory, self.csn_parser.index_path, self.csn_parser.persist_index)
+            ) as pool:
+                futures = {path: pool.submit(_build_partial, path, tuple(files[path])) for path in by_size}
+                partials = [futures[path].result() for path in files]
+        except Exception as e:
+            logger.warning(f"Parallel schema build failed, building sequentially: {e}")
+            return None
+        
+        logger.info(f"Built {len(partials)} CSN file partials with {workers} worker processes")
+        return partials
+    
+    def _table_properties(self, table_name: str) -> Dict[str, Any]:
+        """
+        Table node properties derived from CSN metadata (without 'product')
+        
+        Args:
+            table_name: Entity name
+        
+        Returns:
+            Dict with entity_label (+ columns/semantic_summary if metadata exists)
+        """
+        metadata = self.csn_parser.get_entity_metadata(table_name)
+        table_node = GraphNode(
+            id=f"table-{table_name}",
+            label=table_name,
+            type=NodeType.TABLE,
+            properties={'entity_label': metadata.label if metadata else None}
+        )
+        
+        # Phase 1 (HIGH-30): Enrich table node with column semantics
+        if metadata:
+            self._enrich_table_node_with_column_semantics(table_node, metadata)
+        
+        return table_node.properties
+    
     def _infer_products_from_entities(self, entity_names: List[str]) -> Dict[str, List[str]]:
         """
         Infer data products from CSN entity names
@@ -228,7 +355,12 @@ class SchemaGraphBuilderService:
         logger.info(f"Inferred {len(products)} products from {len(entity_names)} entities")
         return products
     
-    def _add_fk_edges(self, graph: Graph, table_to_product: Dict[str, Dict]) -> None:
+    def _add_fk_edges(
+        self,
+        graph: Graph,
+        table_to_product: Dict[str, Dict],
+        relationships: Optional[List[Relationship]] = None
+    ) -> None:
         """
         Add foreign key edges to graph from CSN associations
         
@@ -244,9 +376,12 @@ class SchemaGraphBuilderService:
         Args:
             graph: Graph to add edges to (modified in place)
             table_to_product: Map of table_name to product info
+            relationships: Already discovered relationships (parallel build);
+                None = discover now
         """
         # Discover relationships from CSN (now includes ON conditions!)
-        relationships = self.relationship_mapper.discover_relationships()
+        if relationships is None:
+            relationships = self.relationship_mapper.discover_relationships()
         
         logger.info(f"[DEBUG] _add_fk_edges: Processing {len(relationships)} relationships")
         logger.info(f"[DEBUG] table_to_product keys (first 5): {list(table_to_product.keys())[:5]}")
@@ -0,0 +1,186 @@
+"""
+Schema Graph Snapshot
+
+Process-level, versioned, immutable snapshot of the schema graph.
+
+Without it, every GET /api/knowledge-graph/schema re-reads all rows from
+graph_nodes/graph_edges, json.loads every properties blob, rebuilds the
+Graph aggregate and serializes it again. The schema graph only changes on
+an explicit rebuild, so all of that work can be done once and shared.
+
+A snapshot holds:
+- the Graph aggregate (for index-backed filtering)
+- the generic dict form (graph.to_dict()) and its pre-serialized JSON
+- precomputed metadata and summary counts
+- a content-derived ETag for conditional requests (If-None-Match -> 304)
+
+Snapshots are replaced only by publish() (schema rebuild) and dropped only
+by invalidate() (cache DELETE). Readers never see a half-built snapshot.
+"""
+import hashlib
+import json
+import logging
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, Mapping, Optional
+
+from ..domain import Graph
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class SchemaGraphSnapshot:
+    """
+    Immutable view of one schema graph version
+
+    The frozen dataclass prevents rebinding; the contained dicts are shared
+    by all readers and must be treated as read-only.
+
+    Attributes:
+        version: Process-local monotonically increasing version number
+        etag: Strong ETag derived from the serialized graph content
+        graph: Graph aggregate the snapshot was built from (treat as read-only)
+        graph_dict: Generic graph dict ({nodes, edges}) shared by all readers
+        graph_json: Pre-serialized graph_dict
+        metadata: graph_id/graph_type/node_count/edge_count/nodes_by_type/edges_by_type
+        summary: total_nodes/total_edges/entity_types/relationship_types
+        cache_used: Whether the graph came from the persistent cache
+        created_at: ISO timestamp of snapshot creation
+    """
+    version: int
+    etag: str
+    graph: Graph
+    graph_dict: Mapping[str, Any]
+    graph_json: str
+    metadata: Mapping[str, Any]
+    summary: Mapping[str, Any]
+    cache_used: bool
+    created_at: str = field(default_factory=lambda: datetime.now().isoformat())
+
+
+class SchemaGraphSnapshotStore:
+    """
+    Holds the current schema graph snapshot for the process
+
+    Thread-safe: concurrent first requests coalesce into one build, and
+    readers always get a complete snapshot.
+
+    Usage:
+        store = SchemaGraphSnapshotStore()
+        snapshot = store.get_or_build(lambda: (cache_service.get_or_rebuild_schema_graph(), True))
+        store.publish(rebuilt_graph, cache_used=False)   # after rebuild
+        store.invalidate()                               # after cache DELETE
+    """
+
+    def __init__(self):
+        """Initialize empty store"""
+        self._snapshot: Optional[SchemaGraphSnapshot] = None
+        self._version = 0
+        self._lock = threading.RLock()
+
+    @property
+    def current(self) -> Optional[SchemaGraphSnapshot]:
+        """Current snapshot (None if not built yet or invalidated)"""
+        return self._snapshot
+
+    def get_or_build(self, loader: Callable[[], tuple]) -> SchemaGraphSnapshot:
+        """
+        Return the current snapshot, building it on first use
+
+        Args:
+            loader: Returns (Graph, cache_used) - only called on a miss
+
+        Returns:
+            SchemaGraphSnapshot
+        """
+        snapshot = self._snapshot
+        if snapshot is not None:
+            return snapshot
+
+        with self._lock:
+            # Another thread may have built it while we waited
+            if self._snapshot is None:
+                graph, cache_used = loader()
+                self._snapshot = self._build(graph, cache_used)
+            return self._snapshot
+
+    def publish(self, graph: Graph, cache_used: bool = False) -> SchemaGraphSnapshot:
+        """
+        Replace the current snapshot with one built from graph (schema rebuild)
+
+        Args:
+            graph: Freshly built schema graph
+            cache_used: Whether graph came from the persistent cache
+
+        Returns:
+            The new snapshot
+        """
+        with self._lock:
+            self._snapshot = self._build(graph, cache_used)
+            return self._snapshot
+
+    def invalidate(self) -> bool:
+        """
+        Drop the current snapshot (cache DELETE)
+
+        Returns:
+            True if a snapshot was dropped
+        """
+        with self._lock:
+            dropped = self._snapshot is not None
+            self._snapshot = None
+        if dropped:
+            logger.info("Schema graph snapshot invalidated")
+        return dropped
+
+    def _build(self, graph: Graph, cache_used: bool) -> SchemaGraphSnapshot:
+        """Serialize graph once and precompute everything readers need"""
+        graph_dict = graph.to_dict()
+        graph_json = json.dumps(graph_dict, separators=(',', ':'), default=str)
+        stats = graph.get_statistics()
+
+        metadata = {
+            'graph_id': graph.id,
+            'graph_type': graph.type.value,
+            'node_count': stats['node_count'],
+            'edge_count': stats['edge_count'],
+            'nodes_by_type': stats['nodes_by_type'],
+            'edges_by_type': stats['edges_by_type']
+        }
+        summary = {
+            'total_nodes': len(graph_dict.get('nodes', [])),
+            'total_edges': len(graph_dict.get('edges', [])),
+            'entity_types': dict(stats['nodes_by_type']),  # from the Graph type index
+            'relationship_types': self._count_by(graph_dict.get('edges', []), ('label', 'type'))
+        }
+
+        self._version += 1
+        etag = hashlib.sha256(graph_json.encode('utf-8')).hexdigest()[:32]
+
+        logger.info(
+            f"Schema graph snapshot v{self._version} built: "
+            f"{metadata['node_count']} nodes, {metadata['edge_count']} edges, "
+            f"{len(graph_json) // 1024} KB JSON"
+        )
+
+        return SchemaGraphSnapshot(
+            version=self._version,
+            etag=etag,
+            graph=graph,
+            graph_dict=graph_dict,
+            graph_json=graph_json,
+            metadata=metadata,
+            summary=summary,
+            cache_used=cache_used
+        )
+
+    @staticmethod
+    def _count_by(items, keys) -> Dict[str, int]:
+        """Count items by the first present key (e.g. edge label, falling back to type)"""
+        counts: Dict[str, int] = {}
+        for item in items:
+            value = item.get(keys[0]) or item.get(keys[1], 'Unknown')
+            counts[value] = counts.get(value, 0) + 1
+        return counts
@@ -0,0 +1,133 @@
+"""
+Integration Tests for ColumnarGraphCacheRepository
+
+Tests snapshot files on disk: round trips, projections and versioning.
+"""
+import pytest
+from modules.knowledge_graph_v2.domain import Graph, GraphNode, GraphEdge, GraphType, NodeType, EdgeType
+from modules.knowledge_graph_v2.domain.lazy_properties import LazyProperties
+from modules.knowledge_graph_v2.repositories import ColumnarGraphCacheRepository, GraphProjection
+
+
+@pytest.fixture
+def repository(tmp_path):
+    """Create repository with a temp snapshot directory"""
+    return ColumnarGraphCacheRepository(str(tmp_path / 'snapshots'))
+
+
+@pytest.fixture
+def sample_graph():
+    """Schema graph with scalar, nested, non-string and missing properties"""
+    graph = Graph("schema", GraphType.SCHEMA)
+    graph.add_node(GraphNode("product-P2P", "P2P", NodeType.PRODUCT))
+    graph.add_node(GraphNode("t1", "Bestellung €", NodeType.TABLE, {
+        'entity_type': 'PurchaseOrder', 'product': 'P2P', 'columns': {'ID': {'key': True}}
+    }))
+    graph.add_node(GraphNode("t2", "Supplier", NodeType.TABLE, {'entity_type': 7, 'product': None}))
+    graph.add_edge(GraphEdge("product-P2P", "t1", EdgeType.CONTAINS))
+    graph.add_edge(GraphEdge("t1", "t2", EdgeType.FOREIGN_KEY, "fk", {'cardinality': 'n:1'}))
+    graph.add_edge(GraphEdge("t2", "t1", EdgeType.FOREIGN_KEY, "", {'cardinality': 'n:1'}))
+    return graph
+
+
+@pytest.mark.integration
+class TestColumnarRepositorySaveAndGet:
+    """Test snapshot round trips"""
+    
+    def test_round_trip_matches_graph(self, repository, sample_graph):
+        """Test loaded graph equals the saved one"""
+        # ACT
+        repository.save(sample_graph, source_version='3')
+        result = repository.get("schema", GraphType.SCHEMA)
+        
+        # ASSERT
+        assert result.to_dict() == sample_graph.to_dict()
+        assert result.edges[0].label is None
+        assert result.get_nodes_by_product('P2P') == sample_graph.get_nodes_by_product('P2P')
+    
+    def test_shared_edge_properties_are_copies(self, repository, sample_graph):
+        """Test edges with identical property blobs do not share dicts"""
+        # ARRANGE
+        repository.save(sample_graph)
+        
+        # ACT
+        edges = repository.get("schema", GraphType.SCHEMA).edges
+        
+        # ASSERT
+        assert edges[1].properties == edges[2].properties
+        assert edges[1].properties is not edges[2].properties
+    
+    def test_get_missing_returns_none(self, repository):
+        """Test loading without a snapshot returns None"""
+        # ACT / ASSERT
+        assert repository.get("schema", GraphType.SCHEMA) is None
+        assert repository.exists("schema", GraphType.SCHEMA) is False
+    
+    def test_corrupt_file_returns_none(self, repository, sample_graph):
+        """Test a damaged snapshot is treated as missing"""
+        # ARRANGE
+        repository.save(sample_graph)
+        path = repository._path(GraphType.SCHEMA)
+        with open(path, 'r+b') as f:
+            f.truncate(100)
+        
+        # ACT / ASSERT
+        assert repository.get("schema", GraphType.SCHEMA) is None
+
+
+@pytest.mark.integration
+class TestColumnarRepositoryProjection:
+    """Test projected snapshot loads"""
+    
+    def test_projections_match_in_memory_projection(self, repository, sample_graph):
+        """Test labels-only and subset loads equal projecting the full graph"""
+        # ARRANGE
+        repository.save(sample_graph)
+        
+        for projection in (GraphProjection.labels_only(), GraphProjection.subset('columns', 'missing')):
+            # ACT
+            result = repository.get("schema", GraphType.SCHEMA, projection=projection)
+            
+            # ASSERT
+            assert result.to_dict() == projection.project(sample_graph).to_dict()
+    
+    def test_lazy_properties_use_index_columns(self, repository, sample_graph):
+        """Test lazy loads index entity types without decoding"""
+        # ARRANGE
+        repository.save(sample_graph)
+        
+        # ACT
+        result = repository.get("schema", GraphType.SCHEMA, projection=GraphProjection.lazy_properties())
+        
+        # ASSERT
+        node = result.get_node("t1")
+        assert isinstance(node.properties, LazyProperties)
+        assert result.page_node_positions(['PurchaseOrder']) == [1]
+        assert node.properties.materialized is False
+        assert result.to_dict() == sample_graph.to_dict()
+
+
+@pytest.mark.integration
+class TestColumnarRepositoryVersioning:
+    """Test source versions and deletion"""
+    
+    def test_source_version_round_trip(self, repository, sample_graph):
+        """Test the source version is readable from the header"""
+        # ACT
+        repository.save(sample_graph, source_version='42')
+        
+        # ASSERT
+        assert repository.get_source_version("schema", GraphType.SCHEMA) == '42'
+        assert repository.get_source_version("data", GraphType.DATA) is None
+    
+    def test_delete_and_clear_all(self, repository, sample_graph):
+        """Test snapshots can be removed"""
+        # ARRANGE
+        repository.save(sample_graph)
+        
+        # ACT / ASSERT
+        assert repository.delete("schema", GraphType.SCHEMA) is True
+        assert repository.delete("schema", GraphType.SCHEMA) is False
+        repository.save(sample_graph)
+        assert repository.clear_all() == 1
+        assert repository.exists("schema", GraphType.SCHEMA) is False
@@ -5,14 +5,25 @@ Tests repository with real SQLite database.
 """
 import pytest
 import os
+import sqlite3
 import tempfile
+from core.services.database_connection_factory import SqliteConnectionFactory
+from core.services.database_unit_of_work import SqliteUnitOfWork
 from modules.knowledge_graph_v2.domain import Graph, GraphNode, GraphEdge, GraphType, NodeType, EdgeType
+from modules.knowledge_graph_v2.domain.lazy_properties import LazyProperties
+from modules.knowledge_graph_v2.repositories.graph_cache_repository import GraphProjection
 from modules.knowledge_graph_v2.repositories.sqlite_graph_cache_repository import (
     SqliteGraphCacheRepository,
     RepositoryError
 )
 
 
+def make_repository(db_path, **kwargs):
+    """Create repository with DI dependencies for a database file"""
+    factory = SqliteConnectionFactory(db_path)
+    return SqliteGraphCacheRepository(factory, SqliteUnitOfWork(factory), **kwargs)
+
+
 @pytest.fixture
 def temp_db_path():
     """Create temporary database file for testing"""
@@ -27,7 +38,7 @@ def temp_db_path():
 @pytest.fixture
 def repository(temp_db_path):
     """Create repository with temp database"""
-    return SqliteGraphCacheRepository(temp_db_path)
+    return make_repository(temp_db_path)
 
 
 @pytest.fixture
@@ -116,12 +127,12 @@ class TestSqliteRepositoryPersistence:
     def test_data_persists_across_instances(self, temp_db_path, sample_graph):
         """Test saved data survives repository close/reopen"""
         # ARRANGE - Save with first instance
-        repo1 = SqliteGraphCacheRepository(temp_db_path)
+        repo1 = make_repository(temp_db_path)
         repo1.save(sample_graph)
         del repo1  # Close connection
         
         # ACT - Load with new instance
-        repo2 = SqliteGraphCacheRepository(temp_db_path)
+        repo2 = make_repository(temp_db_path)
         result = repo2.get("test-schema", GraphType.SCHEMA)
         
         # ASSERT
@@ -272,4 +283,223 @@ class TestSqliteRepositoryMultipleGraphTypes:
         data_result = repository.get("test", GraphType.DATA)
         
         assert schema_result.nodes[0].type == NodeType.TABLE
-        assert data_result.nodes[0].type == NodeType.RECORD
\ No newline at end of file
+        assert data_result.nodes[0].type == NodeType.RECORD
+
+
+def chain_graph(size, graph_id="bulk"):
+    """Data graph n0 -> n1 -> ... with properties on every node and edge"""
+    graph = Graph(graph_id, GraphType.DATA)
+    for i in range(size):
+        graph.add_node(GraphNode(f"n{i}", f"Node {i}", NodeType.RECORD, {'index': i}))
+    for i in range(size - 1):
+        graph.add_edge(GraphEdge(f"n{i}", f"n{i + 1}", EdgeType.REFERENCES, "next", {'weight': i}))
+    return graph
+
+
+def row_counts(db_path):
+    """(nodes, edges, ontologies) row counts"""
+    conn = sqlite3.connect(db_path)
+    try:
+        return tuple(
+            conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+            for table in ('graph_nodes', 'graph_edges', 'graph_ontology')
+        )
+    finally:
+        conn.close()
+
+
+@pytest.mark.integration
+class TestSqliteRepositoryBulkWrite:
+    """Test bulk-write save path (staging ontology + pointer flip)"""
+    
+    def test_bulk_and_standard_save_store_same_graph(self, temp_db_path, tmp_path):
+        """Test both save paths round-trip identical graphs"""
+        # ARRANGE
+        graph = chain_graph(50)
+        standard = make_repository(str(tmp_path / 'standard.db'), bulk_write=False)
+        bulk = make_repository(temp_db_path)
+        
+        # ACT
+        standard.save(graph)
+        bulk.save(graph)
+        
+        # ASSERT
+        expected = standard.get("bulk", GraphType.DATA)
+        result = bulk.get("bulk", GraphType.DATA)
+        assert [n.to_dict() for n in result.nodes] == [n.to_dict() for n in expected.nodes]
+        assert [e.to_dict() for e in result.edges] == [e.to_dict() for e in expected.edges]
+    
+    def test_save_returns_written_version(self, temp_db_path, tmp_path):
+        """Test both save paths return the version get_version reports afterwards"""
+        standard = make_repository(str(tmp_path / 'standard.db'), bulk_write=False)
+        for repository in (make_repository(temp_db_path), standard):
+            # ACT
+            version = repository.save(chain_graph(5))
+            
+            # ASSERT
+            assert version == repository.get_version("bulk", GraphType.DATA)
+            assert repository.save(chain_graph(5)) != version
+    
+    def test_resave_replaces_rows_under_new_ontology_id(self, repository, temp_db_path):
+        """Test a second save leaves no rows of the previous graph"""
+        # ARRANGE
+        repository.save(chain_graph(10))
+        conn = sqlite3.connect(temp_db_path)
+        first_id = conn.execute("SELECT ontology_id FROM graph_ontology").fetchone()[0]
+        conn.close()
+        
+        # ACT
+        repository.save(chain_graph(5))
+        
+        # ASSERT
+        conn = sqlite3.connect(temp_db_path)
+        ids = conn.execute("SELECT DISTINCT ontology_id FROM graph_nodes").fetchall()
+        journal_mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        conn.close()
+        assert row_counts(temp_db_path) == (5, 4, 1)
+        assert ids[0][0] > first_id and len(ids) == 1
+        assert journal_mode == 'wal'
+    
+    def test_deferred_indexes_are_rebuilt(self, repository, temp_db_path):
+        """Test indexes dropped for a large load exist again afterwards"""
+        # ARRANGE
+        repository.DEFER_INDEX_MIN_ROWS = 10
+        
+        # ACT
+        repository.save(chain_graph(20))
+        
+        # ASSERT
+        conn = sqlite3.connect(temp_db_path)
+        names = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+        conn.close()
+        assert {name for name, _, _ in SqliteGraphCacheRepository.INDEXES} <= names
+    
+    def test_failed_save_keeps_previous_graph(self, repository, temp_db_path):
+        """Test an error mid-load rolls back to the previous graph"""
+        # ARRANGE
+        repository.DEFER_INDEX_MIN_ROWS = 1
+        repository.save(chain_graph(10))
+        broken = chain_graph(10)
+        broken.add_node(GraphNode("bad", "Bad", NodeType.RECORD, {'value': object()}))
+        
+        # ACT / ASSERT
+        with pytest.raises(RepositoryError):
+            repository.save(broken)
+        assert row_counts(temp_db_path) == (10, 9, 1)
+        assert len(repository.get("bulk", GraphType.DATA).nodes) == 10
+    
+    def test_readers_never_see_half_written_graph(self, repository, temp_db_path):
+        """Test a concurrent reader sees the old graph until the save commits"""
+        # ARRANGE
+        repository.save(chain_graph(10))
+        seen_mid_save = []
+        node_rows = repository._node_rows
+        
+        def observing_rows(graph, ontology_id):
+            for i, row in enumerate(node_rows(graph, ontology_id)):
+                if i == 5:
+                    seen_mid_save.append(row_counts(temp_db_path))
+                yield row
+        
+        repository._node_rows = observing_rows
+        
+        # ACT
+        repository.save(chain_graph(20))
+        
+        # ASSERT
+        assert seen_mid_save == [(10, 9, 1)]
+        assert row_counts(temp_db_path) == (20, 19, 1)
+    
+    def test_get_reads_one_snapshot_across_concurrent_save(self, repository, temp_db_path):
+        """Test a save committing between the ontology lookup and the row reads is not seen"""
+        # ARRANGE
+        repository.save(chain_graph(10))
+        writer = make_repository(temp_db_path)
+        supports_json1 = repository._supports_json1
+        
+        def save_then_check(conn):
+            # Runs after graph_ontology was read, before nodes/edges are loaded
+            writer.save(chain_graph(20))
+            return supports_json1(conn)
+        
+        repository._supports_json1 = save_then_check
+        
+        # ACT
+        result = repository.get("bulk", GraphType.DATA)
+        
+        # ASSERT
+        assert (len(result.nodes), len(result.edges)) == (10, 9)
+        assert row_counts(temp_db_path) == (20, 19, 1)
+
+
+def annotated_graph():
+    """Schema graph with scalar, boolean, nested and null properties"""
+    graph = Graph("annotated", GraphType.SCHEMA)
+    graph.add_node(GraphNode("t1", "Table 1", NodeType.TABLE, {
+        'entity_type': 'PurchaseOrder', 'product': 'P2P', 'is_root': True,
+        'columns': {'ID': {'key': True}}, 'description': None
+    }))
+    graph.add_node(GraphNode("t2", "Table 2", NodeType.TABLE, {'entity_type': 'Supplier', 'is_root': False}))
+    graph.add_edge(GraphEdge("t1", "t2", EdgeType.FOREIGN_KEY, "fk", {'cardinality': '1:n'}))
+    return graph
+
+
+@pytest.mark.integration
+class TestSqliteRepositoryProjection:
+    """Test projected and lazy graph loading"""
+    
+    def test_labels_only_skips_properties(self, repository):
+        """Test labels-only projection returns structure without properties"""
+        # ARRANGE
+        repository.save(annotated_graph())
+        
+        # ACT
+        result = repository.get("annotated", GraphType.SCHEMA, projection=GraphProjection.labels_only())
+        
+        # ASSERT
+        assert [(n.id, n.label, n.properties) for n in result.nodes] == [("t1", "Table 1", {}), ("t2", "Table 2", {})]
+        assert result.edges[0].properties == {}
+        assert result.edges[0].label == "fk"
+    
+    def test_subset_matches_python_projection(self, repository):
+        """Test SQL-extracted subset equals projecting the full graph"""
+        # ARRANGE
+        repository.save(annotated_graph())
+        projection = GraphProjection.subset('is_root', 'columns', 'description', 'missing')
+        
+        # ACT
+        result = repository.get("annotated", GraphType.SCHEMA, projection=projection)
+        expected = projection.project(repository.get("annotated", GraphType.SCHEMA))
+        
+        # ASSERT
+        assert result.to_dict() == expected.to_dict()
+        assert result.nodes[0].properties == {'is_root': True, 'columns': {'ID': {'key': True}}, 'description': None}
+    
+    def test_subset_without_json1_falls_back(self, repository):
+        """Test subset projection without JSON1 decodes in Python"""
+        # ARRANGE
+        repository.save(annotated_graph())
+        repository._json1 = False
+        
+        # ACT
+        result = repository.get("annotated", GraphType.SCHEMA, projection=GraphProjection.subset('is_root'))
+        
+        # ASSERT
+        assert [n.properties for n in result.nodes] == [{'is_root': True}, {'is_root': False}]
+    
+    def test_lazy_properties_decode_on_access(self, repository):
+        """Test lazy projection defers decoding but keeps graph indexes"""
+        # ARRANGE
+        repository.save(annotated_graph())
+        
+        # ACT
+        result = repository.get("annotated", GraphType.SCHEMA, projection=GraphProjection.lazy_properties())
+        
+        # ASSERT
+        node = result.get_node("t1")
+        assert isinstance(node.properties, LazyProperties)
+        assert result.page_node_positions(['Supplier']) == [1]
+        assert node.properties.materialized is False
+        assert node.properties['columns'] == {'ID': {'key': True}}
+        assert node.properties.materialized is True
+        assert result.to_dict() == repository.get("annotated", GraphType.SCHEMA).to_dict()
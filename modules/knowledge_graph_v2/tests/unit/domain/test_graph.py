@@ -279,4 +279,166 @@ class TestGraphImmutability:
         
         # ASSERT
         assert edges1 is not edges2  # Different objects
-        assert edges1 == edges2  # Same content
\ No newline at end of file
+        assert edges1 == edges2  # Same content
+
+
+@pytest.mark.unit
+@pytest.mark.fast
+class TestGraphIndexes:
+    """Test by-type, by-product and adjacency indexes"""
+    
+    @pytest.fixture
+    def graph(self):
+        """Two products, three tables, containment + FK edges"""
+        graph = Graph("schema", GraphType.SCHEMA)
+        graph.add_node(GraphNode("product-P2P", "P2P", NodeType.PRODUCT))
+        graph.add_node(GraphNode("table-po", "PurchaseOrder", NodeType.TABLE, {'product': 'P2P'}))
+        graph.add_node(GraphNode("product-Supplier", "Supplier", NodeType.PRODUCT))
+        graph.add_node(GraphNode("table-sup", "Supplier", NodeType.TABLE, {'product': 'Supplier'}))
+        graph.add_node(GraphNode("table-poi", "PurchaseOrderItem", NodeType.TABLE, {'product': 'P2P'}))
+        graph.add_edge(GraphEdge("product-P2P", "table-po", EdgeType.CONTAINS))
+        graph.add_edge(GraphEdge("product-Supplier", "table-sup", EdgeType.CONTAINS))
+        graph.add_edge(GraphEdge("product-P2P", "table-poi", EdgeType.CONTAINS))
+        graph.add_edge(GraphEdge("table-po", "table-sup", EdgeType.FOREIGN_KEY))
+        graph.add_edge(GraphEdge("table-poi", "table-po", EdgeType.FOREIGN_KEY))
+        return graph
+    
+    def test_get_nodes_by_type(self, graph):
+        """Test type index returns nodes in insertion order"""
+        # ACT
+        tables = graph.get_nodes_by_type(NodeType.TABLE)
+        
+        # ASSERT
+        assert [n.id for n in tables] == ["table-po", "table-sup", "table-poi"]
+        assert graph.get_nodes_by_type(NodeType.RECORD) == []
+    
+    def test_get_nodes_by_product(self, graph):
+        """Test product index includes the product node and its tables"""
+        # ACT
+        nodes = graph.get_nodes_by_product("P2P")
+        
+        # ASSERT
+        assert [n.id for n in nodes] == ["product-P2P", "table-po", "table-poi"]
+        assert graph.get_nodes_by_product("Unknown") == []
+    
+    def test_adjacency(self, graph):
+        """Test outgoing/incoming edge lookups"""
+        # ACT & ASSERT
+        assert [e.target_id for e in graph.get_outgoing_edges("table-po")] == ["table-sup"]
+        assert {e.source_id for e in graph.get_incoming_edges("table-po")} == {"product-P2P", "table-poi"}
+        assert graph.get_outgoing_edges("table-sup") == []
+    
+    def test_duplicate_edge_not_indexed_twice(self, graph):
+        """Test idempotent edge addition leaves adjacency unchanged"""
+        # ACT
+        graph.add_edge(GraphEdge("table-po", "table-sup", EdgeType.FOREIGN_KEY))
+        
+        # ASSERT
+        assert len(graph.get_outgoing_edges("table-po")) == 1
+    
+    def test_page_node_positions_single_type(self, graph):
+        """Test paging one type slices the type index"""
+        # ACT
+        positions = graph.page_node_positions(['table'], offset=1, limit=1)
+        
+        # ASSERT
+        assert graph.node_ids_at(positions) == ["table-sup"]
+        assert graph.count_nodes(['table']) == 3
+    
+    def test_page_node_positions_multiple_types_keep_graph_order(self, graph):
+        """Test paging several types merges them in insertion order"""
+        # ACT
+        positions = graph.page_node_positions(['table', 'product'], offset=1, limit=3)
+        
+        # ASSERT
+        assert positions == [1, 2, 3]
+        assert graph.count_nodes(['table', 'product']) == 5
+    
+    def test_node_matching_several_type_keys_counted_once(self, graph):
+        """Test a node indexed under its type and its entity_type is paged once"""
+        # ARRANGE
+        graph.add_node(GraphNode("table-inv", "Invoice", NodeType.TABLE, {'entity_type': 'invoice'}))
+        
+        # ACT
+        positions = graph.page_node_positions(['table', 'invoice'])
+        
+        # ASSERT
+        assert graph.node_ids_at(positions) == ["table-po", "table-sup", "table-poi", "table-inv"]
+        assert graph.count_nodes(['table', 'invoice']) == 4
+    
+    def test_page_node_positions_matches_to_dict_order(self, graph):
+        """Test positions index into the serialized node list"""
+        # ARRANGE
+        nodes = graph.to_dict()['nodes']
+        
+        # ACT
+        positions = graph.page_node_positions(offset=3, limit=10)
+        
+        # ASSERT
+        assert [nodes[i]['id'] for i in positions] == ["table-sup", "table-poi"]
+        assert graph.page_node_positions(['unknown']) == []
+        assert graph.count_nodes(['unknown']) == 0
+    
+    def test_edge_positions_within(self, graph):
+        """Test only edges with both endpoints selected are returned, in edge order"""
+        # ARRANGE
+        edges = graph.edges
+        
+        # ACT
+        positions = graph.edge_positions_within(["table-poi", "table-sup", "table-po"])
+        
+        # ASSERT
+        assert [(edges[i].source_id, edges[i].target_id) for i in positions] == [
+            ("table-po", "table-sup"),
+            ("table-poi", "table-po")
+        ]
+
+
+@pytest.mark.unit
+@pytest.mark.fast
+class TestCompactStorage:
+    """Test slotted nodes/edges and hashed duplicate detection"""
+    
+    def test_nodes_and_edges_have_no_instance_dict(self):
+        """Test GraphNode/GraphEdge use __slots__"""
+        # ARRANGE & ACT
+        node = GraphNode("n1", "Node 1", NodeType.TABLE)
+        edge = GraphEdge("n1", "n2", EdgeType.FOREIGN_KEY)
+        
+        # ASSERT
+        assert not hasattr(node, '__dict__')
+        assert not hasattr(edge, '__dict__')
+        with pytest.raises(AttributeError):
+            node.unknown_attribute = 1
+    
+    def test_edge_stays_frozen_and_picklable(self):
+        """Test slotted frozen edge keeps immutability and pickle round-trip"""
+        import pickle
+        from dataclasses import FrozenInstanceError
+        
+        # ARRANGE
+        edge = GraphEdge("n1", "n2", EdgeType.FOREIGN_KEY, label="fk", properties={'weight': 1})
+        
+        # ACT
+        restored = pickle.loads(pickle.dumps(edge))
+        
+        # ASSERT
+        assert restored == edge
+        with pytest.raises(FrozenInstanceError):
+            edge.label = "changed"
+    
+    def test_duplicate_detection_uses_full_key(self):
+        """Test edges differing only by type are both kept"""
+        # ARRANGE
+        graph = Graph("test", GraphType.SCHEMA)
+        graph.add_node(GraphNode("a", "A", NodeType.TABLE))
+        graph.add_node(GraphNode("b", "B", NodeType.TABLE))
+        
+        # ACT
+        graph.add_edge(GraphEdge("a", "b", EdgeType.FOREIGN_KEY))
+        graph.add_edge(GraphEdge("a", "b", EdgeType.REFERENCES))
+        graph.add_edge(GraphEdge("a", "b", EdgeType.FOREIGN_KEY, label="other label"))
+        graph.add_edge(GraphEdge("b", "a", EdgeType.FOREIGN_KEY))
+        
+        # ASSERT
+        assert len(graph.edges) == 3
@@ -0,0 +1,63 @@
+"""
+Unit Tests for LazyProperties
+
+Tests decode-on-access behavior of lazily loaded graph properties.
+"""
+import copy
+import pickle
+
+import pytest
+from modules.knowledge_graph_v2.domain import LazyProperties
+
+
+@pytest.mark.unit
+@pytest.mark.fast
+class TestLazyProperties:
+    """Test lazily decoded properties mapping"""
+    
+    def test_preloaded_get_does_not_decode(self):
+        """Test get() serves preloaded values without decoding"""
+        # ARRANGE
+        props = LazyProperties('{"product": "P2P", "note": null}', {'product': 'P2P', 'note': None})
+        
+        # ACT / ASSERT
+        assert props.get('product') == 'P2P'
+        assert props.get('note', 'default') == 'default'
+        assert props.materialized is False
+    
+    def test_mapping_access_decodes_once(self):
+        """Test item access, iteration and len decode the JSON"""
+        # ARRANGE
+        props = LazyProperties('{"a": 1, "b": {"c": [1, 2]}}')
+        
+        # ACT / ASSERT
+        assert props['b'] == {'c': [1, 2]}
+        assert props.materialized is True
+        assert dict(props) == {'a': 1, 'b': {'c': [1, 2]}}
+        assert len(props) == 2
+        assert props.get('missing') is None
+    
+    def test_truthiness_without_decoding(self):
+        """Test bool() does not decode the blob"""
+        # ACT / ASSERT
+        assert not LazyProperties('{}')
+        assert LazyProperties('{"a": 1}')
+        assert LazyProperties('{"a": 1}').materialized is False
+    
+    def test_equals_dict(self):
+        """Test comparison with a plain dict"""
+        # ACT / ASSERT
+        assert LazyProperties('{"a": 1}') == {'a': 1}
+    
+    def test_copies_and_pickles_as_dict(self):
+        """Test copy and pickle produce plain dicts"""
+        # ARRANGE
+        props = LazyProperties('{"a": [1]}')
+        
+        # ACT
+        copied = copy.deepcopy(props)
+        unpickled = pickle.loads(pickle.dumps(props))
+        
+        # ASSERT
+        assert copied == {'a': [1]} and type(copied) is dict
+        assert unpickled == {'a': [1]} and type(unpickled) is dict
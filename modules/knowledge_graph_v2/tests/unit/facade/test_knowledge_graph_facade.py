@@ -333,4 +333,103 @@ class TestResponseFormat:
         assert result['success'] is False
         assert 'error' in result
         assert 'error_type' in result
-        assert result['error_type'] == "ValueError"
\ No newline at end of file
+        assert result['error_type'] == "ValueError"
+
+
+@pytest.mark.unit
+@pytest.mark.fast
+class TestGetSchemaOverview:
+    """Test projected schema overview"""
+    
+    @pytest.fixture
+    def injected_facade(self):
+        """Facade with all dependencies injected as mocks"""
+        return KnowledgeGraphFacadeV2(Mock(), Mock(), Mock(), Mock(), csn_parser=Mock())
+    
+    def test_cold_start_loads_projected_graph(self, injected_facade):
+        """Test overview without a snapshot requests a property subset"""
+        # ARRANGE
+        graph = Graph('schema', GraphType.SCHEMA)
+        graph.add_node(GraphNode('n1', 'Node 1', NodeType.TABLE, {'entity_label': 'Order'}))
+        facade = injected_facade
+        facade.cache_service.exists_in_cache = Mock(return_value=True)
+        facade.cache_service.get_or_rebuild_schema_graph = Mock(return_value=graph)
+        
+        # ACT
+        result = facade.get_schema_overview(['entity_label'])
+        
+        # ASSERT
+        projection = facade.cache_service.get_or_rebuild_schema_graph.call_args.kwargs['projection']
+        assert projection.property_keys == ('entity_label',)
+        assert result['success'] is True
+        assert result['graph']['nodes'][0]['entity_label'] == 'Order'
+        assert result['etag'] is None
+    
+    def test_project_node_dicts_keeps_identity_fields(self):
+        """Test node dict projection keeps id, label and type"""
+        # ARRANGE
+        nodes = [{'id': 'n1', 'label': 'Node 1', 'type': 'table', 'columns': {}, 'entity_label': 'Order'}]
+        
+        # ACT
+        result = KnowledgeGraphFacadeV2.project_node_dicts(nodes, ['entity_label'])
+        
+        # ASSERT
+        assert result == [{'id': 'n1', 'label': 'Node 1', 'type': 'table', 'entity_label': 'Order'}]
+        assert 'columns' in nodes[0]
+
+
+@pytest.mark.unit
+@pytest.mark.fast
+class TestFindPaths:
+    """Test bounded path search"""
+    
+    @pytest.fixture
+    def injected_facade(self):
+        """Facade with all dependencies injected as mocks"""
+        return KnowledgeGraphFacadeV2(Mock(), Mock(), Mock(), Mock(), csn_parser=Mock())
+    
+    def test_returns_serialized_paths(self, injected_facade):
+        """Test paths are delegated to the engine and serialized"""
+        # ARRANGE
+        from core.interfaces.graph_query import GraphPath, GraphNode as QueryNode
+        facade = injected_facade
+        facade.graph_query_service.node_exists = Mock(return_value=True)
+        path = GraphPath(nodes=[QueryNode('a', 'A'), QueryNode('b', 'B')], edges=[], length=1)
+        facade.graph_query_service.find_paths = Mock(return_value=[path])
+        
+        # ACT
+        result = facade.find_paths('a', 'b', max_hops=4, edge_types=('fk',), k=2)
+        
+        # ASSERT
+        facade.graph_query_service.find_paths.assert_called_once_with('a', 'b', max_hops=4, edge_types=['fk'], k=2)
+        assert result['success'] is True
+        assert result['data']['path_count'] == 1
+        assert result['data']['paths'][0]['length'] == 1
+    
+    def test_unknown_node_is_not_found(self, injected_facade):
+        """Test missing endpoints are reported before searching"""
+        # ARRANGE
+        facade = injected_facade
+        facade.graph_query_service.node_exists = Mock(side_effect=lambda node_id: node_id == 'a')
+        
+        # ACT
+        result = facade.find_paths('a', 'missing')
+        
+        # ASSERT
+        assert result['success'] is False
+        assert 'not found' in result['error']
+        facade.graph_query_service.find_paths.assert_not_called()
+    
+    def test_unsupported_search_reports_error_type(self, injected_facade):
+        """Test engines without constrained search surface NotImplementedError"""
+        # ARRANGE
+        facade = injected_facade
+        facade.graph_query_service.node_exists = Mock(return_value=True)
+        facade.graph_query_service.find_paths = Mock(side_effect=NotImplementedError('no k-shortest'))
+        
+        # ACT
+        result = facade.find_paths('a', 'b', k=3)
+        
+        # ASSERT
+        assert result['success'] is False
+        assert result['error_type'] == 'NotImplementedError'
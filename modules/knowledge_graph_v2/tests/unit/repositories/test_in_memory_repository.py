@@ -5,6 +5,7 @@ Tests repository operations without database (fast unit tests).
 """
 import pytest
 from modules.knowledge_graph_v2.domain import Graph, GraphNode, GraphType, NodeType
+from modules.knowledge_graph_v2.repositories.graph_cache_repository import GraphProjection
 from modules.knowledge_graph_v2.repositories.in_memory_graph_cache_repository import (
     InMemoryGraphCacheRepository
 )
@@ -208,4 +209,37 @@ class TestRepositoryMultipleGraphTypes:
         data_result = repository.get("test", GraphType.DATA)
         
         assert schema_result.nodes[0].type == NodeType.TABLE
-        assert data_result.nodes[0].type == NodeType.RECORD
\ No newline at end of file
+        assert data_result.nodes[0].type == NodeType.RECORD
+
+
+@pytest.mark.unit
+@pytest.mark.fast
+class TestRepositoryProjection:
+    """Test projected reads"""
+    
+    def test_subset_projection_returns_copy(self, repository):
+        """Test subset projection keeps only requested keys without mutating the stored graph"""
+        # ARRANGE
+        graph = Graph("test", GraphType.SCHEMA)
+        graph.add_node(GraphNode("n1", "Node 1", NodeType.TABLE, {'product': 'P2P', 'columns': {'ID': {}}}))
+        repository.save(graph)
+        
+        # ACT
+        result = repository.get("test", GraphType.SCHEMA, projection=GraphProjection.subset('product', 'missing'))
+        
+        # ASSERT
+        assert result.nodes[0].properties == {'product': 'P2P'}
+        assert repository.get("test", GraphType.SCHEMA).nodes[0].properties == {'product': 'P2P', 'columns': {'ID': {}}}
+    
+    def test_labels_only_projection(self, repository, sample_graph):
+        """Test labels-only projection drops all properties"""
+        # ARRANGE
+        sample_graph.nodes[0].properties['color'] = 'blue'
+        repository.save(sample_graph)
+        
+        # ACT
+        result = repository.get("test-schema", GraphType.SCHEMA, projection=GraphProjection.labels_only())
+        
+        # ASSERT
+        assert result.nodes[0].properties == {}
+        assert result.nodes[0].label == "Test Node"
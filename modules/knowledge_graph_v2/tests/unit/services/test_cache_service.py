@@ -334,4 +334,89 @@ class TestRealWorldScenarios:
         
         # ASSERT
         assert mock_schema_builder.build_from_csn.call_count == 1  # Only built once
-        assert mock_cache_repo.get.call_count == 2  # Checked cache twice
\ No newline at end of file
+        assert mock_cache_repo.get.call_count == 2  # Checked cache twice
+
+
+@pytest.mark.unit
+@pytest.mark.fast
+class TestSnapshotPreference:
+    """Test columnar snapshot preference and fallback"""
+    
+    @pytest.fixture
+    def mock_snapshot_repo(self):
+        """Create mock snapshot repository"""
+        repo = Mock()
+        repo.get = Mock(return_value=None)
+        repo.get_source_version = Mock(return_value=None)
+        return repo
+    
+    @pytest.fixture
+    def snapshot_service(self, mock_cache_repo, mock_schema_builder, mock_snapshot_repo):
+        """Create cache service with a snapshot repository"""
+        mock_cache_repo.get_version = Mock(return_value='5')
+        mock_cache_repo.save = Mock(return_value='6')
+        return GraphCacheService(mock_cache_repo, mock_schema_builder, snapshot_repository=mock_snapshot_repo)
+    
+    def test_current_snapshot_is_preferred(self, snapshot_service, mock_cache_repo, mock_snapshot_repo):
+        """Test snapshot written from the current cache version skips the cache"""
+        # ARRANGE
+        snapshot_graph = Graph('schema', GraphType.SCHEMA)
+        mock_snapshot_repo.get_source_version.return_value = '5'
+        mock_snapshot_repo.get.return_value = snapshot_graph
+        
+        # ACT
+        result = snapshot_service.get_or_rebuild_schema_graph()
+        
+        # ASSERT
+        assert result is snapshot_graph
+        mock_cache_repo.get.assert_not_called()
+    
+    def test_stale_snapshot_falls_back_and_is_rewritten(self, snapshot_service, mock_cache_repo, mock_snapshot_repo):
+        """Test stale snapshot is ignored and rewritten from the cache"""
+        # ARRANGE
+        cached_graph = Graph('schema', GraphType.SCHEMA)
+        mock_snapshot_repo.get_source_version.return_value = '4'
+        mock_cache_repo.get.return_value = cached_graph
+        
+        # ACT
+        result = snapshot_service.get_or_rebuild_schema_graph()
+        
+        # ASSERT
+        assert result is cached_graph
+        mock_snapshot_repo.get.assert_not_called()
+        mock_snapshot_repo.save.assert_called_once_with(cached_graph, source_version='5')
+    
+    def test_rebuild_writes_snapshot(self, snapshot_service, mock_schema_builder, mock_snapshot_repo):
+        """Test a rebuilt graph is snapshotted with the version save() wrote"""
+        # ACT
+        result = snapshot_service.get_or_rebuild_schema_graph()
+        
+        # ASSERT
+        mock_schema_builder.build_from_csn.assert_called_once()
+        mock_snapshot_repo.save.assert_called_once_with(result, source_version='6')
+    
+    def test_snapshot_errors_do_not_fail_loads(self, snapshot_service, mock_cache_repo, mock_snapshot_repo):
+        """Test snapshot read/write errors fall back to the cache"""
+        # ARRANGE
+        cached_graph = Graph('schema', GraphType.SCHEMA)
+        mock_snapshot_repo.get_source_version.side_effect = OSError("disk error")
+        mock_snapshot_repo.save.side_effect = OSError("disk full")
+        mock_cache_repo.get.return_value = cached_graph
+        
+        # ACT
+        result = snapshot_service.get_or_rebuild_schema_graph()
+        
+        # ASSERT
+        assert result is cached_graph
+    
+    def test_clear_and_force_rebuild_delete_snapshot(self, snapshot_service, mock_cache_repo, mock_snapshot_repo):
+        """Test cache clears also drop the snapshot"""
+        # ARRANGE
+        mock_cache_repo.exists.return_value = True
+        
+        # ACT
+        snapshot_service.clear_cache(GraphType.SCHEMA)
+        snapshot_service.force_rebuild_schema()
+        
+        # ASSERT
+        assert mock_snapshot_repo.delete.call_count == 2
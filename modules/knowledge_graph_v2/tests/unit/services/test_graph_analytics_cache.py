@@ -0,0 +1,210 @@
+"""
+Unit Tests for GraphAnalyticsCache
+
+Tests version-keyed caching, coalescing of concurrent requests, bounded
+waits (stale/pending), precomputation and persistence across instances.
+"""
+import threading
+import time
+
+import pytest
+
+from core.services.database_connection_factory import SqliteConnectionFactory
+from core.services.database_unit_of_work import SqliteUnitOfWork
+from modules.knowledge_graph_v2.repositories import SqliteGraphAnalyticsRepository
+from modules.knowledge_graph_v2.services import GraphAnalyticsCache
+
+
+class Version:
+    """Mutable graph version for tests"""
+
+    def __init__(self, value='1-10'):
+        self.value = value
+
+    def __call__(self):
+        return self.value
+
+
+def make_repository(tmp_path):
+    """Create a SQLite analytics repository in a temp database"""
+    factory = SqliteConnectionFactory(str(tmp_path / 'graph.db'))
+    return SqliteGraphAnalyticsRepository(factory, SqliteUnitOfWork(factory))
+
+
+@pytest.mark.unit
+@pytest.mark.fast
+class TestGraphAnalyticsCache:
+    """Test caching, coalescing and background computation"""
+
+    def test_computes_once_per_version(self):
+        """Test repeated requests hit memory until the version changes"""
+        # ARRANGE
+        version = Version()
+        cache = GraphAnalyticsCache(version_provider=version)
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return [['a', 0.5]]
+
+        # ACT
+        first = cache.get('pagerank', {'damping_factor': 0.85}, compute)
+        second = cache.get('pagerank', {'damping_factor': 0.85}, compute)
+        version.value = '2-11'
+        third = cache.get('pagerank', {'damping_factor': 0.85}, compute)
+
+        # ASSERT
+        assert (first.status, first.source) == ('ready', 'computed')
+        assert (second.status, second.source) == ('ready', 'memory')
+        assert third.graph_version == '2-11'
+        assert len(calls) == 2
+        cache.shutdown()
+
+    def test_params_are_part_of_key(self):
+        """Test different parameters are cached separately"""
+        cache = GraphAnalyticsCache(version_provider=Version())
+
+        low = cache.get('pagerank', {'damping_factor': 0.5}, lambda: 'low')
+        high = cache.get('pagerank', {'damping_factor': 0.9}, lambda: 'high')
+
+        assert (low.value, high.value) == ('low', 'high')
+        cache.shutdown()
+
+    def test_concurrent_requests_coalesce(self):
+        """Test concurrent requests share one computation"""
+        # ARRANGE
+        cache = GraphAnalyticsCache(version_provider=Version(), max_workers=2)
+        release = threading.Event()
+        calls = []
+
+        def compute():
+            calls.append(1)
+            release.wait(5)
+            return 42
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(cache.get('cycles', {}, compute)))
+            for _ in range(5)
+        ]
+
+        # ACT
+        for thread in threads:
+            thread.start()
+        while cache.get_stats()['coalesced'] < 4:
+            time.sleep(0.001)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        # ASSERT
+        assert len(calls) == 1
+        assert [r.value for r in results] == [42] * 5
+        cache.shutdown()
+
+    def test_pending_then_stale_when_computation_slow(self):
+        """Test bounded wait returns pending first, then the previous version as stale"""
+        # ARRANGE
+        version = Version()
+        cache = GraphAnalyticsCache(version_provider=version, wait_seconds=0.01)
+        release = threading.Event()
+
+        def slow():
+            release.wait(5)
+            return version.value
+
+        # ACT
+        pending = cache.get('components', {}, slow)
+        release.set()
+        ready = cache.get('components', {}, slow, wait_seconds=5)
+        release.clear()
+        version.value = '2-11'
+        stale = cache.get('components', {}, slow)
+        release.set()
+
+        # ASSERT
+        assert pending.status == 'pending'
+        assert pending.available is False
+        assert (ready.status, ready.value) == ('ready', '1-10')
+        assert (stale.status, stale.value, stale.graph_version) == ('stale', '1-10', '1-10')
+        cache.shutdown(wait=True)
+
+    def test_precompute_skips_current_results(self):
+        """Test precompute schedules only metrics missing for the current version"""
+        cache = GraphAnalyticsCache(version_provider=Version())
+        cache.get('degree_centrality', {}, lambda: [])
+
+        scheduled = cache.precompute([
+            ('degree_centrality', {}, lambda: []),
+            ('cycles', {}, lambda: [])
+        ])
+        cache.shutdown(wait=True)
+
+        assert scheduled == 1
+        assert cache.get_stats()['computations'] == 2
+
+    def test_invalidate_without_provider(self):
+        """Test invalidate() outdates results when no version provider is set"""
+        cache = GraphAnalyticsCache()
+        cache.get('cycles', {}, lambda: 'old')
+
+        cache.invalidate()
+        result = cache.get('cycles', {}, lambda: 'new')
+
+        assert result.value == 'new'
+        cache.shutdown()
+
+    def test_failure_is_raised(self):
+        """Test computation errors reach the caller and are counted"""
+        cache = GraphAnalyticsCache(version_provider=Version())
+
+        def broken():
+            raise RuntimeError('boom')
+
+        with pytest.raises(RuntimeError, match='boom'):
+            cache.get('cycles', {}, broken)
+        assert cache.get_stats()['failures'] == 1
+        cache.shutdown()
+
+    def test_persisted_result_survives_restart(self, tmp_path):
+        """Test a new cache instance serves persisted results for the same version"""
+        # ARRANGE
+        repository = make_repository(tmp_path)
+        first = GraphAnalyticsCache(repository=repository, version_provider=Version())
+        first.get('pagerank', {'damping_factor': 0.85}, lambda: {'scores': [['a', 1.0]]})
+        first.shutdown(wait=True)
+
+        restarted = GraphAnalyticsCache(repository=repository, version_provider=Version())
+
+        def must_not_run():
+            raise AssertionError('should be served from the repository')
+
+        # ACT
+        result = restarted.get('pagerank', {'damping_factor': 0.85}, must_not_run)
+
+        # ASSERT
+        assert (result.status, result.source) == ('ready', 'persisted')
+        assert result.value == {'scores': [['a', 1.0]]}
+        restarted.shutdown()
+
+    def test_result_discarded_when_graph_changes_during_computation(self, tmp_path):
+        """Test a result computed across a rebuild is neither cached nor persisted"""
+        # ARRANGE
+        version = Version()
+        repository = make_repository(tmp_path)
+        cache = GraphAnalyticsCache(repository=repository, version_provider=version)
+
+        def compute_during_rebuild():
+            version.value = '2-11'
+            return {'scores': [['a', 1.0]]}
+
+        # ACT
+        result = cache.get('pagerank', {'damping_factor': 0.85}, compute_during_rebuild)
+        cache.shutdown(wait=True)
+
+        # ASSERT
+        assert result.value == {'scores': [['a', 1.0]]}
+        stats = cache.get_stats()
+        assert stats['entries'] == 0
+        assert stats['discarded_stale'] == 1
+        assert repository.get('pagerank', '{"damping_factor":0.85}') is None
@@ -315,4 +315,83 @@ class TestSchemaBuilderStatistics:
         assert stats['node_count'] == 5  # 2 products + 3 tables
         assert stats['edge_count'] == 3  # 3 containment edges
         assert stats['nodes_by_type']['product'] == 2
-        assert stats['nodes_by_type']['table'] == 3
\ No newline at end of file
+        assert stats['nodes_by_type']['table'] == 3
+
+
+def write_csn_file(directory, file_name, entities):
+    """Write a CSN file; entities maps name -> {column: type} (type = other entity name for FKs)"""
+    import json
+    definitions = {}
+    for name, columns in entities.items():
+        elements = {'ID': {'key': True, 'type': 'cds.String'}}
+        for column, target in columns.items():
+            elements[column] = {'type': 'cds.String'}
+            elements[f'to_{target}'] = {
+                'type': 'cds.Association',
+                'target': f'p2p.{target}',
+                'on': [{'ref': [column]}, '=', {'ref': [f'to_{target}', 'ID']}]
+            }
+        definitions[f'p2p.{name}'] = {'kind': 'entity', '@EndUserText.label': name, 'elements': elements}
+    (directory / file_name).write_text(json.dumps([{'definitions': definitions}]))
+
+
+@pytest.mark.unit
+class TestParallelSchemaBuild:
+    """Test process-pool build produces the same graph as the sequential build"""
+    
+    @pytest.fixture
+    def csn_dir(self, tmp_path):
+        """Three CSN files with cross-file associations"""
+        directory = tmp_path / 'csn'
+        directory.mkdir()
+        write_csn_file(directory, 'Purchase_Order_CSN.json', {
+            'PurchaseOrder': {'Supplier': 'Supplier', 'CompanyCode': 'CompanyCode'},
+            'PurchaseOrderItem': {'PurchaseOrder': 'PurchaseOrder', 'Product': 'Product'}
+        })
+        write_csn_file(directory, 'Supplier_CSN.json', {'Supplier': {'CompanyCode': 'CompanyCode'}})
+        write_csn_file(directory, 'Master_CSN.json', {'CompanyCode': {}, 'Product': {}})
+        return directory
+    
+    def test_parallel_build_matches_sequential(self, csn_dir):
+        """Test workers > 1 yields an identical graph"""
+        from core.services.csn_parser import CSNParser
+        
+        # ARRANGE
+        sequential = SchemaGraphBuilderService(CSNParser(str(csn_dir)), workers=1)
+        parallel = SchemaGraphBuilderService(CSNParser(str(csn_dir)), workers=3)
+        
+        # ACT
+        expected = sequential.build_from_csn()
+        actual = parallel.build_from_csn()
+        partials = parallel._build_partials_parallel()
+        
+        # ASSERT
+        assert partials is not None, "parallel build fell back to sequential"
+        assert len(partials) == len(parallel.csn_parser.list_entities_by_file())
+        assert actual.to_dict() == expected.to_dict()
+        assert expected.get_statistics()['edges_by_type']['fk'] == 5
+    
+    def test_partial_is_picklable(self, csn_dir):
+        """Test partials survive the trip back from worker processes"""
+        import pickle
+        from core.services.csn_parser import CSNParser
+        
+        # ARRANGE
+        service = SchemaGraphBuilderService(CSNParser(str(csn_dir)))
+        
+        # ACT
+        partial = service.build_partial('Supplier_CSN.json', ('Supplier',))
+        restored = pickle.loads(pickle.dumps(partial))
+        
+        # ASSERT
+        assert restored == partial
+        assert {rel.to_entity for rel in restored.relationships} == {'CompanyCode'}
+        assert restored.tables[0][1]['entity_label'] == 'Supplier'
+    
+    def test_zero_workers_means_cpu_count(self, mock_csn_parser, mock_relationship_mapper):
+        """Test workers=0 resolves to one worker per core"""
+        import os
+        
+        service = SchemaGraphBuilderService(mock_csn_parser, workers=0)
+        
+        assert service.workers == (os.cpu_count() or 1)
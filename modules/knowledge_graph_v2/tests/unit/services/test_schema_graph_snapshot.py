@@ -0,0 +1,112 @@
+"""
+Unit Tests for SchemaGraphSnapshotStore
+
+Tests the process-level schema graph snapshot: single build under
+concurrency, versioning on publish, invalidation and content ETags.
+"""
+import json
+import threading
+
+import pytest
+
+from modules.knowledge_graph_v2.domain import Graph, GraphType, GraphNode, GraphEdge, NodeType, EdgeType
+from modules.knowledge_graph_v2.services import SchemaGraphSnapshotStore
+
+
+def make_graph(extra_node: bool = False) -> Graph:
+    """Create a small schema graph"""
+    graph = Graph('schema', GraphType.SCHEMA)
+    graph.add_node(GraphNode(id='product-p2p', label='P2P', type=NodeType.PRODUCT))
+    graph.add_node(GraphNode(id='table-po', label='PurchaseOrder', type=NodeType.TABLE))
+    graph.add_edge(GraphEdge(source_id='product-p2p', target_id='table-po', type=EdgeType.CONTAINS))
+    if extra_node:
+        graph.add_node(GraphNode(id='table-inv', label='Invoice', type=NodeType.TABLE))
+    return graph
+
+
+@pytest.mark.unit
+@pytest.mark.fast
+class TestSchemaGraphSnapshotStore:
+    """Test snapshot building, versioning and invalidation"""
+
+    def test_get_or_build_loads_once(self):
+        """Test the loader only runs on the first request"""
+        store = SchemaGraphSnapshotStore()
+        calls = []
+
+        def loader():
+            calls.append(1)
+            return make_graph(), True
+
+        first = store.get_or_build(loader)
+        second = store.get_or_build(loader)
+
+        assert first is second
+        assert len(calls) == 1
+        assert first.version == 1
+        assert first.cache_used is True
+
+    def test_concurrent_first_requests_coalesce(self):
+        """Test concurrent misses build a single snapshot"""
+        store = SchemaGraphSnapshotStore()
+        calls = []
+        barrier = threading.Barrier(8)
+        results = []
+
+        def loader():
+            calls.append(1)
+            return make_graph(), True
+
+        def worker():
+            barrier.wait()
+            results.append(store.get_or_build(loader))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(calls) == 1
+        assert all(r is results[0] for r in results)
+
+    def test_snapshot_precomputes_json_and_summary(self):
+        """Test pre-serialized JSON matches the dict form and summary counts"""
+        snapshot = SchemaGraphSnapshotStore().publish(make_graph())
+
+        assert json.loads(snapshot.graph_json) == snapshot.graph_dict
+        assert snapshot.summary['total_nodes'] == 2
+        assert snapshot.summary['total_edges'] == 1
+        assert snapshot.summary['entity_types'] == {'product': 1, 'table': 1}
+        assert snapshot.metadata['node_count'] == 2
+
+    def test_publish_bumps_version_and_etag(self):
+        """Test a rebuild with different content yields a new version and ETag"""
+        store = SchemaGraphSnapshotStore()
+        first = store.publish(make_graph())
+        second = store.publish(make_graph(extra_node=True))
+
+        assert second.version == first.version + 1
+        assert second.etag != first.etag
+        assert store.current is second
+
+    def test_etag_stable_for_same_content(self):
+        """Test identical content keeps the ETag (clients stay valid across rebuilds)"""
+        store = SchemaGraphSnapshotStore()
+        first = store.publish(make_graph())
+        second = store.publish(make_graph())
+
+        assert second.version == first.version + 1
+        assert second.etag == first.etag
+
+    def test_invalidate_forces_reload(self):
+        """Test invalidate drops the snapshot and the next request reloads"""
+        store = SchemaGraphSnapshotStore()
+        store.publish(make_graph())
+
+        assert store.invalidate() is True
+        assert store.current is None
+        assert store.invalidate() is False
+
+        reloaded = store.get_or_build(lambda: (make_graph(extra_node=True), True))
+        assert reloaded.summary['total_nodes'] == 3
@@ -6,18 +6,24 @@ Validates performance at enterprise scale.
 
 Usage:
     python scripts/python/benchmark_knowledge_graph_10k.py
+    python scripts/python/benchmark_knowledge_graph_10k.py --scaling-only
+    python scripts/python/benchmark_knowledge_graph_10k.py --scaling-only --sizes 10000,100000
     
 Output:
     - Performance metrics (timing, throughput)
+    - Graph build time and RSS at 10K / 100K / 1M edges
     - Bottleneck identification
     - Scalability recommendations
 """
+import argparse
+import gc
+import os
 import sys
 import time
 import sqlite3
 import statistics
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Sequence
 
 # Add project root to path
 project_root = Path(__file__).parent.parent.parent
@@ -29,13 +35,44 @@ from modules.knowledge_graph_v2.domain import (
 from modules.knowledge_graph_v2.repositories.sqlite_graph_cache_repository import (
     SqliteGraphCacheRepository
 )
+from core.services.database_connection_factory import SqliteConnectionFactory
+from core.services.database_unit_of_work import SqliteUnitOfWork
+
+
+# Edge counts for the build scaling benchmark (data graphs at real P2P volumes)
+DEFAULT_SCALING_SIZES = (10_000, 100_000, 1_000_000)
+EDGES_PER_NODE = 3
+
+
+def get_rss_mb() -> Optional[float]:
+    """
+    Current resident set size of this process in MB
+    
+    Uses /proc/self/statm (Linux). Falls back to peak RSS from
+    resource.getrusage where /proc is unavailable (macOS), and None on
+    platforms without either (Windows).
+    """
+    try:
+        with open('/proc/self/statm') as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * os.sysconf('SC_PAGE_SIZE') / (1024 * 1024)
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is bytes on macOS, KB elsewhere
+        return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+    except (ImportError, OSError):
+        return None
 
 
 class PerformanceBenchmark:
     """Performance benchmark orchestrator"""
     
-    def __init__(self):
+    def __init__(self, scaling_sizes: Sequence[int] = DEFAULT_SCALING_SIZES):
         self.results: Dict[str, Any] = {}
+        self.scaling_sizes = tuple(scaling_sizes)
         self.db_path = "modules/knowledge_graph_v2/database/graph_cache_benchmark.db"
         
         # Ensure database directory exists
@@ -78,6 +115,11 @@ class PerformanceBenchmark:
         self.benchmark_batch_operations()
         print()
         
+        # Benchmark 6: Build Scaling
+        print("📊 Benchmark 6: Graph Build Scaling (time + RSS)")
+        self.benchmark_build_scaling()
+        print()
+        
         # Summary
         self.print_summary()
         
@@ -147,7 +189,7 @@ class PerformanceBenchmark:
         
         # Write to database
         print(f"   Writing to database...")
-        repo = SqliteGraphCacheRepository(self.db_path)
+        repo = self._create_repository()
         
         start = time.time()
         repo.save(graph)
@@ -175,7 +217,7 @@ class PerformanceBenchmark:
         - Edge retrieval performance
         - Deserialization overhead
         """
-        repo = SqliteGraphCacheRepository(self.db_path)
+        repo = self._create_repository()
         
         # Single read
         print("   Reading graph from database...")
@@ -229,7 +271,7 @@ class PerformanceBenchmark:
         - Node existence checks
         - Edge traversal
         """
-        repo = SqliteGraphCacheRepository(self.db_path)
+        repo = self._create_repository()
         graph = repo.get("benchmark-10k", GraphType.DATA)
         
         if graph is None:
@@ -335,6 +377,89 @@ class PerformanceBenchmark:
             'edge_throughput': edges_added / edge_time
         }
     
+    def benchmark_build_scaling(self) -> None:
+        """
+        Benchmark: In-memory graph build at increasing edge counts
+        
+        Tests:
+        - add_node()/add_edge() throughput stays flat as the graph grows
+          (duplicate detection is a hashed key lookup, not a scan)
+        - Memory per edge with slotted GraphNode/GraphEdge
+        - Duplicate re-insertion cost (10% of edges re-added)
+        """
+        scaling = []
+        
+        for edge_count in self.scaling_sizes:
+            node_count = max(edge_count // EDGES_PER_NODE, 2)
+            duplicates = edge_count // 10
+            
+            gc.collect()
+            rss_before = get_rss_mb()
+            
+            graph = Graph(f"scaling-{edge_count}", GraphType.DATA)
+            start = time.time()
+            for i in range(node_count):
+                graph.add_node(GraphNode(
+                    id=f"n{i}",
+                    label=f"Record {i}",
+                    type=NodeType.TABLE if i % 100 == 0 else NodeType.RECORD,
+                    properties={'index': i}
+                ))
+            node_time = time.time() - start
+            
+            start = time.time()
+            for i in range(edge_count):
+                # Stride by hop so (source, target) pairs are unique
+                hop = 1 + i // node_count
+                graph.add_edge(GraphEdge(
+                    source_id=f"n{i % node_count}",
+                    target_id=f"n{(i + hop) % node_count}",
+                    type=EdgeType.FOREIGN_KEY if i % 10 == 0 else EdgeType.REFERENCES
+                ))
+            edge_time = time.time() - start
+            
+            start = time.time()
+            for i in range(duplicates):
+                hop = 1 + i // node_count
+                graph.add_edge(GraphEdge(
+                    source_id=f"n{i % node_count}",
+                    target_id=f"n{(i + hop) % node_count}",
+                    type=EdgeType.FOREIGN_KEY if i % 10 == 0 else EdgeType.REFERENCES
+                ))
+            duplicate_time = time.time() - start
+            
+            rss_after = get_rss_mb()
+            rss_delta = (
+                rss_after - rss_before
+                if rss_before is not None and rss_after is not None else None
+            )
+            stored_edges = len(graph.edges)
+            
+            result = {
+                'edge_count': stored_edges,
+                'node_count': node_count,
+                'node_time': node_time,
+                'edge_time': edge_time,
+                'build_time': node_time + edge_time,
+                'edge_throughput': stored_edges / edge_time if edge_time else 0,
+                'duplicate_time': duplicate_time,
+                'rss_mb': rss_after,
+                'rss_delta_mb': rss_delta,
+                'bytes_per_edge': rss_delta * 1024 * 1024 / stored_edges if rss_delta else None
+            }
+            scaling.append(result)
+            
+            rss_text = f"{rss_delta:,.1f} MB" if rss_delta is not None else "n/a"
+            print(f"   ✅ {stored_edges:>9,} edges / {node_count:>9,} nodes: "
+                  f"build {result['build_time']:.2f}s "
+                  f"({result['edge_throughput']:,.0f} edges/sec), "
+                  f"{duplicates:,} duplicates {duplicate_time:.2f}s, RSS +{rss_text}")
+            
+            del graph
+            gc.collect()
+        
+        self.results['scaling'] = scaling
+    
     def benchmark_batch_operations(self) -> None:
         """
         Benchmark: Repeated read/write cycles
@@ -344,7 +469,7 @@ class PerformanceBenchmark:
         - Cache effectiveness
         - Consistency under load
         """
-        repo = SqliteGraphCacheRepository(self.db_path)
+        repo = self._create_repository()
         
         print("   Running 1,000 save/read cycles...")
         save_times = []
@@ -436,6 +561,8 @@ class PerformanceBenchmark:
         print(f"   Read (100 nodes): {batch_data.get('avg_read_ms', 0):.2f}ms")
         print()
         
+        self.print_scaling_summary()
+        
         # Bottleneck Analysis
         print("=" * 80)
         print("🔍 BOTTLENECK ANALYSIS")
@@ -453,6 +580,29 @@ class PerformanceBenchmark:
         
         self.generate_recommendations()
     
+    def print_scaling_summary(self) -> None:
+        """Print the build scaling table"""
+        scaling = self.results.get('scaling', [])
+        if not scaling:
+            return
+        
+        print("🔸 Graph Build Scaling:")
+        print(f"   {'Edges':>10} {'Nodes':>10} {'Build (s)':>10} {'Edges/sec':>12} {'RSS +MB':>9} {'B/edge':>8}")
+        for row in scaling:
+            rss = f"{row['rss_delta_mb']:.1f}" if row['rss_delta_mb'] is not None else "n/a"
+            per_edge = f"{row['bytes_per_edge']:.0f}" if row['bytes_per_edge'] else "n/a"
+            print(f"   {row['edge_count']:>10,} {row['node_count']:>10,} {row['build_time']:>10.2f} "
+                  f"{row['edge_throughput']:>12,.0f} {rss:>9} {per_edge:>8}")
+        
+        # Linear build: throughput should not collapse as the graph grows
+        first, last = scaling[0], scaling[-1]
+        if first['edge_throughput'] and last['edge_throughput'] < first['edge_throughput'] / 3:
+            print(f"   ⚠️ SUPERLINEAR BUILD: edge throughput dropped "
+                  f"{first['edge_throughput'] / last['edge_throughput']:.1f}x")
+        else:
+            print("   ✅ LINEAR BUILD: edge throughput stable across sizes")
+        print()
+    
     def analyze_bottlenecks(self) -> None:
         """Identify performance bottlenecks"""
         write_data = self.results.get('write_10k', {})
@@ -571,6 +721,11 @@ class PerformanceBenchmark:
             print("   Knowledge Graph handles 10K+ nodes efficiently.")
             print()
     
+    def _create_repository(self) -> SqliteGraphCacheRepository:
+        """Create cache repository for the benchmark database (same DI wiring as server.py)"""
+        connection_factory = SqliteConnectionFactory(self.db_path)
+        return SqliteGraphCacheRepository(connection_factory, SqliteUnitOfWork(connection_factory))
+    
     def check_database_health(self) -> None:
         """Check database integrity and performance"""
         print("🔍 Database Health Check:")
@@ -613,9 +768,34 @@ class PerformanceBenchmark:
             conn.close()
 
 
-def main():
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Knowledge Graph performance benchmark")
+    parser.add_argument(
+        '--scaling-only',
+        action='store_true',
+        help='Only run the in-memory build scaling benchmark (no database)'
+    )
+    parser.add_argument(
+        '--sizes',
+        default=','.join(str(size) for size in DEFAULT_SCALING_SIZES),
+        help='Comma-separated edge counts for the scaling benchmark (default: 10000,100000,1000000)'
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None):
     """Run benchmark suite"""
-    benchmark = PerformanceBenchmark()
+    args = parse_args(argv)
+    sizes = [int(size) for size in args.sizes.split(',') if size.strip()]
+    benchmark = PerformanceBenchmark(scaling_sizes=sizes)
+    
+    if args.scaling_only:
+        print("📊 Graph Build Scaling (time + RSS)")
+        benchmark.benchmark_build_scaling()
+        print()
+        benchmark.print_scaling_summary()
+        return 0
     
     try:
         # Run all benchmarks
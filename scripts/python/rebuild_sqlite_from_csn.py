@@ -14,7 +14,6 @@ Key features:
 - Matches HANA Cloud's data product organization
 """
 
-import json
 import sqlite3
 import sys
 from pathlib import Path
@@ -25,6 +24,9 @@ import re
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
+from core.services.csn_stream_reader import iter_csn_entities
+from core.services.database_connection_factory import enable_wal
+
 
 def extract_product_name_from_filename(filename: str) -> str:
     """
@@ -116,74 +118,63 @@ def create_tables(cursor: sqlite3.Cursor):
     print("✓ Created tables: data_products, tables, columns")
 
 
-def process_csn_file(filepath: Path, cursor: sqlite3.Cursor, conn: sqlite3.Connection):
+def upsert_data_product(cursor: sqlite3.Cursor, product_name: str, namespace: str, filename: str) -> int:
     """
-    Process a single CSN file and insert data into SQLite.
+    Insert or update a data product row.
     
     Args:
-        filepath: Path to CSN JSON file
         cursor: SQLite cursor
-        conn: SQLite connection
+        product_name: Data product name
+        namespace: CSN namespace of the product's entities
+        filename: Source CSN filename
+        
+    Returns:
+        Data product ID
     """
-    print(f"\nProcessing: {filepath.name}")
-    
-    # Extract data product name from filename
-    product_name = extract_product_name_from_filename(filepath.name)
-    
-    with open(filepath, 'r', encoding='utf-8') as f:
-        csn_data = json.load(f)
-    
-    # CSN files are arrays with single object
-    if isinstance(csn_data, list) and len(csn_data) > 0:
-        csn_data = csn_data[0]
-    
-    definitions = csn_data.get('definitions', {})
-    
-    if not definitions:
-        print(f"  ⚠ No definitions found in {filepath.name}")
-        return
-    
-    # Find the namespace from entity definitions
-    namespace = None
-    entity_count = 0
-    
-    for entity_name, entity_def in definitions.items():
-        if entity_def.get('kind') == 'entity':
-            if namespace is None:
-                namespace = extract_namespace(entity_name)
-            entity_count += 1
-    
-    if not namespace:
-        print(f"  ⚠ No namespace found in {filepath.name}")
-        return
-    
-    print(f"  Data Product: {product_name}")
-    print(f"  Namespace: {namespace}")
-    print(f"  Entities: {entity_count}")
-    
-    # Insert or update data product
     cursor.execute("""
         INSERT INTO data_products (name, namespace, description)
         VALUES (?, ?, ?)
         ON CONFLICT(name) DO UPDATE SET
             namespace = excluded.namespace,
             description = excluded.description
-    """, (product_name, namespace, f"Data product from {filepath.name}"))
+    """, (product_name, namespace, f"Data product from {filename}"))
     
     product_id = cursor.lastrowid
     if product_id == 0:
         # Get existing product ID
         cursor.execute("SELECT id FROM data_products WHERE name = ?", (product_name,))
         product_id = cursor.fetchone()[0]
+    return product_id
+
+
+def process_csn_file(filepath: Path, cursor: sqlite3.Cursor, conn: sqlite3.Connection):
+    """
+    Process a single CSN file and insert data into SQLite.
     
-    # Process entities (tables)
+    Args:
+        filepath: Path to CSN JSON file
+        cursor: SQLite cursor
+        conn: SQLite connection
+    """
+    print(f"\nProcessing: {filepath.name}")
+    
+    # Extract data product name from filename
+    product_name = extract_product_name_from_filename(filepath.name)
+    
+    # Entities are streamed one at a time (CSN exports can be tens of MB)
+    namespace = None
+    product_id = None
     tables_added = 0
     columns_added = 0
     
-    for entity_name, entity_def in definitions.items():
-        # Skip context definitions, only process entities
-        if entity_def.get('kind') != 'entity':
-            continue
+    for entity_name, entity_def in iter_csn_entities(filepath):
+        if product_id is None:
+            # Namespace of the first entity identifies the data product
+            namespace = extract_namespace(entity_name)
+            if not namespace:
+                print(f"  ⚠ No namespace found in {filepath.name}")
+                return
+            product_id = upsert_data_product(cursor, product_name, namespace, filepath.name)
         
         # Extract table name (without namespace)
         table_name = entity_name.split('.')[-1] if '.' in entity_name else entity_name
@@ -230,7 +221,14 @@ def process_csn_file(filepath: Path, cursor: sqlite3.Cursor, conn: sqlite3.Conne
             
             columns_added += 1
     
+    if product_id is None:
+        print(f"  ⚠ No entities found in {filepath.name}")
+        return
+    
     conn.commit()
+    print(f"  Data Product: {product_name}")
+    print(f"  Namespace: {namespace}")
+    print(f"  Entities: {tables_added}")
     print(f"  ✓ Added {tables_added} tables, {columns_added} columns")
 
 
@@ -334,6 +332,10 @@ def main():
     
     finally:
         conn.close()
+    
+    # Pooled read-only connections never change the journal mode
+    if enable_wal(str(db_path)):
+        print("✓ Journal mode: WAL")
 
 
 if __name__ == '__main__':
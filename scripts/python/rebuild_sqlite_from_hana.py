@@ -40,6 +40,7 @@ PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
 from core.services.csn_parser import CSNParser
+from core.services.database_connection_factory import enable_wal
 from core.services.database_path_helper import get_database_path
 
 # Configure logging
@@ -231,6 +232,11 @@ class SQLiteRebuilder:
             self._create_metadata_table(hana_structure)
             
             self.conn.commit()
+            self.conn.close()
+            self.conn = None
+            
+            # Pooled read-only connections never change the journal mode
+            enable_wal(str(self.sqlite_path))
             logger.info("✅ SQLite database rebuilt successfully")
             
             return True
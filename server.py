@@ -46,9 +46,11 @@ def configure_data_products_v2(app):
     """
     from modules.data_products_v2.repositories.sqlite_data_product_repository import SQLiteDataProductRepository
     from modules.data_products_v2.repositories.hana_data_product_repository import HANADataProductRepository
+    from modules.data_products_v2.repositories.caching_data_product_repository import CachingDataProductRepository
     from modules.data_products_v2.facade.data_products_facade import DataProductsFacade
     from modules.data_products_v2.backend.api import DataProductsV2API, create_blueprint
     from core.services.database_path_helper import get_database_path
+    from core.services.sql_result_cache import SQLResultCache
     
     # 1. Create repositories (leaf dependencies)
     sqlite_repo = SQLiteDataProductRepository(db_path=get_database_path('p2p_data'))
@@ -77,17 +79,40 @@ def configure_data_products_v2(app):
     else:
         print("⚠️  HANA credentials not found in .env - HANA data source disabled")
     
-    # 2. Create facades (middle layer) with injected repositories
+    # 2. Wrap repositories with metadata cache (catalog browsing is the hottest path)
+    #    SQLite: invalidated by file identity + PRAGMA data_version
+    #    HANA: no cheap change signal, entries expire after a TTL
+    #    execute_sql results (AI-generated SELECTs) share one byte-bounded result cache
+    sql_result_cache = SQLResultCache(
+        max_bytes=int(float(os.getenv('SQL_RESULT_CACHE_MAX_MB', 64)) * 1024 * 1024),
+        ttl_seconds=float(os.getenv('HANA_SQL_RESULT_CACHE_TTL', 120)),
+        enabled=os.getenv('SQL_RESULT_CACHE_ENABLED', 'true').lower() == 'true'
+    )
+    app.config['SQL_RESULT_CACHE'] = sql_result_cache
+    
+    sqlite_repo = CachingDataProductRepository(
+        sqlite_repo,
+        version_provider=sqlite_repo.get_data_version,
+        sql_cache=sql_result_cache
+    )
+    if hana_repo:
+        hana_repo = CachingDataProductRepository(
+            hana_repo,
+            ttl_seconds=float(os.getenv('HANA_METADATA_CACHE_TTL', 300)),
+            sql_cache=sql_result_cache
+        )
+    
+    # 3. Create facades (middle layer) with injected repositories
     sqlite_facade = DataProductsFacade(repository=sqlite_repo)
     hana_facade = DataProductsFacade(repository=hana_repo) if hana_repo else None
     
-    # 3. Create API instance (top layer) with injected facades
+    # 4. Create API instance (top layer) with injected facades
     api_instance = DataProductsV2API(
         sqlite_facade=sqlite_facade,
         hana_facade=hana_facade
     )
     
-    # 4. Create and register blueprint
+    # 5. Create and register blueprint
     blueprint = create_blueprint(api_instance)
     app.register_blueprint(blueprint, url_prefix='/api/data-products')
     
@@ -126,8 +151,13 @@ def configure_knowledge_graph_v2(app):
     """
     import json
     from pathlib import Path
-    from modules.knowledge_graph_v2.repositories import SqliteGraphCacheRepository
-    from modules.knowledge_graph_v2.services import GraphCacheService, SchemaGraphBuilderService
+    from modules.knowledge_graph_v2.repositories import (
+        SqliteGraphCacheRepository, SqliteGraphAnalyticsRepository, ColumnarGraphCacheRepository
+    )
+    from modules.knowledge_graph_v2.services import (
+        GraphCacheService, SchemaGraphBuilderService, SchemaGraphSnapshotStore,
+        GraphAnalyticsCache
+    )
     from modules.knowledge_graph_v2.facade import KnowledgeGraphFacadeV2
     from modules.knowledge_graph_v2.backend import KnowledgeGraphV2API, create_blueprint
     from core.services.csn_parser import CSNParser
@@ -147,18 +177,40 @@ def configure_knowledge_graph_v2(app):
     connection_factory = SqliteConnectionFactory(str(db_path))
     unit_of_work = SqliteUnitOfWork(connection_factory)
     cache_repo = SqliteGraphCacheRepository(connection_factory, unit_of_work)
+    # Columnar snapshots next to the database (read-optimized copy of the cache)
+    snapshot_config = config.get('snapshots', {})
+    snapshot_dir = db_path.parent / snapshot_config.get('directory', 'graph_snapshots')
+    snapshot_repo = ColumnarGraphCacheRepository(str(snapshot_dir)) if snapshot_config.get('enabled', True) else None
     
     # 2. MIDDLE: Create service dependencies
     csn_dir = Path('docs/csn')
     csn_parser = CSNParser(csn_dir)
-    schema_builder = SchemaGraphBuilderService(csn_parser)
+    schema_builder = SchemaGraphBuilderService(
+        csn_parser,
+        workers=config.get('schema_build', {}).get('workers', 1)
+    )
     cache_service = GraphCacheService(
         cache_repository=cache_repo,
-        schema_builder=schema_builder
+        schema_builder=schema_builder,
+        snapshot_repository=snapshot_repo
     )
+    # Process-level schema graph snapshot (built once, replaced on rebuild)
+    snapshot_store = SchemaGraphSnapshotStore()
     
     # 3. ANALYTICS: Create graph query engine (uses same database as cache)
-    graph_query_engine = NetworkXGraphQueryEngine(str(db_path))
+    graph_query_engine = NetworkXGraphQueryEngine(
+        str(db_path),
+        snapshot_dir=str(snapshot_dir) if snapshot_repo else None
+    )
+    # Analytics results: keyed by graph version, computed in the background,
+    # persisted in the graph database (survive restarts)
+    analytics_config = config.get('analytics', {})
+    analytics_cache = GraphAnalyticsCache(
+        repository=SqliteGraphAnalyticsRepository(connection_factory, unit_of_work),
+        version_provider=graph_query_engine.get_graph_version,
+        max_workers=analytics_config.get('workers', GraphAnalyticsCache.DEFAULT_WORKERS),
+        wait_seconds=analytics_config.get('wait_seconds', GraphAnalyticsCache.DEFAULT_WAIT_SECONDS)
+    )
     
     print(f"✅ knowledge_graph_v2 configured with database: {db_path}")
     
@@ -167,7 +219,9 @@ def configure_knowledge_graph_v2(app):
         cache_repository=cache_repo,
         cache_service=cache_service,
         schema_builder=schema_builder,
-        graph_query_engine=graph_query_engine
+        graph_query_engine=graph_query_engine,
+        snapshot_store=snapshot_store,
+        analytics_cache=analytics_cache
     )
     
     # 5. API: Create API instance with injected facade
@@ -201,6 +255,12 @@ def configure_ai_assistant(app, data_products_api):
     import json
     from pathlib import Path
     from modules.ai_assistant.backend.services.sql_execution_service import SQLExecutionService
+    from modules.ai_assistant.backend.services.async_runtime import get_async_runtime
+    from modules.ai_assistant.backend.services.tool_executor import ToolExecutor, set_tool_executor
+    from modules.ai_assistant.backend.services.schema_context_provider import (
+        SchemaContextProvider, set_schema_context_provider
+    )
+    from core.services.csn_parser import get_parser
     from core.services.database_path_helper import get_database_path
     
     # Load configuration from module.json
@@ -212,9 +272,11 @@ def configure_ai_assistant(app, data_products_api):
     #    This is the CORRECT approach - reuse existing facade infrastructure
     
     # 2. Create SQL execution service with simplified database path helper (MED-031)
+    #    Shares the SQL result cache created by configure_data_products_v2
     sql_service = SQLExecutionService(
         p2p_data_db=get_database_path('p2p_data'),
-        p2p_graph_db=get_database_path('p2p_graph')
+        p2p_graph_db=get_database_path('p2p_graph'),
+        result_cache=app.config.get('SQL_RESULT_CACHE')
     )
     
     print(f"✅ ai_assistant configured with databases: p2p_data={get_database_path('p2p_data')}, p2p_graph={get_database_path('p2p_graph')}")
@@ -223,6 +285,37 @@ def configure_ai_assistant(app, data_products_api):
     app.config['AI_ASSISTANT_SQL_SERVICE'] = sql_service
     app.config['AI_ASSISTANT_DATA_PRODUCTS_API'] = data_products_api  # NEW: Use API for datasource switching
     
+    # 4. Chat streaming: SSE heartbeat interval and per-stream chunk buffer
+    module_config = config.get('configuration', {})
+    app.config['AI_ASSISTANT_STREAM_HEARTBEAT_SECONDS'] = module_config.get('stream_heartbeat_seconds', 15)
+    app.config['AI_ASSISTANT_STREAM_QUEUE_SIZE'] = module_config.get('stream_queue_size', 64)
+    
+    # 5. Shared event loop thread for all agent calls (keeps LLM HTTP connections alive)
+    app.config['AI_ASSISTANT_ASYNC_RUNTIME'] = get_async_runtime()
+    
+    # 6. Blocking tool calls (sqlite3/hdbcli): per-datasource thread pools with timeouts
+    tool_concurrency = dict(module_config.get('tool_concurrency', {}))
+    set_tool_executor(ToolExecutor(
+        default_concurrency=tool_concurrency.pop('default', 4),
+        concurrency_limits=tool_concurrency,
+        timeout=module_config.get('tool_timeout_seconds', 30)
+    ))
+    
+    # 7. Pre-rendered schema context for the agent prompt (no catalog query per message)
+    #    Built once from catalog + CSN + knowledge graph, refreshed in the background after the TTL
+    schema_context = SchemaContextProvider(
+        csn_parser=get_parser(),
+        ontology_db_path=get_database_path('p2p_graph'),
+        token_budget=module_config.get('schema_context_token_budget', 1200),
+        ttl_seconds=module_config.get('schema_context_ttl_seconds', 600)
+    )
+    set_schema_context_provider(schema_context)
+    app.config['AI_ASSISTANT_SCHEMA_CONTEXT'] = schema_context
+    try:
+        schema_context.warm('hana', data_products_api.get_facade('hana'))
+    except ValueError:
+        pass  # HANA not configured - nothing to pre-render
+    
     print("✅ ai_assistant module configured with Dependency Injection")
     return sql_service
 
@@ -0,0 +1,139 @@
+"""
+Tests for the shared AI assistant event loop (AsyncRuntime)
+
+Following Gu Wu standards:
+- AAA pattern (Arrange, Act, Assert)
+- pytest markers
+- Descriptive docstrings
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from modules.ai_assistant.backend.services.async_runtime import AsyncRuntime
+
+
+@pytest.fixture
+def runtime():
+    """Started runtime with a fast lag probe"""
+    runtime = AsyncRuntime(probe_interval=0.02)
+    runtime.start()
+    yield runtime
+    runtime.stop()
+
+
+@pytest.mark.unit
+class TestAsyncRuntime:
+    """Coroutines from request threads share one long-lived loop"""
+
+    def test_all_calls_run_on_the_same_loop(self, runtime):
+        """
+        Test: consecutive and concurrent calls run on one loop (connection pools survive)
+        """
+        # ARRANGE
+        async def current_loop():
+            await asyncio.sleep(0.01)
+            return asyncio.get_running_loop()
+
+        loops = []
+
+        def request_thread():
+            loops.append(runtime.run(current_loop()))
+
+        # ACT
+        threads = [threading.Thread(target=request_thread) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        loops.append(runtime.run(current_loop()))
+
+        # ASSERT
+        assert len(loops) == 6
+        assert all(loop is runtime.loop for loop in loops)
+        assert not runtime.loop.is_closed()
+
+    def test_exceptions_are_reraised(self, runtime):
+        """
+        Test: a failing coroutine raises in the caller and is counted
+        """
+        # ARRANGE
+        async def failing():
+            raise ValueError('model unavailable')
+
+        # ACT
+        with pytest.raises(ValueError, match='model unavailable'):
+            runtime.run(failing())
+
+        # ASSERT
+        assert runtime.stats()['failed_total'] == 1
+
+    def test_timeout_cancels_coroutine(self, runtime):
+        """
+        Test: run() with timeout cancels the coroutine on the loop
+        """
+        # ARRANGE
+        cancelled = threading.Event()
+
+        async def slow():
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        # ACT
+        with pytest.raises(TimeoutError):
+            runtime.run(slow(), timeout=0.05)
+
+        # ASSERT
+        assert cancelled.wait(1)
+
+    def test_stats_report_in_flight_and_loop_lag(self, runtime):
+        """
+        Test: in-flight submissions and loop lag from a blocking coroutine are reported
+        """
+        # ARRANGE
+        release = threading.Event()
+
+        async def waiting():
+            while not release.is_set():
+                await asyncio.sleep(0.01)
+
+        async def blocking():
+            time.sleep(0.2)  # Blocks the loop on purpose
+
+        # ACT
+        future = runtime.submit(waiting())
+        in_flight = runtime.stats()['in_flight_submissions']
+        release.set()
+        future.result(1)
+        runtime.run(blocking())
+        time.sleep(0.1)
+        stats = runtime.stats()
+
+        # ASSERT
+        assert in_flight == 1
+        assert stats['in_flight_submissions'] == 0
+        assert stats['submitted_total'] == 2
+        assert stats['max_loop_lag_ms'] >= 100
+        assert stats['running'] is True
+
+    def test_stop_shuts_down_loop(self):
+        """
+        Test: stop() ends the loop thread and closes the loop
+        """
+        # ARRANGE
+        runtime = AsyncRuntime()
+        runtime.start()
+        loop = runtime.loop
+
+        # ACT
+        runtime.stop()
+
+        # ASSERT
+        assert not runtime.is_running
+        assert loop.is_closed()
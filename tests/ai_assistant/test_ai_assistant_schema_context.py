@@ -0,0 +1,208 @@
+"""
+Tests for the pre-rendered schema context of the agent prompt
+
+Following Gu Wu standards:
+- AAA pattern (Arrange, Act, Assert)
+- pytest markers
+- Descriptive docstrings
+"""
+
+import json
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from core.interfaces.data_product_repository import DataProduct, Table
+from core.services.csn_parser import CSNParser
+from modules.ai_assistant.backend.services.schema_context_provider import SchemaContextProvider
+
+
+def product(name, display_name):
+    """HANA-style data product"""
+    return DataProduct(name, display_name, 'sap.s4com', 'v1', name, 'hana', '', 'SAP', 'N/A', 1)
+
+
+@pytest.fixture
+def csn_parser(tmp_path):
+    """CSN metadata for SupplierInvoice with amount semantics"""
+    definitions = {
+        'supplierinvoice.SupplierInvoice': {
+            'kind': 'entity',
+            '@EndUserText.label': 'Supplier Invoice',
+            'elements': {
+                'SupplierInvoice': {'key': True, 'type': 'cds.String'},
+                'FiscalYear': {'key': True, 'type': 'cds.String'},
+                'InvoiceGrossAmount': {
+                    'type': 'cds.Decimal',
+                    '@Semantics.amount.currencyCode': {'=': 'DocumentCurrency'}
+                },
+                'DocumentCurrency': {'type': 'cds.String', '@Semantics.currencyCode': True}
+            }
+        }
+    }
+    directory = tmp_path / 'csn'
+    directory.mkdir()
+    (directory / 'Supplier_Invoice_CSN.json').write_text(json.dumps([{'definitions': definitions}]))
+    return CSNParser(str(directory), persist_index=False)
+
+
+@pytest.fixture
+def repository():
+    """HANA facade stand-in with two data products"""
+    repo = Mock(spec=['get_data_products', 'get_tables_in_product'])
+    repo.get_data_products.return_value = [
+        product('P2P_DATAPRODUCT_sap_bdc_SupplierInvoice_V1', 'Supplier Invoice'),
+        product('P2P_DATAPRODUCT_sap_bdc_Supplier_V1', 'Supplier')
+    ]
+    repo.get_tables_in_product.side_effect = lambda name: (
+        [Table('supplierinvoice.SupplierInvoice', 'TABLE', 10, name)] if 'SupplierInvoice' in name else []
+    )
+    return repo
+
+
+@pytest.mark.unit
+class TestSchemaContextProvider:
+    """Schema fragment is built once and served from memory"""
+
+    def test_fragment_lists_tables_and_csn_details(self, csn_parser, repository):
+        """
+        Test: table names, keys, columns and semantic hints end up in the fragment
+        """
+        # ARRANGE
+        provider = SchemaContextProvider(csn_parser=csn_parser)
+
+        # ACT
+        fragment = provider.get_context('hana', repository)
+
+        # ASSERT
+        assert '**IMPORTANT: HANA Cloud Data Source Active**' in fragment
+        assert '- Supplier Invoice: P2P_DATAPRODUCT_sap_bdc_SupplierInvoice_V1' in fragment
+        assert 'keys SupplierInvoice, FiscalYear' in fragment
+        assert 'InvoiceGrossAmount=amount in DocumentCurrency' in fragment
+        assert fragment.rstrip().endswith('ALWAYS use the full table names shown above.')
+
+    def test_repeated_messages_skip_catalog_queries(self, csn_parser, repository):
+        """
+        Test: only the first message queries the catalog
+        """
+        # ARRANGE
+        provider = SchemaContextProvider(csn_parser=csn_parser)
+
+        # ACT
+        fragments = {provider.get_context('hana', repository) for _ in range(5)}
+
+        # ASSERT
+        assert len(fragments) == 1
+        assert repository.get_data_products.call_count == 1
+        assert provider.get_stats()['hits'] == 4
+
+    def test_fragment_respects_token_budget(self, repository):
+        """
+        Test: many data products are cut to the budget, footer is kept
+        """
+        # ARRANGE
+        repository.get_data_products.return_value = [
+            product(f'P2P_DATAPRODUCT_sap_bdc_Product{i}_V1', f'Product {i}') for i in range(200)
+        ]
+        provider = SchemaContextProvider(token_budget=150)
+
+        # ACT
+        fragment = provider.get_context('hana', repository)
+
+        # ASSERT
+        assert len(fragment) <= 150 * SchemaContextProvider.CHARS_PER_TOKEN + 40
+        assert 'more data products' in fragment
+        assert 'ALWAYS use the full table names' in fragment
+
+    def test_version_change_rebuilds(self, repository):
+        """
+        Test: a datasource with version provider rebuilds when the version changes
+        """
+        # ARRANGE
+        version = [1]
+        provider = SchemaContextProvider(version_providers={'hana': lambda: version[0]})
+        provider.get_context('hana', repository)
+
+        # ACT
+        provider.get_context('hana', repository)
+        version[0] = 2
+        provider.get_context('hana', repository)
+
+        # ASSERT
+        assert repository.get_data_products.call_count == 2
+
+    def test_expired_fragment_served_while_refreshing(self, repository):
+        """
+        Test: after the TTL the stale fragment is returned and rebuilt in the background
+        """
+        # ARRANGE
+        provider = SchemaContextProvider(ttl_seconds=0)
+        first = provider.get_context('hana', repository)
+
+        # ACT
+        stale = provider.get_context('hana', repository)
+        deadline = time.monotonic() + 2
+        while repository.get_data_products.call_count < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        # ASSERT
+        assert stale == first
+        assert repository.get_data_products.call_count == 2
+
+    def test_catalog_failure_keeps_last_good_fragment(self, repository):
+        """
+        Test: a failed rebuild does not wipe the previous fragment
+        """
+        # ARRANGE
+        version = [1]
+        provider = SchemaContextProvider(version_providers={'hana': lambda: version[0]})
+        good = provider.get_context('hana', repository)
+        repository.get_data_products.side_effect = RuntimeError('HANA unavailable')
+        version[0] = 2
+
+        # ACT
+        fragment = provider.get_context('hana', repository)
+
+        # ASSERT
+        assert fragment == good
+        assert provider.get_stats()['build_errors'] == 1
+
+    def test_failed_first_build_is_retried(self, repository):
+        """
+        Test: a failed build without previous fragment is not cached
+        """
+        # ARRANGE
+        provider = SchemaContextProvider()
+        repository.get_data_products.side_effect = RuntimeError('HANA unavailable')
+        provider.warm('hana', repository, background=False)
+        repository.get_data_products.side_effect = None
+
+        # ACT
+        fragment = provider.get_context('hana', repository)
+
+        # ASSERT
+        assert 'Available HANA tables' in fragment
+        assert repository.get_data_products.call_count == 2
+
+    def test_failed_rebuild_is_retried_in_background(self, repository):
+        """
+        Test: the kept fragment is expired, so the next message retries the build
+        """
+        # ARRANGE
+        version = [1]
+        provider = SchemaContextProvider(version_providers={'hana': lambda: version[0]})
+        provider.get_context('hana', repository)
+        repository.get_data_products.side_effect = RuntimeError('HANA unavailable')
+        version[0] = 2
+        provider.get_context('hana', repository)
+        repository.get_data_products.side_effect = None
+
+        # ACT
+        provider.get_context('hana', repository)
+        deadline = time.monotonic() + 2
+        while provider.get_stats()['background_refreshes'] < 1 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        # ASSERT
+        assert repository.get_data_products.call_count == 3
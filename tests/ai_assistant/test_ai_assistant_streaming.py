@@ -0,0 +1,219 @@
+"""
+Tests for incremental SSE streaming of /api/ai-assistant/chat/stream
+
+Runs the real JouleAgent.process_message_stream against a stubbed
+streaming model (pydantic-ai FunctionModel with delays between chunks)
+and checks that the first delta reaches the client long before the
+answer is complete, heartbeats fill idle gaps and a disconnect cancels
+the model stream.
+
+Following Gu Wu standards:
+- AAA pattern (Arrange, Act, Assert)
+- pytest markers
+- Descriptive docstrings
+"""
+
+import asyncio
+import json
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+from flask import Flask
+from pydantic_ai import Agent
+from pydantic_ai.models.function import FunctionModel
+
+from modules.ai_assistant.backend import api as ai_assistant_api
+from modules.ai_assistant.backend.services.agent_service import JouleAgent
+from modules.ai_assistant.backend.services.stream_bridge import AsyncStreamBridge, HEARTBEAT
+from modules.ai_assistant.backend.services.tool_executor import ToolExecutor
+
+
+CHUNKS = ['Open ', 'purchase ', 'orders: ', '42', '.']
+CHUNK_DELAY = 0.2
+
+
+class StubModel:
+    """Streaming model stand-in: yields CHUNKS with a delay before each"""
+
+    def __init__(self, first_delay=CHUNK_DELAY):
+        self.first_delay = first_delay
+        self.cancelled = threading.Event()
+        self.chunks_sent = 0
+
+    async def stream(self, messages, info):
+        try:
+            for i, chunk in enumerate(CHUNKS):
+                await asyncio.sleep(self.first_delay if i == 0 else CHUNK_DELAY)
+                self.chunks_sent += 1
+                yield chunk
+        except (asyncio.CancelledError, GeneratorExit):
+            self.cancelled.set()
+            raise
+
+
+def make_agent(model):
+    """JouleAgent whose streaming agent runs on the stub model"""
+    agent = JouleAgent.__new__(JouleAgent)
+    agent.streaming_agent = Agent(FunctionModel(stream_function=model.stream))
+    agent.tool_executor = ToolExecutor()
+    return agent
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """Flask test client for the ai_assistant blueprint"""
+    app = Flask(__name__)
+    app.config['AI_ASSISTANT_SQL_SERVICE'] = Mock()
+    app.config['AI_ASSISTANT_DATA_PRODUCTS_API'] = Mock()
+    app.config['AI_ASSISTANT_STREAM_HEARTBEAT_SECONDS'] = 0.05
+    app.register_blueprint(ai_assistant_api.blueprint)
+    return app.test_client()
+
+
+def stream_chat(client):
+    """POST a chat message and return the unbuffered streaming response"""
+    return client.post(
+        '/api/ai-assistant/chat/stream',
+        json={'message': 'How many open purchase orders?', 'context': {'datasource': 'p2p_data'}},
+        buffered=False
+    )
+
+
+def timed_events(response):
+    """(seconds since start, SSE line) for every non-empty line of the stream"""
+    start = time.perf_counter()
+    for chunk in response.response:
+        text = chunk.decode() if isinstance(chunk, bytes) else chunk
+        for line in text.split('\n'):
+            if line:
+                yield time.perf_counter() - start, line
+
+
+@pytest.mark.unit
+class TestIncrementalStreaming:
+    """Chunks are forwarded as they arrive"""
+
+    def test_time_to_first_delta_is_one_chunk(self, client, monkeypatch):
+        """
+        Test: the first delta arrives after ~one chunk delay, not the whole answer
+        """
+        # ARRANGE
+        model = StubModel()
+        monkeypatch.setattr(ai_assistant_api, 'get_joule_agent', lambda: make_agent(model))
+
+        # ACT
+        response = stream_chat(client)
+        events = list(timed_events(response))
+
+        # ASSERT
+        deltas = [(t, json.loads(line[6:])) for t, line in events
+                  if line.startswith('data: {') and '"delta"' in line]
+        first_delta, last_event = deltas[0][0], events[-1][0]
+        assert ''.join(event['content'] for _, event in deltas) == ''.join(CHUNKS)
+        assert first_delta < 2 * CHUNK_DELAY
+        assert last_event > (len(CHUNKS) - 1) * CHUNK_DELAY
+        assert events[-1][1] == 'data: [DONE]'
+        done = next(json.loads(line[6:]) for _, line in events if '"done"' in line)
+        assert done['response']['message'] == ''.join(CHUNKS)
+        assert done['conversation_id']
+
+    def test_heartbeats_fill_idle_gaps(self, client, monkeypatch):
+        """
+        Test: SSE comment heartbeats are sent while the model is silent
+        """
+        # ARRANGE
+        model = StubModel(first_delay=0.3)
+        monkeypatch.setattr(ai_assistant_api, 'get_joule_agent', lambda: make_agent(model))
+
+        # ACT
+        lines = [line for _, line in timed_events(stream_chat(client))]
+
+        # ASSERT
+        first_data = next(i for i, line in enumerate(lines) if line.startswith('data:'))
+        assert lines[:first_data].count(': heartbeat') >= 2
+
+    def test_disconnect_cancels_model_stream(self, client, monkeypatch):
+        """
+        Test: closing the response (client gone) cancels the model stream
+        """
+        # ARRANGE
+        model = StubModel()
+        monkeypatch.setattr(ai_assistant_api, 'get_joule_agent', lambda: make_agent(model))
+        response = stream_chat(client)
+
+        # ACT
+        for _, line in timed_events(response):
+            if '"delta"' in line:
+                break
+        response.close()
+
+        # ASSERT
+        assert model.cancelled.wait(2)
+        assert model.chunks_sent < len(CHUNKS)
+
+
+@pytest.mark.unit
+class TestAsyncStreamBridge:
+    """Bridge between an async generator and a sync iterator"""
+
+    def test_errors_are_reraised(self):
+        """
+        Test: an exception in the async generator surfaces in the iterator
+        """
+        # ARRANGE
+        async def failing():
+            yield 1
+            raise RuntimeError('rate limit')
+
+        # ACT
+        bridge = AsyncStreamBridge(failing, heartbeat_interval=None)
+        received = []
+        with pytest.raises(RuntimeError, match='rate limit'):
+            for item in bridge:
+                received.append(item)
+
+        # ASSERT
+        assert received == [1]
+        assert bridge.wait_finished(1)
+
+    def test_bounded_queue_applies_back_pressure(self):
+        """
+        Test: the producer stops after max_queue_size unread chunks
+        """
+        # ARRANGE
+        produced = []
+
+        async def numbers():
+            for i in range(100):
+                produced.append(i)
+                yield i
+
+        # ACT
+        bridge = AsyncStreamBridge(numbers, max_queue_size=4, heartbeat_interval=None)
+        iterator = iter(bridge)
+        first = next(iterator)
+        time.sleep(0.1)
+
+        # ASSERT
+        assert first == 0
+        assert len(produced) <= 4 + 2
+        bridge.close()
+        assert bridge.wait_finished(1)
+
+    def test_heartbeat_sentinel(self):
+        """
+        Test: HEARTBEAT is yielded while waiting, then the chunk
+        """
+        # ARRANGE
+        async def slow():
+            await asyncio.sleep(0.2)
+            yield 'late'
+
+        # ACT
+        items = list(AsyncStreamBridge(slow, heartbeat_interval=0.05))
+
+        # ASSERT
+        assert items[-1] == 'late'
+        assert items.count(HEARTBEAT) >= 2
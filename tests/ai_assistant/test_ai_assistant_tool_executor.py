@@ -0,0 +1,136 @@
+"""
+Tests for the agent tool executor (blocking repository calls off the event loop)
+
+Following Gu Wu standards:
+- AAA pattern (Arrange, Act, Assert)
+- pytest markers
+- Descriptive docstrings
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from modules.ai_assistant.backend.services.tool_executor import ToolExecutor
+
+
+CALL_SECONDS = 0.2
+
+
+class BlockingRepository:
+    """Repository stand-in whose calls block like sqlite3/hdbcli"""
+
+    def __init__(self):
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def execute_sql(self, sql_query):
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(CALL_SECONDS)
+        with self._lock:
+            self.active -= 1
+        return {"success": True, "rows": [{"sql": sql_query}]}
+
+
+@pytest.fixture
+def executor():
+    """Executor with a tight HANA limit"""
+    executor = ToolExecutor(default_concurrency=4, concurrency_limits={'hana': 1}, timeout=5)
+    yield executor
+    executor.shutdown()
+
+
+@pytest.mark.unit
+class TestToolExecutor:
+    """Blocking tool calls run concurrently within per-datasource limits"""
+
+    def test_multi_tool_turn_runs_concurrently(self, executor):
+        """
+        Test: three tool calls in one turn overlap instead of running one after another
+        """
+        # ARRANGE
+        repository = BlockingRepository()
+
+        async def turn():
+            return await asyncio.gather(*[
+                executor.run('p2p_data', repository.execute_sql, f"SELECT {i}") for i in range(3)
+            ])
+
+        # ACT
+        start = time.perf_counter()
+        results = asyncio.run(turn())
+        elapsed = time.perf_counter() - start
+
+        # ASSERT
+        assert [r['rows'][0]['sql'] for r in results] == ['SELECT 0', 'SELECT 1', 'SELECT 2']
+        assert repository.max_active == 3
+        assert elapsed < 2 * CALL_SECONDS
+
+    def test_datasource_limit_is_respected(self, executor):
+        """
+        Test: a datasource limited to 1 runs its calls one at a time
+        """
+        # ARRANGE
+        repository = BlockingRepository()
+
+        async def turn():
+            await asyncio.gather(*[executor.run('hana', repository.execute_sql, 'SELECT 1') for _ in range(2)])
+
+        # ACT
+        asyncio.run(turn())
+
+        # ASSERT
+        assert repository.max_active == 1
+
+    def test_event_loop_stays_responsive(self, executor):
+        """
+        Test: the loop keeps ticking while a blocking call runs
+        """
+        # ARRANGE
+        repository = BlockingRepository()
+        ticks = []
+
+        async def ticker():
+            while True:
+                ticks.append(time.perf_counter())
+                await asyncio.sleep(0.01)
+
+        async def turn():
+            task = asyncio.create_task(ticker())
+            await executor.run('p2p_data', repository.execute_sql, 'SELECT 1')
+            task.cancel()
+
+        # ACT
+        asyncio.run(turn())
+
+        # ASSERT
+        assert len(ticks) >= 5
+        assert max(b - a for a, b in zip(ticks, ticks[1:])) < CALL_SECONDS / 2
+
+    def test_call_timeout(self, executor):
+        """
+        Test: a call exceeding its timeout raises TimeoutError
+        """
+        # ARRANGE
+        repository = BlockingRepository()
+
+        # ACT / ASSERT
+        with pytest.raises(TimeoutError, match="execute_sql on 'p2p_data'"):
+            asyncio.run(executor.run('p2p_data', repository.execute_sql, 'SELECT 1', timeout=0.05))
+
+    def test_errors_are_reraised(self, executor):
+        """
+        Test: exceptions from the blocking call reach the tool
+        """
+        # ARRANGE
+        def failing():
+            raise RuntimeError('connection lost')
+
+        # ACT / ASSERT
+        with pytest.raises(RuntimeError, match='connection lost'):
+            asyncio.run(executor.run('hana', failing))
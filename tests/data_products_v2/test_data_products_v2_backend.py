@@ -15,12 +15,16 @@ Endpoints Tested:
 - GET  /api/data-products/{product}/tables  - Get tables
 - GET  /api/data-products/{product}/{table}/structure - Get structure
 - POST /api/data-products/{product}/{table}/query - Query data
+- GET  /api/data-products/{product}/{table}/export - Stream table (NDJSON/CSV)
+- GET  /api/data-products/cache/status - Metadata cache hit ratios
+- DELETE /api/data-products/cache - Invalidate metadata cache
 
 Author: P2P Development Team
 Date: 2026-02-15
 Version: 1.0.0
 """
 
+import json
 import pytest
 import requests
 import time
@@ -272,6 +276,150 @@ def test_query_table_contract(flask_server, test_timeout):
     assert 'executionTime' in data, "Response missing 'executionTime' field"
 
 
+@pytest.mark.e2e
+@pytest.mark.api_contract
+def test_query_table_cursor_pagination_contract(flask_server, test_timeout):
+    """
+    Test: POST /api/data-products/{product}/{table}/query with "cursor" uses keyset pagination
+    
+    Validates:
+    - First page (cursor=null) returns nextCursor/hasMore
+    - Following the cursor returns the next rows without overlap
+    - Garbage cursor returns HTTP 400 INVALID_CURSOR
+    """
+    # ARRANGE
+    list_response = requests.get(f"{flask_server}{API_PREFIX}/", params={"source": "sqlite"}, timeout=test_timeout)
+    if list_response.json().get('count', 0) == 0:
+        pytest.skip("No products available")
+    product_name = list_response.json()['data_products'][0]['product_name']
+    
+    tables_url = f"{flask_server}{API_PREFIX}/{product_name}/tables"
+    tables_response = requests.get(tables_url, params={"source": "sqlite"}, timeout=test_timeout)
+    if tables_response.json().get('count', 0) == 0:
+        pytest.skip("No tables available")
+    table_name = tables_response.json()['tables'][0]['table_name']
+    query_url = f"{flask_server}{API_PREFIX}/{product_name}/{table_name}/query"
+    
+    # ACT
+    first = requests.post(
+        query_url, json={"limit": 2, "cursor": None}, params={"source": "sqlite"}, timeout=test_timeout
+    )
+    
+    # ASSERT
+    assert first.status_code == 200, f"Expected 200, got {first.status_code}"
+    first_data = first.json()
+    assert first_data['success'] is True
+    assert 'nextCursor' in first_data, "Cursor mode response missing 'nextCursor'"
+    assert 'hasMore' in first_data, "Cursor mode response missing 'hasMore'"
+    assert len(first_data['rows']) <= 2
+    
+    if first_data['hasMore']:
+        second = requests.post(
+            query_url,
+            json={"limit": 2, "cursor": first_data['nextCursor']},
+            params={"source": "sqlite"},
+            timeout=test_timeout
+        )
+        assert second.status_code == 200
+        second_data = second.json()
+        assert second_data['rows'], "Next page should not be empty when hasMore is true"
+        assert second_data['rows'][0] not in first_data['rows'], "Pages must not overlap"
+        assert second_data['totalCount'] == first_data['totalCount']
+    
+    bad = requests.post(
+        query_url, json={"limit": 2, "cursor": "not-a-cursor"}, params={"source": "sqlite"}, timeout=test_timeout
+    )
+    assert bad.status_code == 400
+    assert bad.json()['error']['code'] == 'INVALID_CURSOR'
+
+
+@pytest.mark.e2e
+@pytest.mark.api_contract
+def test_export_table_streaming_contract(flask_server, test_timeout):
+    """
+    Test: GET /api/data-products/{product}/{table}/export streams the table
+    
+    Validates:
+    - CSV export starts with the column header row
+    - NDJSON export has one JSON object per line
+    - Unknown format returns HTTP 400
+    """
+    # ARRANGE
+    list_response = requests.get(f"{flask_server}{API_PREFIX}/", params={"source": "sqlite"}, timeout=test_timeout)
+    if list_response.json().get('count', 0) == 0:
+        pytest.skip("No products available")
+    product_name = list_response.json()['data_products'][0]['product_name']
+    
+    tables_url = f"{flask_server}{API_PREFIX}/{product_name}/tables"
+    tables_response = requests.get(tables_url, params={"source": "sqlite"}, timeout=test_timeout)
+    if tables_response.json().get('count', 0) == 0:
+        pytest.skip("No tables available")
+    table_name = tables_response.json()['tables'][0]['table_name']
+    export_url = f"{flask_server}{API_PREFIX}/{product_name}/{table_name}/export"
+    
+    structure_url = f"{flask_server}{API_PREFIX}/{product_name}/{table_name}/structure"
+    structure = requests.get(structure_url, params={"source": "sqlite"}, timeout=test_timeout).json()
+    
+    # ACT
+    csv_response = requests.get(
+        export_url, params={"source": "sqlite", "format": "csv"}, stream=True, timeout=test_timeout
+    )
+    ndjson_response = requests.get(export_url, params={"source": "sqlite", "batch_size": 50}, timeout=test_timeout)
+    bad_response = requests.get(export_url, params={"source": "sqlite", "format": "xml"}, timeout=test_timeout)
+    
+    # ASSERT
+    assert csv_response.status_code == 200, f"Expected 200, got {csv_response.status_code}"
+    assert csv_response.headers['Content-Type'].startswith('text/csv')
+    header = next(csv_response.iter_lines(decode_unicode=True))
+    assert header.split(',') == [col['column_name'] for col in structure['columns']]
+    
+    assert ndjson_response.status_code == 200
+    assert ndjson_response.headers['Content-Type'].startswith('application/x-ndjson')
+    for line in ndjson_response.text.splitlines():
+        assert isinstance(json.loads(line), dict), "Each NDJSON line must be an object"
+    
+    assert bad_response.status_code == 400
+
+
+@pytest.mark.e2e
+@pytest.mark.api_contract
+def test_metadata_cache_status_contract(flask_server, test_timeout):
+    """
+    Test: GET /api/data-products/cache/status reports metadata cache hit ratios
+    
+    Validates:
+    - Repeated catalog browsing is served from cache (hits increase)
+    - SQLite connection pool counters are reported per database file
+    - DELETE /api/data-products/cache invalidates entries
+    """
+    # ARRANGE
+    list_url = f"{flask_server}{API_PREFIX}/"
+    status_url = f"{flask_server}{API_PREFIX}/cache/status"
+    requests.get(list_url, params={"source": "sqlite"}, timeout=test_timeout)
+    before = requests.get(status_url, timeout=test_timeout).json()['caches']['sqlite']
+    
+    # ACT
+    requests.get(list_url, params={"source": "sqlite"}, timeout=test_timeout)
+    response = requests.get(status_url, timeout=test_timeout)
+    delete_response = requests.delete(
+        f"{flask_server}{API_PREFIX}/cache", params={"source": "sqlite"}, timeout=test_timeout
+    )
+    
+    # ASSERT
+    assert response.status_code == 200
+    data = response.json()
+    assert data['success'] is True
+    sqlite_stats = data['caches']['sqlite']
+    for field in ('hit_ratio', 'hits', 'misses', 'size', 'max_entries', 'invalidation'):
+        assert field in sqlite_stats, f"Cache status missing '{field}'"
+    assert sqlite_stats['hits'] > before['hits'], "Repeated product list should hit the cache"
+    for pool_stats in data['connectionPools'].values():
+        assert 'hit_ratio' in pool_stats and 'open_connections' in pool_stats
+    
+    assert delete_response.status_code == 200
+    assert delete_response.json()['invalidated']['sqlite'] >= 1
+
+
 @pytest.mark.e2e
 @pytest.mark.api_contract
 def test_api_performance(flask_server, test_timeout):
@@ -0,0 +1,143 @@
+"""
+API Contract Tests for Knowledge Graph V2 Path Search Endpoint
+
+Tests GET /api/knowledge-graph/paths following Gu Wu API contract testing
+methodology. Tests the contract, trusts the implementation.
+"""
+import pytest
+import requests
+
+
+# ============================================================================
+# Configuration
+# ============================================================================
+
+BASE_URL = "http://localhost:5000"
+API_PREFIX = "/api/knowledge-graph"
+
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+@pytest.fixture
+def paths_url():
+    """URL of the path search endpoint"""
+    return f"{BASE_URL}{API_PREFIX}/paths"
+
+
+@pytest.fixture
+def connected_pair():
+    """Source/target of an edge in the schema graph (product contains table)"""
+    response = requests.get(f"{BASE_URL}{API_PREFIX}/schema", timeout=30)
+    edges = response.json()['data']['graph']['edges']
+    edge = next(e for e in edges if e['source_id'].startswith('product-'))
+    return edge['source_id'], edge['target_id']
+
+
+# ============================================================================
+# API Contract Tests
+# ============================================================================
+
+@pytest.mark.e2e
+@pytest.mark.api_contract
+def test_paths_between_connected_nodes(paths_url, connected_pair):
+    """
+    Test: GET /paths for two adjacent nodes
+    
+    Contract:
+    - Returns 200 status
+    - data.paths is a list of paths with nodes, edges and length
+    - The shortest path has length 1
+    """
+    # ARRANGE
+    source, target = connected_pair
+    
+    # ACT
+    response = requests.get(paths_url, params={'source': source, 'target': target, 'k': 2}, timeout=10)
+    
+    # ASSERT
+    assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+    data = response.json()
+    assert data['success'] is True
+    assert data['data']['path_count'] >= 1
+    path = data['data']['paths'][0]
+    assert path['length'] == 1
+    assert path['nodes'][0]['id'] == source
+    assert path['nodes'][-1]['id'] == target
+
+
+@pytest.mark.e2e
+@pytest.mark.api_contract
+def test_paths_missing_parameters(paths_url):
+    """
+    Test: GET /paths without source/target
+    
+    Contract:
+    - Returns 400 status
+    """
+    # ACT
+    response = requests.get(paths_url, timeout=10)
+    
+    # ASSERT
+    assert response.status_code == 400, f"Expected 400, got {response.status_code}"
+    assert response.json()['success'] is False
+
+
+@pytest.mark.e2e
+@pytest.mark.api_contract
+def test_paths_invalid_bounds(paths_url, connected_pair):
+    """
+    Test: GET /paths with out-of-range max_hops / k
+    
+    Contract:
+    - Returns 400 status
+    """
+    # ARRANGE
+    source, target = connected_pair
+    
+    # ACT / ASSERT
+    for params in ({'max_hops': 0}, {'max_hops': 'many'}, {'k': 0}, {'k': 1000}):
+        response = requests.get(paths_url, params={'source': source, 'target': target, **params}, timeout=10)
+        assert response.status_code == 400, f"Expected 400 for {params}, got {response.status_code}"
+
+
+@pytest.mark.e2e
+@pytest.mark.api_contract
+def test_paths_unknown_node(paths_url, connected_pair):
+    """
+    Test: GET /paths with an unknown node
+    
+    Contract:
+    - Returns 404 status
+    """
+    # ARRANGE
+    source, _ = connected_pair
+    
+    # ACT
+    response = requests.get(paths_url, params={'source': source, 'target': 'no-such-node'}, timeout=10)
+    
+    # ASSERT
+    assert response.status_code == 404, f"Expected 404, got {response.status_code}"
+
+
+@pytest.mark.e2e
+@pytest.mark.api_contract
+def test_paths_edge_type_filter(paths_url, connected_pair):
+    """
+    Test: GET /paths with an edge type that is never used
+    
+    Contract:
+    - Returns 200 status with no paths
+    """
+    # ARRANGE
+    source, target = connected_pair
+    
+    # ACT
+    response = requests.get(
+        paths_url, params={'source': source, 'target': target, 'edge_types': 'no_such_type'}, timeout=10
+    )
+    
+    # ASSERT
+    assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+    assert response.json()['data']['paths'] == []
@@ -239,4 +239,29 @@ def test_schema_summary_performance():
     
     data = response.json()
     assert data['success'] is True
-    assert 'summary' in data['data']
\ No newline at end of file
+    assert 'summary' in data['data']
+
+
+@pytest.mark.e2e
+@pytest.mark.api_contract
+def test_schema_etag_not_modified():
+    """Test: Schema responses carry an ETag and If-None-Match returns 304"""
+    # ARRANGE
+    url = "http://localhost:5000/api/knowledge-graph/schema"
+    
+    # ACT
+    first = requests.get(url, timeout=30)
+    etag = first.headers.get('ETag')
+    second = requests.get(url, headers={'If-None-Match': etag}, timeout=10)
+    
+    # ASSERT
+    assert first.status_code == 200
+    assert etag
+    assert first.json()['success'] is True
+    assert second.status_code == 304
+    assert second.headers.get('ETag') == etag
+    assert second.content == b''
+    
+    # Filtered views of the same snapshot share its ETag
+    summary = requests.get(f"{url}?summary=true", headers={'If-None-Match': etag}, timeout=10)
+    assert summary.status_code == 304
@@ -0,0 +1,137 @@
+"""
+Tests for the compiled CSN entity index
+
+Verifies byte-span extraction, incremental (mtime + hash keyed) syncing
+and that CSNParser serves metadata from the persisted index.
+"""
+
+import json
+import os
+
+import pytest
+
+from core.services.csn_index_store import CSNIndexStore, scan_csn_definitions
+from core.services.csn_parser import CSNParser
+
+
+def write_csn(path, entities, as_list=True):
+    """Write a CSN file with one entity per (name, label) pair"""
+    document = {
+        'meta': {'creator': 'test'},
+        'definitions': {
+            f'p2p.{name}': {
+                'kind': 'entity',
+                '@EndUserText.label': label,
+                'elements': {
+                    'ID': {'key': True, 'type': 'cds.String', 'length': 10},
+                    'Amount': {'type': 'cds.Decimal', '@Semantics.amount.currencyCode': 'Currency'}
+                }
+            }
+            for name, label in entities
+        },
+        'i18n': {}
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump([document] if as_list else document, f, indent=4, ensure_ascii=False)
+
+
+def extract(name, definition):
+    """Minimal metadata extractor"""
+    return {'name': name, 'label': definition.get('@EndUserText.label')}
+
+
+@pytest.fixture
+def csn_dir(tmp_path):
+    """Directory with two CSN files"""
+    directory = tmp_path / 'csn'
+    directory.mkdir()
+    write_csn(directory / 'A_CSN.json', [('PurchaseOrder', 'Bestellung'), ('Supplier', 'Lieferant')])
+    write_csn(directory / 'B_CSN.json', [('Invoice', 'Rechnung €')], as_list=False)
+    return directory
+
+
+@pytest.mark.unit
+class TestScanDefinitions:
+    """Byte spans of entity definitions"""
+
+    def test_spans_parse_to_definitions(self, csn_dir):
+        raw = (csn_dir / 'B_CSN.json').read_bytes()
+        raw = b'\xef\xbb\xbf' + raw.replace(b'"meta"', '"méta"'.encode('utf-8'))
+
+        for name, definition, offset, length in scan_csn_definitions(raw):
+            assert json.loads(raw[offset:offset + length]) == definition
+            assert name == 'p2p.Invoice'
+
+    def test_invalid_document_raises(self):
+        with pytest.raises(ValueError):
+            list(scan_csn_definitions(b'"not csn"'))
+
+
+@pytest.mark.unit
+class TestCSNIndexStore:
+    """Incremental syncing"""
+
+    def test_sync_reindexes_only_changed_files(self, csn_dir, tmp_path):
+        store = CSNIndexStore(str(tmp_path / 'index.db'))
+
+        first = store.sync(str(csn_dir), extract)
+        os.utime(csn_dir / 'A_CSN.json', ns=(1, 1))  # touched, same content
+        touched = store.sync(str(csn_dir), extract)
+        write_csn(csn_dir / 'B_CSN.json', [('Invoice', 'Rechnung'), ('InvoiceItem', 'Position')])
+        changed = store.sync(str(csn_dir), extract)
+
+        assert (first['files_indexed'], first['entities']) == (2, 3)
+        assert (touched['files_indexed'], touched['files_unchanged']) == (0, 2)
+        assert (changed['files_indexed'], changed['entities']) == (1, 4)
+
+    def test_removed_files_are_dropped(self, csn_dir, tmp_path):
+        store = CSNIndexStore(str(tmp_path / 'index.db'))
+        store.sync(str(csn_dir), extract)
+
+        os.remove(csn_dir / 'B_CSN.json')
+        stats = store.sync(str(csn_dir), extract)
+
+        assert stats['files_removed'] == 1
+        assert set(store.load_entities(str(csn_dir))) == {'PurchaseOrder', 'Supplier'}
+
+    def test_location_and_metadata(self, csn_dir, tmp_path):
+        store = CSNIndexStore(str(tmp_path / 'index.db'))
+        store.sync(str(csn_dir), extract)
+
+        invoice = store.load_entities(str(csn_dir))['Invoice']
+
+        assert invoice.full_name == 'p2p.Invoice'
+        assert CSNIndexStore.read_definition(invoice)['@EndUserText.label'] == 'Rechnung €'
+        assert store.get_metadata(invoice) == {'name': 'Invoice', 'label': 'Rechnung €'}
+
+    def test_unwritable_path_falls_back_to_memory(self, csn_dir, tmp_path):
+        store = CSNIndexStore(str(tmp_path / 'missing' / 'index.db'))
+
+        assert store.index_path == ':memory:'
+        assert store.sync(str(csn_dir), extract)['entities'] == 3
+
+
+@pytest.mark.unit
+class TestCSNParserIndex:
+    """CSNParser backed by the compiled index"""
+
+    def test_second_parser_reuses_persisted_index(self, csn_dir):
+        CSNParser(str(csn_dir)).list_entities()
+        parser = CSNParser(str(csn_dir))
+
+        stats = parser._get_index_store().sync(str(csn_dir), parser._extract_indexed_metadata)
+        metadata = parser.get_entity_metadata('PurchaseOrder')
+
+        assert (csn_dir / '.csn_index.db').exists()
+        assert stats['files_indexed'] == 0
+        assert metadata.label == 'Bestellung'
+        assert metadata.primary_keys == ('ID',)
+        assert metadata.columns[1].semantic_properties == {'currencyCode': 'Currency'}
+
+    def test_metadata_matches_direct_extraction(self, csn_dir):
+        parser = CSNParser(str(csn_dir), persist_index=False)
+
+        for name in parser.list_entities():
+            entity_def, _ = parser._find_entity_definition(name)
+            assert parser.get_entity_metadata(name) == parser._build_entity_metadata(name, entity_def)
+        assert not (csn_dir / '.csn_index.db').exists()
@@ -0,0 +1,117 @@
+"""
+Tests for CSNParser metadata memoization and entity name lookup
+
+Verifies EntityMetadata is immutable, memoized in a bounded LRU and that
+simple names resolve to exactly one definition (no suffix matches).
+"""
+
+import dataclasses
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from core.services.csn_parser import CSNParser
+
+
+@pytest.fixture
+def csn_dir(tmp_path):
+    """CSN file where one entity name is a suffix of another"""
+    definitions = {
+        f'companycode.{name}': {
+            'kind': 'entity',
+            '@EndUserText.label': name,
+            'elements': {
+                'ID': {'key': True, 'type': 'cds.String'},
+                'to_Company': {
+                    'type': {'ref': ['cds.Association']},
+                    'target': 'CompanyCode',
+                    'keys': [{'ref': ['ID']}]
+                }
+            }
+        }
+        for name in ('CompanyCodeCurrencyRole', 'CurrencyRole', 'CompanyCode')
+    }
+    directory = tmp_path / 'csn'
+    directory.mkdir()
+    (directory / 'Company_Code_CSN.json').write_text(json.dumps([{'definitions': definitions}]))
+    return directory
+
+
+@pytest.mark.unit
+class TestEntityMetadataMemo:
+    """Memoized, immutable EntityMetadata"""
+
+    def test_metadata_is_memoized(self, csn_dir):
+        parser = CSNParser(str(csn_dir), persist_index=False)
+
+        assert parser.get_entity_metadata('CurrencyRole') is parser.get_entity_metadata('CurrencyRole')
+
+    def test_metadata_is_frozen(self, csn_dir):
+        metadata = CSNParser(str(csn_dir), persist_index=False).get_entity_metadata('CompanyCode')
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            metadata.label = 'changed'
+        assert isinstance(metadata.columns, tuple)
+        assert isinstance(metadata.associations[0].keys, tuple)
+
+    def test_memo_is_bounded(self, csn_dir):
+        parser = CSNParser(str(csn_dir), persist_index=False)
+        parser.METADATA_MEMO_SIZE = 2
+
+        for name in parser.list_entities():
+            parser.get_entity_metadata(name)
+
+        assert list(parser._metadata_memo) == ['CompanyCodeCurrencyRole', 'CurrencyRole']
+
+    def test_shared_across_threads(self, csn_dir):
+        parser = CSNParser(str(csn_dir), persist_index=False)
+        parser.list_entities()
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(parser.get_entity_metadata, ['CompanyCode'] * 20))
+
+        assert all(result is results[0] for result in results)
+
+    def test_clear_cache_drops_memo(self, csn_dir):
+        parser = CSNParser(str(csn_dir), persist_index=False)
+        first = parser.get_entity_metadata('CompanyCode')
+
+        parser.clear_cache()
+
+        assert parser.get_entity_metadata('CompanyCode') is not first
+        assert parser.get_entity_metadata('CompanyCode') == first
+
+
+@pytest.mark.unit
+class TestEntityNameLookup:
+    """Exact simple-name -> full-name resolution"""
+
+    def test_simple_name_is_not_suffix_matched(self, csn_dir):
+        parser = CSNParser(str(csn_dir), persist_index=False)
+
+        _, full_name = parser._find_entity_definition('CurrencyRole')
+
+        assert full_name == 'companycode.CurrencyRole'
+
+    def test_whole_file_fallback_uses_name_map(self, csn_dir):
+        parser = CSNParser(str(csn_dir), persist_index=False)
+        parser.list_entities()
+        # Simulate a stale byte span (file changed after indexing)
+        parser._entity_locations['CurrencyRole'] = dataclasses.replace(
+            parser._entity_locations['CurrencyRole'], byte_offset=0
+        )
+
+        _, full_name = parser._find_entity_definition('CurrencyRole')
+
+        assert full_name == 'companycode.CurrencyRole'
+        assert parser._entity_names_in_file(str(csn_dir / 'Company_Code_CSN.json'))['CompanyCode'] == \
+            'companycode.CompanyCode'
+
+    def test_iter_entity_definitions_streams_every_entity(self, csn_dir):
+        parser = CSNParser(str(csn_dir), persist_index=False)
+
+        streamed = {name: (full_name, entity_def) for name, full_name, entity_def in parser.iter_entity_definitions()}
+
+        assert sorted(streamed) == parser.list_entities()
+        assert streamed['CurrencyRole'] == tuple(reversed(parser._find_entity_definition('CurrencyRole')))
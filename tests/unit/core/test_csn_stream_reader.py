@@ -0,0 +1,99 @@
+"""
+Tests for the streaming CSN reader
+
+Verifies definitions and byte spans match a full json.load for any chunk
+size, that non-definition sections are skipped without being materialized
+and that malformed documents raise ValueError.
+"""
+
+import io
+import json
+import tracemalloc
+
+import pytest
+
+from core.services.csn_stream_reader import iter_csn_definitions, iter_csn_entities
+
+
+def csn_document(as_list=True, meta=None, i18n=None):
+    """CSN document with tricky strings around the definitions"""
+    document = {
+        'meta': meta if meta is not None else {'note': 'braces } ] { [ and "quotes" \\ in strings'},
+        'definitions': {
+            'p2p': {'kind': 'context'},
+            'p2p.PurchaseOrder': {
+                'kind': 'entity',
+                '@EndUserText.label': 'Bestellung – Kopf €',
+                'elements': {
+                    'ID': {'key': True, 'type': 'cds.String', 'length': 10},
+                    'Amount': {'type': 'cds.Decimal', 'precision': 1.5e3}
+                }
+            },
+            'p2p.Supplier': {'kind': 'entity', 'elements': {'ID': {'type': 'cds.String'}}}
+        },
+        'i18n': i18n if i18n is not None else {}
+    }
+    raw = json.dumps([document] if as_list else document, indent=2, ensure_ascii=False).encode('utf-8')
+    return document, raw
+
+
+@pytest.mark.unit
+class TestIterCSNDefinitions:
+    """Pure-Python streaming scanner"""
+
+    @pytest.mark.parametrize('chunk_size', [16, 37, 4096])
+    def test_matches_full_parse(self, chunk_size):
+        document, raw = csn_document()
+
+        result = list(iter_csn_definitions(io.BytesIO(raw), chunk_size=chunk_size))
+
+        assert [(d.full_name, d.definition) for d in result] == list(document['definitions'].items())
+
+    def test_byte_spans_with_bom_and_utf8(self):
+        _, raw = csn_document(as_list=False)
+        raw = b'\xef\xbb\xbf' + raw
+
+        for item in iter_csn_definitions(io.BytesIO(raw), chunk_size=16):
+            assert json.loads(raw[item.byte_offset:item.byte_offset + item.byte_length]) == item.definition
+
+    def test_reads_from_path(self, tmp_path):
+        document, raw = csn_document()
+        path = tmp_path / 'A_CSN.json'
+        path.write_bytes(raw)
+
+        assert [d.full_name for d in iter_csn_definitions(str(path))] == list(document['definitions'])
+
+    def test_skipped_sections_are_not_materialized(self):
+        big = {f'key{i}': 'x' * 1000 for i in range(4000)}  # ~4 MB before the definitions
+        _, raw = csn_document(meta=big)
+
+        tracemalloc.start()
+        names = [d.full_name for d in iter_csn_definitions(io.BytesIO(raw))]
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        assert names == ['p2p', 'p2p.PurchaseOrder', 'p2p.Supplier']
+        assert peak < 1024 * 1024
+
+    @pytest.mark.parametrize('raw', [
+        b'"not csn"',
+        b'',
+        b'{"definitions": {"p2p.A": {"kind": "ent',
+        b'{"meta": {"note": "unterminated}'
+    ])
+    def test_invalid_document_raises(self, raw):
+        with pytest.raises(ValueError):
+            list(iter_csn_definitions(io.BytesIO(raw), chunk_size=16))
+
+
+@pytest.mark.unit
+class TestIterCSNEntities:
+    """Entity-only iteration"""
+
+    def test_yields_entities_only(self):
+        document, raw = csn_document()
+
+        entities = dict(iter_csn_entities(io.BytesIO(raw)))
+
+        assert list(entities) == ['p2p.PurchaseOrder', 'p2p.Supplier']
+        assert entities['p2p.PurchaseOrder'] == document['definitions']['p2p.PurchaseOrder']
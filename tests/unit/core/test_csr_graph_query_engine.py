@@ -0,0 +1,173 @@
+"""
+Tests for CSRGraphQueryEngine
+
+Verifies the array-based engine answers the IGraphQueryEngine queries the
+same way as NetworkXGraphQueryEngine on the same graph_edges table, and
+that GraphQueryService picks it for large graphs.
+"""
+
+import json
+import sqlite3
+
+import pytest
+
+pytest.importorskip('numpy')
+
+from core.interfaces.graph_query import TraversalDirection  # noqa: E402
+from core.services.csr_graph_query_engine import CSRGraphQueryEngine  # noqa: E402
+from core.services.graph_query_service import GraphQueryService  # noqa: E402
+from core.services.networkx_graph_query_engine import NetworkXGraphQueryEngine  # noqa: E402
+
+
+EDGES = [
+    ('PurchaseOrder:PO1', 'Supplier:S1', 'fk', 'Supplier', None),
+    ('PurchaseOrder:PO1', 'CompanyCode:1000', 'fk', 'CompanyCode', json.dumps({'weight': 1})),
+    ('Invoice:INV1', 'PurchaseOrder:PO1', 'references', None, None),
+    ('Invoice:INV1', 'Supplier:S1', 'billed_by', 'Supplier', None),
+    ('Supplier:S1', 'CompanyCode:1000', 'fk', None, None),
+    ('Payment:PAY1', 'Invoice:INV1', 'settles', None, None),
+    ('Orphan:X', 'Orphan:Y', 'fk', None, None),
+]
+
+
+class SQLiteDataSource:
+    """Stand-in with the SQLite data source's type name"""
+    pass
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    """Create a graph database with the graph_edges cache table"""
+    path = tmp_path / "graph.db"
+    conn = sqlite3.connect(path)
+    conn.execute("""
+        CREATE TABLE graph_edges (
+            edge_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            ontology_id INTEGER NOT NULL,
+            from_node_key TEXT NOT NULL,
+            to_node_key TEXT NOT NULL,
+            edge_type TEXT,
+            edge_label TEXT,
+            properties_json TEXT
+        )
+    """)
+    conn.executemany(
+        "INSERT INTO graph_edges (ontology_id, from_node_key, to_node_key, edge_type, edge_label, properties_json) "
+        "VALUES (1, ?, ?, ?, ?, ?)",
+        EDGES
+    )
+    conn.commit()
+    conn.close()
+    return str(path)
+
+
+@pytest.fixture
+def engines(db_path):
+    """CSR engine and the NetworkX reference over the same database"""
+    return CSRGraphQueryEngine(db_path), NetworkXGraphQueryEngine(db_path)
+
+
+def ids(nodes):
+    return sorted(node.id for node in nodes)
+
+
+@pytest.mark.unit
+class TestCSRGraphQueryEngine:
+    """Query results match NetworkXGraphQueryEngine"""
+
+    def test_counts_and_nodes(self, engines):
+        csr, reference = engines
+
+        assert csr.get_node_count() == reference.get_node_count()
+        assert csr.get_edge_count() == reference.get_edge_count()
+        assert csr.get_node('Supplier:S1').properties == reference.get_node('Supplier:S1').properties
+        assert csr.node_exists('Payment:PAY1') and not csr.node_exists('Payment:PAY2')
+
+    @pytest.mark.parametrize('direction', list(TraversalDirection))
+    def test_neighbors_and_traverse(self, engines, direction):
+        csr, reference = engines
+
+        for node_id in ('PurchaseOrder:PO1', 'Invoice:INV1', 'Supplier:S1'):
+            assert ids(csr.get_neighbors(node_id, direction)) == ids(reference.get_neighbors(node_id, direction))
+            for depth in (0, 1, 3):
+                result = csr.traverse(node_id, depth, direction)
+                assert result[0].id == node_id
+                assert ids(result) == ids(reference.traverse(node_id, depth, direction))
+
+    def test_edge_type_filter(self, engines):
+        csr, reference = engines
+
+        assert ids(csr.get_neighbors('Invoice:INV1', edge_types=['billed_by'])) == ['Supplier:S1']
+        assert ids(csr.traverse('Payment:PAY1', 3, edge_types=['settles', 'references'])) == \
+            ids(reference.traverse('Payment:PAY1', 3, edge_types=['settles', 'references']))
+        assert csr.get_neighbors('Invoice:INV1', edge_types=['unknown']) == []
+
+    def test_shortest_path_is_bounded(self, engines):
+        csr, reference = engines
+
+        path = csr.shortest_path('Payment:PAY1', 'CompanyCode:1000')
+        expected = reference.shortest_path('Payment:PAY1', 'CompanyCode:1000')
+
+        assert path.length == expected.length == 3
+        assert path.nodes[0].id == 'Payment:PAY1' and path.nodes[-1].id == 'CompanyCode:1000'
+        assert all(e.source_id == n.id for e, n in zip(path.edges, path.nodes))
+        assert csr.shortest_path('Payment:PAY1', 'CompanyCode:1000', max_hops=2) is None
+        assert csr.shortest_path('CompanyCode:1000', 'Payment:PAY1') is None
+
+    def test_subgraph_edges_match(self, engines):
+        csr, reference = engines
+        node_ids = ['PurchaseOrder:PO1', 'Supplier:S1', 'CompanyCode:1000', 'Missing:1']
+
+        result = csr.subgraph(node_ids)
+        expected = reference.subgraph(node_ids)
+
+        assert result.nodes == expected.nodes
+        assert {e.id: e.properties for e in result.edges} == {e.id: e.properties for e in expected.edges}
+
+    def test_pagerank_matches_networkx(self, engines):
+        csr, reference = engines
+        # Pure-Python reference (networkx.pagerank itself needs scipy)
+        pagerank_alg = pytest.importorskip('networkx.algorithms.link_analysis.pagerank_alg')
+        if not hasattr(pagerank_alg, '_pagerank_python'):
+            pytest.skip('networkx has no pure-Python pagerank')
+
+        scores = {r['node_id']: r['score'] for r in csr.get_pagerank(top_k=None)}
+        expected = pagerank_alg._pagerank_python(reference._ensure_graph_loaded())
+
+        assert scores.keys() == expected.keys()
+        assert all(abs(scores[n] - expected[n]) < 1e-6 for n in scores)
+
+    def test_clear_cache_reloads(self, engines, db_path):
+        csr, _ = engines
+        conn = sqlite3.connect(db_path)
+        conn.execute("INSERT INTO graph_edges (ontology_id, from_node_key, to_node_key, edge_type) "
+                     "VALUES (1, 'Payment:PAY1', 'Supplier:S1', 'pays')")
+        conn.commit()
+        conn.close()
+
+        csr.clear_cache()
+
+        assert 'Supplier:S1' in ids(csr.get_neighbors('Payment:PAY1'))
+
+
+@pytest.mark.unit
+class TestEngineSelection:
+    """GraphQueryService chooses CSR for large SQLite graphs"""
+
+    def test_small_graph_uses_networkx(self, db_path):
+        service = GraphQueryService(SQLiteDataSource(), db_path=db_path)
+
+        assert isinstance(service.engine, NetworkXGraphQueryEngine)
+
+    def test_threshold_selects_csr(self, db_path):
+        service = GraphQueryService(SQLiteDataSource(), db_path=db_path, csr_min_edges=len(EDGES))
+
+        assert isinstance(service.engine, CSRGraphQueryEngine)
+        assert service.get_backend_info()['platform'] == 'NumPy CSR + SQLite'
+        assert service.get_pagerank(top_k=1)[0]['node_id']
+
+    def test_explicit_engine(self, db_path):
+        assert isinstance(GraphQueryService(SQLiteDataSource(), db_path=db_path, engine='csr').engine,
+                          CSRGraphQueryEngine)
+        with pytest.raises(ValueError):
+            GraphQueryService(SQLiteDataSource(), db_path=db_path, engine='igraph')
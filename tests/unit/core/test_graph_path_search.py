@@ -0,0 +1,137 @@
+"""
+Tests for bounded bidirectional path search
+
+Verifies bidirectional_shortest_path / k_shortest_paths against a
+brute-force enumeration of simple paths, the max_hops cutoff and the
+engine integration (edge-type constraints).
+"""
+
+import random
+import sqlite3
+
+import pytest
+
+from core.services.graph_path_search import bidirectional_shortest_path, k_shortest_paths
+from core.services.networkx_graph_query_engine import NetworkXGraphQueryEngine
+
+
+def random_graph(seed, nodes=12, edges=30):
+    """Adjacency dicts of a random directed graph"""
+    rng = random.Random(seed)
+    succ = {n: [] for n in range(nodes)}
+    pred = {n: [] for n in range(nodes)}
+    for _ in range(edges):
+        u, v = rng.randrange(nodes), rng.randrange(nodes)
+        if u != v and v not in succ[u]:
+            succ[u].append(v)
+            pred[v].append(u)
+    return succ, pred
+
+
+def simple_paths(succ, source, target, max_hops):
+    """All simple paths with at most max_hops edges (brute force)"""
+    found = []
+    stack = [[source]]
+    while stack:
+        path = stack.pop()
+        if path[-1] == target:
+            found.append(path)
+            continue
+        if len(path) - 1 < max_hops:
+            stack.extend(path + [n] for n in succ[path[-1]] if n not in path)
+    return found
+
+
+@pytest.mark.unit
+class TestPathSearch:
+    """Search results equal brute force"""
+
+    @pytest.mark.parametrize('seed', range(15))
+    def test_shortest_length_matches_brute_force(self, seed):
+        succ, pred = random_graph(seed)
+        for source, target in [(0, 5), (3, 9), (7, 1)]:
+            for max_hops in (1, 2, 4, 11):
+                expected = simple_paths(succ, source, target, max_hops)
+                path = bidirectional_shortest_path(source, target, succ.get, pred.get, max_hops)
+
+                if not expected:
+                    assert path is None
+                else:
+                    assert len(path) == min(map(len, expected))
+                    assert path[0] == source and path[-1] == target
+                    assert all(b in succ[a] for a, b in zip(path, path[1:]))
+
+    @pytest.mark.parametrize('seed', range(15))
+    def test_k_shortest_matches_brute_force(self, seed):
+        succ, pred = random_graph(seed)
+        expected = sorted(map(len, simple_paths(succ, 0, 5, 6)))
+
+        paths = k_shortest_paths(0, 5, succ.get, pred.get, 6, k=5)
+
+        assert [len(p) for p in paths] == expected[:5]
+        assert len({tuple(p) for p in paths}) == len(paths)
+        assert all(len(set(p)) == len(p) for p in paths)
+
+    def test_fruitless_search_stops_at_max_hops(self):
+        # Long chain: the target is 100 hops away
+        expanded = []
+        succ = {n: [n + 1] for n in range(100)}
+        pred = {n + 1: [n] for n in range(100)}
+
+        def successors(node):
+            expanded.append(node)
+            return succ.get(node, [])
+
+        def predecessors(node):
+            expanded.append(node)
+            return pred.get(node, [])
+
+        assert bidirectional_shortest_path(0, 100, successors, predecessors, 6) is None
+        assert len(expanded) == 6
+
+
+@pytest.fixture
+def engine(tmp_path):
+    """NetworkX engine over a graph with two routes of different edge types"""
+    path = tmp_path / "graph.db"
+    conn = sqlite3.connect(path)
+    conn.execute("""
+        CREATE TABLE graph_edges (
+            edge_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            ontology_id INTEGER NOT NULL,
+            from_node_key TEXT NOT NULL,
+            to_node_key TEXT NOT NULL,
+            edge_type TEXT,
+            edge_label TEXT,
+            properties_json TEXT
+        )
+    """)
+    conn.executemany(
+        "INSERT INTO graph_edges (ontology_id, from_node_key, to_node_key, edge_type) VALUES (1, ?, ?, ?)",
+        [
+            ('Supplier:S1', 'Invoice:INV1', 'billed'),
+            ('Supplier:S1', 'PurchaseOrder:PO1', 'fk'),
+            ('PurchaseOrder:PO1', 'Invoice:INV1', 'fk'),
+        ]
+    )
+    conn.commit()
+    conn.close()
+    return NetworkXGraphQueryEngine(str(path))
+
+
+@pytest.mark.unit
+class TestEngineFindPaths:
+    """Edge-type constrained and k-shortest search in the engine"""
+
+    def test_edge_types_constrain_route(self, engine):
+        paths = engine.find_paths('Supplier:S1', 'Invoice:INV1', edge_types=['fk'])
+
+        assert [n.id for n in paths[0].nodes] == ['Supplier:S1', 'PurchaseOrder:PO1', 'Invoice:INV1']
+        assert all(e.properties['type'] == 'fk' for e in paths[0].edges)
+
+    def test_k_shortest_in_length_order(self, engine):
+        paths = engine.find_paths('Supplier:S1', 'Invoice:INV1', k=5)
+
+        assert [p.length for p in paths] == [1, 2]
+        assert engine.shortest_path('Supplier:S1', 'Invoice:INV1').length == 1
+        assert engine.shortest_path('Supplier:S1', 'Invoice:INV1', max_hops=0) is None
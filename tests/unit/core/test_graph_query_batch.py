@@ -0,0 +1,208 @@
+"""
+Tests for batched multi-source neighbor and k-hop queries
+
+Verifies get_neighbors_batch / traverse_batch agree with the per-node
+queries (NetworkX, CSR) and that the HANA engine issues one set-based
+edge-table statement per hop instead of one per node.
+"""
+
+import sqlite3
+
+import pytest
+
+from core.interfaces.graph_query import TraversalDirection
+from core.services.hana_graph_query_engine import HANAGraphQueryEngine, WorkspaceEdgeTable
+from core.services.networkx_graph_query_engine import NetworkXGraphQueryEngine
+
+
+EDGES = [
+    ('PurchaseOrder:PO1', 'Supplier:S1', 'fk'),
+    ('PurchaseOrder:PO2', 'Supplier:S1', 'fk'),
+    ('PurchaseOrder:PO2', 'CompanyCode:1000', 'fk'),
+    ('Invoice:INV1', 'PurchaseOrder:PO1', 'references'),
+    ('Invoice:INV2', 'PurchaseOrder:PO2', 'references'),
+    ('Supplier:S1', 'Country:DE', 'located_in'),
+]
+
+SEEDS = ['Invoice:INV1', 'Invoice:INV2', 'Missing:1']
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    """Create a graph database with the graph_edges cache table"""
+    path = tmp_path / "graph.db"
+    conn = sqlite3.connect(path)
+    conn.execute("""
+        CREATE TABLE graph_edges (
+            edge_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            ontology_id INTEGER NOT NULL,
+            from_node_key TEXT NOT NULL,
+            to_node_key TEXT NOT NULL,
+            edge_type TEXT,
+            edge_label TEXT,
+            properties_json TEXT
+        )
+    """)
+    conn.executemany(
+        "INSERT INTO graph_edges (ontology_id, from_node_key, to_node_key, edge_type) VALUES (1, ?, ?, ?)",
+        EDGES
+    )
+    conn.commit()
+    conn.close()
+    return str(path)
+
+
+def local_engines(db_path):
+    """In-process engines (CSR only when NumPy is installed)"""
+    engines = [NetworkXGraphQueryEngine(db_path)]
+    try:
+        from core.services.csr_graph_query_engine import CSRGraphQueryEngine
+        engines.append(CSRGraphQueryEngine(db_path))
+    except ImportError:
+        pass
+    return engines
+
+
+def ids(nodes):
+    return sorted(node.id for node in nodes)
+
+
+@pytest.mark.unit
+class TestLocalBatchQueries:
+    """Batch results equal the merged per-node results"""
+
+    @pytest.mark.parametrize('direction', list(TraversalDirection))
+    def test_neighbors_batch_matches_single(self, db_path, direction):
+        node_ids = ['PurchaseOrder:PO2', 'Supplier:S1', 'Missing:1']
+        for engine in local_engines(db_path):
+            batch = engine.get_neighbors_batch(node_ids, direction)
+
+            assert list(batch) == node_ids
+            for node_id in node_ids:
+                assert ids(batch[node_id]) == ids(engine.get_neighbors(node_id, direction))
+
+    def test_neighbors_batch_limit_and_filter(self, db_path):
+        for engine in local_engines(db_path):
+            batch = engine.get_neighbors_batch(['PurchaseOrder:PO2', 'Supplier:S1'], edge_types=['fk'], limit=1)
+
+            assert len(batch['PurchaseOrder:PO2']) == 1
+            assert batch['Supplier:S1'] == []
+
+    @pytest.mark.parametrize('depth', [0, 1, 2, 3])
+    def test_traverse_batch_matches_union(self, db_path, depth):
+        for engine in local_engines(db_path):
+            result = engine.traverse_batch(SEEDS, depth)
+            expected = {n.id for seed in SEEDS for n in engine.traverse(seed, depth)}
+
+            assert ids(result) == sorted(expected)
+            assert len(result) == len(expected)
+            assert {n.id for n in result[:2]} == {'Invoice:INV1', 'Invoice:INV2'}
+
+    def test_traverse_batch_edge_types(self, db_path):
+        for engine in local_engines(db_path):
+            result = engine.traverse_batch(SEEDS, 3, edge_types=['references'])
+
+            assert ids(result) == ['Invoice:INV1', 'Invoice:INV2', 'PurchaseOrder:PO1', 'PurchaseOrder:PO2']
+
+
+HANA_EDGE_TABLES = (
+    WorkspaceEdgeTable('OrderSupplier', 'PurchaseOrder', 'PurchaseOrder', 'Supplier', 'Supplier'),
+    WorkspaceEdgeTable('OrderCompany', 'PurchaseOrder', 'PurchaseOrder', 'CompanyCode', 'CompanyCode'),
+    WorkspaceEdgeTable('InvoiceItem', 'Invoice', 'Invoice', 'PurchaseOrder', 'PurchaseOrder'),
+    WorkspaceEdgeTable('SupplierAddress', 'Supplier', 'Supplier', 'Country', 'Country'),
+)
+
+
+class EdgeTableDataSource:
+    """HANA data source stand-in running the batched SQL against edge tables built from EDGES"""
+
+    def __init__(self):
+        self.queries = []
+        self.conn = sqlite3.connect(':memory:')
+        self.conn.row_factory = sqlite3.Row
+        for edge in HANA_EDGE_TABLES:
+            self.conn.execute(f'CREATE TABLE "{edge.table}" ("{edge.source_column}" TEXT, "{edge.target_column}" TEXT)')
+            self.conn.executemany(f'INSERT INTO "{edge.table}" VALUES (?, ?)', [
+                (source.split(':', 1)[1], target.split(':', 1)[1])
+                for source, target, _ in EDGES
+                if source.split(':', 1)[0] == edge.source_table and target.split(':', 1)[0] == edge.target_table
+            ])
+
+    def execute_query(self, sql, params=None):
+        self.queries.append((sql, params))
+        return {'success': True, 'rows': [dict(row) for row in self.conn.execute(sql, params or ())]}
+
+
+def hana_engine(data_source):
+    return HANAGraphQueryEngine(data_source, edge_tables=HANA_EDGE_TABLES)
+
+
+@pytest.mark.unit
+class TestHANABatchQueries:
+    """One statement per hop / per batch"""
+
+    def test_neighbors_batch_is_one_query(self):
+        data_source = EdgeTableDataSource()
+        engine = hana_engine(data_source)
+
+        batch = engine.get_neighbors_batch(['PurchaseOrder:PO1', 'PurchaseOrder:PO2'])
+
+        assert len(data_source.queries) == 1
+        sql, params = data_source.queries[0]
+        assert 'GRAPH_NEIGHBORS' not in sql
+        assert params == ('PO1', 'PO2', 'PO1', 'PO2')
+        assert ids(batch['PurchaseOrder:PO2']) == ['CompanyCode:1000', 'Supplier:S1']
+
+    @pytest.mark.parametrize('direction', list(TraversalDirection))
+    def test_neighbors_batch_matches_local_engine(self, db_path, direction):
+        node_ids = ['PurchaseOrder:PO2', 'Supplier:S1', 'Missing:1']
+        engine = hana_engine(EdgeTableDataSource())
+        expected = NetworkXGraphQueryEngine(db_path).get_neighbors_batch(node_ids, direction)
+
+        batch = engine.get_neighbors_batch(node_ids, direction)
+
+        assert {node_id: ids(nodes) for node_id, nodes in batch.items()} == {
+            node_id: ids(nodes) for node_id, nodes in expected.items()
+        }
+
+    def test_traverse_batch_queries_once_per_hop(self):
+        data_source = EdgeTableDataSource()
+        engine = hana_engine(data_source)
+
+        result = engine.traverse_batch(['Invoice:INV1', 'Invoice:INV2'], depth=3)
+
+        assert len(data_source.queries) == 3
+        assert {n.id: n.properties['depth'] for n in result} == {
+            'Invoice:INV1': 0, 'Invoice:INV2': 0,
+            'PurchaseOrder:PO1': 1, 'PurchaseOrder:PO2': 1,
+            'Supplier:S1': 2, 'CompanyCode:1000': 2,
+            'Country:DE': 3
+        }
+
+    def test_large_frontier_is_chunked_with_bound_keys(self):
+        data_source = EdgeTableDataSource()
+        engine = hana_engine(data_source)
+        engine.MAX_BATCH_VERTICES = 2
+
+        engine.get_neighbors_batch(['PurchaseOrder:PO1', 'PurchaseOrder:PO2', "Supplier:O'Neil"])
+
+        assert len(data_source.queries) == 2
+        sql, params = data_source.queries[1]
+        assert params == ("O'Neil",)
+        assert "O'Neil" not in sql
+
+    def test_edge_types_select_edge_tables(self):
+        data_source = EdgeTableDataSource()
+        engine = hana_engine(data_source)
+
+        batch = engine.get_neighbors_batch(['PurchaseOrder:PO2'], edge_types=['OrderSupplier'])
+
+        assert ids(batch['PurchaseOrder:PO2']) == ['Supplier:S1']
+        assert 'OrderCompany' not in data_source.queries[0][0]
+
+    def test_failed_query_returns_empty_buckets(self):
+        engine = HANAGraphQueryEngine(type('Failing', (), {
+            'execute_query': lambda self, sql, params=None: {'success': False, 'error': 'boom'}
+        })())
+
+        assert engine.get_neighbors_batch(['PurchaseOrder:PO1']) == {'PurchaseOrder:PO1': []}
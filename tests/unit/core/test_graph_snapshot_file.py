@@ -0,0 +1,82 @@
+"""
+Tests for the columnar graph snapshot file format
+
+Verifies round trips of the string table and int32 columns, atomic
+replacement and that foreign, truncated or corrupt files are rejected.
+"""
+
+import os
+from array import array
+
+import pytest
+
+from core.services.graph_snapshot_file import (
+    SnapshotFormatError,
+    SnapshotReader,
+    StringInterner,
+    read_snapshot_metadata,
+    snapshot_path,
+    write_snapshot
+)
+
+
+@pytest.fixture
+def snapshot_file(tmp_path):
+    """Snapshot with non-ASCII strings and two columns"""
+    strings = StringInterner()
+    ids = array('i', [strings.intern(s) for s in ('PurchaseOrder:1', 'Lieferant €', '', 'PurchaseOrder:1')])
+    path = snapshot_path(str(tmp_path / 'snapshots'), 'schema')
+    write_snapshot(path, {'source_version': '7'}, strings.strings, {'node.id': ids, 'edge.source': array('i')})
+    return path
+
+
+@pytest.mark.unit
+class TestGraphSnapshotFile:
+    """Format round trip and validation"""
+
+    def test_round_trip(self, snapshot_file):
+        with SnapshotReader(snapshot_file) as snapshot:
+            strings = snapshot.strings()
+            ids = snapshot.column('node.id').tolist()
+            empty = snapshot.column('edge.source').tolist()
+
+        assert snapshot_file.endswith('schema.kgsnap')
+        assert [strings[i] for i in ids] == ['PurchaseOrder:1', 'Lieferant €', '', 'PurchaseOrder:1']
+        assert ids[0] == ids[3]
+        assert empty == []
+        assert read_snapshot_metadata(snapshot_file) == {'source_version': '7'}
+
+    def test_rewrite_replaces_file(self, snapshot_file):
+        write_snapshot(snapshot_file, {'source_version': '8'}, ['x'], {'node.id': array('i', [0])})
+
+        with SnapshotReader(snapshot_file) as snapshot:
+            assert snapshot.metadata == {'source_version': '8'}
+            assert snapshot.strings() == ['x']
+        assert os.listdir(os.path.dirname(snapshot_file)) == ['schema.kgsnap']
+
+    def test_missing_column_raises(self, snapshot_file):
+        with SnapshotReader(snapshot_file) as snapshot:
+            with pytest.raises(SnapshotFormatError):
+                snapshot.column('edge.target')
+
+    @pytest.mark.parametrize('content', [b'', b'KGSNAP', b'SQLite format 3\0' + b'\0' * 100])
+    def test_invalid_files_are_rejected(self, tmp_path, content):
+        path = tmp_path / 'bad.kgsnap'
+        path.write_bytes(content)
+
+        with pytest.raises(SnapshotFormatError):
+            SnapshotReader(str(path))
+        assert read_snapshot_metadata(str(path)) is None
+
+    def test_truncated_file_is_rejected(self, snapshot_file):
+        with open(snapshot_file, 'rb') as f:
+            raw = f.read()
+        with open(snapshot_file, 'wb') as f:
+            f.write(raw[:-3])
+
+        with pytest.raises(SnapshotFormatError):
+            SnapshotReader(snapshot_file)
+
+    def test_columns_must_be_int32(self, tmp_path):
+        with pytest.raises(ValueError):
+            write_snapshot(str(tmp_path / 'x.kgsnap'), {}, [], {'node.id': array('q', [1])})
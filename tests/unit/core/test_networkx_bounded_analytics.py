@@ -0,0 +1,90 @@
+"""
+Tests for NetworkXGraphQueryEngine sampled betweenness and bounded cycles
+
+Verifies pivot sampling is reproducible and falls back to exact results
+for small graphs, and that cycle enumeration honours length/count bounds.
+"""
+
+import sqlite3
+
+import pytest
+
+from core.services.networkx_graph_query_engine import NetworkXGraphQueryEngine
+
+
+def ring_edges(size, prefix='N'):
+    """Directed ring N0 -> N1 -> ... -> N0 plus chords (many short cycles)"""
+    edges = [(f'{prefix}{i}', f'{prefix}{(i + 1) % size}') for i in range(size)]
+    edges += [(f'{prefix}{(i + 1) % size}', f'{prefix}{i}') for i in range(0, size, 2)]
+    return edges
+
+
+@pytest.fixture
+def engine(tmp_path):
+    """Engine over a 40-node ring graph"""
+    path = tmp_path / "graph.db"
+    conn = sqlite3.connect(path)
+    conn.execute("""
+        CREATE TABLE graph_edges (
+            edge_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            ontology_id INTEGER NOT NULL,
+            from_node_key TEXT NOT NULL,
+            to_node_key TEXT NOT NULL,
+            edge_type TEXT,
+            edge_label TEXT,
+            properties_json TEXT
+        )
+    """)
+    conn.executemany(
+        "INSERT INTO graph_edges (ontology_id, from_node_key, to_node_key, edge_type) VALUES (1, ?, ?, 'fk')",
+        ring_edges(40)
+    )
+    conn.commit()
+    conn.close()
+    return NetworkXGraphQueryEngine(str(path))
+
+
+@pytest.mark.unit
+class TestSampledBetweenness:
+    """Approximate betweenness via pivot sampling"""
+
+    def test_seed_makes_sampling_reproducible(self, engine):
+        first = engine.get_betweenness_centrality(top_k=None, sample_size=5, seed=42)
+        second = engine.get_betweenness_centrality(top_k=None, sample_size=5, seed=42)
+
+        assert first == second
+        assert len(first) == 40
+
+    def test_sample_covering_graph_is_exact(self, engine):
+        exact = engine.get_betweenness_centrality(top_k=None)
+
+        assert engine.get_betweenness_centrality(top_k=None, sample_size=1000, seed=1) == exact
+
+    def test_resolve_sample_size(self):
+        resolve = NetworkXGraphQueryEngine.resolve_sample_size
+
+        assert resolve(100_000) is None
+        assert resolve(100_000, sample_size=200) == 200
+        assert resolve(100_000, epsilon=0.1) == 1152  # ceil(ln(1e5) / 0.01)
+        assert resolve(50, epsilon=0.1) is None  # sample would cover the graph
+        with pytest.raises(ValueError):
+            resolve(100, sample_size=0)
+
+
+@pytest.mark.unit
+class TestBoundedCycles:
+    """Cycle enumeration with length/count bounds"""
+
+    def test_max_cycles_limits_count(self, engine):
+        assert len(engine.find_cycles(max_cycles=3)) == 3
+
+    def test_max_length_limits_cycle_size(self, engine):
+        cycles = engine.find_cycles(max_length=2)
+
+        assert len(cycles) == 20  # one 2-cycle per chord
+        assert all(len(cycle) <= 2 for cycle in cycles)
+
+    def test_iter_cycles_is_lazy(self, engine):
+        cycles = engine.iter_cycles()
+
+        assert len(next(cycles)) >= 2
@@ -0,0 +1,173 @@
+"""
+Tests for NetworkXGraphQueryEngine incremental refresh
+
+Verifies that refresh() applies only inserted/deleted graph_edges rows and
+always ends up identical to a cold load of the same database.
+"""
+
+import json
+import sqlite3
+
+import pytest
+
+from core.services.networkx_graph_query_engine import NetworkXGraphQueryEngine
+
+
+EDGES = [
+    ('PurchaseOrder:PO1', 'Supplier:S1', 'fk', 'Supplier', None),
+    ('PurchaseOrder:PO1', 'CompanyCode:1000', 'fk', 'CompanyCode', json.dumps({'weight': 1})),
+    ('Invoice:INV1', 'PurchaseOrder:PO1', 'references', None, None),
+]
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    """Create a graph database with the graph_edges cache table"""
+    path = tmp_path / "graph.db"
+    conn = sqlite3.connect(path)
+    conn.execute("""
+        CREATE TABLE graph_edges (
+            edge_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            ontology_id INTEGER NOT NULL,
+            from_node_key TEXT NOT NULL,
+            to_node_key TEXT NOT NULL,
+            edge_type TEXT,
+            edge_label TEXT,
+            properties_json TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+    conn.commit()
+    conn.close()
+    insert_edges(str(path), EDGES)
+    return str(path)
+
+
+def insert_edges(db_path, edges, ontology_id=1):
+    """Append edge rows"""
+    conn = sqlite3.connect(db_path)
+    conn.executemany(
+        "INSERT INTO graph_edges (ontology_id, from_node_key, to_node_key, edge_type, edge_label, properties_json) "
+        "VALUES (?, ?, ?, ?, ?, ?)",
+        [(ontology_id, *edge) for edge in edges]
+    )
+    conn.commit()
+    conn.close()
+
+
+def execute(db_path, sql, params=()):
+    """Run a write statement"""
+    conn = sqlite3.connect(db_path)
+    conn.execute(sql, params)
+    conn.commit()
+    conn.close()
+
+
+def graph_view(G):
+    """Comparable view of a DiGraph"""
+    return (
+        sorted(G.nodes(data=True)),
+        sorted((u, v, sorted(d.items())) for u, v, d in G.edges(data=True))
+    )
+
+
+def snapshot(engine):
+    """Comparable view of the engine's graph"""
+    return graph_view(engine._ensure_graph_loaded())
+
+
+@pytest.mark.unit
+class TestNetworkXIncrementalRefresh:
+    """Test refresh() against cold loads"""
+
+    def test_bulk_load_builds_graph(self, db_path):
+        """Test cold load adds all nodes and edges with attributes"""
+        engine = NetworkXGraphQueryEngine(db_path)
+
+        assert engine.get_node_count() == 4
+        assert engine.get_edge_count() == 3
+        G = engine._ensure_graph_loaded()
+        assert G.nodes['Supplier:S1'] == {'label': 'Supplier', 'table': 'Supplier', 'record_id': 'S1'}
+        assert G.edges['PurchaseOrder:PO1', 'CompanyCode:1000']['weight'] == 1
+        assert G.edges['Invoice:INV1', 'PurchaseOrder:PO1']['label'] == 'references'
+
+    def test_refresh_without_changes_is_noop(self, db_path):
+        """Test refresh with an unchanged table applies nothing"""
+        engine = NetworkXGraphQueryEngine(db_path)
+
+        result = engine.refresh()
+
+        assert result['mode'] == 'incremental'
+        assert (result['inserted'], result['deleted']) == (0, 0)
+
+    def test_refresh_applies_inserted_edges(self, db_path):
+        """Test new rows above the high-water mark are added"""
+        engine = NetworkXGraphQueryEngine(db_path)
+        insert_edges(db_path, [('Invoice:INV1', 'Supplier:S1', 'fk', 'Supplier', None)])
+
+        result = engine.refresh()
+
+        assert result['inserted'] == 1
+        assert engine.get_edge_count() == 4
+        assert snapshot(engine) == snapshot(NetworkXGraphQueryEngine(db_path))
+
+    def test_refresh_removes_deleted_edges_and_orphans(self, db_path):
+        """Test deleted rows are removed along with nodes left without edges"""
+        engine = NetworkXGraphQueryEngine(db_path)
+        execute(db_path, "DELETE FROM graph_edges WHERE to_node_key = 'CompanyCode:1000'")
+
+        result = engine.refresh()
+
+        assert result['deleted'] == 1
+        assert not engine.node_exists('CompanyCode:1000')
+        assert snapshot(engine) == snapshot(NetworkXGraphQueryEngine(db_path))
+
+    def test_refresh_after_full_rebuild_matches_cold_load(self, db_path):
+        """Test delete-all + re-insert (cache save) converges to the cold-load graph"""
+        engine = NetworkXGraphQueryEngine(db_path)
+        execute(db_path, "DELETE FROM graph_edges")
+        rebuilt = [EDGES[0], ('PurchaseOrder:PO1', 'CompanyCode:1000', 'fk', 'CompanyCode', None)]
+        insert_edges(db_path, rebuilt, ontology_id=2)
+
+        result = engine.refresh()
+
+        assert (result['inserted'], result['deleted']) == (2, 3)
+        assert 'weight' not in engine._ensure_graph_loaded().edges['PurchaseOrder:PO1', 'CompanyCode:1000']
+        assert snapshot(engine) == snapshot(NetworkXGraphQueryEngine(db_path))
+
+    def test_refresh_keeps_pair_with_remaining_row(self, db_path):
+        """Test deleting one of two rows for the same pair keeps the edge with the other's attributes"""
+        engine = NetworkXGraphQueryEngine(db_path)
+        insert_edges(db_path, [('PurchaseOrder:PO1', 'Supplier:S1', 'references', 'InvoicingParty', None)])
+        engine.refresh()
+        execute(db_path, "DELETE FROM graph_edges WHERE edge_label = 'InvoicingParty'")
+
+        engine.refresh()
+
+        G = engine._ensure_graph_loaded()
+        assert G.edges['PurchaseOrder:PO1', 'Supplier:S1']['label'] == 'Supplier'
+        assert snapshot(engine) == snapshot(NetworkXGraphQueryEngine(db_path))
+
+    def test_refresh_swaps_graph_instead_of_mutating_it(self, db_path):
+        """Test a graph held by a running query is not changed by a refresh"""
+        engine = NetworkXGraphQueryEngine(db_path)
+        before = engine._ensure_graph_loaded()
+        expected = graph_view(before)
+        execute(db_path, "DELETE FROM graph_edges WHERE to_node_key = 'CompanyCode:1000'")
+        insert_edges(db_path, [('Invoice:INV2', 'PurchaseOrder:PO1', 'references', None, None)])
+
+        engine.refresh()
+
+        assert engine._ensure_graph_loaded() is not before
+        assert graph_view(before) == expected
+        assert snapshot(engine) == snapshot(NetworkXGraphQueryEngine(db_path))
+
+    def test_refresh_before_load_performs_bulk_load(self, db_path):
+        """Test refresh on an unloaded engine warms it"""
+        engine = NetworkXGraphQueryEngine(db_path, auto_load=False)
+
+        result = engine.refresh()
+
+        assert result['mode'] == 'load'
+        assert result['high_water_mark'] == 3
+        assert engine.get_edge_count() == 3
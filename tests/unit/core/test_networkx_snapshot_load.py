@@ -0,0 +1,102 @@
+"""
+Tests for NetworkXGraphQueryEngine cold loads from columnar snapshots
+
+Verifies a snapshot-backed load is identical to a row-by-row load and that
+stale or foreign snapshots fall back to streaming graph_edges.
+"""
+
+import sqlite3
+
+import pytest
+
+from core.services.database_connection_factory import SqliteConnectionFactory
+from core.services.database_unit_of_work import SqliteUnitOfWork
+from core.services.networkx_graph_query_engine import NetworkXGraphQueryEngine
+from modules.knowledge_graph_v2.domain import Graph, GraphNode, GraphEdge, GraphType, NodeType, EdgeType
+from modules.knowledge_graph_v2.repositories import ColumnarGraphCacheRepository, SqliteGraphCacheRepository
+
+
+def build_graph(graph_id, graph_type, size):
+    """Chain of records with shared and nested edge properties"""
+    graph = Graph(graph_id, graph_type)
+    for i in range(size):
+        graph.add_node(GraphNode(f"Order:{i}", "Order", NodeType.RECORD, {'amount': i}))
+    graph.add_node(GraphNode("plain", "Plain", NodeType.TABLE))
+    for i in range(size - 1):
+        properties = {'cardinality': 'n:1', 'label': 'ignored'} if i % 2 else {'keys': ['ID', i]}
+        label = None if i % 3 else 'next'
+        graph.add_edge(GraphEdge(f"Order:{i}", f"Order:{i + 1}", EdgeType.FOREIGN_KEY, label, properties))
+    graph.add_edge(GraphEdge("Order:0", "plain", EdgeType.CONTAINS))
+    return graph
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """SQLite cache and snapshot directory with a schema and a data graph"""
+    db_path = str(tmp_path / 'graph.db')
+    factory = SqliteConnectionFactory(db_path)
+    sqlite_repo = SqliteGraphCacheRepository(factory, SqliteUnitOfWork(factory))
+    snapshot_repo = ColumnarGraphCacheRepository(str(tmp_path / 'snapshots'))
+    for graph in (build_graph('schema', GraphType.SCHEMA, 6), build_graph('data', GraphType.DATA, 9)):
+        sqlite_repo.save(graph)
+        snapshot_repo.save(graph, source_version=sqlite_repo.get_version(graph.id, graph.type))
+    return db_path, snapshot_repo
+
+
+def loaded(engine):
+    """Comparable view of the engine's graph and refresh bookkeeping"""
+    G = engine._ensure_graph_loaded()
+    return (
+        list(G.nodes(data=True)),
+        list(G.edges(data=True)),
+        engine._edge_pairs,
+        engine._high_water_mark
+    )
+
+
+@pytest.mark.unit
+class TestNetworkXSnapshotLoad:
+    """Snapshot-backed cold load"""
+
+    def test_snapshot_load_matches_row_load(self, cache):
+        db_path, snapshot_repo = cache
+
+        engine = NetworkXGraphQueryEngine(db_path, auto_load=False, snapshot_dir=snapshot_repo.snapshot_dir)
+
+        assert loaded(engine) == loaded(NetworkXGraphQueryEngine(db_path, auto_load=False))
+        assert engine._snapshot_edges == 5 + 8 + 2
+
+    def test_stale_snapshot_falls_back_to_rows(self, cache):
+        db_path, snapshot_repo = cache
+        snapshot_repo.save(build_graph('data', GraphType.DATA, 9), source_version='1')
+
+        engine = NetworkXGraphQueryEngine(db_path, auto_load=False, snapshot_dir=snapshot_repo.snapshot_dir)
+
+        assert loaded(engine) == loaded(NetworkXGraphQueryEngine(db_path, auto_load=False))
+        assert engine._snapshot_edges == 5 + 1  # schema graph only
+
+    def test_modified_rows_fall_back_to_rows(self, cache):
+        db_path, snapshot_repo = cache
+        conn = sqlite3.connect(db_path)
+        conn.execute(
+            "UPDATE graph_edges SET to_node_key = 'Order:3' WHERE edge_id = (SELECT MAX(edge_id) FROM graph_edges)"
+        )
+        conn.commit()
+        conn.close()
+
+        engine = NetworkXGraphQueryEngine(db_path, auto_load=False, snapshot_dir=snapshot_repo.snapshot_dir)
+
+        assert loaded(engine) == loaded(NetworkXGraphQueryEngine(db_path, auto_load=False))
+        assert engine._snapshot_edges == 5 + 1
+
+    def test_refresh_after_snapshot_load(self, cache):
+        db_path, snapshot_repo = cache
+        engine = NetworkXGraphQueryEngine(db_path, auto_load=False, snapshot_dir=snapshot_repo.snapshot_dir)
+        engine._ensure_graph_loaded()
+        factory = SqliteConnectionFactory(db_path)
+        SqliteGraphCacheRepository(factory, SqliteUnitOfWork(factory)).save(build_graph('data', GraphType.DATA, 4))
+
+        result = engine.refresh()
+
+        assert result['mode'] == 'incremental'
+        assert loaded(engine)[:3] == loaded(NetworkXGraphQueryEngine(db_path, auto_load=False))[:3]
@@ -0,0 +1,130 @@
+"""
+Tests for the SQL result cache
+
+Covers SQL normalization, version/TTL freshness, the byte budget and
+SQLExecutionService integration against a real SQLite file.
+"""
+
+import sqlite3
+
+import pytest
+
+from core.services.sql_result_cache import SQLResultCache, normalize_sql
+from modules.ai_assistant.backend.services.sql_execution_service import SQLExecutionService
+
+
+@pytest.fixture
+def service(tmp_path):
+    """SQLExecutionService with a result cache over two small databases"""
+    data_db = tmp_path / "p2p_data.db"
+    conn = sqlite3.connect(data_db)
+    conn.execute("CREATE TABLE Supplier (Supplier TEXT, Name TEXT)")
+    conn.executemany("INSERT INTO Supplier VALUES (?, ?)", [("S1", "Acme"), ("S2", "Globex")])
+    conn.commit()
+    conn.close()
+    graph_db = tmp_path / "p2p_graph.db"
+    sqlite3.connect(graph_db).close()
+    return SQLExecutionService(str(data_db), str(graph_db), result_cache=SQLResultCache())
+
+
+@pytest.mark.unit
+class TestNormalizeSql:
+    """Test cache key normalization"""
+
+    def test_formatting_differences_share_a_key(self):
+        """Test whitespace, keyword case and trailing semicolon are ignored"""
+        assert normalize_sql("SELECT  *\n FROM Supplier;") == normalize_sql("select * from supplier")
+
+    def test_literals_keep_case_and_spacing(self):
+        """Test string literals and quoted identifiers are not normalized"""
+        assert normalize_sql("SELECT * FROM t WHERE Name = 'Acme  Corp'") != \
+            normalize_sql("SELECT * FROM t WHERE Name = 'acme corp'")
+        assert "'Acme  Corp'" in normalize_sql("SELECT * FROM t WHERE Name = 'Acme  Corp'")
+
+
+@pytest.mark.unit
+class TestSQLResultCache:
+    """Test freshness rules and the byte budget"""
+
+    def test_version_mismatch_misses(self):
+        """Test an entry is only served for the version it was stored with"""
+        cache = SQLResultCache()
+        cache.put('sqlite', 'SELECT 1', {'rows': [1]}, version=1)
+
+        assert cache.get('sqlite', 'SELECT 1', version=1) == {'rows': [1]}
+        assert cache.get('sqlite', 'SELECT 1', version=2) is None
+        assert cache.get_stats()['version_invalidations'] == 1
+
+    def test_versionless_entries_expire(self):
+        """Test HANA-style entries use the TTL"""
+        cache = SQLResultCache(ttl_seconds=0)
+        cache.put('hana', 'SELECT 1', {'rows': [1]})
+
+        assert cache.get('hana', 'SELECT 1') is None
+        assert cache.get_stats()['expirations'] == 1
+
+    def test_byte_budget_evicts_least_recently_used(self):
+        """Test total size stays within max_bytes"""
+        cache = SQLResultCache(max_bytes=100, max_entry_bytes=100)
+        cache.put('sqlite', 'SELECT 1', 'a', size=40)
+        cache.put('sqlite', 'SELECT 2', 'b', size=40)
+        cache.get('sqlite', 'SELECT 1')
+        cache.put('sqlite', 'SELECT 3', 'c', size=40)
+
+        assert cache.get('sqlite', 'SELECT 2') is None
+        assert cache.get('sqlite', 'SELECT 1') == 'a'
+        stats = cache.get_stats()
+        assert stats['bytes'] == 80 and stats['evictions'] == 1
+
+    def test_oversized_entry_not_stored(self):
+        """Test one huge result cannot flush the cache"""
+        cache = SQLResultCache(max_bytes=100)
+
+        assert cache.put('sqlite', 'SELECT 1', 'x', size=26) is False
+        assert cache.get_stats()['oversized'] == 1
+
+    def test_disabled_cache_bypasses(self):
+        """Test enabled=False turns the cache off"""
+        cache = SQLResultCache(enabled=False)
+        cache.put('sqlite', 'SELECT 1', 'a')
+
+        assert cache.get('sqlite', 'SELECT 1') is None
+        assert cache.get_stats()['bypasses'] == 1
+
+
+@pytest.mark.unit
+class TestSQLExecutionServiceCache:
+    """Test result caching in SQLExecutionService"""
+
+    def test_repeated_query_is_cached(self, service):
+        """Test the same question (differently formatted) is answered from cache"""
+        first = service.execute_query("SELECT * FROM Supplier")
+        second = service.execute_query("select *  from Supplier;")
+
+        assert first.cached is False and second.cached is True
+        assert second.rows == first.rows
+        assert service.result_cache.get_stats()['hits'] == 1
+
+    def test_database_change_invalidates(self, service):
+        """Test a commit to the database makes cached results stale"""
+        service.execute_query("SELECT COUNT(*) AS n FROM Supplier")
+        conn = sqlite3.connect(service.p2p_data_db)
+        conn.execute("INSERT INTO Supplier VALUES ('S3', 'Initech')")
+        conn.commit()
+        conn.close()
+
+        result = service.execute_query("SELECT COUNT(*) AS n FROM Supplier")
+
+        assert result.cached is False
+        assert result.rows == [{'n': 3}]
+
+    def test_bypass_and_errors_are_not_cached(self, service):
+        """Test use_cache=False always executes and failures are never stored"""
+        service.execute_query("SELECT * FROM Supplier")
+        bypassed = service.execute_query("SELECT * FROM Supplier", use_cache=False)
+        service.execute_query("SELECT * FROM Missing")
+        failed = service.execute_query("SELECT * FROM Missing")
+
+        assert bypassed.cached is False
+        assert failed.success is False and failed.cached is False
+        assert service.result_cache.get_stats()['bypasses'] == 1
@@ -0,0 +1,120 @@
+"""
+Tests for SqliteConnectionPool
+
+Verifies read-only pooled connections, per-thread reuse, PRAGMA setup
+and the hit/miss/wait counters.
+"""
+
+import sqlite3
+import threading
+
+import pytest
+
+from core.services.database_connection_factory import (
+    SqliteConnectionPool,
+    DatabaseConnectionError,
+    enable_wal,
+    get_connection_pool
+)
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    """Create a small SQLite database"""
+    path = tmp_path / "pool_test.db"
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE Supplier (Supplier TEXT PRIMARY KEY, Name TEXT)")
+    conn.executemany("INSERT INTO Supplier VALUES (?, ?)", [("S1", "Acme"), ("S2", "Globex")])
+    conn.commit()
+    conn.close()
+    return str(path)
+
+
+@pytest.mark.unit
+class TestSqliteConnectionPool:
+    """Test SqliteConnectionPool behaviour"""
+
+    def test_connection_is_read_only_and_configured(self, db_path):
+        """Test connections reject writes and leave the journal mode alone"""
+        pool = SqliteConnectionPool(db_path)
+
+        with pool.connection() as conn:
+            assert conn.execute("SELECT COUNT(*) FROM Supplier").fetchone()[0] == 2
+            assert conn.execute("PRAGMA query_only").fetchone()[0] == 1
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0].lower() == "delete"
+            with pytest.raises(sqlite3.Error):
+                conn.execute("INSERT INTO Supplier VALUES ('S3', 'Initech')")
+
+    def test_enable_wal_is_seen_by_pool(self, db_path):
+        """Test the writer-side setup step switches the file to WAL"""
+        assert enable_wal(db_path) is True
+
+        with SqliteConnectionPool(db_path).connection() as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0].lower() == "wal"
+
+    def test_reuse_counts_hits_and_misses(self, db_path):
+        """Test released connections are reused"""
+        pool = SqliteConnectionPool(db_path)
+
+        with pool.connection() as first:
+            pass
+        with pool.connection() as second:
+            pass
+
+        stats = pool.get_stats()
+        assert first is second
+        assert stats['misses'] == 1
+        assert stats['hits'] == 1
+        assert stats['open_connections'] == 1
+
+    def test_nested_acquire_on_same_thread_reuses_connection(self, db_path):
+        """Test nested borrowing does not consume a second slot"""
+        pool = SqliteConnectionPool(db_path, max_connections=1, acquire_timeout=0.1)
+
+        with pool.connection() as outer:
+            with pool.connection() as inner:
+                assert inner is outer
+
+        assert pool.get_stats()['idle_connections'] == 1
+
+    def test_exhausted_pool_waits_then_times_out(self, db_path):
+        """Test wait counters and timeout when all connections are borrowed"""
+        pool = SqliteConnectionPool(db_path, max_connections=1, acquire_timeout=0.05)
+        held = pool.acquire()
+        errors = []
+
+        def borrow():
+            try:
+                with pool.connection():
+                    pass
+            except DatabaseConnectionError as e:
+                errors.append(e)
+
+        worker = threading.Thread(target=borrow)
+        worker.start()
+        worker.join()
+        assert len(errors) == 1
+
+        pool.release(held)
+        worker = threading.Thread(target=borrow)
+        worker.start()
+        worker.join()
+        assert len(errors) == 1
+
+    def test_sees_writes_committed_after_release(self, db_path):
+        """Test pooled readers pick up new data between borrows"""
+        pool = SqliteConnectionPool(db_path)
+        with pool.connection() as conn:
+            conn.execute("SELECT * FROM Supplier").fetchall()
+
+        writer = sqlite3.connect(db_path)
+        writer.execute("INSERT INTO Supplier VALUES ('S3', 'Initech')")
+        writer.commit()
+        writer.close()
+
+        with pool.connection() as conn:
+            assert conn.execute("SELECT COUNT(*) FROM Supplier").fetchone()[0] == 3
+
+    def test_registry_shares_pool_per_path(self, db_path):
+        """Test get_connection_pool returns one pool per database file"""
+        assert get_connection_pool(db_path) is get_connection_pool(db_path)
@@ -0,0 +1,131 @@
+"""
+Tests for keyset pagination and cached row counts
+
+Exercises SQLiteDataProductsService.query_table in cursor mode and the
+TableCountCache invalidation rules.
+"""
+
+import sqlite3
+
+import pytest
+
+from core.interfaces.data_product_repository import InvalidCursorError
+from core.services.sqlite_data_products_service import SQLiteDataProductsService
+from core.services.table_pagination import TableCountCache, build_keyset_predicate
+
+
+@pytest.fixture
+def service(tmp_path):
+    """Create a service over a database with a composite-key table and a keyless table"""
+    path = tmp_path / "paging.db"
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE PurchaseOrderItem (PurchaseOrder TEXT, PurchaseOrderItem INTEGER, "
+        "Material TEXT, PRIMARY KEY (PurchaseOrder, PurchaseOrderItem))"
+    )
+    conn.executemany(
+        "INSERT INTO PurchaseOrderItem VALUES (?, ?, ?)",
+        [(f"PO{po:03d}", item, f"M{po}{item}") for po in range(5) for item in (10, 20, 30)]
+    )
+    conn.execute("CREATE TABLE Note (Text TEXT)")
+    conn.executemany("INSERT INTO Note VALUES (?)", [(f"n{i}",) for i in range(7)])
+    conn.commit()
+    conn.close()
+    return SQLiteDataProductsService(str(path))
+
+
+def _read_all(service, table, limit):
+    """Follow nextCursor until exhausted"""
+    rows, cursor = [], ''
+    while True:
+        page = service.query_table('SQLITE_TEST', table, limit=limit, cursor=cursor)
+        rows.extend(page['rows'])
+        if not page['hasMore']:
+            assert page['nextCursor'] is None
+            return rows
+        cursor = page['nextCursor']
+
+
+@pytest.mark.unit
+class TestKeysetPagination:
+    """Test cursor-mode query_table"""
+
+    def test_cursor_pages_cover_table_in_key_order(self, service):
+        """Test composite-key paging returns every row exactly once"""
+        rows = _read_all(service, 'PurchaseOrderItem', limit=4)
+        offset_rows = service.query_table('SQLITE_TEST', 'PurchaseOrderItem', limit=100)['rows']
+
+        keys = [(r['PurchaseOrder'], r['PurchaseOrderItem']) for r in rows]
+        assert keys == sorted(keys)
+        assert len(rows) == 15
+        assert sorted(map(str, rows)) == sorted(map(str, offset_rows))
+
+    def test_rowid_fallback_for_keyless_table(self, service):
+        """Test tables without primary key page by rowid without leaking it"""
+        rows = _read_all(service, 'Note', limit=3)
+
+        assert [r['Text'] for r in rows] == [f"n{i}" for i in range(7)]
+        assert all(set(r) == {'Text'} for r in rows)
+
+    def test_cursor_from_other_table_is_rejected(self, service):
+        """Test a token cannot be replayed against another table"""
+        page = service.query_table('SQLITE_TEST', 'Note', limit=2, cursor='')
+
+        with pytest.raises(InvalidCursorError):
+            service.query_table('SQLITE_TEST', 'PurchaseOrderItem', limit=2, cursor=page['nextCursor'])
+
+    def test_zero_limit_returns_empty_page(self, service):
+        """Test limit=0 yields no rows instead of failing on the cursor row"""
+        page = service.query_table('SQLITE_TEST', 'Note', limit=0, cursor='')
+
+        assert page['rows'] == []
+        assert page['nextCursor'] is None
+
+    def test_total_count_refreshes_after_write(self, service):
+        """Test cached count is invalidated by PRAGMA data_version"""
+        assert service.query_table('SQLITE_TEST', 'Note', limit=1)['totalCount'] == 7
+
+        conn = sqlite3.connect(service.db_path)
+        conn.execute("INSERT INTO Note VALUES ('n7')")
+        conn.commit()
+        conn.close()
+
+        assert service.query_table('SQLITE_TEST', 'Note', limit=1)['totalCount'] == 8
+
+
+@pytest.mark.unit
+class TestTableCountCache:
+    """Test TableCountCache invalidation"""
+
+    def test_reuses_count_while_version_unchanged(self):
+        """Test count is computed once per version"""
+        version = [1]
+        calls = []
+        cache = TableCountCache(version_provider=lambda: version[0])
+
+        assert cache.get_or_compute('T', lambda: calls.append(1) or 5) == 5
+        assert cache.get_or_compute('T', lambda: calls.append(1) or 6) == 5
+        version[0] = 2
+        assert cache.get_or_compute('T', lambda: calls.append(1) or 6) == 6
+        assert len(calls) == 2
+
+    def test_unknown_count_is_not_cached(self):
+        """Test a failed count (None) is retried instead of served from cache"""
+        cache = TableCountCache(version_provider=lambda: 1)
+
+        assert cache.get_or_compute('T', lambda: None) is None
+        assert cache.get_or_compute('T', lambda: 5) == 5
+
+    def test_ttl_expiry(self):
+        """Test zero TTL always recomputes"""
+        cache = TableCountCache(ttl_seconds=0)
+
+        cache.get_or_compute('T', lambda: 1)
+        assert cache.get_or_compute('T', lambda: 2) == 2
+
+    def test_expanded_predicate_matches_row_value_semantics(self):
+        """Test the HANA-style OR chain for composite keys"""
+        predicate, params = build_keyset_predicate(['A', 'B'], ['x', 1], row_value_syntax=False)
+
+        assert predicate == '(("A" > ?) OR ("A" = ? AND "B" > ?))'
+        assert params == ['x', 'x', 1]
@@ -0,0 +1,128 @@
+"""
+Tests for CachingDataProductRepository
+
+Verifies LRU bounds, TTL expiry, version-based invalidation, explicit
+invalidation and hit-ratio reporting.
+"""
+
+from unittest.mock import Mock
+
+import pytest
+
+from core.interfaces.data_product_repository import IDataProductRepository, Table
+from modules.data_products_v2.repositories.caching_data_product_repository import (
+    CachingDataProductRepository
+)
+
+
+@pytest.fixture
+def inner():
+    """Mock repository returning one table per product"""
+    repo = Mock(spec=IDataProductRepository)
+    repo.get_source_type.return_value = 'sqlite'
+    repo.get_data_products.return_value = ['PurchaseOrder', 'Supplier']
+    repo.get_tables_in_product.side_effect = lambda product: [Table(product, 'TABLE', 0, 'SQLITE_X')]
+    return repo
+
+
+@pytest.mark.unit
+class TestCachingDataProductRepository:
+    """Test caching decorator behaviour"""
+
+    def test_repeat_calls_hit_cache(self, inner):
+        """Test second call is served from cache"""
+        cache = CachingDataProductRepository(inner)
+
+        cache.get_data_products()
+        result = cache.get_data_products()
+
+        assert result == ['PurchaseOrder', 'Supplier']
+        assert inner.get_data_products.call_count == 1
+        stats = cache.get_cache_stats()
+        assert stats['hits'] == 1 and stats['misses'] == 1
+        assert stats['hit_ratio'] == 0.5
+
+    def test_version_change_invalidates(self, inner):
+        """Test SQLite-style version provider drops stale entries"""
+        version = [1]
+        cache = CachingDataProductRepository(inner, version_provider=lambda: version[0])
+
+        cache.get_tables_in_product('Supplier')
+        version[0] = 2
+        cache.get_tables_in_product('Supplier')
+
+        assert inner.get_tables_in_product.call_count == 2
+        assert cache.get_cache_stats()['version_invalidations'] == 1
+
+    def test_ttl_expiry(self, inner):
+        """Test HANA-style TTL expiry"""
+        cache = CachingDataProductRepository(inner, ttl_seconds=0)
+
+        cache.get_data_products()
+        cache.get_data_products()
+
+        assert inner.get_data_products.call_count == 2
+        assert cache.get_cache_stats()['expirations'] == 1
+
+    def test_lru_eviction(self, inner):
+        """Test capacity bound evicts least recently used entry"""
+        cache = CachingDataProductRepository(inner, max_entries=2)
+
+        cache.get_tables_in_product('A')
+        cache.get_tables_in_product('B')
+        cache.get_tables_in_product('A')
+        cache.get_tables_in_product('C')
+        cache.get_tables_in_product('A')
+        cache.get_tables_in_product('B')
+
+        assert inner.get_tables_in_product.call_count == 4
+        assert cache.get_cache_stats()['evictions'] == 2
+
+    def test_invalidate_single_product(self, inner):
+        """Test explicit invalidation of one product plus the product list"""
+        cache = CachingDataProductRepository(inner)
+        cache.get_data_products()
+        cache.get_tables_in_product('A')
+        cache.get_tables_in_product('B')
+
+        removed = cache.invalidate('A')
+        cache.get_tables_in_product('B')
+
+        assert removed == 2
+        assert inner.get_tables_in_product.call_count == 2
+
+    def test_row_queries_are_not_cached(self, inner):
+        """Test query_table_data always reaches the source"""
+        inner.query_table_data.return_value = {'rows': []}
+        cache = CachingDataProductRepository(inner)
+
+        cache.query_table_data('A', 'T')
+        cache.query_table_data('A', 'T')
+
+        assert inner.query_table_data.call_count == 2
+
+
+@pytest.mark.unit
+class TestCachingExecuteSql:
+    """Test execute_sql result caching"""
+
+    def test_execute_sql_cached_per_version(self, inner):
+        """Test repeated SQL is served from the SQL cache until the version changes"""
+        from core.services.sql_result_cache import SQLResultCache
+
+        inner.execute_sql.return_value = {'success': True, 'rows': [{'n': 1}], 'columns': ['n'], 'row_count': 1}
+        version = [1]
+        cache = CachingDataProductRepository(
+            inner, version_provider=lambda: version[0], sql_cache=SQLResultCache()
+        )
+
+        cache.execute_sql("SELECT COUNT(*) AS n FROM Supplier")
+        hit = cache.execute_sql("select count(*) as n from Supplier")
+        version[0] = 2
+        miss = cache.execute_sql("SELECT COUNT(*) AS n FROM Supplier")
+        cache.execute_sql("SELECT COUNT(*) AS n FROM Supplier", use_cache=False)
+
+        assert hit['cached'] is True
+        assert 'cached' not in miss
+        assert inner.execute_sql.call_count == 3
+        assert cache.get_sql_cache_stats()['bypasses'] == 1